@@ -12,6 +12,14 @@ except Exception:  # pragma: no cover - fallback when scm metadata is unavailabl
 
 __author__ = "Grovex Tech & Solutions"
 
-from .core import FinanceFeedbackEngine
-
 __all__ = ["FinanceFeedbackEngine"]
+
+
+def __getattr__(name):
+    # Deferred so lightweight entry points (CLI help, benchmarks, scripts)
+    # do not pay for the engine's dependency tree on ``import``
+    if name == "FinanceFeedbackEngine":
+        from .core import FinanceFeedbackEngine
+
+        return FinanceFeedbackEngine
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -353,7 +353,20 @@ class TradingAgentConfig(BaseModel):
     reasoning_max_concurrent_assets: int = 3
     reasoning_rate_limit_requests_per_minute: float = 4.0
     reasoning_rate_limit_burst: int = 1
+    reasoning_asset_timeout_seconds: float = Field(90.0, gt=0.0)
+    # Priority scheduling: dispatch pairs with open positions, pending exits,
+    # high volatility or stale analyses first. With a positive cycle time
+    # budget, pairs not dispatched before it expires carry over to the next
+    # cycle (0 = no budget).
+    reasoning_priority_scheduling_enabled: bool = False
+    reasoning_cycle_time_budget_seconds: float = Field(0.0, ge=0.0)
     main_loop_error_backoff_seconds: int = 300
+    # Pipelined perception: prefetch the next cycle's MTM and monitoring context
+    # while REASONING waits on the LLM. Prefetched context older than
+    # pipelined_perception_max_age_seconds, or captured before an EXECUTION
+    # state, is discarded and perception runs synchronously as usual.
+    pipelined_perception_enabled: bool = False
+    pipelined_perception_max_age_seconds: float = Field(30.0, gt=0.0)
 
     # --- Resilience & Observability ---
     max_retries_per_cycle: int = 3
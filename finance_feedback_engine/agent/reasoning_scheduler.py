@@ -0,0 +1,150 @@
+"""Urgency-based ordering of asset pairs for the REASONING state."""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PairUrgency:
+    """Urgency score for one asset pair with its contributing components."""
+
+    asset_pair: str
+    score: float
+    components: Dict[str, float] = field(default_factory=dict)
+
+
+class ReasoningPriorityScheduler:
+    """Score asset pairs by urgency so LLM work is dispatched highest-first.
+
+    Signals are recorded by the trading loop as a side effect of earlier
+    cycles (open positions seen by the duplicate-entry guard, the volatility
+    and action of the last decision per pair) so scoring never costs an extra
+    exchange round trip. Pairs that could not be dispatched before the cycle
+    budget ran out are carried over and boosted in the next cycle.
+    """
+
+    def __init__(
+        self,
+        open_position_weight: float = 100.0,
+        exit_signal_weight: float = 150.0,
+        carry_over_weight: float = 50.0,
+        high_volatility_weight: float = 25.0,
+        high_volatility_threshold: float = 0.04,
+        staleness_weight_per_minute: float = 1.0,
+        max_staleness_minutes: float = 60.0,
+    ):
+        self.open_position_weight = open_position_weight
+        self.exit_signal_weight = exit_signal_weight
+        self.carry_over_weight = carry_over_weight
+        self.high_volatility_weight = high_volatility_weight
+        self.high_volatility_threshold = high_volatility_threshold
+        self.staleness_weight_per_minute = staleness_weight_per_minute
+        self.max_staleness_minutes = max_staleness_minutes
+
+        self._last_analyzed_at: Dict[str, float] = {}
+        self._last_volatility: Dict[str, float] = {}
+        self._pending_exit: set[str] = set()
+        self._open_positions: set[str] = set()
+        self._carry_over: set[str] = set()
+
+    def set_open_positions(self, asset_pairs: Iterable[str]) -> None:
+        """Replace the set of pairs that currently hold an open position."""
+        self._open_positions = {str(pair).upper() for pair in asset_pairs if pair}
+
+    def record_analysis(
+        self,
+        asset_pair: str,
+        decision: Optional[Dict[str, Any]],
+        exit_pending: bool = False,
+        now: Optional[float] = None,
+    ) -> None:
+        """Record a completed analysis for ``asset_pair``.
+
+        Args:
+            asset_pair: Pair that was analyzed.
+            decision: Resulting decision payload (may be None on failure).
+            exit_pending: True if the decision asked to reduce or close a
+                position, so the pair is revisited promptly.
+            now: Optional wall-clock override (seconds since epoch).
+        """
+        key = str(asset_pair).upper()
+        self._last_analyzed_at[key] = time.time() if now is None else now
+        self._carry_over.discard(key)
+
+        if isinstance(decision, dict):
+            try:
+                volatility = float(decision.get("volatility") or 0.0)
+            except (TypeError, ValueError):
+                volatility = 0.0
+            self._last_volatility[key] = volatility
+
+        if exit_pending:
+            self._pending_exit.add(key)
+        else:
+            self._pending_exit.discard(key)
+
+    def defer(self, asset_pairs: Iterable[str]) -> None:
+        """Carry pairs that were not dispatched this cycle over to the next."""
+        for pair in asset_pairs:
+            self._carry_over.add(str(pair).upper())
+
+    @property
+    def carried_over(self) -> List[str]:
+        """Pairs currently waiting from a previous cycle."""
+        return sorted(self._carry_over)
+
+    def score(self, asset_pair: str, now: Optional[float] = None) -> PairUrgency:
+        """Compute the urgency score for a single pair."""
+        key = str(asset_pair).upper()
+        now = time.time() if now is None else now
+        components: Dict[str, float] = {}
+
+        if key in self._open_positions:
+            components["open_position"] = self.open_position_weight
+        if key in self._pending_exit:
+            components["exit_signal"] = self.exit_signal_weight
+        if key in self._carry_over:
+            components["carry_over"] = self.carry_over_weight
+        if self._last_volatility.get(key, 0.0) >= self.high_volatility_threshold:
+            components["high_volatility"] = self.high_volatility_weight
+
+        last = self._last_analyzed_at.get(key)
+        staleness_minutes = (
+            self.max_staleness_minutes
+            if last is None
+            else min(self.max_staleness_minutes, max(0.0, now - last) / 60.0)
+        )
+        components["staleness"] = staleness_minutes * self.staleness_weight_per_minute
+
+        return PairUrgency(
+            asset_pair=asset_pair,
+            score=sum(components.values()),
+            components=components,
+        )
+
+    def prioritize(
+        self, indexed_pairs: List[Tuple[int, str]], now: Optional[float] = None
+    ) -> List[Tuple[int, str]]:
+        """Order ``(index, asset_pair)`` tuples by descending urgency.
+
+        Ties keep their original (config) order.
+        """
+        now = time.time() if now is None else now
+        scored = [
+            (self.score(item[1], now=now).score, position, item)
+            for position, item in enumerate(indexed_pairs)
+        ]
+        scored.sort(key=lambda entry: (-entry[0], entry[1]))
+        ordered = [item for _, _, item in scored]
+        if ordered != indexed_pairs:
+            logger.info(
+                "Reasoning priority order: %s",
+                [pair for _, pair in ordered],
+            )
+        return ordered
@@ -2,6 +2,7 @@
 
 import asyncio
 import datetime
+import functools
 import logging
 import queue
 import time
@@ -15,6 +16,7 @@ from typing import Any, Dict, List, Optional
 from opentelemetry import metrics, trace
 
 from finance_feedback_engine.agent.config import TradingAgentConfig
+from finance_feedback_engine.agent.reasoning_scheduler import ReasoningPriorityScheduler
 from finance_feedback_engine.agent.trade_execution_safety import (
     clear_stale_reservations,
     finalize_trade_reservation,
@@ -53,6 +55,7 @@ from finance_feedback_engine.monitoring.prometheus import (
 from finance_feedback_engine.monitoring.trade_monitor import TradeMonitor
 from finance_feedback_engine.risk.exposure_reservation import get_exposure_manager
 from finance_feedback_engine.risk.gatekeeper import RiskGatekeeper
+from finance_feedback_engine.risk.risk_state import TradeBatch
 from finance_feedback_engine.trading_platforms.base_platform import BaseTradingPlatform
 from finance_feedback_engine.utils import validate_data_freshness
 from finance_feedback_engine.utils.environment import is_development, is_production
@@ -224,6 +227,20 @@ class LoopMetrics:
         self.last_cycle_total_duration = sum(cycle_phase_durations.values())
 
 
+@dataclass
+class _PerceptionPrefetch:
+    """Market/portfolio context gathered in the background for the next cycle."""
+
+    cycle_id: Optional[str]
+    execution_epoch: int
+    loop_epoch: int
+    started_at: float
+    captured_at: float = 0.0
+    market_context: Optional[Dict[str, Any]] = None
+    portfolio_snapshot: Optional[Any] = None
+    mtm_updated: bool = False
+
+
 class _TokenBucketRateLimiter:
     """Async token-bucket limiter for pacing provider calls without fixed sleeps."""
 
@@ -401,6 +418,23 @@ class TradingLoopAgent:
         self._cycle_retry_budget: dict[str, int] = {}
         self._loop_metrics = LoopMetrics()
 
+        # Pipelined perception: next cycle's MTM/monitoring context is prefetched
+        # while reasoning runs. The execution epoch is bumped on every EXECUTION
+        # entry so that context captured before a possible fill is never reused;
+        # the loop epoch is bumped on start/recovery/pause/resume/stop so that a
+        # prefetch from before a reset is never consumed by a later cycle.
+        self._perception_prefetch_task: Optional[asyncio.Task] = None
+        self._execution_epoch = 0
+        self._loop_epoch = 0
+        self._perception_prefetch_stats = {"started": 0, "used": 0, "discarded": 0}
+
+        # Urgency-ordered dispatch for REASONING (open positions, exits, stale pairs first)
+        self._reasoning_scheduler = ReasoningPriorityScheduler(
+            high_volatility_threshold=float(
+                getattr(self.config, "high_volatility_threshold", 0.04)
+            )
+        )
+
         # Property for dashboard to track if stop was requested
         self.stop_requested = False
 
@@ -759,7 +793,9 @@ class TradingLoopAgent:
                         # Increment cycle counter for dashboard
                         self._cycle_count += 1
                         # Normal sleep between analysis cycles
-                        await asyncio.sleep(self.config.analysis_frequency_seconds)
+                        await self._sleep_until_next_cycle(
+                            self.config.analysis_frequency_seconds
+                        )
 
                 except asyncio.CancelledError:
                     logger.info("Trading loop cancelled.")
@@ -1612,6 +1648,7 @@ class TradingLoopAgent:
 
         Delegates to _recover_existing_positions() for the actual recovery logic.
         """
+        self._cancel_perception_prefetch()
         try:
             await self._recover_existing_positions()
         except Exception as e:
@@ -1633,25 +1670,24 @@ class TradingLoopAgent:
         logger.info("State: PERCEPTION - Fetching data and performing safety checks...")
         logger.info("=" * 80)
 
-        try:
-            await self._update_position_mtm()
-        except Exception as e:
-            logger.warning("Failed to update position MTM: %s", e, exc_info=True)
-            tracker = getattr(self.engine, "error_tracker", None)
-            if tracker:
-                tracker.capture_error(
-                    e,
-                    context={
-                        "phase": "position_mtm_update",
-                        "cycle_id": self._current_cycle_id,
-                    },
-                )
+        prefetch = await self._consume_perception_prefetch()
+        if prefetch is not None:
+            logger.info(
+                "Using pipelined perception prefetch (age %.2fs, mtm_updated=%s)",
+                time.monotonic() - prefetch.captured_at,
+                prefetch.mtm_updated,
+            )
+            market_context = prefetch.market_context or {}
+            await self._begin_portfolio_snapshot(prefetch.portfolio_snapshot)
+        else:
+            await self._run_position_mtm_update()
+            await self._begin_portfolio_snapshot()
 
-        # --- Data Freshness Validation ---
-        # Fetch monitoring context and cache for reuse throughout PERCEPTION state
-        market_context = (
-            self.trade_monitor.monitoring_context_provider.get_monitoring_context()
-        )
+            # --- Data Freshness Validation ---
+            # Fetch monitoring context and cache for reuse throughout PERCEPTION state
+            market_context = (
+                self.trade_monitor.monitoring_context_provider.get_monitoring_context()
+            )
         asset_type = market_context.get("asset_type", "crypto")
         data_timestamp = market_context.get("latest_market_data_timestamp")
         if str(asset_type).lower() == "crypto":
@@ -1801,6 +1837,214 @@ class TradingLoopAgent:
         # Transition to reasoning after gathering market data
         await self._transition_to(AgentState.REASONING)
 
+    async def _run_position_mtm_update(self) -> bool:
+        """Run the MTM update, capturing failures instead of raising.
+
+        Returns:
+            True if the update completed without raising.
+        """
+        try:
+            await self._update_position_mtm()
+            return True
+        except Exception as e:
+            logger.warning("Failed to update position MTM: %s", e, exc_info=True)
+            tracker = getattr(self.engine, "error_tracker", None)
+            if tracker:
+                tracker.capture_error(
+                    e,
+                    context={
+                        "phase": "position_mtm_update",
+                        "cycle_id": self._current_cycle_id,
+                    },
+                )
+            return False
+
+    def _start_perception_prefetch(self) -> None:
+        """Prefetch the next cycle's perception inputs in the background.
+
+        Called at the start of REASONING when ``pipelined_perception_enabled`` is
+        set, so position MTM and the monitoring context are gathered while the
+        LLM is busy. The result is only used by the next PERCEPTION if it passes
+        the checks in ``_consume_perception_prefetch``.
+        """
+        if not getattr(self.config, "pipelined_perception_enabled", False):
+            return
+        if (
+            self._perception_prefetch_task is not None
+            and not self._perception_prefetch_task.done()
+        ):
+            return
+
+        prefetch = _PerceptionPrefetch(
+            cycle_id=self._current_cycle_id,
+            execution_epoch=self._execution_epoch,
+            loop_epoch=self._loop_epoch,
+            started_at=time.monotonic(),
+        )
+
+        async def _prefetch() -> _PerceptionPrefetch:
+            prefetch.mtm_updated = await self._run_position_mtm_update()
+            provider = self.trade_monitor.monitoring_context_provider
+            prefetch.portfolio_snapshot = await self._capture_portfolio_snapshot()
+            prefetch.market_context = await asyncio.get_running_loop().run_in_executor(
+                None,
+                functools.partial(
+                    provider.get_monitoring_context,
+                    snapshot=prefetch.portfolio_snapshot,
+                ),
+            )
+            prefetch.captured_at = time.monotonic()
+            return prefetch
+
+        self._perception_prefetch_stats["started"] += 1
+        self._perception_prefetch_task = asyncio.create_task(_prefetch())
+
+    async def _sleep_until_next_cycle(self, seconds: float) -> None:
+        """Sleep between cycles, re-arming the perception prefetch near the end.
+
+        A prefetch started during REASONING would go stale over a long cycle
+        interval, so when pipelining is enabled the prefetch is restarted
+        shortly before the next PERCEPTION unless the existing one will still
+        be within its max age.
+        """
+        if not getattr(self.config, "pipelined_perception_enabled", False) or seconds <= 0:
+            await asyncio.sleep(seconds)
+            return
+
+        max_age = float(
+            getattr(self.config, "pipelined_perception_max_age_seconds", 30.0)
+        )
+        lead = min(float(seconds), max_age / 2.0)
+        await asyncio.sleep(seconds - lead)
+
+        task = self._perception_prefetch_task
+        if task is not None and task.done() and not task.cancelled():
+            try:
+                prefetch = task.result()
+            except Exception:
+                prefetch = None
+            if prefetch is not None and time.monotonic() + lead - prefetch.captured_at <= max_age:
+                await asyncio.sleep(lead)
+                return
+
+        if task is None or task.done():
+            self._perception_prefetch_task = None
+            self._start_perception_prefetch()
+        await asyncio.sleep(lead)
+
+    async def _consume_perception_prefetch(self) -> Optional[_PerceptionPrefetch]:
+        """Return the pending perception prefetch if it is still safe to use.
+
+        A prefetch is discarded when it failed, when it was started before the
+        loop was (re)started, recovered, paused or resumed, when an EXECUTION
+        state was entered after it started (positions and exposure may have
+        changed), or when it is older than ``pipelined_perception_max_age_seconds``.
+        """
+        task = self._perception_prefetch_task
+        self._perception_prefetch_task = None
+        if task is None:
+            return None
+
+        try:
+            prefetch = await task
+        except asyncio.CancelledError:
+            prefetch = None
+        except Exception as e:
+            logger.warning("Perception prefetch failed: %s", e)
+            prefetch = None
+
+        reason = None
+        if prefetch is None or not isinstance(prefetch.market_context, dict):
+            reason = "failed"
+        elif prefetch.loop_epoch != self._loop_epoch:
+            reason = "loop reset since prefetch"
+        elif prefetch.execution_epoch != self._execution_epoch:
+            reason = "execution since prefetch"
+        else:
+            max_age = float(
+                getattr(self.config, "pipelined_perception_max_age_seconds", 30.0)
+            )
+            age = time.monotonic() - prefetch.captured_at
+            if age > max_age:
+                reason = f"stale ({age:.1f}s > {max_age:.1f}s)"
+
+        if reason is not None:
+            self._perception_prefetch_stats["discarded"] += 1
+            logger.info("Discarding perception prefetch: %s", reason)
+            return None
+
+        self._perception_prefetch_stats["used"] += 1
+        return prefetch
+
+    def _portfolio_snapshot_providers(self) -> list:
+        """Monitoring providers that serve this cycle's portfolio snapshot.
+
+        The trade monitor's provider and the decision engine's provider are
+        separate instances over the same platform, so both get the snapshot.
+        """
+        source = getattr(self.trade_monitor, "monitoring_context_provider", None)
+        if source is None:
+            return []
+        providers = [source]
+        engine_provider = getattr(self.engine, "monitoring_provider", None)
+        if (
+            engine_provider is not None
+            and engine_provider is not source
+            and hasattr(engine_provider, "use_snapshot")
+            and getattr(engine_provider, "platform", None)
+            is getattr(source, "platform", None)
+        ):
+            providers.append(engine_provider)
+        return providers
+
+    async def _capture_portfolio_snapshot(self):
+        """Fetch one portfolio snapshot; None (contexts fetch live) on failure."""
+        try:
+            return await self.trade_monitor.monitoring_context_provider.capture_snapshot()
+        except Exception as e:
+            logger.warning(
+                "Portfolio snapshot capture failed; monitoring context will be fetched live: %s",
+                e,
+            )
+            return None
+
+    async def _begin_portfolio_snapshot(self, snapshot=None) -> None:
+        """Install the cycle's portfolio snapshot, capturing one if not given.
+
+        Every monitoring context built until ``_invalidate_portfolio_snapshot``
+        (reasoning, risk checks, decision-engine context) reads this snapshot
+        instead of fetching the portfolio again per asset.
+        """
+        if snapshot is None:
+            snapshot = await self._capture_portfolio_snapshot()
+        for provider in self._portfolio_snapshot_providers():
+            provider.use_snapshot(snapshot)
+        if snapshot is not None:
+            try:
+                self.risk_gatekeeper.risk_state.sync_snapshot(snapshot)
+            except Exception as e:
+                logger.debug("Failed to sync risk state from snapshot: %s", e)
+
+    def _invalidate_portfolio_snapshot(self) -> None:
+        """Drop the cycle's portfolio snapshot (after executions / at cycle end)."""
+        for provider in self._portfolio_snapshot_providers():
+            try:
+                provider.invalidate_snapshot()
+            except Exception as e:
+                logger.debug("Failed to invalidate portfolio snapshot: %s", e)
+
+    def _cancel_perception_prefetch(self) -> None:
+        """Cancel any in-flight perception prefetch and retire finished ones.
+
+        Bumps the loop epoch, so a prefetch task still referenced elsewhere
+        (or re-armed concurrently) is rejected by the next PERCEPTION.
+        """
+        self._loop_epoch += 1
+        task = self._perception_prefetch_task
+        self._perception_prefetch_task = None
+        if task is not None and not task.done():
+            task.cancel()
+
     async def _update_position_mtm(self) -> None:
         """
         Mark-to-market: Update all open positions with current market prices.
@@ -1864,6 +2108,12 @@ class TradingLoopAgent:
             except Exception as e:
                 logger.debug("Could not fetch price for %s: %s", normalized_pair, e)
 
+        if price_updates:
+            try:
+                self.risk_gatekeeper.risk_state.mark_to_market(price_updates)
+            except Exception as e:
+                logger.debug("Failed to mark risk state to market: %s", e)
+
         if price_updates and hasattr(self.trading_platform, "update_position_prices"):
             # Wrap update_position_prices in retry and error capture
             update_retry_cfg = RetryConfig.get_config("API_CALL")
@@ -1949,6 +2199,9 @@ class TradingLoopAgent:
             await self._transition_to(AgentState.IDLE)
             return
 
+        # Overlap the next cycle's perception with this cycle's LLM work
+        self._start_perception_prefetch()
+
         # Create a snapshot copy for iteration (prevents race conditions)
         asset_pairs_snapshot = list(self.config.asset_pairs)
         logger.info(
@@ -2055,6 +2308,26 @@ class TradingLoopAgent:
 
             pairs_to_analyze.append((idx, asset_pair))
 
+        priority_enabled = bool(
+            getattr(self.config, "reasoning_priority_scheduling_enabled", False)
+        )
+        if priority_enabled:
+            pairs_to_analyze = self._reasoning_scheduler.prioritize(pairs_to_analyze)
+
+        # Per-cycle time budget: pairs not dispatched before it expires, and
+        # analyses still running when it expires, are carried over to the next
+        # cycle instead of holding up the rest of the cycle.
+        time_budget = float(
+            getattr(self.config, "reasoning_cycle_time_budget_seconds", 0.0) or 0.0
+        )
+        budget_deadline = (
+            time.monotonic() + time_budget if priority_enabled and time_budget > 0 else None
+        )
+        deferred_pairs: list[str] = []
+        asset_timeout = float(
+            getattr(self.config, "reasoning_asset_timeout_seconds", 90.0)
+        )
+
         max_concurrent = max(
             1, int(getattr(self.config, "reasoning_max_concurrent_assets", 3))
         )
@@ -2081,10 +2354,24 @@ class TradingLoopAgent:
                 if limiter is not None:
                     await limiter.acquire()
 
+                if budget_deadline is not None and time.monotonic() >= budget_deadline:
+                    logger.info(
+                        "Reasoning time budget exhausted; deferring %s to next cycle.",
+                        asset_pair,
+                    )
+                    deferred_pairs.append(asset_pair)
+                    return index, None
+
+                # Running analyses are cut off at the budget deadline too
+                timeout = asset_timeout
+                if budget_deadline is not None:
+                    timeout = min(timeout, max(0.0, budget_deadline - time.monotonic()))
+
                 try:
                     logger.info(
-                        "    → Calling DecisionEngine for %s (90s timeout)...",
+                        "    → Calling DecisionEngine for %s (%.0fs timeout)...",
                         asset_pair,
+                        timeout,
                     )
 
                     analyze_fn = getattr(self.engine, "analyze_asset", None)
@@ -2101,7 +2388,8 @@ class TradingLoopAgent:
                     include_macro = bool(monitoring_cfg.get("include_macro", False))
 
                     if callable(analyze_async_fn):
-                        analysis_result = await analyze_async_fn(
+                        # Not awaited here so the wait_for below can cut it off
+                        analysis_result = analyze_async_fn(
                             asset_pair,
                             include_sentiment=include_sentiment,
                             include_macro=include_macro,
@@ -2124,7 +2412,9 @@ class TradingLoopAgent:
                     else:
                         analysis_awaitable = asyncio.sleep(0, result=analysis_result)
 
-                    decision = await asyncio.wait_for(analysis_awaitable, timeout=90)
+                    decision = await asyncio.wait_for(
+                        analysis_awaitable, timeout=timeout
+                    )
 
                     # Reset failure count on success
                     self.analysis_failures.pop(failure_key, None)
@@ -2132,6 +2422,15 @@ class TradingLoopAgent:
                     return index, decision
 
                 except asyncio.TimeoutError:
+                    if timeout < asset_timeout:
+                        # Budget overrun, not a provider failure: no failure penalty
+                        logger.info(
+                            "Reasoning time budget exhausted while analyzing %s; "
+                            "deferring to next cycle.",
+                            asset_pair,
+                        )
+                        deferred_pairs.append(asset_pair)
+                        return index, None
                     logger.warning(
                         "Analysis for %s timed out, skipping this cycle.", asset_pair
                     )
@@ -2199,8 +2498,30 @@ class TradingLoopAgent:
             else []
         )
 
+        if deferred_pairs:
+            self._reasoning_scheduler.defer(deferred_pairs)
+            analysis_results = [
+                (index, decision)
+                for index, decision in analysis_results
+                if asset_pairs_snapshot[index] not in deferred_pairs
+            ]
+            logger.info(
+                "Deferred %d pair(s) to next cycle: %s",
+                len(deferred_pairs),
+                deferred_pairs,
+            )
+
         # Preserve deterministic ordering by original asset index
         ordered_results = sorted(analysis_results, key=lambda item: item[0])
+        for index, decision in ordered_results:
+            pair_intent = _derive_execution_intent(decision or {})
+            self._reasoning_scheduler.record_analysis(
+                asset_pairs_snapshot[index],
+                decision,
+                exit_pending=bool(
+                    pair_intent["position_side"] and not pair_intent["entry_side"]
+                ),
+            )
         ordered_actionable_decisions: list[dict] = []
 
         # Safety guard: detect currently open assets and avoid opening duplicate exposure
@@ -2321,6 +2642,8 @@ class TradingLoopAgent:
                     # Keep first observed side per asset for duplicate-entry logic.
                     open_position_side.setdefault(canonical, side)
 
+            self._reasoning_scheduler.set_open_positions(open_asset_pairs)
+
             self._log_portfolio_risk_snapshot(
                 "Portfolio risk snapshot (decision loop)",
                 portfolio_snapshot,
@@ -2721,6 +3044,8 @@ class TradingLoopAgent:
 
         # Process without lock
         approved_decisions = []
+        # Exposure approved earlier in this pass counts against later decisions
+        risk_batch = TradeBatch()
         for decision in decisions_to_check:
             decision_id = decision.get("id")
             asset_pair = decision.get("asset_pair")
@@ -2749,7 +3074,7 @@ class TradingLoopAgent:
 
             # First run the standard RiskGatekeeper validation
             approved, reason = self.risk_gatekeeper.validate_trade(
-                decision, monitoring_context
+                decision, monitoring_context, batch=risk_batch
             )
 
             if not approved:
@@ -2857,6 +3182,7 @@ class TradingLoopAgent:
                     asset_pair,
                 )
                 approved_decisions.append(decision)
+                risk_batch.add(decision)
                 try:
                     exposure_manager = get_exposure_manager()
                     reserve_trade_exposure(
@@ -3057,6 +3383,11 @@ class TradingLoopAgent:
         """
         logger.info("State: EXECUTION - Processing decisions...")
 
+        # Any perception prefetch or portfolio snapshot captured before this
+        # point may predate a fill.
+        self._execution_epoch += 1
+        self._invalidate_portfolio_snapshot()
+
         async with self._current_decisions_lock:
             if not self._current_decisions:
                 await self._transition_to(AgentState.IDLE)
@@ -3261,6 +3592,14 @@ class TradingLoopAgent:
                             logger.warning(
                                 f"Failed to finalize reservation for {decision_id}: {e}"
                             )
+                        try:
+                            self.risk_gatekeeper.risk_state.apply_decision_fill(decision)
+                        except Exception as e:
+                            logger.debug(
+                                "Failed to apply fill to risk state for %s: %s",
+                                decision_id,
+                                e,
+                            )
                     else:
                         decision["execution_status"] = "execution_failed"
                         decision["executed"] = False
@@ -4343,7 +4682,9 @@ class TradingLoopAgent:
 
     def get_loop_metrics(self) -> Dict[str, Any]:
         """Return cycle timing metrics for API consumption."""
-        return asdict(self._loop_metrics)
+        metrics_payload = asdict(self._loop_metrics)
+        metrics_payload["perception_prefetch"] = dict(self._perception_prefetch_stats)
+        return metrics_payload
 
     async def _deliver_webhook(
         self, webhook_url: str, payload: dict, max_retries: int = 3
@@ -5565,12 +5906,16 @@ class TradingLoopAgent:
             logger.error(f"Error in process_cycle: {e}", exc_info=True)
             self._reset_cycle_budget()
             return False
+        finally:
+            # Outside a cycle (dashboards, CLI) monitoring context is live again
+            self._invalidate_portfolio_snapshot()
 
     def stop(self):
         """Stops the trading loop."""
         logger.info("Stopping autonomous trading agent...")
         self.is_running = False
         self.stop_requested = True
+        self._cancel_perception_prefetch()
 
         # Mark state as IDLE for metrics when stop is requested
         self.state = AgentState.IDLE
@@ -5599,6 +5944,7 @@ class TradingLoopAgent:
         logger.info("Pausing trading agent via public method")
         self.is_running = False
         self._paused = True
+        self._cancel_perception_prefetch()
         return True
 
     def resume(self) -> bool:
@@ -5618,4 +5964,5 @@ class TradingLoopAgent:
         logger.info("Resuming trading agent via public method")
         self.is_running = True
         self._paused = False
+        self._cancel_perception_prefetch()
         return True
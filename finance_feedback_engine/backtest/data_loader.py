@@ -11,6 +11,12 @@ from datetime import datetime, timezone, timedelta
 from typing import Optional, Dict, Any
 import json
 
+from finance_feedback_engine.persistence.ohlcv_lake import (
+    DEFAULT_LAKE_PATH,
+    OHLCVLake,
+    coverage_end,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -30,14 +36,17 @@ class HistoricalDataManager:
         "D": 86400,         # 1 day
     }
     
-    def __init__(self, cache_format: str = "parquet"):
+    def __init__(self, cache_format: str = "parquet", lake: Optional[OHLCVLake] = None):
         """
         Initialize data manager.
         
         Args:
             cache_format: 'parquet' (default) or 'csv'
+            lake: Shared OHLCV lake fetched candles are written into
+                (default: the lake used by HistoricalDataProvider)
         """
         self.cache_format = cache_format
+        self.lake = lake or OHLCVLake(DEFAULT_LAKE_PATH)
         self.CACHE_DIR.mkdir(parents=True, exist_ok=True)
         
         logger.info(f"HistoricalDataManager initialized (cache: {cache_format})")
@@ -69,6 +78,13 @@ class HistoricalDataManager:
         # Generate cache filename
         cache_file = self._get_cache_path(symbol, granularity, count)
         
+        # Serve from the shared lake when the trailing window is fully covered
+        if use_cache:
+            df = self._load_from_lake(symbol, granularity, count)
+            if df is not None:
+                logger.info(f"Loaded {len(df)} candles for {symbol} {granularity} from OHLCV lake")
+                return df
+        
         # Try to load from cache
         if use_cache and cache_file.exists():
             try:
@@ -111,6 +127,7 @@ class HistoricalDataManager:
             if not df.empty:
                 self._save_to_cache(df, cache_file)
                 logger.info(f"Cached {len(df)} candles to {cache_file.name}")
+                self._save_to_lake(df, symbol, granularity)
             
             return df
             
@@ -193,6 +210,37 @@ class HistoricalDataManager:
             logger.error(f"Coinbase data fetch failed: {e}")
             raise
     
+    def _load_from_lake(
+        self, symbol: str, granularity: str, count: int
+    ) -> Optional[pd.DataFrame]:
+        """Return the last ``count`` closed candles if the lake already covers them."""
+        span = timedelta(seconds=self.GRANULARITIES[granularity] * count)
+        end = coverage_end(granularity, datetime.now(timezone.utc))
+        start = end - span
+        if not self.lake.covers(symbol, granularity, start, end):
+            return None
+        # Exclude the still-forming bar that opens at ``end``
+        df = self.lake.read(symbol, granularity, start, end - timedelta(microseconds=1))
+        if df.empty:
+            return None
+        df = df.tail(count).reset_index().rename(columns={"timestamp": "time"})
+        return df[["time", "open", "high", "low", "close", "volume"]]
+    
+    def _save_to_lake(self, df: pd.DataFrame, symbol: str, granularity: str) -> None:
+        """Write fetched candles into the shared lake, covering the span returned."""
+        try:
+            first = df["time"].iloc[0]
+            # The last bar is covered through its close
+            last_close = df["time"].iloc[-1] + timedelta(seconds=self.GRANULARITIES[granularity])
+            self.lake.write(
+                symbol,
+                granularity,
+                df,
+                covered=(first, coverage_end(granularity, last_close)),
+            )
+        except Exception as e:
+            logger.warning(f"Failed to write {symbol} {granularity} candles to OHLCV lake: {e}")
+    
     def _get_cache_path(self, symbol: str, granularity: str, count: int) -> Path:
         """Generate cache file path."""
         filename = f"{symbol}_{granularity}_{count}.{self.cache_format}"
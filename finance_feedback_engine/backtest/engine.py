@@ -103,7 +103,9 @@ class Backtester:
     def run(
         self,
         data: pd.DataFrame,
-        strategy: Callable[[pd.DataFrame, int], Optional[str]]
+        strategy: Callable[[pd.DataFrame, int], Optional[str]],
+        checkpoint: Optional[Callable[[int], None]] = None,
+        checkpoint_every: int = 0
     ) -> List[Trade]:
         """
         Run backtest on historical data.
@@ -112,6 +114,10 @@ class Backtester:
             data: DataFrame with OHLCV data (time, open, high, low, close, volume)
             strategy: Function that returns 'BUY', 'SELL', or None for each candle
                      Signature: strategy(data: pd.DataFrame, index: int) -> Optional[str]
+            checkpoint: Optional callback invoked with the candle index every
+                     ``checkpoint_every`` candles. It may raise to abort the
+                     run early (e.g. ``optuna.TrialPruned``).
+            checkpoint_every: Candles between checkpoint calls (0 = never)
         
         Returns:
             List of completed trades
@@ -141,6 +147,9 @@ class Backtester:
                 
                 if signal in ["BUY", "LONG", "SELL", "SHORT"]:
                     self._open_position(current_candle, signal)
+            
+            if checkpoint and checkpoint_every > 0 and i and i % checkpoint_every == 0:
+                checkpoint(i)
         
         # Close any remaining position at end of data
         if self.current_position:
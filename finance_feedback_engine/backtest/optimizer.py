@@ -6,6 +6,7 @@ Far more efficient than grid search - learns from previous trials.
 """
 
 import logging
+import tempfile
 import pandas as pd
 from decimal import Decimal
 from typing import List, Dict, Any, Callable, Optional
@@ -14,6 +15,14 @@ import optuna
 from optuna.samplers import TPESampler
 from optuna.pruners import MedianPruner
 
+from finance_feedback_engine.optimization.parallel import (
+    is_picklable,
+    load_shared_ohlcv,
+    resolve_storage,
+    run_parallel_trials,
+    share_ohlcv,
+)
+
 from .engine import Backtester
 
 logger = logging.getLogger(__name__)
@@ -92,6 +101,9 @@ class ParameterOptimizer:
         self.fee_pct = fee_pct
         self.results: List[OptimizationResult] = []
         self.study: Optional[optuna.Study] = None
+        self._data: Optional[pd.DataFrame] = None
+        self._data_path: Optional[str] = None
+        self._prune_interval: Optional[int] = None
         
         logger.info(
             f"Optuna Parameter Optimizer initialized: "
@@ -108,7 +120,11 @@ class ParameterOptimizer:
         position_size_range: tuple = (0.005, 0.05),  # 0.5% to 5%
         min_trades: int = 5,
         timeout: Optional[int] = None,
-        n_jobs: int = 1
+        n_jobs: int = 1,
+        n_workers: int = 1,
+        storage: Optional[str] = None,
+        study_name: str = "ffe_parameter_optimization",
+        prune_interval: Optional[int] = None
     ) -> List[OptimizationResult]:
         """
         Run Bayesian optimization using Optuna.
@@ -123,6 +139,16 @@ class ParameterOptimizer:
             min_trades: Minimum trades required for valid result
             timeout: Maximum optimization time in seconds (None = no limit)
             n_jobs: Number of parallel trials (1 = sequential)
+            n_workers: Number of worker processes (>1 runs trials across a
+                process pool sharing one study storage; the strategy must be
+                picklable, e.g. a module-level function)
+            storage: Optuna storage shared by the workers: an RDB URL such as
+                ``sqlite:///study.db`` or a journal file path (default: a
+                temporary journal file)
+            study_name: Study name within ``storage`` (resumed if it exists)
+            prune_interval: Report the running return to the pruner every N
+                candles so hopeless trials stop part-way (None = only prune
+                after the backtest on ``min_trades``)
         
         Returns:
             List of optimization results, sorted by score
@@ -135,6 +161,8 @@ class ParameterOptimizer:
         
         # Store parameters for objective function
         self._data = data
+        self._data_path = None
+        self._prune_interval = prune_interval
         self._strategy = strategy
         self._min_trades = min_trades
         self._stop_loss_range = stop_loss_range
@@ -155,24 +183,57 @@ class ParameterOptimizer:
         # Suppress Optuna's verbose logging
         optuna.logging.set_verbosity(optuna.logging.WARNING)
         
-        self.study = optuna.create_study(
-            direction="maximize",  # Maximize score
-            sampler=sampler,
-            pruner=pruner,
-            study_name="ffe_parameter_optimization"
-        )
-        
-        # Run optimization
-        self.study.optimize(
-            self._objective,
-            n_trials=n_trials,
-            timeout=timeout,
-            n_jobs=n_jobs,
-            show_progress_bar=True
-        )
+        if n_workers > 1 and not is_picklable(strategy):
+            logger.warning(
+                "Strategy cannot be sent to worker processes; "
+                "falling back to in-process optimization"
+            )
+            n_workers = 1
         
-        # Extract results
-        self.results = self._extract_results()
+        with tempfile.TemporaryDirectory(prefix="ffe_optuna_") as work_dir:
+            temporary_storage = n_workers > 1 and storage is None
+            if temporary_storage:
+                storage = f"{work_dir}/study.journal"
+            
+            self.study = optuna.create_study(
+                direction="maximize",  # Maximize score
+                sampler=sampler,
+                pruner=pruner,
+                study_name=study_name,
+                storage=resolve_storage(storage) if storage else None,
+                load_if_exists=storage is not None
+            )
+            
+            if n_workers > 1:
+                # Share OHLCV read-only: workers memory-map one Arrow IPC file
+                self._data_path = share_ohlcv(data, f"{work_dir}/ohlcv.arrow")
+                run_parallel_trials(
+                    study_name=study_name,
+                    storage_spec=storage,
+                    objective=self._objective,
+                    n_trials=n_trials,
+                    n_workers=n_workers,
+                    timeout=timeout,
+                    seed=42,
+                    sampler_kwargs={"n_startup_trials": 10},
+                    pruner=pruner
+                )
+                self._data_path = None
+                if temporary_storage:
+                    # Keep the study usable after the work dir is removed
+                    self.study = self._copy_to_memory(study_name, storage)
+            else:
+                # Run optimization
+                self.study.optimize(
+                    self._objective,
+                    n_trials=n_trials,
+                    timeout=timeout,
+                    n_jobs=n_jobs,
+                    show_progress_bar=True
+                )
+            
+            # Extract results
+            self.results = self._extract_results()
         
         # Sort by score (best first)
         self.results.sort(key=lambda r: r.score, reverse=True)
@@ -234,12 +295,13 @@ class ParameterOptimizer:
         
         # Test these parameters
         result = self._test_parameters(
-            data=self._data,
+            data=self._get_data(),
             strategy=self._strategy,
             stop_loss_pct=stop_loss_pct,
             take_profit_pct=take_profit_pct,
             position_size_pct=position_size_pct,
-            trial_number=trial.number
+            trial_number=trial.number,
+            trial=trial if self._prune_interval else None
         )
         
         # Store result for later extraction
@@ -259,7 +321,8 @@ class ParameterOptimizer:
         stop_loss_pct: float,
         take_profit_pct: float,
         position_size_pct: float,
-        trial_number: int
+        trial_number: int,
+        trial: Optional[optuna.Trial] = None
     ) -> OptimizationResult:
         """
         Test a single parameter combination.
@@ -271,9 +334,14 @@ class ParameterOptimizer:
             take_profit_pct: Take profit percentage
             position_size_pct: Position size percentage
             trial_number: Optuna trial number
+            trial: When given, report the running return every
+                ``prune_interval`` candles and stop if the pruner says so
         
         Returns:
             Optimization result
+        
+        Raises:
+            optuna.TrialPruned: If the trial was pruned part-way
         """
         # Create backtester with these parameters
         backtester = Backtester(
@@ -284,8 +352,24 @@ class ParameterOptimizer:
             fee_pct=self.fee_pct
         )
         
+        def checkpoint(step: int) -> None:
+            running_return = (
+                (backtester.current_balance - self.initial_balance)
+                / self.initial_balance * 100
+            )
+            trial.report(float(running_return), step)
+            if trial.should_prune():
+                raise optuna.TrialPruned(
+                    f"Pruned at candle {step} (return {float(running_return):.2f}%)"
+                )
+        
         # Run backtest
-        trades = backtester.run(data, strategy)
+        trades = backtester.run(
+            data,
+            strategy,
+            checkpoint=checkpoint if trial is not None else None,
+            checkpoint_every=self._prune_interval or 0
+        )
         summary = backtester.get_summary()
         
         # Calculate additional metrics
@@ -309,6 +393,32 @@ class ParameterOptimizer:
         
         return result
     
+    @staticmethod
+    def _copy_to_memory(study_name: str, storage: str) -> optuna.Study:
+        """Copy a study out of file storage into an in-memory study."""
+        in_memory = optuna.storages.InMemoryStorage()
+        optuna.copy_study(
+            from_study_name=study_name,
+            from_storage=resolve_storage(storage),
+            to_storage=in_memory
+        )
+        return optuna.load_study(study_name=study_name, storage=in_memory)
+    
+    def _get_data(self) -> pd.DataFrame:
+        """Return trial data, memory-mapping the shared copy inside workers."""
+        if self._data is None and self._data_path:
+            return load_shared_ohlcv(self._data_path)
+        return self._data
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle only what worker processes need (not the study or raw data)."""
+        state = self.__dict__.copy()
+        state["study"] = None
+        state["results"] = []
+        if state.get("_data_path"):
+            state["_data"] = None
+        return state
+    
     def _extract_results(self) -> List[OptimizationResult]:
         """
         Extract results from completed Optuna trials.
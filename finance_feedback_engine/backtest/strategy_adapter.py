@@ -296,3 +296,35 @@ def create_ffe_strategy(engine):
         return adapter.get_signal(data, index)
     
     return strategy_function
+
+
+def simple_momentum_strategy(data: pd.DataFrame, index: int) -> Optional[str]:
+    """
+    Simple 10/20 moving-average momentum strategy.
+    
+    Defined at module level so it can be sent to optimizer worker processes.
+    
+    Args:
+        data: OHLCV DataFrame
+        index: Current candle index
+    
+    Returns:
+        'BUY', 'SELL', or None
+    """
+    if index < 20:
+        return None
+    
+    # Calculate momentum indicators
+    ma_short = data.iloc[index-10:index+1]['close'].mean()
+    ma_long = data.iloc[index-20:index+1]['close'].mean()
+    current_price = data.iloc[index]['close']
+    
+    # Buy when short MA > long MA and price > short MA
+    if ma_short > ma_long and current_price > ma_short:
+        return "BUY"
+    
+    # Sell when short MA < long MA and price < short MA
+    if ma_short < ma_long and current_price < ma_short:
+        return "SELL"
+    
+    return None
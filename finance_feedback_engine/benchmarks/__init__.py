@@ -0,0 +1,31 @@
+"""Offline micro-benchmarks for the engine's hot paths.
+
+Run the suite and compare against a stored baseline::
+
+    python -m finance_feedback_engine.benchmarks run --output current.json
+    python -m finance_feedback_engine.benchmarks compare benchmarks/baseline.json current.json
+
+Every case runs on seeded synthetic data with no network, LLM or database
+access, so timings are comparable across runs on the same machine.
+"""
+
+from .baseline import (
+    BenchmarkComparison,
+    compare_results,
+    format_comparison,
+    load_results,
+    save_results,
+)
+from .suite import BENCHMARKS, BenchmarkCase, benchmark, run_benchmarks
+
+__all__ = [
+    "BENCHMARKS",
+    "BenchmarkCase",
+    "BenchmarkComparison",
+    "benchmark",
+    "compare_results",
+    "format_comparison",
+    "load_results",
+    "run_benchmarks",
+    "save_results",
+]
@@ -0,0 +1,98 @@
+"""Command line entry point: ``python -m finance_feedback_engine.benchmarks``.
+
+Subcommands:
+    list                        Show registered benchmarks
+    run [-o FILE] [NAME ...]    Run benchmarks and write JSON results
+    compare BASELINE [CURRENT]  Compare results; exit 1 on regression
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from .baseline import (
+    DEFAULT_BASELINE_PATH,
+    DEFAULT_TOLERANCE,
+    compare_results,
+    format_comparison,
+    load_results,
+    save_results,
+)
+from .suite import BENCHMARKS, _load_cases, run_benchmarks
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m finance_feedback_engine.benchmarks",
+        description="Offline hot-path benchmarks with baseline regression checks.",
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("list", help="List registered benchmarks")
+
+    run = sub.add_parser("run", help="Run benchmarks and store JSON results")
+    run.add_argument("names", nargs="*", help="Benchmarks to run (default: all)")
+    run.add_argument("-o", "--output", help="Results file (default: print only)")
+    run.add_argument(
+        "--repeat", type=int, default=5, help="Timed samples per benchmark"
+    )
+    run.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help=f"Also overwrite {DEFAULT_BASELINE_PATH}",
+    )
+
+    compare = sub.add_parser("compare", help="Compare results against a baseline")
+    compare.add_argument("baseline", nargs="?", default=str(DEFAULT_BASELINE_PATH))
+    compare.add_argument(
+        "current", nargs="?", help="Results file (default: run the suite now)"
+    )
+    compare.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help="Allowed slowdown as a fraction (default: %(default)s)",
+    )
+    compare.add_argument("--repeat", type=int, default=5)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = _build_parser().parse_args(argv)
+
+    if args.command == "list":
+        _load_cases()
+        for name in sorted(BENCHMARKS):
+            print(f"{name:<30} {BENCHMARKS[name].description}")
+        return 0
+
+    if args.command == "run":
+        results = run_benchmarks(args.names or None, repeat=args.repeat)
+        for name, stats in results["results"].items():
+            print(f"{name:<30} median {stats['median_ms']:10.3f} ms")
+        if args.output:
+            print(f"Results written to {save_results(results, args.output)}")
+        if args.save_baseline:
+            print(f"Baseline written to {save_results(results, DEFAULT_BASELINE_PATH)}")
+        return 0
+
+    baseline = load_results(args.baseline)
+    if args.current:
+        current = load_results(args.current)
+    else:
+        current = run_benchmarks(list(baseline.get("results", {})), repeat=args.repeat)
+    comparisons = compare_results(baseline, current, tolerance=args.tolerance)
+    print(format_comparison(comparisons))
+
+    regressions = [c.name for c in comparisons if c.status == "regression"]
+    if regressions:
+        print(
+            f"\n{len(regressions)} regression(s) beyond {args.tolerance:.0%}: "
+            + ", ".join(regressions)
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""JSON baselines and regression comparison for benchmark results."""
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+DEFAULT_BASELINE_PATH = Path("benchmarks/baseline.json")
+DEFAULT_TOLERANCE = 0.25  # Allowed slowdown as a fraction of the baseline
+METRIC = "median_ms"
+
+
+@dataclass
+class BenchmarkComparison:
+    """Baseline vs current timing for one benchmark."""
+
+    name: str
+    baseline_ms: Optional[float]
+    current_ms: Optional[float]
+    status: str  # ok, regression, improved, new, missing
+
+    @property
+    def change(self) -> Optional[float]:
+        """Relative change (+0.30 = 30% slower)."""
+        if not self.baseline_ms or self.current_ms is None:
+            return None
+        return self.current_ms / self.baseline_ms - 1
+
+
+def save_results(results: Dict[str, Any], path: Union[str, Path]) -> Path:
+    """Write a ``run_benchmarks`` result as pretty JSON."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+        f.write("\n")
+    return path
+
+
+def load_results(path: Union[str, Path]) -> Dict[str, Any]:
+    with open(path, "r") as f:
+        return json.load(f)
+
+
+def compare_results(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    tolerance: float = DEFAULT_TOLERANCE,
+    min_delta_ms: float = 0.05,
+) -> List[BenchmarkComparison]:
+    """Flag benchmarks whose median slowed down by more than ``tolerance``.
+
+    Args:
+        baseline: Stored results
+        current: Fresh results
+        tolerance: Allowed relative slowdown (0.25 = 25%)
+        min_delta_ms: Absolute change below which timings count as noise
+
+    Returns:
+        One comparison per benchmark in either result set
+    """
+    base = baseline.get("results", {})
+    cur = current.get("results", {})
+    comparisons = []
+    for name in sorted(set(base) | set(cur)):
+        base_ms = base.get(name, {}).get(METRIC)
+        cur_ms = cur.get(name, {}).get(METRIC)
+        if base_ms is None:
+            status = "new"
+        elif cur_ms is None:
+            status = "missing"
+        elif cur_ms - base_ms > max(base_ms * tolerance, min_delta_ms):
+            status = "regression"
+        elif base_ms - cur_ms > max(base_ms * tolerance, min_delta_ms):
+            status = "improved"
+        else:
+            status = "ok"
+        comparisons.append(BenchmarkComparison(name, base_ms, cur_ms, status))
+    return comparisons
+
+
+def format_comparison(comparisons: List[BenchmarkComparison]) -> str:
+    """Plain-text table of a comparison."""
+    width = max([len(c.name) for c in comparisons] + [9])
+    lines = [
+        f"{'benchmark':<{width}}  {'baseline':>11}  {'current':>11}  {'change':>8}  status"
+    ]
+    for c in comparisons:
+        base = f"{c.baseline_ms:.3f} ms" if c.baseline_ms is not None else "-"
+        cur = f"{c.current_ms:.3f} ms" if c.current_ms is not None else "-"
+        change = f"{c.change:+.1%}" if c.change is not None else "-"
+        lines.append(
+            f"{c.name:<{width}}  {base:>11}  {cur:>11}  {change:>8}  {c.status}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,268 @@
+"""Benchmark cases for the engine's hot paths.
+
+Each case builds its inputs once in ``setup`` (scratch files go under the
+supplied directory) and returns the zero-argument callable that is timed.
+A ``cleanup`` attribute on that callable, if set, runs after timing.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from pathlib import Path
+from typing import Any, Callable
+
+from .fixtures import (
+    hashed_embedding,
+    synthetic_candles,
+    synthetic_ohlcv,
+    synthetic_price_history,
+)
+from .suite import benchmark
+
+RISK_ASSETS = ["BTCUSD", "ETHUSD", "SOLUSD", "EURUSD", "GBPUSD", "USDJPY"]
+
+
+def _momentum(data, index):
+    if index < 20:
+        return None
+    close = data["close"]
+    change = close.iloc[index] / close.iloc[index - 20] - 1
+    if change > 0.01:
+        return "BUY"
+    if change < -0.01:
+        return "SELL"
+    return None
+
+
+@benchmark("backtest_engine_run")
+def backtest_engine_run(tmp: Path) -> Callable[[], Any]:
+    """backtest.engine.Backtester.run over 2,000 hourly candles."""
+    from ..backtest.engine import Backtester
+
+    data = synthetic_ohlcv(2000).reset_index().rename(columns={"timestamp": "time"})
+    backtester = Backtester(initial_balance=Decimal("10000"))
+    return lambda: backtester.run(data, _momentum)
+
+
+class _StubDecisionEngine:
+    """Alternates BUY and SELL without any model calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def generate_decision(self, asset_pair, market_data, *args, **kwargs):
+        self.calls += 1
+        price = float(market_data.get("close", 100.0))
+        return {
+            "id": f"bench-{self.calls}",
+            "asset_pair": asset_pair,
+            "action": "BUY" if self.calls % 2 else "SELL",
+            "confidence": 75,
+            "suggested_amount": 100.0,
+            "entry_price": price,
+        }
+
+
+@benchmark("backtesting_run_backtest")
+def backtesting_run_backtest(tmp: Path) -> Callable[[], Any]:
+    """backtesting.Backtester.run_backtest over 48 hourly candles with a stub engine."""
+    from unittest.mock import patch
+
+    from ..backtesting.backtester import Backtester
+
+    data = synthetic_ohlcv(48)
+    # The stub engine needs no local models; skip the agent's Ollama probe
+    offline = patch(
+        "finance_feedback_engine.utils.ollama_readiness.verify_ollama_for_agent",
+        return_value=(True, None),
+    )
+
+    def run():
+        backtester = Backtester(
+            historical_data_provider=None,
+            initial_balance=10000.0,
+            enable_decision_cache=False,
+            enable_portfolio_memory=False,
+            config={
+                "persistence": {"storage_path": str(tmp)},
+                "decision_engine": {"ai_provider": "mock"},
+            },
+        )
+        try:
+            with offline:
+                return backtester.run_backtest(
+                    "BTCUSD",
+                    data.index[0].to_pydatetime(),
+                    data.index[-1].to_pydatetime(),
+                    _StubDecisionEngine(),
+                    data_override=data,
+                )
+        finally:
+            backtester.close()
+
+    return run
+
+
+@benchmark("mock_live_pulse", number=20)
+def mock_live_pulse(tmp: Path) -> Callable[[], Any]:
+    """MockLiveProvider.get_pulse_data on one-minute candles."""
+    from ..data_providers.mock_live_provider import MockLiveProvider
+
+    data = synthetic_ohlcv(6 * 1440, freq="1min")
+    data = data.reset_index().rename(columns={"timestamp": "date"})
+    provider = MockLiveProvider(data, asset_pair="BTCUSD")
+    provider.initialize_pulse_mode("1m")
+    loop = asyncio.new_event_loop()
+
+    def pulse():
+        if not provider.advance_pulse():
+            provider.initialize_pulse_mode("1m")
+            provider.advance_pulse()
+        return loop.run_until_complete(provider.get_pulse_data())
+
+    # Start far enough in that every timeframe has full history
+    for _ in range(300):
+        provider.advance_pulse()
+    pulse.cleanup = loop.close
+    return pulse
+
+
+@benchmark("timeframe_indicators", number=10)
+def timeframe_indicators(tmp: Path) -> Callable[[], Any]:
+    """TimeframeAggregator trend/indicator pass over 300 candles."""
+    from ..data_providers.timeframe_aggregator import TimeframeAggregator
+
+    aggregator = TimeframeAggregator(data_provider=None)
+    candles = synthetic_candles(300)
+    return lambda: aggregator._detect_trend(candles, "1h")
+
+
+@benchmark("decision_store_recent", number=5)
+def decision_store_recent(tmp: Path) -> Callable[[], Any]:
+    """DecisionStore.get_recent_decisions over 1,000 stored decisions."""
+    from ..persistence.decision_store import DecisionStore
+
+    store = DecisionStore({"storage_path": str(tmp / "decisions")})
+    for i in range(1000):
+        store.save_decision(
+            {
+                "id": f"dec-{i:05d}",
+                "asset_pair": RISK_ASSETS[i % len(RISK_ASSETS)],
+                "action": ("BUY", "SELL", "HOLD")[i % 3],
+                "confidence": 50 + i % 50,
+                "timestamp": f"2024-01-{1 + i % 28:02d}T00:00:00+00:00",
+            }
+        )
+    return lambda: store.get_recent_decisions(limit=50, asset_pair="EURUSD")
+
+
+@benchmark("vector_memory_find_similar", number=10)
+def vector_memory_find_similar(tmp: Path) -> Callable[[], Any]:
+    """VectorMemory.find_similar against 5,000 stored vectors."""
+    from ..memory.vector_store import VectorMemory
+
+    class _HashedVectorMemory(VectorMemory):
+        def get_embedding(self, text):
+            return hashed_embedding(text)
+
+    memory = _HashedVectorMemory(str(tmp / "vectors.pkl"))
+    for i in range(5000):
+        memory.add_record(f"rec-{i}", f"BTCUSD trade {i} outcome", {"i": i})
+    return lambda: memory.find_similar("BTCUSD uptrend breakout", top_k=10)
+
+
+@benchmark("portfolio_memory_context", number=5)
+def portfolio_memory_context(tmp: Path) -> Callable[[], Any]:
+    """PortfolioMemoryEngine.generate_context over 500 recorded outcomes."""
+    from ..memory.portfolio_memory import PortfolioMemoryEngine, TradeOutcome
+
+    engine = PortfolioMemoryEngine({"persistence": {"storage_path": str(tmp)}})
+    # Spread over the long-term window so both recent and 90-day stats are built
+    now = datetime.now(timezone.utc)
+    for i in range(500):
+        pnl = ((i * 37) % 200 - 90) / 10
+        entry = now - timedelta(hours=4 * (500 - i))
+        # Appended directly: persisting each outcome is not what is measured
+        engine.trade_outcomes.append(
+            TradeOutcome(
+                decision_id=f"dec-{i}",
+                asset_pair=RISK_ASSETS[i % len(RISK_ASSETS)],
+                action="BUY" if i % 2 else "SELL",
+                entry_timestamp=entry.isoformat(),
+                exit_timestamp=(entry + timedelta(hours=3)).isoformat(),
+                entry_price=100.0,
+                exit_price=100.0 + pnl,
+                position_size=1.0,
+                realized_pnl=pnl,
+                pnl_percentage=pnl,
+                holding_period_hours=3.0,
+                ai_provider=("local", "qwen", "gemini")[i % 3],
+                decision_confidence=60 + i % 40,
+                was_profitable=pnl > 0,
+            )
+        )
+    return lambda: engine.generate_context(asset_pair="BTCUSD")
+
+
+def _holdings():
+    history = synthetic_price_history(RISK_ASSETS, 90)
+    holdings = {
+        asset: {"quantity": 1.0 + i, "current_price": history[asset][-1]["price"]}
+        for i, asset in enumerate(RISK_ASSETS)
+    }
+    return holdings, history
+
+
+@benchmark("risk_var", number=10)
+def risk_var(tmp: Path) -> Callable[[], Any]:
+    """VaRCalculator.calculate_portfolio_var for six assets over 90 days."""
+    from ..risk.var_calculator import VaRCalculator
+
+    holdings, history = _holdings()
+    calculator = VaRCalculator(lookback_days=60)
+    return lambda: calculator.calculate_portfolio_var(holdings, history, 0.95)
+
+
+@benchmark("risk_correlation", number=10)
+def risk_correlation(tmp: Path) -> Callable[[], Any]:
+    """CorrelationAnalyzer.analyze_platform_correlations for six assets."""
+    from ..risk.correlation_analyzer import CorrelationAnalyzer
+
+    holdings, history = _holdings()
+    analyzer = CorrelationAnalyzer(lookback_days=30)
+    return lambda: analyzer.analyze_platform_correlations(holdings, history, "coinbase")
+
+
+@benchmark("ensemble_aggregate", number=20)
+def ensemble_aggregate(tmp: Path) -> Callable[[], Any]:
+    """EnsembleDecisionManager.aggregate_decisions across four providers."""
+    from ..decision_engine.ensemble_manager import EnsembleDecisionManager
+
+    providers = ["local", "qwen", "gemini", "codex"]
+    manager = EnsembleDecisionManager(
+        {
+            "ensemble": {
+                "enabled_providers": providers,
+                "provider_weights": {p: 1 / len(providers) for p in providers},
+                "voting_strategy": "weighted",
+            }
+        }
+    )
+    decisions = {
+        p: {
+            "action": ("BUY", "BUY", "SELL", "HOLD")[i],
+            "confidence": 60 + 10 * i,
+            "reasoning": f"{p} view",
+            "amount": 100.0,
+        }
+        for i, p in enumerate(providers)
+    }
+    loop = asyncio.new_event_loop()
+
+    def aggregate():
+        return loop.run_until_complete(
+            manager.aggregate_decisions(dict(decisions), failed_providers=[])
+        )
+
+    aggregate.cleanup = loop.close
+    return aggregate
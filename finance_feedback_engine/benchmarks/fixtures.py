@@ -0,0 +1,63 @@
+"""Seeded synthetic inputs shared by the benchmark cases."""
+
+import hashlib
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List
+
+import numpy as np
+import pandas as pd
+
+SEED = 7
+
+
+def synthetic_ohlcv(
+    periods: int, freq: str = "1h", start: str = "2024-01-01", seed: int = SEED
+) -> pd.DataFrame:
+    """Random-walk OHLCV frame indexed by UTC timestamp."""
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.004, periods)))
+    open_ = np.concatenate([[close[0]], close[:-1]])
+    spread = np.abs(rng.normal(0, 0.002, periods)) * close
+    index = pd.date_range(start, periods=periods, freq=freq, tz="UTC", name="timestamp")
+    return pd.DataFrame(
+        {
+            "open": open_,
+            "high": np.maximum(open_, close) + spread,
+            "low": np.minimum(open_, close) - spread,
+            "close": close,
+            "volume": rng.uniform(10, 1000, periods),
+        },
+        index=index,
+    )
+
+
+def synthetic_candles(periods: int, seed: int = SEED) -> List[Dict[str, Any]]:
+    """The same random walk as a list of candle dicts."""
+    frame = synthetic_ohlcv(periods, seed=seed)
+    return [
+        {"timestamp": int(ts.timestamp()), **row}
+        for ts, row in zip(frame.index, frame.to_dict("records"))
+    ]
+
+
+def synthetic_price_history(
+    assets: List[str], days: int, seed: int = SEED
+) -> Dict[str, List[Dict[str, float]]]:
+    """Daily prices per asset in the ``[{'date', 'price'}]`` layout risk code uses."""
+    rng = np.random.default_rng(seed)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    dates = [(start + timedelta(days=i)).strftime("%Y-%m-%d") for i in range(days)]
+    common = rng.normal(0, 0.01, days)
+    history = {}
+    for asset in assets:
+        returns = 0.6 * common + rng.normal(0, 0.01, days)
+        prices = 100 * np.exp(np.cumsum(returns))
+        history[asset] = [{"date": d, "price": float(p)} for d, p in zip(dates, prices)]
+    return history
+
+
+def hashed_embedding(text: str, dim: int = 256) -> np.ndarray:
+    """Deterministic stand-in for an embedding model."""
+    digest = hashlib.sha256(text.encode()).digest()
+    rng = np.random.default_rng(int.from_bytes(digest[:8], "little"))
+    return rng.normal(size=dim)
@@ -0,0 +1,129 @@
+"""Benchmark registry and timing runner."""
+
+import gc
+import logging
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# A setup function gets a scratch directory and returns the callable to time
+SetupFn = Callable[[Path], Callable[[], Any]]
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """One timed hot path."""
+
+    name: str
+    setup: SetupFn
+    number: int = 1  # Calls per timed sample
+    description: str = ""
+
+
+BENCHMARKS: Dict[str, BenchmarkCase] = {}
+
+
+def benchmark(name: str, number: int = 1) -> Callable[[SetupFn], SetupFn]:
+    """Register ``setup`` as the benchmark ``name``."""
+
+    def decorator(setup: SetupFn) -> SetupFn:
+        doc = (setup.__doc__ or "").strip().splitlines()
+        BENCHMARKS[name] = BenchmarkCase(
+            name=name, setup=setup, number=number, description=doc[0] if doc else ""
+        )
+        return setup
+
+    return decorator
+
+
+def _load_cases() -> None:
+    # Registration happens on import
+    from . import cases  # noqa: F401
+
+
+def time_case(case: BenchmarkCase, repeat: int = 5, warmup: int = 1) -> Dict[str, Any]:
+    """Time ``case`` and summarise per-call latency in milliseconds."""
+    with tempfile.TemporaryDirectory(prefix=f"ffe-bench-{case.name}-") as tmp:
+        fn = case.setup(Path(tmp))
+        samples = []
+        gc_was_enabled = gc.isenabled()
+        try:
+            for _ in range(warmup):
+                fn()
+            gc.disable()
+            for _ in range(repeat):
+                started = time.perf_counter()
+                for _ in range(case.number):
+                    fn()
+                samples.append((time.perf_counter() - started) / case.number * 1000)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+            cleanup = getattr(fn, "cleanup", None)
+            if callable(cleanup):
+                cleanup()
+
+    return {
+        "median_ms": statistics.median(samples),
+        "min_ms": min(samples),
+        "mean_ms": statistics.fmean(samples),
+        "stdev_ms": statistics.stdev(samples) if len(samples) > 1 else 0.0,
+        "repeat": repeat,
+        "number": case.number,
+    }
+
+
+def run_benchmarks(
+    names: Optional[Iterable[str]] = None,
+    repeat: int = 5,
+    warmup: int = 1,
+    quiet: bool = True,
+) -> Dict[str, Any]:
+    """Run the selected benchmarks (all by default).
+
+    Args:
+        names: Benchmark names to run; unknown names raise ``KeyError``
+        repeat: Timed samples per benchmark
+        warmup: Untimed calls before sampling
+        quiet: Silence library logging while timing
+
+    Returns:
+        ``{"metadata": {...}, "results": {name: stats}}``
+    """
+    _load_cases()
+    selected = list(names) if names else sorted(BENCHMARKS)
+    unknown = [n for n in selected if n not in BENCHMARKS]
+    if unknown:
+        raise KeyError(f"Unknown benchmark(s): {', '.join(unknown)}")
+
+    results: Dict[str, Any] = {}
+    previous_disable = logging.root.manager.disable
+    if quiet:
+        logging.disable(logging.CRITICAL)
+    try:
+        for name in selected:
+            results[name] = time_case(BENCHMARKS[name], repeat=repeat, warmup=warmup)
+    finally:
+        logging.disable(previous_disable)
+
+    for name, stats in results.items():
+        logger.info(f"{name}: median {stats['median_ms']:.3f} ms")
+
+    return {
+        "metadata": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "machine": platform.machine(),
+            "repeat": repeat,
+        },
+        "results": results,
+    }
@@ -61,6 +61,16 @@ except ImportError:
     "--study-name",
     help="Name for the optimization study (for resuming)",
 )
+@click.option(
+    "--n-jobs",
+    type=int,
+    default=1,
+    help="Worker processes for parallel trials (default: 1)",
+)
+@click.option(
+    "--storage",
+    help="Shared study storage: sqlite:///path.db or a journal file path (for resuming)",
+)
 @click.option(
     "--output-dir",
     type=click.Path(),
@@ -93,6 +103,8 @@ def optimize(
     multi_objective,
     optimize_weights,
     study_name,
+    n_jobs,
+    storage,
     output_dir,
     mlflow_experiment,
     no_mlflow,
@@ -187,6 +199,7 @@ def optimize(
                         "n_trials": n_trials,
                         "multi_objective": multi_objective,
                         "optimize_weights": optimize_weights,
+                        "n_jobs": n_jobs,
                     }
                 )
 
@@ -197,6 +210,8 @@ def optimize(
                     timeout=timeout,
                     show_progress=show_progress,
                     study_name=study_name,
+                    n_jobs=n_jobs,
+                    storage=storage,
                 )
 
                 # Log results
@@ -220,6 +235,8 @@ def optimize(
                 timeout=timeout,
                 show_progress=show_progress,
                 study_name=study_name,
+                n_jobs=n_jobs,
+                storage=storage,
             )
 
     except Exception as e:
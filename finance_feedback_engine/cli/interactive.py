@@ -8,10 +8,21 @@ console = Console()
 
 def _build_command_index(main_cli):
     """Return a list of (name, help) for top-level commands in the Click group."""
+    ctx = click.Context(main_cli, info_name=main_cli.name)
+    # Lazily registered commands keep their help in the registry, so listing
+    # them does not import their modules
+    lazy_commands = getattr(main_cli, "lazy_commands", {})
     cmds = []
-    for name, cmd in sorted(main_cli.commands.items()):
-        # Shorten help to first sentence
-        help_text = (cmd.help or "").strip().split("\n")[0]
+    for name in main_cli.list_commands(ctx):
+        cmd = main_cli.commands.get(name)
+        if cmd is None and name in lazy_commands:
+            help_text = lazy_commands[name][1]
+        else:
+            cmd = cmd or main_cli.get_command(ctx, name)
+            if cmd is None:
+                continue
+            # Shorten help to first sentence
+            help_text = (cmd.help or "").strip().split("\n")[0]
         if len(help_text) > 120:
             help_text = help_text[:117] + "..."
         cmds.append((name, help_text))
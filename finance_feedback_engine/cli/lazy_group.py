@@ -0,0 +1,74 @@
+"""Click group whose subcommands are imported on first use.
+
+Command modules pull in the engine, pandas, sklearn and the platform SDKs,
+so importing all of them up front made ``ffe --help`` take seconds. A
+``LazyGroup`` only knows each command's import path and one-line help
+until the command is actually invoked.
+"""
+
+import importlib
+from typing import Dict, List, Optional, Tuple
+
+import click
+
+
+class LazyGroup(click.Group):
+    """``click.Group`` that resolves registered commands on demand.
+
+    Args:
+        lazy_commands: Mapping of command name to ``(import_path, short_help)``
+            where ``import_path`` is ``"package.module:attribute"``
+    """
+
+    def __init__(
+        self,
+        *args,
+        lazy_commands: Optional[Dict[str, Tuple[str, str]]] = None,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.lazy_commands: Dict[str, Tuple[str, str]] = dict(lazy_commands or {})
+
+    def add_lazy_command(
+        self, name: str, import_path: str, short_help: str = ""
+    ) -> None:
+        """Register ``name`` without importing its module."""
+        self.lazy_commands[name] = (import_path, short_help)
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_commands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        command = super().get_command(ctx, cmd_name)
+        if command is None and cmd_name in self.lazy_commands:
+            command = self._load(cmd_name)
+        return command
+
+    def _load(self, cmd_name: str) -> click.Command:
+        import_path, _ = self.lazy_commands[cmd_name]
+        module_name, attr = import_path.split(":", 1)
+        command = getattr(importlib.import_module(module_name), attr)
+        if not isinstance(command, click.Command):
+            raise TypeError(f"{import_path} is not a click command")
+        # Cache so later lookups skip the import machinery
+        self.add_command(command, name=cmd_name)
+        return command
+
+    def format_commands(
+        self, ctx: click.Context, formatter: click.HelpFormatter
+    ) -> None:
+        """Like ``click.Group.format_commands`` but without loading lazy commands."""
+        rows = []
+        for name in self.list_commands(ctx):
+            if name in self.commands:
+                command = self.commands[name]
+                if command.hidden:
+                    continue
+                help_text = command.get_short_help_str(formatter.width - 6 - len(name))
+            else:
+                help_text = self.lazy_commands[name][1]
+            rows.append((name, help_text))
+
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
@@ -16,60 +16,136 @@ from packaging.requirements import Requirement
 from rich.console import Console
 from rich.table import Table
 
-from finance_feedback_engine.cli.commands.agent import _run_live_dashboard
-from finance_feedback_engine.cli.commands.agent import monitor as monitor_command
-from finance_feedback_engine.cli.commands.agent import run_agent as run_agent_command
-
-# Export run_agent for backward compatibility with tests
-run_agent = run_agent_command
-
-# Export _run_live_market_view as alias for backward compatibility with tests
-_run_live_market_view = _run_live_dashboard
-from finance_feedback_engine.cli.commands.analysis import analyze as analyze_command
-from finance_feedback_engine.cli.commands.analysis import history as history_command
-from finance_feedback_engine.cli.commands.backtest import backtest as backtest_command
-from finance_feedback_engine.cli.commands.backtest import (
-    monte_carlo as monte_carlo_command,
-)
-from finance_feedback_engine.cli.commands.backtest import (
-    portfolio_backtest as portfolio_backtest_command,
-)
-from finance_feedback_engine.cli.commands.backtest import (
-    walk_forward as walk_forward_command,
-)
-from finance_feedback_engine.cli.commands.demo import demo as demo_command
-from finance_feedback_engine.cli.commands.experiment import (
-    experiment as experiment_command,
-)
-from finance_feedback_engine.cli.commands.behavior_experiment import (
-    behavior_experiment as behavior_experiment_command,
-)
-from finance_feedback_engine.cli.commands.frontend import frontend as frontend_command
-from finance_feedback_engine.cli.commands.memory import (
-    learning_report as learning_report_command,
-)
-from finance_feedback_engine.cli.commands.memory import (
-    prune_memory as prune_memory_command,
-)
-from finance_feedback_engine.utils.retention_manager import create_default_manager
-from finance_feedback_engine.cli.commands.optimize import optimize as optimize_command
-from finance_feedback_engine.cli.commands.trading import balance as balance_command
-from finance_feedback_engine.cli.commands.trading import execute as execute_command
-from finance_feedback_engine.cli.commands.trading import _decision_display_action, _decision_display_label
-from finance_feedback_engine.cli.commands.analytics import (
-    daily_pnl as daily_pnl_command,
-    weekly_pnl as weekly_pnl_command,
-    monthly_pnl as monthly_pnl_command,
-    asset_breakdown as asset_breakdown_command,
-    export_csv as export_csv_command,
-)
-from finance_feedback_engine.cli.interactive import start_interactive_session
-from finance_feedback_engine.core import FinanceFeedbackEngine
-from finance_feedback_engine.dashboard import (
-    PortfolioDashboardAggregator,
-    display_portfolio_dashboard,
-)
-from finance_feedback_engine.monitoring.metrics import inc, init_metrics
+from finance_feedback_engine.cli.lazy_group import LazyGroup
+
+# Modular commands, imported only when invoked: (import path, short help)
+LAZY_COMMANDS = {
+    "demo": (
+        "finance_feedback_engine.cli.commands.demo:demo",
+        "Run interactive demo of Finance Feedback Engine.",
+    ),
+    "analyze": (
+        "finance_feedback_engine.cli.commands.analysis:analyze",
+        "Analyze an asset pair and generate trading decision.",
+    ),
+    "history": (
+        "finance_feedback_engine.cli.commands.analysis:history",
+        "Show decision history.",
+    ),
+    "balance": (
+        "finance_feedback_engine.cli.commands.trading:balance",
+        "Show current account balances.",
+    ),
+    "execute": (
+        "finance_feedback_engine.cli.commands.trading:execute",
+        "Execute a trading decision.",
+    ),
+    "backtest": (
+        "finance_feedback_engine.cli.commands.backtest:backtest",
+        "Run AI-driven backtest using the decision engine.",
+    ),
+    "portfolio-backtest": (
+        "finance_feedback_engine.cli.commands.backtest:portfolio_backtest",
+        "Run multi-asset portfolio backtest with correlation-aware position sizing.",
+    ),
+    "walk-forward": (
+        "finance_feedback_engine.cli.commands.backtest:walk_forward",
+        "Run walk-forward analysis with overfitting detection.",
+    ),
+    "monte-carlo": (
+        "finance_feedback_engine.cli.commands.backtest:monte_carlo",
+        "Run Monte Carlo simulation with price perturbations.",
+    ),
+    "experiment": (
+        "finance_feedback_engine.cli.commands.experiment:experiment",
+        "Run an Optuna experiment across multiple asset pairs.",
+    ),
+    "behavior-experiment": (
+        "finance_feedback_engine.cli.commands.behavior_experiment:behavior_experiment",
+        "Analyze whether judged-open decisions cluster just below execution thresholds.",
+    ),
+    "optimize": (
+        "finance_feedback_engine.cli.commands.optimize:optimize",
+        "Run hyperparameter optimization using Optuna with MLflow tracking.",
+    ),
+    "learning-report": (
+        "finance_feedback_engine.cli.commands.memory:learning_report",
+        "Generate comprehensive learning validation report.",
+    ),
+    "prune-memory": (
+        "finance_feedback_engine.cli.commands.memory:prune_memory",
+        "Prune old trade outcomes from portfolio memory.",
+    ),
+    "run-agent": (
+        "finance_feedback_engine.cli.commands.agent:run_agent",
+        "Starts the autonomous trading agent.",
+    ),
+    "monitor": (
+        "finance_feedback_engine.cli.commands.agent:monitor",
+        "Live trade monitoring commands.",
+    ),
+    "frontend": (
+        "finance_feedback_engine.cli.commands.frontend:frontend",
+        "Manage the React frontend (dev, build, serve).",
+    ),
+    # Analytics commands
+    "daily-pnl": (
+        "finance_feedback_engine.cli.commands.analytics:daily_pnl",
+        "Show daily P&L summary with performance metrics.",
+    ),
+    "weekly-pnl": (
+        "finance_feedback_engine.cli.commands.analytics:weekly_pnl",
+        "Show weekly P&L summary with performance metrics.",
+    ),
+    "monthly-pnl": (
+        "finance_feedback_engine.cli.commands.analytics:monthly_pnl",
+        "Show monthly P&L summary with performance metrics.",
+    ),
+    "asset-breakdown": (
+        "finance_feedback_engine.cli.commands.analytics:asset_breakdown",
+        "Show P&L breakdown by asset pair.",
+    ),
+    "export-csv": (
+        "finance_feedback_engine.cli.commands.analytics:export_csv",
+        "Export trade outcomes to CSV for Metabase integration.",
+    ),
+}
+
+# Heavy names kept importable from (and patchable on) this module but only
+# loaded on first access. Code below goes through _lazy() rather than the
+# bare global so a test patch of e.g. ``cli.main.FinanceFeedbackEngine`` wins.
+_LAZY_ATTRS = {
+    "FinanceFeedbackEngine": ("finance_feedback_engine.core", "FinanceFeedbackEngine"),
+    "PortfolioDashboardAggregator": (
+        "finance_feedback_engine.dashboard",
+        "PortfolioDashboardAggregator",
+    ),
+    "display_portfolio_dashboard": (
+        "finance_feedback_engine.dashboard",
+        "display_portfolio_dashboard",
+    ),
+    # Backward-compatible exports used by tests
+    "run_agent": ("finance_feedback_engine.cli.commands.agent", "run_agent"),
+    "_run_live_market_view": (
+        "finance_feedback_engine.cli.commands.agent",
+        "_run_live_dashboard",
+    ),
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        import importlib
+
+        module_name, attr = _LAZY_ATTRS[name]
+        return getattr(importlib.import_module(module_name), attr)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _lazy(name):
+    """Return a module-level name, honouring patches, importing it if needed."""
+    return globals().get(name) or __getattr__(name)
+
 
 # from rich import print as rprint  # unused
 
@@ -523,7 +599,7 @@ def _set_nested(config: dict, keys: tuple, value):
     cur[keys[-1]] = value
 
 
-@click.group(invoke_without_command=True)
+@click.group(cls=LazyGroup, lazy_commands=LAZY_COMMANDS, invoke_without_command=True)
 @click.option(
     "--config",
     "-c",
@@ -587,6 +663,8 @@ def cli(ctx, config, verbose, trace, otlp_endpoint, interactive):
 
     # Initialize metrics early (safe no-op if prometheus_client missing)
     try:
+        from finance_feedback_engine.monitoring.metrics import init_metrics
+
         init_metrics()
     except Exception as e:
         logger.warning(f"Failed to initialize metrics: {e}")
@@ -678,6 +756,8 @@ def cli(ctx, config, verbose, trace, otlp_endpoint, interactive):
             if Confirm.ask("Would you like to update/install them now?"):
                 # Invoke update-ai command with auto-install flag
                 ctx.invoke(update_ai, auto_install=True)
+        from finance_feedback_engine.cli.interactive import start_interactive_session
+
         start_interactive_session(cli)
         return
 
@@ -1194,14 +1274,14 @@ def dashboard(ctx):
     """Show unified dashboard aggregating all platform portfolios."""
     try:
         config = ctx.obj["config"]
-        engine = FinanceFeedbackEngine(config)
+        engine = _lazy("FinanceFeedbackEngine")(config)
 
         # For now, we only have one platform instance
         # Future: support multiple platforms from config
         platforms = [engine.trading_platform]
 
         # Aggregate portfolio data
-        aggregator = PortfolioDashboardAggregator(platforms)
+        aggregator = _lazy("PortfolioDashboardAggregator")(platforms)
         # Support tests that patch get_aggregated_portfolio
         if hasattr(aggregator, "get_aggregated_portfolio"):
             aggregated_data = aggregator.get_aggregated_portfolio()
@@ -1210,7 +1290,7 @@ def dashboard(ctx):
 
         # Display unified dashboard; if aggregator returns simple dict, print summary
         try:
-            display_portfolio_dashboard(aggregated_data)
+            _lazy("display_portfolio_dashboard")(aggregated_data)
         except (Exception, AttributeError, TypeError):
             if isinstance(aggregated_data, dict):
                 console.print("[bold cyan]Portfolio Dashboard[/bold cyan]")
@@ -1250,6 +1330,11 @@ def approve(ctx, decision_id):
         config = ctx.obj["config"]
 
         # Load decision from storage
+        from finance_feedback_engine.cli.commands.trading import (
+            _decision_display_action,
+            _decision_display_label,
+        )
+        from finance_feedback_engine.monitoring.metrics import inc
         from finance_feedback_engine.persistence.decision_store import DecisionStore
 
         DecisionStore(config={"storage_path": "data/decisions"})
@@ -1276,7 +1361,7 @@ def approve(ctx, decision_id):
             decision = json.load(f)
 
         # Initialize engine after confirming decision exists
-        engine = FinanceFeedbackEngine(config)
+        engine = _lazy("FinanceFeedbackEngine")(config)
 
         # Display decision details in Rich Panel with Table
         from rich.panel import Panel
@@ -1535,7 +1620,7 @@ def status(ctx):
         )
 
         # Try to initialize engine and fetch account info for dynamic leverage
-        engine = FinanceFeedbackEngine(config)
+        engine = _lazy("FinanceFeedbackEngine")(config)
         console.print("\n[bold green]✓ Engine initialized successfully[/bold green]")
 
         # Fetch and display dynamic leverage from exchange
@@ -1577,7 +1662,7 @@ def positions(ctx, save):
     
     try:
         config = ctx.obj["config"]
-        engine = FinanceFeedbackEngine(config)
+        engine = _lazy("FinanceFeedbackEngine")(config)
 
         platform = getattr(engine, "trading_platform", None)
         if platform is None:
@@ -1795,7 +1880,7 @@ def track_trades(ctx):
     
     try:
         config = ctx.obj["config"]
-        engine = FinanceFeedbackEngine(config)
+        engine = _lazy("FinanceFeedbackEngine")(config)
 
         platform = getattr(engine, "trading_platform", None)
         if platform is None:
@@ -1853,7 +1938,7 @@ def check_volatility(ctx, send_alerts):
     
     try:
         config = ctx.obj["config"]
-        engine = FinanceFeedbackEngine(config)
+        engine = _lazy("FinanceFeedbackEngine")(config)
 
         platform = getattr(engine, "trading_platform", None)
         if platform is None:
@@ -1973,7 +2058,7 @@ def backtest_simple(ctx, symbol, days, granularity, no_cache):
         console.print(f"\n[bold cyan]═══ BACKTESTING ENGINE (THR-300) ═══[/bold cyan]\n")
         
         config = ctx.obj["config"]
-        engine = FinanceFeedbackEngine(config)
+        engine = _lazy("FinanceFeedbackEngine")(config)
         platform = getattr(engine, "trading_platform", None)
         
         if platform is None:
@@ -2147,9 +2232,10 @@ def backtest_simple(ctx, symbol, days, granularity, no_cache):
 @click.option("--n-trials", default=100, type=int, help="Number of Optuna trials (default: 100)")
 @click.option("--min-trades", default=5, type=int, help="Minimum trades for valid result (default: 5)")
 @click.option("--use-ffe", is_flag=True, help="Use full FFE decision engine (requires initialization)")
+@click.option("--workers", default=1, type=int, help="Worker processes for parallel trials (default: 1)")
 @click.option("--export", type=str, help="Export results to CSV file")
 @click.pass_context
-def optimize_params(ctx, symbol, days, granularity, n_trials, min_trades, use_ffe, export):
+def optimize_params(ctx, symbol, days, granularity, n_trials, min_trades, use_ffe, workers, export):
     """
     Run Bayesian parameter optimization using Optuna (THR-301).
     
@@ -2158,7 +2244,10 @@ def optimize_params(ctx, symbol, days, granularity, n_trials, min_trades, use_ff
     """
     from finance_feedback_engine.backtest import HistoricalDataManager, Backtester
     from finance_feedback_engine.backtest.optimizer import ParameterOptimizer
-    from finance_feedback_engine.backtest.strategy_adapter import create_ffe_strategy
+    from finance_feedback_engine.backtest.strategy_adapter import (
+        create_ffe_strategy,
+        simple_momentum_strategy,
+    )
     from decimal import Decimal
     import asyncio
     
@@ -2166,7 +2255,7 @@ def optimize_params(ctx, symbol, days, granularity, n_trials, min_trades, use_ff
         console.print(f"\n[bold cyan]═══ OPTUNA PARAMETER OPTIMIZATION (THR-301) ═══[/bold cyan]\n")
         
         config = ctx.obj["config"]
-        engine = FinanceFeedbackEngine(config)
+        engine = _lazy("FinanceFeedbackEngine")(config)
         platform = getattr(engine, "trading_platform", None)
         
         if platform is None:
@@ -2281,26 +2370,6 @@ def optimize_params(ctx, symbol, days, granularity, n_trials, min_trades, use_ff
         
         if not use_ffe:
             # Simple momentum strategy (fallback or default)
-            def simple_momentum_strategy(data, index):
-                """Simple momentum strategy for optimization."""
-                if index < 20:
-                    return None
-                
-                # Calculate momentum indicators
-                ma_short = data.iloc[index-10:index+1]['close'].mean()
-                ma_long = data.iloc[index-20:index+1]['close'].mean()
-                current_price = data.iloc[index]['close']
-                
-                # Buy when short MA > long MA and price > short MA
-                if ma_short > ma_long and current_price > ma_short:
-                    return "BUY"
-                
-                # Sell when short MA < long MA and price < short MA
-                if ma_short < ma_long and current_price < ma_short:
-                    return "SELL"
-                
-                return None
-            
             strategy = simple_momentum_strategy
             console.print("  ✓ Simple momentum strategy loaded")
         
@@ -2325,7 +2394,9 @@ def optimize_params(ctx, symbol, days, granularity, n_trials, min_trades, use_ff
             position_size_range=(0.005, 0.05),  # 0.5% to 5%
             min_trades=min_trades,
             timeout=None,  # No timeout
-            n_jobs=1  # Sequential execution (parallel would need careful async handling)
+            n_jobs=1,  # In-process trials stay sequential (FFE strategy is async-bound)
+            n_workers=1 if use_ffe else workers,
+            prune_interval=max(len(df) // 10, 1)
         )
         
         if not results:
@@ -2401,7 +2472,7 @@ def wipe_decisions(ctx, confirm):
     """Delete all stored trading decisions."""
     try:
         config = ctx.obj["config"]
-        engine = FinanceFeedbackEngine(config)
+        engine = _lazy("FinanceFeedbackEngine")(config)
 
         # Get current count
         count = engine.decision_store.get_decision_count()
@@ -2463,7 +2534,7 @@ def retrain_meta_learner(ctx, force):
         from train_meta_learner import run_training
 
         config = ctx.obj["config"]
-        engine = FinanceFeedbackEngine(config)
+        engine = _lazy("FinanceFeedbackEngine")(config)
 
         console.print("\n[bold cyan]Checking meta-learner performance...[/bold cyan]")
 
@@ -2590,6 +2661,8 @@ def cleanup_data(policy: str, dry_run: bool, status: bool):
         python main.py cleanup-data --dry-run           # Preview what would be deleted
         python main.py cleanup-data --status            # Show current status
     """
+    from finance_feedback_engine.utils.retention_manager import create_default_manager
+
     try:
         manager = create_default_manager()
 
@@ -2628,32 +2701,7 @@ def cleanup_data(policy: str, dry_run: bool, status: bool):
 # Infrastructure commands: (remaining in this file for now)
 # ============================================
 
-# Register commands from modular command files
-cli.add_command(demo_command, name="demo")
-cli.add_command(analyze_command, name="analyze")
-cli.add_command(history_command, name="history")
-cli.add_command(balance_command, name="balance")
-cli.add_command(execute_command, name="execute")
-cli.add_command(backtest_command, name="backtest")
-cli.add_command(portfolio_backtest_command, name="portfolio-backtest")
-cli.add_command(walk_forward_command, name="walk-forward")
-cli.add_command(monte_carlo_command, name="monte-carlo")
-cli.add_command(experiment_command, name="experiment")
-cli.add_command(behavior_experiment_command, name="behavior-experiment")
-cli.add_command(optimize_command, name="optimize")
-cli.add_command(learning_report_command, name="learning-report")
-cli.add_command(prune_memory_command, name="prune-memory")
-cli.add_command(run_agent_command, name="run-agent")
-cli.add_command(monitor_command, name="monitor")
-cli.add_command(frontend_command, name="frontend")
-
-# Analytics commands
-cli.add_command(daily_pnl_command, name="daily-pnl")
-cli.add_command(weekly_pnl_command, name="weekly-pnl")
-cli.add_command(monthly_pnl_command, name="monthly-pnl")
-cli.add_command(asset_breakdown_command, name="asset-breakdown")
-cli.add_command(export_csv_command, name="export-csv")
-
+# Modular commands are registered lazily via LAZY_COMMANDS above
 
 if __name__ == "__main__":
     cli()
@@ -125,6 +125,19 @@ class FinanceFeedbackEngine:
             )
             # Continue anyway - system may work with fewer models
 
+        # Size the pooled keep-alive transport shared by exchange/data clients
+        transport_cfg = (config.get("data_providers") or {}).get("http_transport")
+        if isinstance(transport_cfg, dict) and transport_cfg:
+            from .utils.http_transport import configure_http_transport
+
+            configure_http_transport(
+                **{
+                    k: transport_cfg[k]
+                    for k in ("pool_connections", "pool_maxsize", "max_retries", "timeout")
+                    if k in transport_cfg
+                }
+            )
+
         # Initialize data provider
         api_key = os.environ.get("ALPHA_VANTAGE_API_KEY") or config.get(
             "alpha_vantage_api_key"
@@ -1813,3 +1826,13 @@ class FinanceFeedbackEngine:
             decision.get("filtered_reason_code") if isinstance(decision, dict) else None,
         )
         return decision
+
+    async def close(self) -> None:
+        """Release data provider sessions and the historical data loop thread."""
+        try:
+            await self.data_provider.close()
+        except Exception as e:
+            logger.debug(f"Error closing data provider: {e}")
+        historical = getattr(self, "historical_data_provider", None)
+        if historical is not None:
+            await asyncio.to_thread(historical.close)
@@ -0,0 +1,224 @@
+"""Paginated, concurrent historical candle backfill into the OHLCV lake.
+
+A date range is split into provider-sized pages (``MAX_CANDLES_PER_REQUEST``
+bars each) and pages are fetched concurrently over one pooled keep-alive
+``requests.Session``. Every request still goes through the provider's own
+``RateLimiter`` and ``CircuitBreaker``, so concurrency never exceeds the
+provider's request budget.
+
+Completed pages are flushed to the :class:`OHLCVLake` in bounded batches and
+only then recorded as covered. Lake coverage doubles as the checkpoint: a
+re-run (or a run after a crash) plans pages for the still-missing intervals
+only.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+
+import pandas as pd
+
+from ..persistence.ohlcv_lake import (
+    OHLCVLake,
+    bar_interval,
+    coverage_end,
+    normalize_timeframe,
+    to_utc,
+)
+from ..utils.http_transport import HTTPTransport
+
+logger = logging.getLogger(__name__)
+
+Page = Tuple[datetime, datetime]
+
+
+@dataclass
+class BackfillResult:
+    """Outcome of a backfill run."""
+
+    asset_pair: str
+    timeframe: str
+    pages_planned: int = 0
+    pages_fetched: int = 0
+    candles_written: int = 0
+    failed_pages: List[Page] = field(default_factory=list)
+
+    @property
+    def complete(self) -> bool:
+        return not self.failed_pages
+
+
+class CandleBackfiller:
+    """Fetch a date range page by page from a provider exposing ``fetch_candle_page``.
+
+    Works with :class:`CoinbaseDataProvider` and :class:`OandaDataProvider`.
+    """
+
+    def __init__(
+        self,
+        provider: Any,
+        lake: Optional[OHLCVLake] = None,
+        max_workers: int = 4,
+        flush_rows: int = 50_000,
+        session: Optional[Any] = None,
+    ):
+        """
+        Args:
+            provider: Data provider with ``fetch_candle_page`` and
+                ``MAX_CANDLES_PER_REQUEST``
+            lake: Destination lake (default: the shared historical lake)
+            max_workers: Pages fetched concurrently
+            flush_rows: Buffered candles that trigger a write to disk
+            session: Optional pre-configured HTTP session (default: a pooled
+                keep-alive transport session sized to ``max_workers``)
+        """
+        self.provider = provider
+        self.lake = lake or OHLCVLake()
+        self.max_workers = max(1, max_workers)
+        self.flush_rows = max(1, flush_rows)
+        self._transport = (
+            None
+            if session is not None
+            else HTTPTransport(pool_connections=1, pool_maxsize=self.max_workers)
+        )
+        self.session = session if session is not None else self._transport.session
+
+    def plan_pages(
+        self,
+        asset_pair: str,
+        timeframe: str,
+        start: datetime,
+        end: datetime,
+    ) -> List[Page]:
+        """Split the not-yet-covered parts of ``[start, end)`` into request pages."""
+        page_span = bar_interval(timeframe) * self.provider.MAX_CANDLES_PER_REQUEST
+        pages: List[Page] = []
+        for gap_start, gap_end in self.lake.missing_ranges(
+            asset_pair, timeframe, start, end
+        ):
+            cursor = gap_start
+            while cursor < gap_end:
+                page_end = min(cursor + page_span, gap_end)
+                pages.append((cursor, page_end))
+                cursor = page_end
+        return pages
+
+    def _fetch_page(self, asset_pair: str, timeframe: str, page: Page) -> pd.DataFrame:
+        candles = self.provider.fetch_candle_page(
+            self.session, asset_pair, timeframe, page[0], page[1]
+        )
+        if not candles:
+            return pd.DataFrame()
+        frame = pd.DataFrame(candles)
+        frame["timestamp"] = pd.to_datetime(frame["date"], utc=True)
+        return frame.drop(columns=["date"]).set_index("timestamp")
+
+    def _flush(
+        self,
+        asset_pair: str,
+        timeframe: str,
+        frames: List[pd.DataFrame],
+        pages: List[Page],
+        result: BackfillResult,
+    ) -> None:
+        frames = [f for f in frames if not f.empty]
+        if frames:
+            result.candles_written += self.lake.write(
+                asset_pair, timeframe, pd.concat(frames)
+            )
+        # Coverage is recorded only after the candles are on disk
+        for page_start, page_end in pages:
+            self.lake.mark_covered(
+                asset_pair, timeframe, page_start, coverage_end(timeframe, page_end)
+            )
+
+    def run(
+        self,
+        asset_pair: str,
+        start: datetime,
+        end: datetime,
+        timeframe: str = "1h",
+    ) -> BackfillResult:
+        """Backfill ``[start, end)`` for ``asset_pair`` into the lake.
+
+        Pages that fail are reported in ``failed_pages`` and stay uncovered,
+        so the next run retries just those.
+        """
+        timeframe = normalize_timeframe(timeframe)
+        start = to_utc(start).to_pydatetime()
+        end = to_utc(end).to_pydatetime()
+        result = BackfillResult(asset_pair=asset_pair, timeframe=timeframe)
+        pages = self.plan_pages(asset_pair, timeframe, start, end)
+        result.pages_planned = len(pages)
+        if not pages:
+            logger.info(f"Backfill {asset_pair} {timeframe}: range already covered")
+            return result
+
+        logger.info(
+            f"Backfill {asset_pair} {timeframe}: {len(pages)} page(s) "
+            f"from {start} to {end} with {self.max_workers} worker(s)"
+        )
+
+        buffered_frames: List[pd.DataFrame] = []
+        buffered_pages: List[Page] = []
+        buffered_rows = 0
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = {
+                pool.submit(self._fetch_page, asset_pair, timeframe, page): page
+                for page in pages
+            }
+            for future in as_completed(futures):
+                # Drop our reference so finished pages can be freed after flushing
+                page = futures.pop(future)
+                try:
+                    frame = future.result()
+                except Exception as e:
+                    logger.warning(
+                        f"Backfill page {page[0]} -> {page[1]} for {asset_pair} failed: {e}"
+                    )
+                    result.failed_pages.append(page)
+                    continue
+
+                result.pages_fetched += 1
+                buffered_frames.append(frame)
+                buffered_pages.append(page)
+                buffered_rows += len(frame)
+                if buffered_rows >= self.flush_rows:
+                    self._flush(
+                        asset_pair, timeframe, buffered_frames, buffered_pages, result
+                    )
+                    buffered_frames, buffered_pages, buffered_rows = [], [], 0
+
+        self._flush(asset_pair, timeframe, buffered_frames, buffered_pages, result)
+        result.failed_pages.sort()
+
+        logger.info(
+            f"Backfill {asset_pair} {timeframe}: wrote {result.candles_written} candles "
+            f"from {result.pages_fetched}/{result.pages_planned} page(s)"
+            + (f", {len(result.failed_pages)} failed" if result.failed_pages else "")
+        )
+        return result
+
+    def close(self) -> None:
+        """Release pooled connections owned by this backfiller."""
+        if self._transport is not None:
+            self._transport.close()
+
+
+def backfill_candles(
+    provider: Any,
+    asset_pair: str,
+    start: datetime,
+    end: datetime,
+    timeframe: str = "1h",
+    lake: Optional[OHLCVLake] = None,
+    max_workers: int = 4,
+) -> BackfillResult:
+    """One-shot helper around :class:`CandleBackfiller`."""
+    backfiller = CandleBackfiller(provider, lake=lake, max_workers=max_workers)
+    try:
+        return backfiller.run(asset_pair, start, end, timeframe)
+    finally:
+        backfiller.close()
@@ -0,0 +1,152 @@
+"""Columnar candle container.
+
+Candles used to travel through the providers and aggregators as
+``List[Dict[str, Any]]`` and every indicator rebuilt
+``[c["close"] for c in candles]``. ``CandleSeries`` keeps one NumPy array per
+field instead: indicators read columns directly and slicing returns views
+over the same buffers. It still behaves as a read-only sequence of candle
+dicts for legacy callers; use ``to_records()`` for JSON.
+"""
+
+from collections.abc import Sequence
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Union
+
+import numpy as np
+
+OHLCV_FIELDS = ("open", "high", "low", "close", "volume")
+
+
+def _to_array(values: Any) -> np.ndarray:
+    array = np.asarray(values)
+    if array.dtype.kind in "biuf":
+        return array
+    # Timestamps, ISO strings and mixed/None values stay Python objects
+    return np.array(values, dtype=object)
+
+
+class CandleSeries(Sequence):
+    """Structure-of-arrays view over a run of candles.
+
+    ``series[i]`` returns a plain candle dict, ``series[a:b]`` returns a
+    ``CandleSeries`` sharing the underlying arrays, and ``series.close`` (or
+    ``series.column("close")``) returns the column itself.
+    """
+
+    __slots__ = ("_columns", "_length")
+
+    def __init__(self, columns: Optional[Mapping[str, Any]] = None):
+        self._columns: Dict[str, np.ndarray] = {}
+        self._length = 0
+        for position, (name, values) in enumerate((columns or {}).items()):
+            array = values if isinstance(values, np.ndarray) else _to_array(values)
+            if array.ndim != 1:
+                raise ValueError(f"Column {name!r} must be one-dimensional")
+            if position == 0:
+                self._length = len(array)
+            elif len(array) != self._length:
+                raise ValueError(
+                    f"Column {name!r} has {len(array)} rows, expected {self._length}"
+                )
+            self._columns[name] = array
+
+    @classmethod
+    def from_records(cls, records: Iterable[Mapping[str, Any]]) -> "CandleSeries":
+        """Build from candle dicts; keys missing from a record become ``None``."""
+        records = list(records)
+        if not records:
+            return cls()
+        fields = list(records[0])
+        seen = set(fields)
+        for record in records:
+            if len(record) != len(fields) or not seen.issuperset(record):
+                for key in record:
+                    if key not in seen:
+                        seen.add(key)
+                        fields.append(key)
+        return cls({name: [r.get(name) for r in records] for name in fields})
+
+    @classmethod
+    def coerce(
+        cls, candles: Union["CandleSeries", Iterable[Mapping[str, Any]], None]
+    ) -> "CandleSeries":
+        """Return ``candles`` as a ``CandleSeries`` without copying if it already is one."""
+        if isinstance(candles, cls):
+            return candles
+        return cls.from_records(candles or [])
+
+    @property
+    def fields(self) -> List[str]:
+        return list(self._columns)
+
+    def column(self, name: str) -> np.ndarray:
+        """The backing array for ``name`` (a view, not a copy)."""
+        return self._columns[name]
+
+    @property
+    def open(self) -> np.ndarray:
+        return self._columns["open"]
+
+    @property
+    def high(self) -> np.ndarray:
+        return self._columns["high"]
+
+    @property
+    def low(self) -> np.ndarray:
+        return self._columns["low"]
+
+    @property
+    def close(self) -> np.ndarray:
+        return self._columns["close"]
+
+    @property
+    def volume(self) -> np.ndarray:
+        return self._columns["volume"]
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            series = CandleSeries.__new__(CandleSeries)
+            series._columns = {n: col[index] for n, col in self._columns.items()}
+            series._length = len(range(*index.indices(self._length)))
+            return series
+        if not -self._length <= index < self._length:
+            raise IndexError("candle index out of range")
+        return {
+            name: col[index].item() if col.dtype.kind != "O" else col[index]
+            for name, col in self._columns.items()
+        }
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        # Lazily, one dict per step; columnar callers should read the arrays
+        names = list(self._columns)
+        for row in zip(*(col.tolist() for col in self._columns.values())):
+            yield dict(zip(names, row))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CandleSeries):
+            return self.fields == other.fields and all(
+                np.array_equal(col, other._columns[name])
+                for name, col in self._columns.items()
+            )
+        if isinstance(other, Sequence) and not isinstance(other, (str, bytes)):
+            return self.to_records() == list(other)
+        return NotImplemented
+
+    __hash__ = None  # Mutable buffers
+
+    def __repr__(self) -> str:
+        return f"CandleSeries(len={self._length}, fields={self.fields})"
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Candle dicts with plain Python values (JSON-serialisable)."""
+        names = list(self._columns)
+        rows = zip(*(col.tolist() for col in self._columns.values()))
+        return [dict(zip(names, row)) for row in rows]
+
+    def to_frame(self):
+        """Columns as a ``pandas.DataFrame``."""
+        import pandas as pd
+
+        return pd.DataFrame(self._columns)
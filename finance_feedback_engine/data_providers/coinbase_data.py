@@ -10,6 +10,7 @@ from typing import Any, Dict, List, Optional
 from urllib.parse import urlencode
 
 from ..utils.circuit_breaker import CircuitBreaker, CircuitBreakerOpenError
+from ..utils.http_transport import HTTPTransport, get_http_transport
 from ..utils.product_id import is_cfm_product
 from ..utils.rate_limiter import RateLimiter
 
@@ -37,6 +38,9 @@ class CoinbaseDataProvider:
 
     BASE_URL = "https://api.coinbase.com"
 
+    # Advanced Trade candles endpoint returns at most 350 candles per request
+    MAX_CANDLES_PER_REQUEST = 350
+
     # Granularity mappings (Coinbase uses seconds)
     # Note: Coinbase Advanced Trade API supports: 1m, 5m, 15m, 30m, 1h, 6h, 1d
     # 4h is NOT supported - mapped to 6h (21600s) as closest available
@@ -78,6 +82,7 @@ class CoinbaseDataProvider:
         self,
         credentials: Optional[Dict[str, Any]] = None,
         rate_limiter: Optional[RateLimiter] = None,
+        transport: Optional[HTTPTransport] = None,
     ):
         """
         Initialize Coinbase data provider.
@@ -85,8 +90,10 @@ class CoinbaseDataProvider:
         Args:
             credentials: Optional credentials (not needed for public data)
             rate_limiter: Optional shared rate limiter instance
+            transport: Optional HTTP transport (default: shared pooled transport)
         """
         self.credentials = credentials or {}
+        self.transport = transport or get_http_transport()
 
         # Use shared rate limiter or create new one
         # Coinbase allows 15 req/sec for public data, we'll be conservative
@@ -221,8 +228,6 @@ class CoinbaseDataProvider:
         Returns:
             List of normalized candle dictionaries
         """
-        import requests
-
         # Coinbase public candles endpoint
         url = f"{self.BASE_URL}/api/v3/brokerage/products/{product_id}/candles"
 
@@ -237,7 +242,9 @@ class CoinbaseDataProvider:
         # Build auth headers (JWT for Cloud keys, HMAC for legacy keys)
         request_path = f"/api/v3/brokerage/products/{product_id}/candles"
         auth_headers = self._build_auth_headers("GET", request_path)
-        response = requests.get(url, params=params, headers=auth_headers or None, timeout=10)
+        response = self.transport.get(
+            url, params=params, headers=auth_headers or None, timeout=10
+        )
         response.raise_for_status()
 
         data = response.json()
@@ -342,8 +349,6 @@ class CoinbaseDataProvider:
         Returns:
             List of OHLCV dicts: date, open, high, low, close, volume
         """
-        import requests
-
         normalized_product = self._normalize_asset_pair(product_id)
         granularity_enum = self.GRANULARITY_ENUMS.get(granularity, granularity)
         granularity_seconds = self.GRANULARITIES.get(granularity_enum)
@@ -392,7 +397,7 @@ class CoinbaseDataProvider:
 
             self.rate_limiter.wait_for_token()
             response = self.circuit_breaker.call_sync(
-                requests.get,
+                self.transport.get,
                 f"{self.BASE_URL}{request_path}",
                 params=params,
                 headers=headers or None,
@@ -401,6 +406,11 @@ class CoinbaseDataProvider:
             response.raise_for_status()
             payload = response.json()
 
+        return self._parse_historical_candles(payload)
+
+    @staticmethod
+    def _parse_historical_candles(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Convert an Advanced Trade candles payload to sorted OHLCV dicts."""
         candles = []
         for candle in payload.get("candles", []):
             ts = int(candle.get("start", 0))
@@ -419,6 +429,54 @@ class CoinbaseDataProvider:
         candles.sort(key=lambda x: x["date"])
         return candles
 
+    def fetch_candle_page(
+        self,
+        session: Any,
+        asset_pair: str,
+        granularity: str,
+        start: datetime,
+        end: datetime,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch one page of candles opening in ``[start, end)``.
+
+        Used by the range backfill engine; the caller supplies a pooled
+        ``requests.Session`` and keeps pages within MAX_CANDLES_PER_REQUEST.
+
+        Args:
+            session: HTTP session used for the request
+            asset_pair: Asset pair (e.g., 'BTCUSD', 'BTC-USD')
+            granularity: Timeframe ('1m', '1h', ...) or Coinbase enum
+            start: Page start (inclusive)
+            end: Page end (exclusive)
+
+        Returns:
+            List of OHLCV dicts: date, open, high, low, close, volume
+        """
+        product_id = self._normalize_asset_pair(asset_pair)
+        granularity_enum = self.GRANULARITY_ENUMS.get(granularity, granularity)
+        if granularity_enum not in self.GRANULARITIES:
+            raise ValueError(f"Unsupported granularity: {granularity}")
+
+        request_path = f"/api/v3/brokerage/products/{product_id}/candles"
+        params = {
+            "start": int(start.timestamp()),
+            "end": int(end.timestamp()) - 1,
+            "granularity": granularity_enum,
+        }
+        headers = self._build_auth_headers("GET", request_path, f"?{urlencode(params)}")
+
+        self.rate_limiter.wait_for_token()
+        response = self.circuit_breaker.call_sync(
+            session.get,
+            f"{self.BASE_URL}{request_path}",
+            params=params,
+            headers=headers or None,
+            timeout=10,
+        )
+        response.raise_for_status()
+        return self._parse_historical_candles(response.json())
+
     def get_latest_price(self, asset_pair: str) -> float:
         """
         Get latest price for asset pair.
@@ -489,12 +547,10 @@ class CoinbaseDataProvider:
         Returns:
             List of product dictionaries
         """
-        import requests
-
         # Coinbase public products endpoint
         url = f"{self.BASE_URL}/api/v3/brokerage/products"
 
-        response = requests.get(url, timeout=10)
+        response = self.transport.get(url, timeout=10)
         response.raise_for_status()
 
         data = response.json()
@@ -1,13 +1,17 @@
+import asyncio
 import logging
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional, Union
+from typing import List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 
+from ..persistence.ohlcv_lake import bar_interval
 from ..persistence.timeseries_data_store import TimeSeriesDataStore
+from ..utils.background_loop import BackgroundEventLoop
 from ..utils.financial_data_validator import FinancialDataValidator
+from ..utils.http_transport import get_http_transport
 from .alpha_vantage_provider import AlphaVantageProvider
 from .coinbase_data import CoinbaseDataProvider
 from .oanda_data import OandaDataProvider
@@ -36,7 +40,8 @@ class HistoricalDataProvider:
       (e.g., 'open', 'high', 'low', 'close', 'volume').
     - **Caching/Persistence:** Includes logic for checking local storage before
       fetching from external APIs, reducing API calls and improving performance.
-      Integrates with a `TimeSeriesDataStore`.
+      Integrates with a `TimeSeriesDataStore`, whose partitioned OHLCV lake
+      tracks which intervals were already fetched so only gaps hit the network.
     - **Resilience:** Implements rate limiting and retry mechanisms to handle
       API call constraints and transient network issues.
 
@@ -59,6 +64,10 @@ class HistoricalDataProvider:
         self.coinbase_credentials = coinbase_credentials
         self._oanda_provider = None
         self._coinbase_provider = None
+        self._alpha_vantage_provider = None
+        # One loop thread for all sync -> async calls; the thread only starts on
+        # the first Alpha Vantage request and ``close()`` stops it
+        self._loop = BackgroundEventLoop(name="historical-data-loop")
         try:
             if self.cache_dir is not None:
                 self.cache_dir.mkdir(parents=True, exist_ok=True)
@@ -148,69 +157,46 @@ class HistoricalDataProvider:
         self._coinbase_provider = CoinbaseDataProvider(credentials=creds)
         return self._coinbase_provider
 
-    def _fetch_raw_data(
+    def _get_alpha_vantage_provider(self) -> AlphaVantageProvider:
+        """Long-lived Alpha Vantage provider; its aiohttp session lives on ``self._loop``."""
+        if self._alpha_vantage_provider is None:
+            self._alpha_vantage_provider = AlphaVantageProvider(api_key=self.api_key)
+        return self._alpha_vantage_provider
+
+    def _fetch_candle_range(
         self,
+        provider,
         asset_pair: str,
         start_date: datetime,
         end_date: datetime,
-        timeframe: str = "1h",
-    ) -> pd.DataFrame:
-        """
-        Fetch real historical OHLC data via Alpha Vantage provider.
-
-        Returns a DataFrame indexed by timestamp with columns: open, high, low, close, volume (if available).
-        Includes simple file-based caching with TTL to reduce repeated API calls.
-        """
-        # Build cache key (include timeframe in cache key)
-        cache_file = None
-        try:
-            start_str = start_date.strftime("%Y-%m-%d")
-            end_str = end_date.strftime("%Y-%m-%d")
-            cache_file = (
-                self.cache_dir
-                / f"{asset_pair}_{timeframe}_{start_str}_{end_str}.parquet"
+        timeframe: str,
+    ) -> list:
+        """Page ``[start_date, end_date)`` through ``provider.fetch_candle_page``."""
+        session = get_http_transport().session
+        page_span = bar_interval(timeframe) * provider.MAX_CANDLES_PER_REQUEST
+        candles: list = []
+        cursor = start_date
+        while cursor < end_date:
+            page_end = min(cursor + page_span, end_date)
+            candles.extend(
+                provider.fetch_candle_page(
+                    session, asset_pair, timeframe, cursor, page_end
+                )
             )
-            if cache_file.exists():
-                # Check cache freshness based on file modification time
-                import time
-                cache_age_seconds = time.time() - cache_file.stat().st_mtime
-                
-                # Define TTL based on timeframe and API rate limits
-                # With 3 assets × 6 timeframes = 18 API calls at 5/min = ~4 minutes to refresh all
-                # Intraday data: 10 minutes TTL (600 seconds) - gives buffer for rate limiting
-                # Daily data: 24 hours (86400 seconds) for longer-term analysis
-                if timeframe in ["1m", "5m", "15m", "30m", "1h"]:
-                    ttl_seconds = 600  # 10 minutes for intraday
-                else:
-                    ttl_seconds = 86400  # 24 hours for daily+
-                
-                if cache_age_seconds < ttl_seconds:
-                    df = pd.read_parquet(cache_file)
-                    # Ensure datetime index
-                    if not isinstance(df.index, pd.DatetimeIndex):
-                        df.index = pd.to_datetime(df.index, utc=True)
-                    df.index.name = "timestamp"
-                    cache_age_minutes = cache_age_seconds / 60
-                    logger.info(
-                        f"Loaded historical cache for {asset_pair} (timeframe: {timeframe}) {start_str}->{end_str} "
-                        f"(age: {cache_age_minutes:.1f} minutes, TTL: {ttl_seconds/60:.0f} minutes)"
-                    )
-                    return df
-                else:
-                    cache_age_hours = cache_age_seconds / 3600
-                    logger.info(
-                        f"Cache expired for {asset_pair} (timeframe: {timeframe}): "
-                        f"age {cache_age_hours:.1f} hours > TTL {ttl_seconds/3600:.1f} hours. Fetching fresh data..."
-                    )
-        except Exception as e:
-            logger.debug(f"Historical cache load skipped: {e}")
+            cursor = page_end
+        return candles
 
-        start_str = start_date.strftime("%Y-%m-%d")
-        end_str = end_date.strftime("%Y-%m-%d")
-        logger.info(
-            f"📡 FETCHING: {asset_pair} ({timeframe}) from {start_str} to {end_str}"
-        )
+    def _fetch_exchange_candles(
+        self,
+        asset_pair: str,
+        start_date: datetime,
+        end_date: datetime,
+        timeframe: str,
+    ) -> list:
+        """Blocking Coinbase (crypto) / Oanda (forex) fetch of one explicit range.
 
+        Returns candles opening in ``[start_date, end_date)``; empty on failure.
+        """
         candles: list = []
 
         # Crypto candles should come from Coinbase (primary source)
@@ -219,10 +205,8 @@ class HistoricalDataProvider:
             if coinbase_provider is not None:
                 try:
                     logger.info(f"Using Coinbase for crypto candles: {asset_pair}")
-                    candles = coinbase_provider.get_historical_candles(
-                        product_id=asset_pair,
-                        count=500,
-                        granularity=CoinbaseDataProvider.GRANULARITY_ENUMS.get(timeframe, "ONE_HOUR"),
+                    candles = self._fetch_candle_range(
+                        coinbase_provider, asset_pair, start_date, end_date, timeframe
                     )
                 except Exception as e:
                     logger.warning(
@@ -236,44 +220,36 @@ class HistoricalDataProvider:
             if oanda_provider is not None:
                 try:
                     logger.info(f"Using Oanda for forex candles: {asset_pair}")
-                    candles = oanda_provider.get_historical_candles(
-                        instrument=asset_pair,
-                        count=500,
-                        granularity=OandaDataProvider.GRANULARITIES.get(timeframe, "H1"),
+                    candles = self._fetch_candle_range(
+                        oanda_provider, asset_pair, start_date, end_date, timeframe
                     )
                 except Exception as e:
                     logger.warning(
                         f"Oanda historical candle fetch failed for {asset_pair}; "
                         f"falling back to Alpha Vantage. Error: {e}"
                     )
+        return candles
 
-        # Fallback and macro/sentiment/general coverage: Alpha Vantage
-        if not candles:
-            provider = AlphaVantageProvider(api_key=self.api_key)
-            try:
-                import asyncio
-                import concurrent.futures
-
-                coro = provider.get_historical_data(
-                    asset_pair, start=start_str, end=end_str, timeframe=timeframe
-                )
-
-                try:
-                    # Check if we're in an event loop
-                    asyncio.get_running_loop()
-                    # We're in an event loop - run in a separate thread to avoid blocking
-                    logger.debug(f"Fetching {asset_pair} ({timeframe}) data via thread pool")
-                    with concurrent.futures.ThreadPoolExecutor() as executor:
-                        future = executor.submit(asyncio.run, coro)
-                        candles = future.result()
-                except RuntimeError:
-                    # No event loop running - create one
-                    logger.debug(f"Fetching {asset_pair} ({timeframe}) data in new event loop")
-                    candles = asyncio.run(coro)
-            except Exception as e:
-                logger.error(f"Error fetching historical data: {e}", exc_info=True)
-                candles = []
+    async def _fetch_alpha_vantage(
+        self, asset_pair: str, start_str: str, end_str: str, timeframe: str
+    ) -> list:
+        """Alpha Vantage fallback; must run on ``self._loop`` where the session lives."""
+        try:
+            return await self._get_alpha_vantage_provider().get_historical_data(
+                asset_pair, start=start_str, end=end_str, timeframe=timeframe
+            )
+        except Exception as e:
+            logger.error(f"Error fetching historical data: {e}", exc_info=True)
+            return []
 
+    def _candles_to_frame(
+        self,
+        candles: list,
+        asset_pair: str,
+        start_str: str,
+        end_str: str,
+        timeframe: str,
+    ) -> pd.DataFrame:
         if not candles:
             logger.warning(
                 f"No historical candles fetched for {asset_pair} (timeframe: {timeframe}) between {start_str} and {end_str}"
@@ -301,40 +277,77 @@ class HistoricalDataProvider:
         # Volume may be absent for FX; fill NaN if missing
         if "volume" not in df.columns:
             df["volume"] = np.nan
-        df = df[["open", "high", "low", "close", "volume"]].sort_index()
+        return df[["open", "high", "low", "close", "volume"]].sort_index()
 
-        # Save cache
-        try:
-            if cache_file is not None:
-                df.to_parquet(cache_file)
-        except Exception as e:
-            logger.debug(f"Could not write historical cache: {e}")
+    def _fetch_raw_data(
+        self,
+        asset_pair: str,
+        start_date: datetime,
+        end_date: datetime,
+        timeframe: str = "1h",
+    ) -> pd.DataFrame:
+        """
+        Fetch real historical OHLC data (Coinbase/Oanda, Alpha Vantage fallback).
 
-        return df
+        Returns a DataFrame indexed by timestamp with columns: open, high, low, close, volume (if available).
+        Callers pass one of the lake's missing ranges; the data store and lake
+        already serve everything covered. The Alpha Vantage fallback runs on the provider's background loop.
+        """
+        start_str = start_date.strftime("%Y-%m-%d")
+        end_str = end_date.strftime("%Y-%m-%d")
+        logger.info(
+            f"📡 FETCHING: {asset_pair} ({timeframe}) from {start_str} to {end_str}"
+        )
 
-    def get_historical_data(
+        candles = self._fetch_exchange_candles(
+            asset_pair, start_date, end_date, timeframe
+        )
+
+        # Fallback and macro/sentiment/general coverage: Alpha Vantage
+        if not candles:
+            try:
+                candles = self._loop.run(
+                    self._fetch_alpha_vantage(asset_pair, start_str, end_str, timeframe)
+                )
+            except Exception as e:
+                logger.error(f"Error fetching historical data: {e}", exc_info=True)
+                candles = []
+
+        return self._candles_to_frame(
+            candles, asset_pair, start_str, end_str, timeframe
+        )
+
+    async def _fetch_raw_data_async(
         self,
         asset_pair: str,
-        start_date: Union[str, datetime],
-        end_date: Union[str, datetime],
+        start_date: datetime,
+        end_date: datetime,
         timeframe: str = "1h",
     ) -> pd.DataFrame:
-        """
-        Retrieves historical data for a given asset pair and date range.
+        """Async counterpart of ``_fetch_raw_data``."""
+        start_str = start_date.strftime("%Y-%m-%d")
+        end_str = end_date.strftime("%Y-%m-%d")
+        logger.info(
+            f"📡 FETCHING: {asset_pair} ({timeframe}) from {start_str} to {end_str}"
+        )
 
-        Args:
-            asset_pair (str): The asset pair (e.g., "BTCUSD").
-            start_date (Union[str, datetime]): The start date for the data (YYYY-MM-DD or datetime object).
-            end_date (Union[str, datetime]): The end date for the data (YYYY-MM-DD or datetime object).
-            timeframe (str): The timeframe for candles ('1m', '5m', '15m', '30m', '1h', '1d'). Defaults to '1h'.
+        # Exchange SDKs are blocking; keep them off the caller's loop
+        candles = await asyncio.to_thread(
+            self._fetch_exchange_candles, asset_pair, start_date, end_date, timeframe
+        )
+        if not candles:
+            candles = await self._loop.run_async(
+                self._fetch_alpha_vantage(asset_pair, start_str, end_str, timeframe)
+            )
 
-        Returns:
-            pd.DataFrame: A DataFrame with historical data, indexed by datetime,
-                          with columns like 'open', 'high', 'low', 'close', 'volume'.
+        return self._candles_to_frame(
+            candles, asset_pair, start_str, end_str, timeframe
+        )
 
-        Raises:
-            ValueError: If data cannot be fetched or is invalid.
-        """
+    @staticmethod
+    def _normalize_range(
+        start_date: Union[str, datetime], end_date: Union[str, datetime]
+    ) -> Tuple[datetime, datetime]:
         if isinstance(start_date, str):
             start_date = datetime.fromisoformat(start_date)
         if isinstance(end_date, str):
@@ -345,8 +358,12 @@ class HistoricalDataProvider:
             start_date = start_date.replace(tzinfo=timezone.utc)
         if end_date.tzinfo is None:
             end_date = end_date.replace(tzinfo=timezone.utc)
+        return start_date, end_date
 
-        # Check data_store for cached data first
+    def _load_stored(
+        self, asset_pair: str, start_date: datetime, end_date: datetime, timeframe: str
+    ) -> Optional[pd.DataFrame]:
+        """Data store hit for the whole range, if any."""
         cached_data = self.data_store.load_dataframe(
             asset_pair, start_date, end_date, timeframe
         )
@@ -355,16 +372,169 @@ class HistoricalDataProvider:
                 f"✅ Loaded {len(cached_data)} candles for {asset_pair} ({timeframe}) from data store cache."
             )
             return cached_data
+        return None
 
-        # Fetch from API if not cached
-        raw_data = self._fetch_raw_data(asset_pair, start_date, end_date, timeframe)
+    def _merge_fetched(
+        self,
+        asset_pair: str,
+        start_date: datetime,
+        end_date: datetime,
+        timeframe: str,
+        gaps: List[Tuple[datetime, datetime]],
+        raw_frames: List[pd.DataFrame],
+    ) -> pd.DataFrame:
+        """Persist fetched gap data and combine it with what the lake already holds."""
+        lake = self.data_store.lake
+        fetched = []
+        for (gap_start, gap_end), raw_data in zip(gaps, raw_frames):
+            if raw_data.empty:
+                continue
+            raw_data = self._prepare_raw_data(asset_pair, raw_data)
+
+            # Persist fetched data to data_store
+            try:
+                self.data_store.save_dataframe(
+                    asset_pair,
+                    raw_data,
+                    self._coverage_start(raw_data, gap_start, timeframe),
+                    gap_end,
+                    timeframe,
+                )
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to persist data to data store: {e}")
+            fetched.append(raw_data)
 
-        if raw_data.empty:
+        if gaps and not fetched:
             logger.warning(
                 f"No historical data fetched for {asset_pair} (timeframe: {timeframe}) between {start_date.date()} and {end_date.date()}."
             )
             return pd.DataFrame()
 
+        local = lake.read(asset_pair, timeframe, start_date, end_date)
+        frames = [f for f in [local, *fetched] if not f.empty]
+        if not frames:
+            return pd.DataFrame()
+        data = pd.concat(frames)
+        data = data[~data.index.duplicated(keep="last")].sort_index()
+        data = data[(data.index >= start_date) & (data.index <= end_date)]
+
+        logger.info(
+            f"✅ Successfully fetched and processed {len(data)} {timeframe} candles for {asset_pair} "
+            f"({len(gaps)} gap(s) fetched)."
+        )
+        return data
+
+    def get_historical_data(
+        self,
+        asset_pair: str,
+        start_date: Union[str, datetime],
+        end_date: Union[str, datetime],
+        timeframe: str = "1h",
+    ) -> pd.DataFrame:
+        """
+        Retrieves historical data for a given asset pair and date range.
+
+        Args:
+            asset_pair (str): The asset pair (e.g., "BTCUSD").
+            start_date (Union[str, datetime]): The start date for the data (YYYY-MM-DD or datetime object).
+            end_date (Union[str, datetime]): The end date for the data (YYYY-MM-DD or datetime object).
+                Bounds are used as given: a date-only end means midnight at the
+                start of that day, not the end of it.
+            timeframe (str): The timeframe for candles ('1m', '5m', '15m', '30m', '1h', '1d'). Defaults to '1h'.
+
+        Returns:
+            pd.DataFrame: A DataFrame with historical data, indexed by datetime,
+                          with columns like 'open', 'high', 'low', 'close', 'volume'.
+
+        Raises:
+            ValueError: If data cannot be fetched or is invalid.
+        """
+        start_date, end_date = self._normalize_range(start_date, end_date)
+
+        # Check data_store for cached data first
+        stored = self._load_stored(asset_pair, start_date, end_date, timeframe)
+        if stored is not None:
+            return stored
+
+        # Fetch only the intervals the lake has not seen yet
+        gaps = self.data_store.lake.missing_ranges(
+            asset_pair, timeframe, start_date, end_date
+        )
+        raw_frames = [
+            self._fetch_raw_data(asset_pair, gap_start, gap_end, timeframe)
+            for gap_start, gap_end in gaps
+        ]
+        return self._merge_fetched(
+            asset_pair, start_date, end_date, timeframe, gaps, raw_frames
+        )
+
+    async def get_historical_data_async(
+        self,
+        asset_pair: str,
+        start_date: Union[str, datetime],
+        end_date: Union[str, datetime],
+        timeframe: str = "1h",
+    ) -> pd.DataFrame:
+        """
+        Async version of ``get_historical_data``.
+
+        Gaps are fetched concurrently. Blocking exchange SDK calls and local
+        store I/O run in the default executor; Alpha Vantage requests reuse the
+        provider's long-lived session on its background loop.
+        """
+        start_date, end_date = self._normalize_range(start_date, end_date)
+
+        stored = await asyncio.to_thread(
+            self._load_stored, asset_pair, start_date, end_date, timeframe
+        )
+        if stored is not None:
+            return stored
+
+        gaps = self.data_store.lake.missing_ranges(
+            asset_pair, timeframe, start_date, end_date
+        )
+        raw_frames = await asyncio.gather(
+            *(
+                self._fetch_raw_data_async(asset_pair, gap_start, gap_end, timeframe)
+                for gap_start, gap_end in gaps
+            )
+        )
+        return await asyncio.to_thread(
+            self._merge_fetched,
+            asset_pair,
+            start_date,
+            end_date,
+            timeframe,
+            gaps,
+            list(raw_frames),
+        )
+
+    def close(self) -> None:
+        """Close the Alpha Vantage session and stop the background loop."""
+        provider, self._alpha_vantage_provider = self._alpha_vantage_provider, None
+        if provider is not None:
+            try:
+                self._loop.run(provider.close(), timeout=5)
+            except Exception as e:
+                logger.debug(f"Error closing Alpha Vantage provider: {e}")
+        self._loop.close()
+
+    @staticmethod
+    def _coverage_start(
+        data: pd.DataFrame, gap_start: datetime, timeframe: str
+    ) -> datetime:
+        """Start of the interval a fetch actually covered.
+
+        A source may not reach back to ``gap_start`` (exchange history limits,
+        the Alpha Vantage fallback); only then is coverage limited to the first returned bar.
+        Small leading gaps (weekends, holidays) still count as covered.
+        """
+        tolerance = max(timedelta(days=3), 2 * bar_interval(timeframe))
+        first_bar = data.index[0].to_pydatetime()
+        return gap_start if first_bar <= gap_start + tolerance else first_bar
+
+    def _prepare_raw_data(self, asset_pair: str, raw_data: pd.DataFrame) -> pd.DataFrame:
+        """Validate fetched candles and normalize index and columns."""
         # Apply data validation
         # Note: Validator checks for price columns; OHLC data has open/high/low/close
         # We'll validate 'close' as the price column
@@ -385,6 +555,8 @@ class HistoricalDataProvider:
         # Ensure correct index and column names
         if not isinstance(raw_data.index, pd.DatetimeIndex):
             raw_data.index = pd.to_datetime(raw_data.index, utc=True)
+        elif raw_data.index.tz is None:
+            raw_data.index = raw_data.index.tz_localize("UTC")
         raw_data.index.name = "timestamp"
 
         expected_cols = ["open", "high", "low", "close", "volume"]
@@ -396,20 +568,7 @@ class HistoricalDataProvider:
                 raw_data[col] = np.nan
 
         # Sort by timestamp to ensure chronological order
-        raw_data = raw_data.sort_index()
-
-        # Persist fetched data to data_store
-        try:
-            self.data_store.save_dataframe(
-                asset_pair, raw_data, start_date, end_date, timeframe
-            )
-        except Exception as e:
-            logger.warning(f"⚠️ Failed to persist data to data store: {e}")
-
-        logger.info(
-            f"✅ Successfully fetched and processed {len(raw_data)} {timeframe} candles for {asset_pair}."
-        )
-        return raw_data
+        return raw_data.sort_index()
 
     def add_returns(self, df: pd.DataFrame, column: str = "close") -> pd.DataFrame:
         """
@@ -2,10 +2,13 @@
 
 import logging
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional
 
+import numpy as np
 import pandas as pd
 
+from .candle_series import CandleSeries
+
 logger = logging.getLogger(__name__)
 
 
@@ -553,7 +556,7 @@ class MockLiveProvider:
 
     def _generate_timeframe_candles(
         self, current_time: pd.Timestamp, minutes_per_candle: int, max_history: int
-    ) -> List[Dict[str, Any]]:
+    ) -> CandleSeries:
         """
         Generate candles for a specific timeframe by aggregating 1-minute data.
 
@@ -566,65 +569,38 @@ class MockLiveProvider:
             max_history: Maximum number of historical candles to return
 
         Returns:
-            List of OHLCV candles for the timeframe
+            CandleSeries of OHLCV candles for the timeframe
         """
         if (
             not isinstance(self.historical_data, pd.DataFrame)
             or self.historical_data.empty
         ):
-            return []
+            return CandleSeries()
 
         try:
-            df = self.historical_data.copy()
+            df = self.historical_data
 
             # For 1-minute candles, return data as-is
             if minutes_per_candle == 1:
                 # Get last max_history 1-minute candles
-                if "date" not in df.columns:
-                    df["date"] = df.index.astype(str)
-
-                result = []
-                for _, row in df.tail(max_history).iterrows():
-                    try:
-                        open_val = float(row.get("open", row.get("Close", 0)))
-                        high_val = float(row.get("high", row.get("High", 0)))
-                        low_val = float(row.get("low", row.get("Low", 0)))
-                        close_val = float(row.get("close", row.get("Close", 0)))
-                        volume_val = row.get("volume", row.get("Volume", 0))
-
-                        # Handle NaN values
-                        if pd.isna(volume_val):
-                            volume_val = 0
-
-                        result.append(
-                            {
-                                "open": open_val if not pd.isna(open_val) else 0,
-                                "high": high_val if not pd.isna(high_val) else 0,
-                                "low": low_val if not pd.isna(low_val) else 0,
-                                "close": close_val if not pd.isna(close_val) else 0,
-                                "volume": (
-                                    int(volume_val) if not pd.isna(volume_val) else 0
-                                ),
-                                "date": str(row.get("date", row.name)),
-                            }
-                        )
-                    except Exception as row_err:
-                        logger.debug(f"Skipping 1m row due to error: {row_err}")
-                        continue
-                return result
+                tail = df.tail(max_history)
+                if "date" in tail.columns:
+                    dates = tail["date"].astype(str).to_numpy(dtype=object)
+                else:
+                    dates = tail.index.astype(str).to_numpy(dtype=object)
+                return self._candle_columns(tail, dates)
 
             # For multi-minute timeframes, aggregate 1-minute candles
             # Ensure we have a datetime index
             if not isinstance(df.index, pd.DatetimeIndex):
                 if "date" in df.columns:
-                    df["date"] = pd.to_datetime(df["date"])
-                    df.set_index("date", inplace=True)
+                    df = df.set_index(pd.to_datetime(df["date"]))
                 else:
                     try:
-                        df.index = pd.to_datetime(df.index)
+                        df = df.set_axis(pd.to_datetime(df.index))
                     except Exception:
                         # If we can't convert to datetime, return simple fallback
-                        return []
+                        return CandleSeries()
 
             # Detect which columns we have (lowercase or uppercase)
             has_lowercase = all(
@@ -635,100 +611,59 @@ class MockLiveProvider:
             )
 
             if has_lowercase:
-                cols_to_use = ["open", "high", "low", "close", "volume"]
-                cols_to_use = [c for c in cols_to_use if c in df.columns]
-                agg_spec = {
-                    "open": "first",
-                    "high": "max",
-                    "low": "min",
-                    "close": "last",
-                    "volume": "sum",
-                }
-                agg_spec = {k: v for k, v in agg_spec.items() if k in cols_to_use}
+                names = ["open", "high", "low", "close", "volume"]
             elif has_uppercase:
-                cols_to_use = ["Open", "High", "Low", "Close", "Volume"]
-                cols_to_use = [c for c in cols_to_use if c in df.columns]
-                agg_spec = {
-                    "Open": "first",
-                    "High": "max",
-                    "Low": "min",
-                    "Close": "last",
-                    "Volume": "sum",
-                }
-                agg_spec = {k: v for k, v in agg_spec.items() if k in cols_to_use}
+                names = ["Open", "High", "Low", "Close", "Volume"]
             else:
                 # Can't find columns, return empty
                 logger.warning(
                     f"Could not find OHLCV columns for {minutes_per_candle}m aggregation"
                 )
-                return []
-
-            # Resample and aggregate
-            resampled = (
-                df[list(agg_spec.keys())]
-                .resample(f"{minutes_per_candle}min")
-                .agg(agg_spec)
+                return CandleSeries()
+            how = dict(zip(names, ["first", "max", "min", "last", "sum"]))
+            agg_spec = {k: v for k, v in how.items() if k in df.columns}
+
+            # Only the rows feeding the last max_history bins; bins align to
+            # the same boundaries as resampling the full history
+            freq = f"{minutes_per_candle}min"
+            first_bin = df.index[-1].floor(freq) - pd.Timedelta(
+                minutes=minutes_per_candle * (max_history - 1)
             )
+            window = df.loc[df.index >= first_bin, list(agg_spec)]
 
-            # Convert to list of dicts
-            result = []
-            for date, row in resampled.tail(max_history).iterrows():
-                try:
-                    # Get values - handle both naming conventions
-                    if has_lowercase:
-                        open_val = row.get("open", 0)
-                        high_val = row.get("high", 0)
-                        low_val = row.get("low", 0)
-                        close_val = row.get("close", 0)
-                        volume_val = row.get("volume", 0)
-                    else:
-                        open_val = row.get("Open", 0)
-                        high_val = row.get("High", 0)
-                        low_val = row.get("Low", 0)
-                        close_val = row.get("Close", 0)
-                        volume_val = row.get("Volume", 0)
-
-                    # Skip if all required values are NaN
-                    if (
-                        pd.isna(open_val)
-                        and pd.isna(high_val)
-                        and pd.isna(low_val)
-                        and pd.isna(close_val)
-                    ):
-                        continue
-
-                    # Replace NaN with 0
-                    open_val = float(open_val) if not pd.isna(open_val) else 0
-                    high_val = float(high_val) if not pd.isna(high_val) else 0
-                    low_val = float(low_val) if not pd.isna(low_val) else 0
-                    close_val = float(close_val) if not pd.isna(close_val) else 0
-                    volume_val = int(volume_val) if not pd.isna(volume_val) else 0
-
-                    result.append(
-                        {
-                            "open": open_val,
-                            "high": high_val,
-                            "low": low_val,
-                            "close": close_val,
-                            "volume": volume_val,
-                            "date": (
-                                date.isoformat()
-                                if hasattr(date, "isoformat")
-                                else str(date)
-                            ),
-                        }
-                    )
-                except Exception as row_err:
-                    logger.debug(
-                        f"Skipping {minutes_per_candle}m row due to error: {row_err}"
-                    )
-                    continue
-
-            return result
+            resampled = window.resample(freq).agg(agg_spec).tail(max_history)
+            # Skip bins with no price data at all
+            resampled = resampled[resampled[names[:4]].notna().any(axis=1)]
+            dates = np.array(
+                [ts.isoformat() for ts in resampled.index], dtype=object
+            )
+            return self._candle_columns(resampled, dates)
 
         except Exception as e:
             logger.error(f"Error generating {minutes_per_candle}m candles: {e}")
-            return []
+            return CandleSeries()
+
+    @staticmethod
+    def _candle_columns(frame: pd.DataFrame, dates: np.ndarray) -> CandleSeries:
+        """Build a CandleSeries from lower- or upper-case OHLCV columns (NaN -> 0)."""
+
+        def column(name: str) -> np.ndarray:
+            for key in (name, name.capitalize()):
+                if key in frame.columns:
+                    values = pd.to_numeric(frame[key], errors="coerce")
+                    return values.fillna(0).to_numpy(dtype=float)
+            return np.zeros(len(frame))
+
+        return CandleSeries(
+            {
+                "open": column("open"),
+                "high": column("high"),
+                "low": column("low"),
+                "close": column("close"),
+                "volume": column("volume").astype(np.int64),
+                "date": dates,
+            }
+        )
 
     def _simple_aggregation(
         self, df: pd.DataFrame, minutes_per_candle: int
@@ -6,6 +6,7 @@ from datetime import UTC, datetime
 from typing import Any, Dict, List, Optional
 
 from ..utils.circuit_breaker import CircuitBreaker, CircuitBreakerOpenError
+from ..utils.http_transport import HTTPTransport, get_http_transport
 from ..utils.rate_limiter import RateLimiter
 
 logger = logging.getLogger(__name__)
@@ -27,6 +28,9 @@ class OandaDataProvider:
     Rate limit: 120 requests per 20 seconds.
     """
 
+    # Oanda returns at most 5000 candles per request
+    MAX_CANDLES_PER_REQUEST = 5000
+
     # Granularity mappings (Oanda format)
     GRANULARITIES = {
         "1m": "M1",
@@ -44,7 +48,10 @@ class OandaDataProvider:
     }
 
     def __init__(
-        self, credentials: Dict[str, Any], rate_limiter: Optional[RateLimiter] = None
+        self,
+        credentials: Dict[str, Any],
+        rate_limiter: Optional[RateLimiter] = None,
+        transport: Optional[HTTPTransport] = None,
     ):
         """
         Initialize Oanda data provider.
@@ -55,7 +62,9 @@ class OandaDataProvider:
                 - account_id: Oanda account ID
                 - environment: 'practice' or 'live'
             rate_limiter: Optional shared rate limiter instance
+            transport: Optional HTTP transport (default: shared pooled transport)
         """
+        self.transport = transport or get_http_transport()
         self.api_key = credentials.get("access_token") or credentials.get("api_key")
         self.account_id = credentials.get("account_id")
         self.environment = credentials.get("environment", "practice")
@@ -193,7 +202,11 @@ class OandaDataProvider:
         """
         normalized = self._normalize_asset_pair(instrument)
         candles = self._fetch_candles_from_api(normalized, granularity, count)
+        return self._to_historical(candles)
 
+    @staticmethod
+    def _to_historical(candles: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Convert normalized candles to date-keyed OHLCV dicts."""
         historical: List[Dict[str, Any]] = []
         for c in candles:
             ts = c.get("timestamp")
@@ -225,8 +238,6 @@ class OandaDataProvider:
         Returns:
             List of normalized candle dictionaries
         """
-        import requests
-
         # Oanda candles endpoint
         url = f"{self.base_url}/v3/instruments/{instrument}/candles"
 
@@ -241,12 +252,14 @@ class OandaDataProvider:
             "price": "M",  # Midpoint candles for strategy consistency
         }
 
-        response = requests.get(url, headers=headers, params=params, timeout=10)
+        response = self.transport.get(url, headers=headers, params=params, timeout=10)
         response.raise_for_status()
 
-        data = response.json()
+        return self._parse_candles(response.json())
 
-        # Normalize response to standard OHLCV format
+    @staticmethod
+    def _parse_candles(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Normalize a candles payload to complete, time-sorted OHLCV dicts."""
         candles = []
         for candle in data.get("candles", []):
             if not candle.get("complete", True):
@@ -280,6 +293,55 @@ class OandaDataProvider:
 
         return candles
 
+    def fetch_candle_page(
+        self,
+        session: Any,
+        asset_pair: str,
+        granularity: str,
+        start: datetime,
+        end: datetime,
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch one page of candles opening in ``[start, end)``.
+
+        Used by the range backfill engine; the caller supplies a pooled
+        ``requests.Session`` and keeps pages within MAX_CANDLES_PER_REQUEST.
+
+        Args:
+            session: HTTP session used for the request
+            asset_pair: Forex pair (e.g., 'EURUSD', 'EUR_USD')
+            granularity: Timeframe ('1m', '1h', ...) or Oanda code ('M1', 'H1')
+            start: Page start (inclusive)
+            end: Page end (exclusive)
+
+        Returns:
+            List of OHLCV dicts: date, open, high, low, close, volume
+        """
+        instrument = self._normalize_asset_pair(asset_pair)
+        params = {
+            "granularity": self.GRANULARITIES.get(granularity, granularity),
+            "from": start.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "to": end.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "price": "M",
+        }
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json",
+        }
+
+        self.rate_limiter.wait_for_token()
+        response = self.circuit_breaker.call_sync(
+            session.get,
+            f"{self.base_url}/v3/instruments/{instrument}/candles",
+            headers=headers,
+            params=params,
+            timeout=10,
+        )
+        response.raise_for_status()
+        end_ts = end.timestamp()
+        candles = [c for c in self._parse_candles(response.json()) if c["timestamp"] < end_ts]
+        return self._to_historical(candles)
+
     def get_current_price_direct(self, asset_pair: str) -> Optional[Dict[str, Any]]:
         """
         Get current bid/ask/mid price directly from Oanda pricing endpoint.
@@ -295,7 +357,6 @@ class OandaDataProvider:
             Dict with keys: asset_pair, price (mid), provider, timestamp
             Returns None if fetch fails.
         """
-        import requests
         from datetime import datetime, timezone
 
         instrument = self._normalize_asset_pair(asset_pair)
@@ -313,7 +374,7 @@ class OandaDataProvider:
 
         try:
             self.rate_limiter.wait_for_token()
-            response = requests.get(url, headers=headers, params=params, timeout=10)
+            response = self.transport.get(url, headers=headers, params=params, timeout=10)
             response.raise_for_status()
             data = response.json()
         except Exception as e:
@@ -436,8 +497,6 @@ class OandaDataProvider:
         Returns:
             List of instrument dictionaries
         """
-        import requests
-
         if not self.account_id:
             raise ValueError("Oanda account_id is required to fetch instruments")
 
@@ -449,7 +508,7 @@ class OandaDataProvider:
             "Content-Type": "application/json",
         }
 
-        response = requests.get(url, headers=headers, timeout=10)
+        response = self.transport.get(url, headers=headers, timeout=10)
         response.raise_for_status()
 
         data = response.json()
@@ -8,6 +8,7 @@ import numpy as np
 import pandas as pd
 import pandas_ta as ta
 
+from .candle_series import CandleSeries
 from .unified_data_provider import UnifiedDataProvider
 
 logger = logging.getLogger(__name__)
@@ -42,14 +43,20 @@ class TimeframeAggregator:
         self.data_provider = data_provider
         logger.info("TimeframeAggregator initialized")
 
+    @staticmethod
+    def _hlc_frame(candles: CandleSeries) -> pd.DataFrame:
+        return pd.DataFrame(
+            {"high": candles.high, "low": candles.low, "close": candles.close}
+        )
+
     def _calculate_sma(
         self, candles: List[Dict[str, Any]], period: int
     ) -> Optional[float]:
         """Calculate Simple Moving Average."""
         if len(candles) < period:
             return None
-        recent_closes = [c["close"] for c in candles[-period:]]
-        return mean(recent_closes)
+        candles = CandleSeries.coerce(candles)
+        return float(np.mean(candles.close[-period:]))
 
     def _calculate_rsi(
         self, candles: List[Dict[str, Any]], period: int = 14
@@ -58,21 +65,10 @@ class TimeframeAggregator:
         if len(candles) < period + 1:
             return None
 
-        closes = [c["close"] for c in candles[-(period + 1) :]]
-        gains = []
-        losses = []
-
-        for i in range(1, len(closes)):
-            change = closes[i] - closes[i - 1]
-            if change > 0:
-                gains.append(change)
-                losses.append(0)
-            else:
-                gains.append(0)
-                losses.append(abs(change))
-
-        avg_gain = mean(gains) if gains else 0
-        avg_loss = mean(losses) if losses else 0
+        candles = CandleSeries.coerce(candles)
+        changes = np.diff(candles.close[-(period + 1) :].astype(float))
+        avg_gain = float(np.clip(changes, 0, None).mean())
+        avg_loss = float(np.clip(-changes, 0, None).mean())
 
         if avg_loss == 0:
             return 100.0
@@ -103,7 +99,7 @@ class TimeframeAggregator:
         if len(candles) < slow_period + signal_period:
             return None
 
-        closes = pd.Series([c["close"] for c in candles])
+        closes = pd.Series(CandleSeries.coerce(candles).close)
         macd_result = ta.macd(
             closes, fast=fast_period, slow=slow_period, signal=signal_period
         )
@@ -142,9 +138,7 @@ class TimeframeAggregator:
         if len(candles) < max(k_period, d_period) + 1:
             return None
 
-        df = pd.DataFrame(
-            [{"high": c["high"], "low": c["low"], "close": c["close"]} for c in candles]
-        )
+        df = self._hlc_frame(CandleSeries.coerce(candles))
 
         stoch_result = ta.stoch(
             df["high"], df["low"], df["close"], k=k_period, d=d_period, smooth_k=1
@@ -176,9 +170,7 @@ class TimeframeAggregator:
         if len(candles) < period + 1:
             return None
 
-        df = pd.DataFrame(
-            [{"high": c["high"], "low": c["low"], "close": c["close"]} for c in candles]
-        )
+        df = self._hlc_frame(CandleSeries.coerce(candles))
 
         cci_result = ta.cci(df["high"], df["low"], df["close"], length=period)
 
@@ -203,9 +195,10 @@ class TimeframeAggregator:
         if len(candles) < period + 1:
             return None
 
-        highs = pd.Series([c["high"] for c in candles])
-        lows = pd.Series([c["low"] for c in candles])
-        closes = pd.Series([c["close"] for c in candles])
+        candles = CandleSeries.coerce(candles)
+        highs = pd.Series(candles.high)
+        lows = pd.Series(candles.low)
+        closes = pd.Series(candles.close)
 
         # Calculate Williams %R
         period_high = highs.rolling(window=period).max()
@@ -233,9 +226,7 @@ class TimeframeAggregator:
         if len(candles) < 52:  # Need at least 52 candles for standard Ichimoku
             return None
 
-        df = pd.DataFrame(
-            [{"high": c["high"], "low": c["low"], "close": c["close"]} for c in candles]
-        )
+        df = self._hlc_frame(CandleSeries.coerce(candles))
 
         # Standard Ichimoku periods
         tenkan_period = 9
@@ -312,7 +303,8 @@ class TimeframeAggregator:
         if len(candles) < period:
             return None
 
-        closes = pd.Series([c["close"] for c in candles])
+        candles = CandleSeries.coerce(candles)
+        closes = pd.Series(candles.close)
         bb_result = ta.bbands(closes, length=period, std=std_dev)
 
         if bb_result is None or bb_result.empty:
@@ -320,7 +312,7 @@ class TimeframeAggregator:
 
         # pandas-ta column names: BBL_period_std_std, BBM_period_std_std, BBU_period_std_std
         last_row = bb_result.iloc[-1]
-        current_price = candles[-1]["close"]
+        current_price = float(candles.close[-1])
 
         # Column pattern: BBU_20_2.0_2.0 (period_std_std)
         col_suffix = f"{period}_{std_dev}_{std_dev}"
@@ -359,9 +351,7 @@ class TimeframeAggregator:
             return None
 
         # Create DataFrame with required columns
-        df = pd.DataFrame(
-            [{"high": c["high"], "low": c["low"], "close": c["close"]} for c in candles]
-        )
+        df = self._hlc_frame(CandleSeries.coerce(candles))
 
         adx_result = ta.adx(df["high"], df["low"], df["close"], length=period)
 
@@ -393,9 +383,7 @@ class TimeframeAggregator:
             return None
 
         # Create DataFrame with required columns
-        df = pd.DataFrame(
-            [{"high": c["high"], "low": c["low"], "close": c["close"]} for c in candles]
-        )
+        df = self._hlc_frame(CandleSeries.coerce(candles))
 
         atr_result = ta.atr(df["high"], df["low"], df["close"], length=period)
 
@@ -521,7 +509,9 @@ class TimeframeAggregator:
                 "data_quality": "insufficient",
             }
 
-        current_price = candles[-1]["close"]
+        # Columnar once up front; every indicator below reads the same arrays
+        candles = CandleSeries.coerce(candles)
+        current_price = float(candles.close[-1])
         sma_20 = self._calculate_sma(candles, 20)
         sma_50 = self._calculate_sma(candles, 50)
         rsi = self._calculate_rsi(candles, 14)
@@ -649,7 +639,7 @@ class TimeframeAggregator:
 
         # Fetch data across all timeframes
         multi_tf_data = self.data_provider.get_multi_timeframe_data(
-            asset_pair, timeframes
+            asset_pair, timeframes, columnar=True
         )
 
         # Analyze each timeframe
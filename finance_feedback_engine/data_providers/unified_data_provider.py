@@ -1,13 +1,14 @@
 """Unified data provider with cascading fallback across Alpha Vantage, Coinbase, and Oanda."""
 
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from cachetools import TTLCache
 
 from ..utils.circuit_breaker import CircuitBreakerOpenError
 from ..utils.rate_limiter import RateLimiter
 from .alpha_vantage_provider import AlphaVantageProvider
+from .candle_series import CandleSeries
 from .coinbase_data import CoinbaseDataProvider
 from .oanda_data import OandaDataProvider
 from ..utils.product_id import is_cfm_product as _canonical_is_cfm
@@ -102,6 +103,9 @@ class UnifiedDataProvider:
 
         # In-memory cache: {(asset_pair, granularity): (candles, provider_name)}
         self._cache = TTLCache(maxsize=1000, ttl=cache_ttl)  # Configurable TTL, thread-safe
+        # get_candles() dict lists, built once per cached series:
+        # {(asset_pair, granularity): (series, records)}
+        self._records_cache = TTLCache(maxsize=1000, ttl=cache_ttl)
 
         logger.info(f"UnifiedDataProvider initialized with cascading fallback (cache TTL: {cache_ttl}s)")
 
@@ -163,7 +167,7 @@ class UnifiedDataProvider:
 
     def _get_cached_candles(
         self, asset_pair: str, granularity: str
-    ) -> Optional[Tuple[List[Dict[str, Any]], str]]:
+    ) -> Optional[Tuple[CandleSeries, str]]:
         """
         Get candles from cache if available and fresh.
 
@@ -188,7 +192,7 @@ class UnifiedDataProvider:
         self,
         asset_pair: str,
         granularity: str,
-        candles: List[Dict[str, Any]],
+        candles: CandleSeries,
         provider_name: str,
     ) -> None:
         """
@@ -226,6 +230,38 @@ class UnifiedDataProvider:
         Returns:
             Tuple of (candles list, provider_name used)
 
+        Raises:
+            ValueError: If all providers fail
+        """
+        candles, provider_name = self.get_candle_series(
+            asset_pair, granularity, limit, force_provider
+        )
+        cache_key = (asset_pair.upper(), granularity)
+        cached = self._records_cache.get(cache_key)
+        if cached is not None and cached[0] is candles:
+            return cached[1], provider_name
+
+        records = candles.to_records()
+        if cache_key in self._cache:
+            self._records_cache[cache_key] = (candles, records)
+        return records, provider_name
+
+    def get_candle_series(
+        self,
+        asset_pair: str,
+        granularity: str = "1d",
+        limit: int = 300,
+        force_provider: Optional[str] = None,
+    ) -> Tuple[CandleSeries, str]:
+        """
+        Columnar form of ``get_candles``, served straight from the cache.
+
+        Indicator code should use this and read ``series.close`` etc. instead
+        of building per-candle dicts.
+
+        Returns:
+            Tuple of (CandleSeries, provider_name used)
+
         Raises:
             ValueError: If all providers fail
         """
@@ -293,6 +329,8 @@ class UnifiedDataProvider:
                     continue
 
                 if candles:
+                    # Stored columnar: indicators read arrays, not per-candle dicts
+                    candles = CandleSeries.coerce(candles)
                     # Success! Cache with provider info and return
                     self._cache_candles(asset_pair, granularity, candles, provider_name)
                     logger.info(
@@ -332,8 +370,11 @@ class UnifiedDataProvider:
         raise ValueError(error_msg)
 
     def get_multi_timeframe_data(
-        self, asset_pair: str, timeframes: Optional[List[str]] = None
-    ) -> Dict[str, Tuple[List[Dict[str, Any]], str]]:
+        self,
+        asset_pair: str,
+        timeframes: Optional[List[str]] = None,
+        columnar: bool = False,
+    ) -> Dict[str, Tuple[Union[List[Dict[str, Any]], CandleSeries], str]]:
         """
         Fetch data across multiple timeframes.
 
@@ -341,6 +382,7 @@ class UnifiedDataProvider:
             asset_pair: Asset pair
             timeframes: List of timeframes (default: ['1m', '5m', '15m', '1h', '4h', '6h', '1d'])
                 Note: For Coinbase provider, 4h is mapped to 6h
+            columnar: Return ``CandleSeries`` instead of candle lists
 
         Returns:
             Dictionary mapping timeframe to (candles, provider_name)
@@ -348,15 +390,16 @@ class UnifiedDataProvider:
         if timeframes is None:
             timeframes = ["1m", "5m", "15m", "1h", "4h", "1d"]
 
+        fetch = self.get_candle_series if columnar else self.get_candles
         results = {}
 
         for tf in timeframes:
             try:
-                candles, provider = self.get_candles(asset_pair, tf)
+                candles, provider = fetch(asset_pair, tf)
                 results[tf] = (candles, provider)
             except Exception as e:
                 logger.warning(f"Failed to fetch {tf} data: {e}")
-                results[tf] = ([], "failed")
+                results[tf] = (CandleSeries() if columnar else [], "failed")
 
         return results
 
@@ -72,6 +72,10 @@ def _candidate_audit_view(decision: Optional[Dict[str, Any]]) -> Dict[str, Any]:
 
 MAX_WORKERS = 4
 
+# Debate judge speculation (ensemble.debate_judge)
+DEFAULT_JUDGE_PREFILL_WAIT_SECONDS = 5.0
+DEFAULT_JUDGE_SKIP_MIN_CONFIDENCE = 80
+
 
 # ---------------------------------------------------------------------------
 # Position-state awareness for debate roles
@@ -181,6 +185,8 @@ class AIDecisionManager:
     Manager for AI provider handling and inference.
     """
 
+    provider_telemetry = None
+
     def __init__(self, config: Dict[str, Any], backtest_mode: bool = False):
         self.config = config
         self.backtest_mode = backtest_mode
@@ -212,6 +218,14 @@ class AIDecisionManager:
         if self.ai_provider == "ensemble":
             self._get_ensemble_manager()
 
+        from finance_feedback_engine.monitoring.provider_telemetry import (
+            get_provider_telemetry,
+            telemetry_enabled,
+        )
+
+        if telemetry_enabled(config):
+            self.provider_telemetry = get_provider_telemetry(config)
+
     def _get_ensemble_manager(self):
         """Lazily create and cache the ensemble manager."""
         if self.ensemble_manager is None:
@@ -471,26 +485,48 @@ class AIDecisionManager:
         prompt: str,
         bull_case: Optional[Dict[str, Any]],
         bear_case: Optional[Dict[str, Any]],
+        cases_last: bool = False,
     ) -> str:
+        """
+        Judge prompt for a debate.
+
+        With ``cases_last`` the bull/bear summaries are appended after the
+        judge rules, so ``_build_judge_prompt_head(prompt)`` is a prefix of
+        the result and can be prefilled before the advocates finish.
+        """
         bull_summary = self._format_case_for_judge("bull", bull_case)
         bear_summary = self._format_case_for_judge("bear", bear_case)
+        cases = f"""
+Bull case summary:
+{bull_summary}
+
+Bear case summary:
+{bear_summary}
+"""
+        header, rules = self._judge_prompt_sections(prompt)
+        if cases_last:
+            return prompt + header + rules + cases
+        return prompt + header + cases + rules
+
+    def _build_judge_prompt_head(self, prompt: str) -> str:
+        """Case-independent prefix of ``_build_judge_prompt(..., cases_last=True)``."""
+        header, rules = self._judge_prompt_sections(prompt)
+        return prompt + header + rules
+
+    @staticmethod
+    def _judge_prompt_sections(prompt: str) -> tuple[str, str]:
         position_state = _extract_position_state_from_prompt(prompt)
         judge_allowed_actions = "\n".join(
             f"- {action.value}" for action in legal_actions_for_position_state(position_state)
         )
-        return prompt + f"""
+        header = """
 
 DEBATE ROLE: IMPARTIAL JUDGE
 =============================
 You are the final arbiter on a trading decision council.
 Evaluate both cases and choose the strongest actionable edge, or HOLD if neither clears the bar.
-
-Bull case summary:
-{bull_summary}
-
-Bear case summary:
-{bear_summary}
-
+"""
+        rules = f"""
 Decision rules:
 - Do NOT reward persuasive writing.
 - HOLD is an active decision, not the default fallback.
@@ -556,6 +592,93 @@ Data Quality: <good|degraded|stale>
 Missing Evidence: <what would have been needed to justify the losing side or convert HOLD into action>
 Final Rationale: <clear final explanation>
 """
+        return header, rules
+
+    def _debate_judge_options(self) -> Dict[str, Any]:
+        """Judge speculation settings from ``ensemble.debate_judge``."""
+        ensemble_config = (getattr(self, "config", None) or {}).get("ensemble") or {}
+        judge_config = ensemble_config.get("debate_judge") or {}
+        skip_config = judge_config.get("skip_on_hold_agreement") or {}
+        return {
+            "speculative_prefill": bool(judge_config.get("speculative_prefill", False)),
+            "prefill_wait_seconds": float(
+                judge_config.get("prefill_wait_seconds", DEFAULT_JUDGE_PREFILL_WAIT_SECONDS)
+            ),
+            "skip_on_hold_agreement": bool(skip_config.get("enabled", False)),
+            "skip_min_confidence": float(
+                skip_config.get("min_confidence", DEFAULT_JUDGE_SKIP_MIN_CONFIDENCE)
+            ),
+        }
+
+    async def _prefill_judge(self, judge_provider: str, prompt_head: str) -> Optional[float]:
+        """
+        Prefill the judge's case-independent prompt while the advocates run.
+
+        Only local (Ollama) judges keep a prompt cache we can warm; other
+        providers are skipped. Failures are logged and never fail the debate.
+        """
+        from .provider_tiers import is_ollama_model
+
+        if not (is_ollama_model(judge_provider) or judge_provider == "local"):
+            return None
+        try:
+            from .local_llm_provider import LocalLLMProvider
+
+            model_name = None if judge_provider == "local" else judge_provider
+            provider = LocalLLMProvider(
+                dict(self.config, model_name=model_name or self.config.get("model_name", "default"))
+            )
+            return await asyncio.to_thread(
+                provider.prefill, prompt_head, model_name, "debate:judge"
+            )
+        except Exception as e:
+            logger.warning("Debate: judge prefill failed for %s: %s", judge_provider, e)
+            return None
+
+    @staticmethod
+    def _hold_agreement_judgment(
+        bull_case: Optional[Dict[str, Any]],
+        bear_case: Optional[Dict[str, Any]],
+        min_confidence: float,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Judgment standing in for the judge when both advocates agree on HOLD.
+
+        Each advocate must choose HOLD with at least ``min_confidence``; the
+        result carries the lower of the two confidences and the alternatives
+        the advocates considered.
+        """
+        cases = (bull_case, bear_case)
+        if not all(isinstance(case, dict) for case in cases):
+            return None
+        for case in cases:
+            action = case.get("policy_action") or case.get("action")
+            try:
+                confidence = float(case.get("confidence", 0) or 0)
+            except (TypeError, ValueError):
+                return None
+            if str(action).upper() != "HOLD" or confidence < min_confidence:
+                return None
+
+        candidates = ["HOLD"]
+        for case in cases:
+            for candidate in case.get("candidate_actions") or []:
+                if isinstance(candidate, str) and candidate not in candidates:
+                    candidates.append(candidate)
+        confidence = int(min(float(case.get("confidence", 0) or 0) for case in cases))
+        return {
+            "action": "HOLD",
+            "policy_action": "HOLD",
+            "candidate_actions": candidates,
+            "confidence": confidence,
+            "reasoning": (
+                f"Judge skipped: bull ({bull_case.get('confidence')}%) and bear "
+                f"({bear_case.get('confidence')}%) both chose HOLD. "
+                f"Bull: {bull_case.get('reasoning', '')} | Bear: {bear_case.get('reasoning', '')}"
+            ),
+            "amount": 0,
+            "decision_origin": "debate_consensus",
+        }
 
     @staticmethod
     def _extract_prompt_section(prompt: str, header: str) -> str:
@@ -713,11 +836,18 @@ Final Rationale: <clear final explanation>
         3. Query judge provider (final decision based on debate)
         4. Synthesize decisions via ensemble_manager.debate_decisions()
 
+        With ``ensemble.debate_judge.speculative_prefill`` the judge's prompt
+        prefix is prefilled concurrently with steps 1-2. With
+        ``skip_on_hold_agreement`` step 3 is skipped when both advocates
+        choose HOLD at or above ``min_confidence``.
+
         Returns:
             Decision with debate metadata
         """
         logger.info("Using debate mode ensemble")
 
+        if isinstance(self.ensemble_manager, EnsembleDecisionManager):
+            self.ensemble_manager.route_debate_seats()
         bull_provider = self.ensemble_manager.debate_providers.get("bull")
         bear_provider = self.ensemble_manager.debate_providers.get("bear")
         judge_provider = self.ensemble_manager.debate_providers.get("judge")
@@ -873,6 +1003,16 @@ Thesis Breaker: <short invalidating condition>
 Data Quality: <good|degraded|stale>
 """
 
+        # Speculative judge start: the judge's rules do not depend on the
+        # advocates, so its prompt prefix is prefilled while they run and the
+        # bull/bear cases are appended afterwards.
+        judge_options = self._debate_judge_options()
+        judge_prefill_task = None
+        if judge_options["speculative_prefill"]:
+            judge_prefill_task = asyncio.create_task(
+                self._prefill_judge(judge_provider, self._build_judge_prompt_head(prompt))
+            )
+
         _debate_parallel_started = time.perf_counter()
         bull_result, bear_result = await asyncio.gather(
             self._query_debate_role(
@@ -907,121 +1047,151 @@ Data Quality: <good|degraded|stale>
         if bear_case is not None:
             bear_case = _coerce_invalid_role_action(bear_case, "bear", _pos_state)
 
-        # Query judge provider (final decision)
-        try:
-            # Add judge-specific instructions with bull/bear context
-            _timing_started = time.perf_counter()
-            judge_prompt = self._build_judge_prompt(prompt, bull_case, bear_case)
-            debate_timing["judge_prompt_chars"] = float(len(judge_prompt))
-
-            debate_timing["judge_prompt_build_s"] = round(time.perf_counter() - _timing_started, 4)
-            _timing_started = time.perf_counter()
-            judge_decision = await self._query_single_provider(
-                judge_provider,
-                judge_prompt,
-                request_label="debate:judge",
-            )
-            debate_timing["judge_s"] = round(time.perf_counter() - _timing_started, 4)
-            judge_policy_action = judge_decision.get("policy_action") if isinstance(judge_decision, dict) else None
-            judge_candidates = judge_decision.get("candidate_actions") if isinstance(judge_decision, dict) else None
-            judge_action = judge_decision.get("action") if isinstance(judge_decision, dict) else None
-            judge_market_regime = str(market_regime or "").lower()
-            judge_requires_multi_candidate = (
-                judge_market_regime == "ranging"
-                and _pos_state == "flat"
-                and isinstance(judge_policy_action, str)
-                and judge_policy_action in {"OPEN_SMALL_LONG", "OPEN_MEDIUM_LONG", "OPEN_SMALL_SHORT", "OPEN_MEDIUM_SHORT"}
+        hold_agreement = None
+        if judge_options["skip_on_hold_agreement"]:
+            hold_agreement = self._hold_agreement_judgment(
+                bull_case, bear_case, judge_options["skip_min_confidence"]
             )
-            judge_schema_ok = (
-                isinstance(judge_decision, dict)
-                and isinstance(judge_policy_action, str)
-                and bool(judge_policy_action.strip())
-                and isinstance(judge_candidates, list)
-                and len(judge_candidates) > 0
-                and all(isinstance(item, str) and item.strip() for item in judge_candidates)
-                and judge_candidates[0] == judge_policy_action
-                and judge_policy_action == judge_action
-                and (not judge_requires_multi_candidate or len(judge_candidates) >= 2)
+
+        if hold_agreement is not None:
+            # Both advocates chose HOLD with high confidence: the judge cannot
+            # add an actionable edge, so its query is skipped.
+            logger.info(
+                "Debate: bull and bear agree on HOLD (bull=%s%%, bear=%s%%); skipping judge %s",
+                bull_case.get("confidence"),
+                bear_case.get("confidence"),
+                judge_provider,
             )
-            if not (
-                self.ensemble_manager._is_valid_provider_response(judge_decision, judge_provider)
-                and judge_schema_ok
-            ):
-                logger.warning(
-                    "Debate: %s (judge) returned invalid response schema_ok=%s requires_multi=%s regime=%r pos_state=%r action=%r policy_action=%r candidate_actions=%r",
+            if judge_prefill_task is not None:
+                judge_prefill_task.cancel()
+            judge_decision = hold_agreement
+        else:
+            if judge_prefill_task is not None:
+                _timing_started = time.perf_counter()
+                await asyncio.wait({judge_prefill_task}, timeout=judge_options["prefill_wait_seconds"])
+                debate_timing["judge_prefill_wait_s"] = round(time.perf_counter() - _timing_started, 4)
+                if judge_prefill_task.done() and not judge_prefill_task.cancelled():
+                    prefill_s = judge_prefill_task.result()
+                    if prefill_s is not None:
+                        debate_timing["judge_prefill_s"] = round(float(prefill_s), 4)
+
+            # Query judge provider (final decision)
+            try:
+                # Add judge-specific instructions with bull/bear context
+                _timing_started = time.perf_counter()
+                judge_prompt = self._build_judge_prompt(
+                    prompt, bull_case, bear_case, cases_last=judge_prefill_task is not None
+                )
+                debate_timing["judge_prompt_chars"] = float(len(judge_prompt))
+
+                debate_timing["judge_prompt_build_s"] = round(time.perf_counter() - _timing_started, 4)
+                _timing_started = time.perf_counter()
+                judge_decision = await self._query_single_provider(
                     judge_provider,
-                    judge_schema_ok,
-                    judge_requires_multi_candidate,
-                    judge_market_regime,
-                    _pos_state,
-                    judge_action,
-                    judge_policy_action,
-                    judge_candidates,
+                    judge_prompt,
+                    request_label="debate:judge",
                 )
-                failed_debate_roles.append({"role": "judge", "provider": judge_provider, "reason": "invalid_response"})
-                failure_context = _failure_context_snapshot(
-                    market_regime=market_regime,
-                    position_state=_pos_state,
-                    bull_case=bull_case,
-                    bear_case=bear_case,
-                    judge_decision=judge_decision,
-                    judge_requires_multi_candidate=judge_requires_multi_candidate,
-                    failed_debate_providers=failed_debate_providers + [judge_provider],
-                    failed_debate_roles=failed_debate_roles,
-                    debate_seats=debate_seats,
+                debate_timing["judge_s"] = round(time.perf_counter() - _timing_started, 4)
+                judge_policy_action = judge_decision.get("policy_action") if isinstance(judge_decision, dict) else None
+                judge_candidates = judge_decision.get("candidate_actions") if isinstance(judge_decision, dict) else None
+                judge_action = judge_decision.get("action") if isinstance(judge_decision, dict) else None
+                judge_market_regime = str(market_regime or "").lower()
+                judge_requires_multi_candidate = (
+                    judge_market_regime == "ranging"
+                    and _pos_state == "flat"
+                    and isinstance(judge_policy_action, str)
+                    and judge_policy_action in {"OPEN_SMALL_LONG", "OPEN_MEDIUM_LONG", "OPEN_SMALL_SHORT", "OPEN_MEDIUM_SHORT"}
                 )
-                failed_debate_providers.append(judge_provider)
-                increment_provider_request(judge_provider, "failure")
-                error = RuntimeError(
-                    f"Debate mode failed: Missing providers - "
-                    f"bull={'OK' if bull_case else 'FAILED'}, "
-                    f"bear={'OK' if bear_case else 'FAILED'}, "
-                    f"judge=FAILED"
+                judge_schema_ok = (
+                    isinstance(judge_decision, dict)
+                    and isinstance(judge_policy_action, str)
+                    and bool(judge_policy_action.strip())
+                    and isinstance(judge_candidates, list)
+                    and len(judge_candidates) > 0
+                    and all(isinstance(item, str) and item.strip() for item in judge_candidates)
+                    and judge_candidates[0] == judge_policy_action
+                    and judge_policy_action == judge_action
+                    and (not judge_requires_multi_candidate or len(judge_candidates) >= 2)
                 )
-                setattr(error, "analysis_failure_context", failure_context)
-                raise error
-            elif isinstance(judge_decision, dict) and judge_decision.get("decision_origin") == "fallback":
-                logger.warning(
-                    "Debate: %s (judge) returned fallback decision (reason: %s) — "
-                    "treating as provider failure to prevent ghost HOLD",
-                    judge_provider, judge_decision.get("filtered_reason_code", "unknown"),
+                if not (
+                    self.ensemble_manager._is_valid_provider_response(judge_decision, judge_provider)
+                    and judge_schema_ok
+                ):
+                    logger.warning(
+                        "Debate: %s (judge) returned invalid response schema_ok=%s requires_multi=%s regime=%r pos_state=%r action=%r policy_action=%r candidate_actions=%r",
+                        judge_provider,
+                        judge_schema_ok,
+                        judge_requires_multi_candidate,
+                        judge_market_regime,
+                        _pos_state,
+                        judge_action,
+                        judge_policy_action,
+                        judge_candidates,
+                    )
+                    failed_debate_roles.append({"role": "judge", "provider": judge_provider, "reason": "invalid_response"})
+                    failure_context = _failure_context_snapshot(
+                        market_regime=market_regime,
+                        position_state=_pos_state,
+                        bull_case=bull_case,
+                        bear_case=bear_case,
+                        judge_decision=judge_decision,
+                        judge_requires_multi_candidate=judge_requires_multi_candidate,
+                        failed_debate_providers=failed_debate_providers + [judge_provider],
+                        failed_debate_roles=failed_debate_roles,
+                        debate_seats=debate_seats,
+                    )
+                    failed_debate_providers.append(judge_provider)
+                    increment_provider_request(judge_provider, "failure")
+                    error = RuntimeError(
+                        f"Debate mode failed: Missing providers - "
+                        f"bull={'OK' if bull_case else 'FAILED'}, "
+                        f"bear={'OK' if bear_case else 'FAILED'}, "
+                        f"judge=FAILED"
+                    )
+                    setattr(error, "analysis_failure_context", failure_context)
+                    raise error
+                elif isinstance(judge_decision, dict) and judge_decision.get("decision_origin") == "fallback":
+                    logger.warning(
+                        "Debate: %s (judge) returned fallback decision (reason: %s) — "
+                        "treating as provider failure to prevent ghost HOLD",
+                        judge_provider, judge_decision.get("filtered_reason_code", "unknown"),
+                    )
+                    failed_debate_providers.append(judge_provider)
+                    increment_provider_request(judge_provider, "failure")
+                    judge_decision = None
+                else:
+                    logger.info(
+                        f"Debate: {judge_provider} (judge) -> {judge_decision.get('action')} ({judge_decision.get('confidence')}%)"
+                    )
+                    increment_provider_request(judge_provider, "success")
+            except asyncio.TimeoutError:
+                logger.error(
+                    "Debate: judge provider timed out",
+                    extra={
+                        "provider": judge_provider,
+                        "role": "judge",
+                        "timeout_seconds": self.ensemble_timeout,
+                    }
                 )
                 failed_debate_providers.append(judge_provider)
+                failed_debate_roles.append({"role": "judge", "provider": judge_provider, "reason": "timeout"})
                 increment_provider_request(judge_provider, "failure")
-                judge_decision = None
-            else:
-                logger.info(
-                    f"Debate: {judge_provider} (judge) -> {judge_decision.get('action')} ({judge_decision.get('confidence')}%)"
+                # TODO: Track debate provider timeouts for alerting (THR-XXX)
+            except Exception as e:
+                logger.error(
+                    "Debate: judge provider failed with exception",
+                    extra={
+                        "provider": judge_provider,
+                        "role": "judge",
+                        "error": str(e),
+                        "error_type": type(e).__name__,
+                    },
+                    exc_info=True
                 )
-                increment_provider_request(judge_provider, "success")
-        except asyncio.TimeoutError:
-            logger.error(
-                "Debate: judge provider timed out",
-                extra={
-                    "provider": judge_provider,
-                    "role": "judge",
-                    "timeout_seconds": self.ensemble_timeout,
-                }
-            )
-            failed_debate_providers.append(judge_provider)
-            failed_debate_roles.append({"role": "judge", "provider": judge_provider, "reason": "timeout"})
-            increment_provider_request(judge_provider, "failure")
-            # TODO: Track debate provider timeouts for alerting (THR-XXX)
-        except Exception as e:
-            logger.error(
-                "Debate: judge provider failed with exception",
-                extra={
-                    "provider": judge_provider,
-                    "role": "judge",
-                    "error": str(e),
-                    "error_type": type(e).__name__,
-                },
-                exc_info=True
-            )
-            failed_debate_providers.append(judge_provider)
-            failed_debate_roles.append({"role": "judge", "provider": judge_provider, "reason": type(e).__name__})
-            increment_provider_request(judge_provider, "failure")
-            # TODO: Alert on repeated debate provider failures (THR-XXX)
+                failed_debate_providers.append(judge_provider)
+                failed_debate_roles.append({"role": "judge", "provider": judge_provider, "reason": type(e).__name__})
+                increment_provider_request(judge_provider, "failure")
+                # TODO: Alert on repeated debate provider failures (THR-XXX)
 
         # Error: if any debate provider failed, raise error
         if bull_case is None or bear_case is None or judge_decision is None:
@@ -1069,6 +1239,8 @@ Data Quality: <good|degraded|stale>
             )
             if not final_decision.get("decision_origin"):
                 final_decision["decision_origin"] = "judge"
+            if isinstance(final_decision.get("debate_metadata"), dict):
+                final_decision["debate_metadata"]["judge_skipped"] = hold_agreement is not None
             if not final_decision.get("market_regime"):
                 for candidate in (judge_decision, bull_case, bear_case):
                     if isinstance(candidate, dict) and candidate.get("market_regime"):
@@ -1091,7 +1263,52 @@ Data Quality: <good|degraded|stale>
         request_label: Optional[str] = None,
         request_timeout_s: Optional[float] = None,
     ) -> Dict[str, Any]:
-        """Helper to query a single, specified AI provider."""
+        """Helper to query a single, specified AI provider.
+
+        With provider telemetry enabled, records latency and outcome under the
+        debate seat from ``request_label`` (``ensemble`` otherwise).
+        """
+        telemetry = self.provider_telemetry
+        if telemetry is None:
+            return await self._dispatch_single_provider(
+                provider_name, prompt, request_label, request_timeout_s
+            )
+
+        role = (request_label or "").partition("debate:")[2] or "ensemble"
+        started = time.perf_counter()
+        status, tokens = "failure", 0
+        try:
+            result = await self._dispatch_single_provider(
+                provider_name, prompt, request_label, request_timeout_s
+            )
+            if isinstance(result, dict) and result.get("decision_origin") != "fallback":
+                status, tokens = "success", result.get("eval_tokens") or 0
+            return result
+        except asyncio.TimeoutError:
+            status = "timeout"
+            raise
+        except asyncio.CancelledError:
+            # Cut short by the ensemble; the caller records real timeouts
+            status = None
+            raise
+        finally:
+            if status is not None:
+                telemetry.record_request(
+                    provider_name,
+                    time.perf_counter() - started,
+                    status,
+                    role=role,
+                    tokens=tokens,
+                )
+
+    async def _dispatch_single_provider(
+        self,
+        provider_name: str,
+        prompt: str,
+        request_label: Optional[str] = None,
+        request_timeout_s: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Route a single-provider query to the matching inference backend."""
         # Import inline to avoid circular dependencies
         from .provider_tiers import is_ollama_model
 
@@ -1229,8 +1446,10 @@ Data Quality: <good|degraded|stale>
         Simple parallel ensemble: query all enabled providers concurrently and aggregate.
 
         Used when two-phase escalation is disabled. Queries all enabled providers
-        in parallel (up to MAX_WORKERS threads) and aggregates results using the
-        ensemble manager's standard aggregation method.
+        in parallel (up to MAX_WORKERS at once), consuming results as they complete,
+        and aggregates them using the ensemble manager's standard aggregation method.
+        With ``ensemble.early_exit`` enabled, outstanding providers are cancelled once
+        they can no longer change the vote and are reported as cut short.
 
         Args:
             prompt: AI prompt to send to all providers
@@ -1242,68 +1461,76 @@ Data Quality: <good|degraded|stale>
             f"Using simple parallel ensemble with {len(self.ensemble_manager.enabled_providers)} providers"
         )
 
-        provider_decisions = {}
-        failed_providers = []
+        from finance_feedback_engine.monitoring.prometheus import (
+            increment_provider_request,
+        )
 
-        semaphore = asyncio.BoundedSemaphore(MAX_WORKERS)
+        from .streaming_ensemble import collect_provider_votes
 
-        async def run_provider(provider_name: str):
-            async with semaphore:
-                return await self._query_single_provider(provider_name, prompt)
+        ensemble = self.ensemble_manager
+        # Managers without the streaming settings (e.g. test doubles) query everyone
+        early_exit = getattr(ensemble, "early_exit_enabled", False) is True
+        adaptive_timeouts = getattr(ensemble, "adaptive_timeouts", False) is True
 
-        tasks = [
-            asyncio.create_task(run_provider(provider))
-            for provider in self.ensemble_manager.enabled_providers
-        ]
+        providers = (
+            ensemble.routed_providers()
+            if isinstance(ensemble, EnsembleDecisionManager)
+            else ensemble.enabled_providers
+        )
 
         try:
-            results = await asyncio.wait_for(
-                asyncio.gather(*tasks, return_exceptions=True), timeout=self.ensemble_timeout
+            votes = await asyncio.wait_for(
+                collect_provider_votes(
+                    providers,
+                    lambda provider: self._query_single_provider(provider, prompt),
+                    ensemble._is_valid_provider_response,
+                    settle=ensemble.settled_action if early_exit else None,
+                    timeout_for=(
+                        (lambda p: ensemble.provider_timeout(p, self.ensemble_timeout))
+                        if adaptive_timeouts
+                        else None
+                    ),
+                    max_concurrency=MAX_WORKERS,
+                    latency_tracker=getattr(ensemble, "latency_tracker", None),
+                    on_result=increment_provider_request,
+                ),
+                timeout=self.ensemble_timeout,
             )
         except asyncio.TimeoutError:
             logger.error(
-                f"Parallel ensemble timed out after {self.ensemble_timeout}s; cancelling provider tasks"
+                f"Parallel ensemble timed out after {self.ensemble_timeout}s; cancelled provider tasks"
             )
-            for task in tasks:
-                task.cancel()
-            await asyncio.gather(*tasks, return_exceptions=True)
             raise
 
-        from finance_feedback_engine.monitoring.prometheus import (
-            increment_provider_request,
-        )
-
-        for provider, result in zip(self.ensemble_manager.enabled_providers, results):
-            if isinstance(result, Exception):
-                logger.error(f"Provider {provider} failed: {result}")
-                failed_providers.append(provider)
-                increment_provider_request(provider, "failure")
-            else:
-                decision = result
-                if self.ensemble_manager._is_valid_provider_response(
-                    decision, provider
-                ):
-                    provider_decisions[provider] = decision
-                    logger.debug(
-                        f"Provider {provider} -> {decision.get('action')} ({decision.get('confidence')}%)"
-                    )
-                    increment_provider_request(provider, "success")
-                else:
-                    logger.warning(f"Provider {provider} returned invalid response")
-                    failed_providers.append(provider)
-                    increment_provider_request(provider, "failure")
+        provider_decisions = votes.decisions
+        failed_providers = votes.failed
+        if self.provider_telemetry is not None:
+            for provider in votes.timed_out:
+                self.provider_telemetry.record_request(
+                    provider,
+                    ensemble.provider_timeout(provider, self.ensemble_timeout) or 0.0,
+                    "timeout",
+                )
 
         # Raise error if all providers failed
         if not provider_decisions:
             logger.error("All providers failed in parallel ensemble")
             raise RuntimeError(
-                f"All {len(self.ensemble_manager.enabled_providers)} ensemble providers failed. "
+                f"All {len(providers)} ensemble providers failed. "
                 f"Failed providers: {failed_providers}"
             )
 
         # Aggregate results using ensemble manager
-        return await self.ensemble_manager.aggregate_decisions(
-            provider_decisions=provider_decisions, failed_providers=failed_providers
+        aggregate_kwargs = {}
+        if votes.cut_short:
+            aggregate_kwargs["cut_short_providers"] = votes.cut_short
+        routed_out = [p for p in ensemble.enabled_providers if p not in providers]
+        if routed_out:
+            aggregate_kwargs["routed_out_providers"] = routed_out
+        return await ensemble.aggregate_decisions(
+            provider_decisions=provider_decisions,
+            failed_providers=failed_providers,
+            **aggregate_kwargs,
         )
 
     async def _local_ai_raw_inference(
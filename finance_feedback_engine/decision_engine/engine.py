@@ -1,5 +1,5 @@
 """Decision engine for generating AI-powered trading decisions."""
-from finance_feedback_engine.decision_engine.pre_reasoner import MarketBrief, PreReasonGatekeeper, build_pre_reason_prompt, parse_pre_reason_response
+from finance_feedback_engine.decision_engine.pre_reasoner import DEFAULT_BRIEF_CACHE_FLUSH_EVERY, DEFAULT_BRIEF_CACHE_MAX_ENTRIES, DEFAULT_BRIEF_CACHE_PATH, DEFAULT_BRIEF_CACHE_TIMEFRAME, MarketBrief, PreReasonBriefCache, PreReasonGatekeeper, build_pre_reason_prompt, parse_pre_reason_response
 
 import asyncio
 import json
@@ -219,7 +219,26 @@ class DecisionEngine:
 
         # Monitoring context provider (optional, set via set_monitoring_context)
         self.monitoring_provider = None
-        self._pre_reason_gatekeeper = PreReasonGatekeeper()
+        # Pre-reasoning briefs are reused until the next candle closes;
+        # backtests keep the cache in memory only.
+        brief_cache_config = decision_config.get("pre_reason_cache") or {}
+        brief_cache = None
+        if brief_cache_config.get("enabled", False):
+            brief_cache = PreReasonBriefCache(
+                max_entries=brief_cache_config.get(
+                    "max_entries", DEFAULT_BRIEF_CACHE_MAX_ENTRIES
+                ),
+                path=None
+                if backtest_mode
+                else brief_cache_config.get("path", DEFAULT_BRIEF_CACHE_PATH),
+                timeframe=brief_cache_config.get(
+                    "timeframe", DEFAULT_BRIEF_CACHE_TIMEFRAME
+                ),
+                flush_every=brief_cache_config.get(
+                    "flush_every", DEFAULT_BRIEF_CACHE_FLUSH_EVERY
+                ),
+            )
+        self._pre_reason_gatekeeper = PreReasonGatekeeper(brief_cache=brief_cache)
 
         # Initialize vector memory for semantic search (optional)
         self.vector_memory = None
@@ -1518,8 +1537,10 @@ Missing Evidence: <what additional evidence would increase confidence>
         Simple parallel ensemble: query all enabled providers concurrently and aggregate.
 
         Used when two-phase escalation is disabled. Queries all enabled providers
-        in parallel (up to MAX_WORKERS threads) and aggregates results using the
-        ensemble manager's standard aggregation method.
+        concurrently, consuming results as they complete, and aggregates them
+        using the ensemble manager's standard aggregation method. With
+        ``ensemble.early_exit`` enabled, outstanding providers are cancelled once
+        they can no longer change the vote and are reported as cut short.
 
         Args:
             prompt: AI prompt to send to all providers
@@ -1531,46 +1552,40 @@ Missing Evidence: <what additional evidence would increase confidence>
             f"Using simple parallel ensemble with {len(self.ensemble_manager.enabled_providers)} providers"
         )
 
-        provider_decisions = {}
-        failed_providers = []
+        from .streaming_ensemble import collect_provider_votes
 
-        tasks = [
-            self._query_single_provider(provider, prompt)
-            for provider in self.ensemble_manager.enabled_providers
-        ]
-
-        # Use asyncio.gather to run tasks concurrently with a timeout
-        # Note: ENSEMBLE_TIMEOUT is a global constant at the top of the file
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        ensemble = self.ensemble_manager
+        # Managers without the streaming settings (e.g. test doubles) query everyone
+        early_exit = getattr(ensemble, "early_exit_enabled", False) is True
+        adaptive_timeouts = getattr(ensemble, "adaptive_timeouts", False) is True
 
-        for provider, result in zip(self.ensemble_manager.enabled_providers, results):
-            if isinstance(result, Exception):
-                logger.error(f"Provider {provider} failed: {result}")
-                failed_providers.append(provider)
-            else:
-                decision = result
-                if self.ensemble_manager._is_valid_provider_response(
-                    decision, provider
-                ):
-                    provider_decisions[provider] = decision
-                    logger.debug(
-                        f"Provider {provider} -> {decision.get('action')} ({decision.get('confidence')}%)"
-                    )
-                else:
-                    logger.warning(f"Provider {provider} returned invalid response")
-                    failed_providers.append(provider)
+        votes = await collect_provider_votes(
+            ensemble.enabled_providers,
+            lambda provider: self._query_single_provider(provider, prompt),
+            ensemble._is_valid_provider_response,
+            settle=ensemble.settled_action if early_exit else None,
+            timeout_for=ensemble.provider_timeout if adaptive_timeouts else None,
+            latency_tracker=getattr(ensemble, "latency_tracker", None),
+        )
+        provider_decisions = votes.decisions
+        failed_providers = votes.failed
 
         # Raise error if all providers failed
         if not provider_decisions:
             logger.error("All providers failed in parallel ensemble")
             raise RuntimeError(
-                f"All {len(self.ensemble_manager.enabled_providers)} ensemble providers failed. "
+                f"All {len(ensemble.enabled_providers)} ensemble providers failed. "
                 f"Failed providers: {failed_providers}"
             )
 
         # Aggregate results using ensemble manager
-        final = await self.ensemble_manager.aggregate_decisions(
-            provider_decisions=provider_decisions, failed_providers=failed_providers
+        aggregate_kwargs = {}
+        if votes.cut_short:
+            aggregate_kwargs["cut_short_providers"] = votes.cut_short
+        final = await ensemble.aggregate_decisions(
+            provider_decisions=provider_decisions,
+            failed_providers=failed_providers,
+            **aggregate_kwargs,
         )
 
         # Enrich metadata with provider tracing details
@@ -2306,28 +2321,52 @@ Missing Evidence: <what additional evidence would increase confidence>
                     memory_context=memory_context,
                 )
                 reasoning_timing["pre_reason_prompt_build_s"] = round(time.perf_counter() - _timing_started, 4)
-                # Use a raw single-provider local LLM call so the market-brief
-                # schema is not contaminated by the trading-decision wrapper.
-                _timing_started = time.perf_counter()
-                pre_reason_raw_response = await self.ai_manager._query_single_provider_raw(
-                    "deepseek-r1:8b", pre_reason_prompt,
-                )
-                reasoning_timing["pre_reason_raw_call_s"] = round(time.perf_counter() - _timing_started, 4)
-                logger.debug(
-                    "Pre-reasoner raw response for %s: %s",
-                    asset_pair,
-                    str(pre_reason_raw_response)[:200],
-                )
-                try:
-                    pre_reason_response = json.loads(pre_reason_raw_response)
-                except Exception as parse_error:
-                    logger.warning(
-                        "Pre-reasoner JSON parse failed for %s: %s | raw=%s",
+                brief_cache = getattr(self._pre_reason_gatekeeper, "brief_cache", None)
+                pre_reason_response = None
+                # Briefs are keyed on the regime detected for this decision and
+                # the last closed candle of the asset's decision timeframe
+                brief_key = {
+                    "regime": _normalize_market_regime(context.get("regime")),
+                    "position_state": context.get("position_state"),
+                    "timeframe": self._decision_timeframe(asset_pair, market_data),
+                }
+                if brief_cache is not None:
+                    pre_reason_response = brief_cache.get(
+                        asset_pair, market_data, **brief_key
+                    )
+                brief_from_cache = pre_reason_response is not None
+                if brief_from_cache:
+                    logger.info(
+                        "Pre-reasoner: reusing cached brief for %s (candle unchanged)",
+                        asset_pair,
+                    )
+                else:
+                    # Use a raw single-provider local LLM call so the market-brief
+                    # schema is not contaminated by the trading-decision wrapper.
+                    _timing_started = time.perf_counter()
+                    pre_reason_raw_response = await self.ai_manager._query_single_provider_raw(
+                        "deepseek-r1:8b", pre_reason_prompt,
+                    )
+                    reasoning_timing["pre_reason_raw_call_s"] = round(time.perf_counter() - _timing_started, 4)
+                    logger.debug(
+                        "Pre-reasoner raw response for %s: %s",
                         asset_pair,
-                        parse_error,
                         str(pre_reason_raw_response)[:200],
                     )
-                    pre_reason_response = {}
+                    try:
+                        pre_reason_response = json.loads(pre_reason_raw_response)
+                    except Exception as parse_error:
+                        logger.warning(
+                            "Pre-reasoner JSON parse failed for %s: %s | raw=%s",
+                            asset_pair,
+                            parse_error,
+                            str(pre_reason_raw_response)[:200],
+                        )
+                        pre_reason_response = {}
+                    if brief_cache is not None and isinstance(pre_reason_response, dict):
+                        brief_cache.put(
+                            asset_pair, market_data, pre_reason_response, **brief_key
+                        )
                 # Extract data timestamp for deterministic data-quality computation
                 _data_ts = market_data.get("date") or market_data.get("timestamp")
                 _data_ts_float = None
@@ -2357,7 +2396,10 @@ Missing Evidence: <what additional evidence would increase confidence>
                 force_debate, force_reason = self._pre_reason_gatekeeper.should_force_debate(market_brief)
 
                 if not market_brief.actionable and not force_debate:
-                    self._pre_reason_gatekeeper.record_skip()
+                    if brief_from_cache:
+                        self._pre_reason_gatekeeper.record_skip(from_cache=True)
+                    else:
+                        self._pre_reason_gatekeeper.record_skip()
                     logger.info(
                         "Pre-reasoner: skipping debate for %s | reason=%s | regime=%s | confidence=%d | skips=%s",
                         asset_pair,
@@ -2386,6 +2428,7 @@ Missing Evidence: <what additional evidence would increase confidence>
                     skip_decision["market_regime"] = market_brief.regime
                     skip_decision["pre_reasoning"] = {
                         "skip_debate": True,
+                        "brief_cached": brief_from_cache,
                         "regime": market_brief.regime,
                         "reason": market_brief.skip_reason or "No actionable signal",
                         "confidence": market_brief.regime_confidence,
@@ -2593,6 +2636,20 @@ Missing Evidence: <what additional evidence would increase confidence>
             monitoring_context,
         )
 
+    def _decision_timeframe(
+        self, asset_pair: str, market_data: Dict[str, Any]
+    ) -> Optional[str]:
+        """Candle timeframe a decision is made on, if known.
+
+        The market data's own timeframe wins; otherwise the asset's
+        ``agent.asset_parameters`` entry (e.g. ``M5``) is used.
+        """
+        if market_data.get("timeframe"):
+            return str(market_data["timeframe"])
+        agent_config = (getattr(self, "config", None) or {}).get("agent") or {}
+        asset_parameters = agent_config.get("asset_parameters") or {}
+        return (asset_parameters.get(asset_pair) or {}).get("timeframe")
+
     def _should_include_semantic_memory(self) -> bool:
         """
         Determine whether to include semantic memory in the prompt.
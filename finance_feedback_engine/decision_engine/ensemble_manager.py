@@ -31,6 +31,7 @@ from .policy_actions import (
     normalize_policy_action,
 )
 from .performance_tracker import PerformanceTracker
+from .streaming_ensemble import ProviderLatencyTracker, settled_action
 from .two_phase_aggregator import TwoPhaseAggregator
 from .voting_strategies import VotingStrategies
 
@@ -255,6 +256,24 @@ class EnsembleDecisionManager:
         self.local_dominance_target = ensemble_config.get("local_dominance_target", 0.6)
         self.min_local_providers = ensemble_config.get("min_local_providers", 1)
 
+        # Early exit: stop querying once outstanding providers cannot flip the vote
+        early_exit_cfg = ensemble_config.get("early_exit", {}) or {}
+        self.early_exit_enabled = bool(early_exit_cfg.get("enabled", False))
+        self.adaptive_timeouts = bool(early_exit_cfg.get("adaptive_timeouts", False))
+        self.latency_tracker = ProviderLatencyTracker(
+            **{
+                k: early_exit_cfg[k]
+                for k in (
+                    "window",
+                    "percentile",
+                    "multiplier",
+                    "min_samples",
+                    "min_timeout_seconds",
+                )
+                if k in early_exit_cfg
+            }
+        )
+
         # Initialize specialized components
         self.voting_strategies = VotingStrategies(self.voting_strategy)
         self.performance_tracker = PerformanceTracker(config, self.learning_rate)
@@ -270,13 +289,46 @@ class EnsembleDecisionManager:
         if self._is_feature_enabled("thompson_sampling_weights"):
             from .thompson_sampling import ThompsonSamplingWeightOptimizer
 
+            learning_cfg = config.get("persistence", {}).get("learning_state", {})
             self.weight_optimizer = ThompsonSamplingWeightOptimizer(
-                providers=self.enabled_providers
+                providers=self.enabled_providers,
+                **{
+                    k: learning_cfg[k]
+                    for k in ("flush_interval_seconds", "flush_every")
+                    if k in learning_cfg
+                },
             )
             logger.info(
                 "Thompson Sampling weight optimizer enabled for dynamic weight adaptation"
             )
 
+        # Provider telemetry feeds latency-aware routing of members and debate seats
+        from ..monitoring.provider_telemetry import (
+            get_provider_telemetry,
+            telemetry_enabled,
+        )
+
+        routing_cfg = ensemble_config.get("routing", {}) or {}
+        self.telemetry = get_provider_telemetry(config) if telemetry_enabled(config) else None
+        self.router = None
+        if routing_cfg.get("enabled", False):
+            from .provider_routing import ProviderRouter
+
+            self.router = ProviderRouter(
+                self.telemetry,
+                **{
+                    k: routing_cfg[k]
+                    for k in (
+                        "latency_budget_seconds",
+                        "min_samples",
+                        "min_members",
+                        "max_members",
+                        "exploration_rate",
+                    )
+                    if k in routing_cfg
+                },
+            )
+
         logger.info(
             f"Local-First Ensemble initialized. Target Local Dominance: {self.local_dominance_target:.0%}"
         )
@@ -382,6 +434,65 @@ class EnsembleDecisionManager:
 
         return result
 
+    def settled_action(
+        self, provider_decisions: Dict[str, Dict[str, Any]], pending: List[str]
+    ) -> Optional[str]:
+        """
+        Winning action if the outstanding providers can no longer change it.
+
+        Args:
+            provider_decisions: Valid decisions received so far
+            pending: Providers still being queried
+
+        Returns:
+            The settled action, or None to keep waiting
+        """
+        if not self.early_exit_enabled:
+            return None
+        votes = {
+            p: d for p, d in provider_decisions.items() if p in self.enabled_providers
+        }
+        pending = [p for p in pending if p in self.enabled_providers]
+        # Cutting short a local provider must not cost the local quorum
+        active_local = [p for p in votes if self._is_local_provider(p)]
+        if len(active_local) < self.min_local_providers and any(
+            self._is_local_provider(p) for p in pending
+        ):
+            return None
+        return settled_action(
+            votes, pending, self.voting_strategy, self._calculate_robust_weights
+        )
+
+    def provider_timeout(
+        self, provider: str, ceiling: Optional[float] = None
+    ) -> Optional[float]:
+        """Per-provider timeout from observed latency, capped at ``ceiling``."""
+        if not self.adaptive_timeouts:
+            return ceiling
+        return self.latency_tracker.timeout_for(provider, ceiling)
+
+    def routed_providers(self) -> List[str]:
+        """Enabled providers to query for the next decision (all without routing)."""
+        if self.router is None:
+            return list(self.enabled_providers)
+        return self.router.select_ensemble_members(self.enabled_providers)
+
+    def route_debate_seats(self) -> Dict[str, str]:
+        """
+        Re-pick debate seats from telemetry before a debate.
+
+        Updates ``debate_providers`` in place so the DebateManager, which
+        shares the mapping, attributes role decisions to the routed models.
+        """
+        if self.router is not None:
+            candidates = list(
+                dict.fromkeys([*self.debate_providers.values(), *self.enabled_providers])
+            )
+            self.debate_providers.update(
+                self.router.select_debate_seats(self.debate_providers, candidates)
+            )
+        return self.debate_providers
+
     def _normalize_weights(self, weights: Dict[str, float]) -> Dict[str, float]:
         """
         Normalize provider weights safely.
@@ -451,6 +562,8 @@ class EnsembleDecisionManager:
         provider_decisions: Dict[str, Dict[str, Any]],
         failed_providers: Optional[List[str]] = None,
         adjusted_weights: Optional[Dict[str, float]] = None,
+        cut_short_providers: Optional[List[str]] = None,
+        routed_out_providers: Optional[List[str]] = None,
     ) -> Dict[str, Any]:
         """
         Aggregate decisions from multiple providers into unified decision.
@@ -466,6 +579,10 @@ class EnsembleDecisionManager:
         Args:
             provider_decisions: Dict mapping provider name to decision dict
             failed_providers: Optional list of providers that failed to respond
+            cut_short_providers: Providers cancelled after the vote settled;
+                they do not count against confidence like failures do
+            routed_out_providers: Enabled providers the router left out of
+                this decision; they are not counted as failures
 
         Returns:
             Unified decision with ensemble metadata
@@ -474,7 +591,11 @@ class EnsembleDecisionManager:
             raise ValueError("No provider decisions to aggregate")
 
         failed_providers = failed_providers or []
-        total_providers = len(self.enabled_providers)
+        cut_short_providers = cut_short_providers or []
+        routed_out_providers = routed_out_providers or []
+        total_providers = len(
+            [p for p in self.enabled_providers if p not in routed_out_providers]
+        )
         active_providers = len(provider_decisions)
         failure_rate = (
             len(failed_providers) / total_providers if total_providers > 0 else 0
@@ -571,13 +692,16 @@ class EnsembleDecisionManager:
 
         # Adjust confidence based on provider availability
         final_decision = self._adjust_confidence_for_failures(
-            final_decision, active_providers, total_providers
+            final_decision, active_providers + len(cut_short_providers), total_providers
         )
 
         # Add comprehensive ensemble metadata
         ensemble_metadata = {
             "providers_used": provider_names,
             "providers_failed": failed_providers,
+            "providers_cut_short": cut_short_providers,
+            "providers_routed_out": routed_out_providers,
+            "early_exit": bool(cut_short_providers),
             "num_active": active_providers,
             "num_total": total_providers,
             "failure_rate": failure_rate,
@@ -733,7 +857,13 @@ class EnsembleDecisionManager:
         """
         # Use the TwoPhaseAggregator component
         result = await self.two_phase_aggregator.aggregate_two_phase(
-            prompt, asset_pair, market_data, query_function
+            prompt,
+            asset_pair,
+            market_data,
+            query_function,
+            settle=self.settled_action if self.early_exit_enabled else None,
+            timeout_for=self.provider_timeout if self.adaptive_timeouts else None,
+            latency_tracker=self.latency_tracker,
         )
 
         # If two-phase mode is not enabled, return None to indicate standard aggregation should be used
@@ -774,6 +904,7 @@ class EnsembleDecisionManager:
         # Get Phase 1 decision from provider decisions
         phase1_decisions = phase1_result["provider_decisions"]
         phase1_failed = phase1_result["failed_providers"]
+        phase1_cut_short = phase1_result.get("cut_short_providers", [])
 
         # Aggregate Phase 1 decisions
         if tracer:
@@ -782,11 +913,15 @@ class EnsembleDecisionManager:
                 attributes={"num_providers": len(phase1_decisions)},
             ):
                 phase1_decision = await self.aggregate_decisions(
-                    provider_decisions=phase1_decisions, failed_providers=phase1_failed
+                    provider_decisions=phase1_decisions,
+                    failed_providers=phase1_failed,
+                    cut_short_providers=phase1_cut_short,
                 )
         else:
             phase1_decision = await self.aggregate_decisions(
-                provider_decisions=phase1_decisions, failed_providers=phase1_failed
+                provider_decisions=phase1_decisions,
+                failed_providers=phase1_failed,
+                cut_short_providers=phase1_cut_short,
             )
 
         phase1_action = phase1_decision["action"]
@@ -855,11 +990,15 @@ class EnsembleDecisionManager:
                 },
             ):
                 final_decision = await self.aggregate_decisions(
-                    provider_decisions=all_decisions, failed_providers=all_failed
+                    provider_decisions=all_decisions,
+                    failed_providers=all_failed,
+                    cut_short_providers=phase1_cut_short,
                 )
         else:
             final_decision = await self.aggregate_decisions(
-                provider_decisions=all_decisions, failed_providers=all_failed
+                provider_decisions=all_decisions,
+                failed_providers=all_failed,
+                cut_short_providers=phase1_cut_short,
             )
 
         # Check if Phase 2 changed the decision
@@ -1710,12 +1849,19 @@ class EnsembleDecisionManager:
         learning_providers = list(provider_decisions.keys()) if self.debate_mode else self.enabled_providers
 
         # Use the PerformanceTracker component
-        self.performance_tracker.update_provider_performance(
+        graded = self.performance_tracker.update_provider_performance(
             provider_decisions,
             actual_outcome,
             performance_metric,
             learning_providers,
         )
+        if self.telemetry is not None:
+            for key, correct in (graded or {}).items():
+                decision = provider_decisions.get(key) or {}
+                role = key if self.debate_mode else "ensemble"
+                self.telemetry.record_outcome(
+                    decision.get("provider", key), correct, role=role
+                )
 
         # Update the base weights with the newly calculated values
         new_weights = self.performance_tracker.calculate_adaptive_weights(
@@ -1760,6 +1906,12 @@ class EnsembleDecisionManager:
         # Use the PerformanceTracker component
         self.performance_tracker._save_performance_history()
 
+    def flush_learning_state(self) -> None:
+        """Persist coalesced learning updates (call after a backtest or replay)."""
+        self.performance_tracker.flush()
+        if self.weight_optimizer is not None:
+            self.weight_optimizer.flush()
+
     def get_provider_stats(self) -> Dict[str, Any]:
         """Get current provider statistics and weights."""
         stats = {
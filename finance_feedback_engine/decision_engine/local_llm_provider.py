@@ -118,6 +118,36 @@ def _extract_allowed_policy_actions(prompt: str) -> list[str]:
     return narrowed or list(_POLICY_ACTION_ORDER)
 
 
+def _build_decision_prompt(prompt: str, request_label: Optional[str] = None) -> str:
+    """Wrap a trading prompt with the decision-schema instructions sent to Ollama."""
+    allowed_actions = _extract_allowed_policy_actions(prompt)
+    allowed_actions_str = ", ".join(allowed_actions)
+    if request_label and request_label.startswith("debate:"):
+        return (
+            "You are a professional day trading advisor. "
+            "Analyze market data and provide trading recommendations. "
+            "Respond ONLY with valid JSON containing these exact keys: "
+            f"action (one of {allowed_actions_str}), policy_action (must equal action and be one of {allowed_actions_str}), "
+            "candidate_actions (JSON array of seriously considered allowed policy actions, with candidate_actions[0] equal to policy_action), "
+            "confidence (0-100 integer), reasoning (brief explanation string), amount (decimal number for position size). "
+            "Never omit policy_action or candidate_actions for debate requests. "
+            "Calibrate confidence honestly: 80-89 means strong actionable setup that should clear strict judged-open gates; 70-79 means borderline and below the strict entry bar; do not use 75 as a generic synonym for high confidence. "
+            "Never output an action outside the allowed policy-action list in the prompt.\n\n"
+            f"{prompt}"
+        )
+    else:
+        return (
+            "You are a professional day trading advisor. "
+            "Analyze market data and provide trading recommendations. "
+            "Respond ONLY with valid JSON containing these exact keys: "
+            f"action (one of {allowed_actions_str}), confidence (0-100 integer), "
+            "reasoning (brief explanation string), "
+            "amount (decimal number for position size). "
+            "Never output an action outside the allowed policy-action list in the prompt.\n\n"
+            f"{prompt}"
+        )
+
+
 class LocalLLMProvider:
     """
     Local LLM provider using Ollama with connection pooling (Phase 2 optimization).
@@ -707,6 +737,57 @@ class LocalLLMProvider:
             f"Local raw query failed after {max_retries} attempts for model {active_model}"
         )
 
+    def prefill(
+        self,
+        prompt_prefix: str,
+        model_name: str = None,
+        request_label: Optional[str] = None,
+        request_timeout_s: Optional[float] = None,
+    ) -> float:
+        """
+        Evaluate a prompt prefix so a later query sharing it reuses the KV cache.
+
+        The prefix is wrapped exactly as ``query()`` wraps its prompt and a
+        single token is generated. Ollama keeps the evaluated prompt in the
+        runner's cache, so a following ``query()`` whose prompt starts with
+        ``prompt_prefix`` only evaluates the appended text.
+
+        Returns:
+            Seconds spent on the prefill request
+        """
+        active_model = model_name or self.model_name
+        self.ensure_connection()
+        llm_timeout = request_timeout_s or self.config.get("api_timeouts", {}).get("llm_query", 120)
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(
+                self.ollama_client.generate,
+                model=active_model,
+                prompt=_build_decision_prompt(prompt_prefix, request_label),
+                options={
+                    "temperature": 0.7,
+                    "top_p": 0.9,
+                    "num_predict": 1,
+                },
+            )
+            try:
+                future.result(timeout=llm_timeout)
+            except Exception:
+                future.cancel()
+                raise
+        elapsed = time.perf_counter() - started
+        logger.info(
+            "Local LLM prefill done | model=%s request_label=%s prefix_chars=%d prefill_s=%.3f",
+            active_model,
+            request_label or "none",
+            len(prompt_prefix),
+            elapsed,
+        )
+        return elapsed
+
     def query(
         self,
         prompt: str,
@@ -754,32 +835,7 @@ class LocalLLMProvider:
                 )
 
                 # Create system prompt for trading
-                allowed_actions = _extract_allowed_policy_actions(prompt)
-                allowed_actions_str = ", ".join(allowed_actions)
-                if request_label and request_label.startswith("debate:"):
-                    full_prompt = (
-                        "You are a professional day trading advisor. "
-                        "Analyze market data and provide trading recommendations. "
-                        "Respond ONLY with valid JSON containing these exact keys: "
-                        f"action (one of {allowed_actions_str}), policy_action (must equal action and be one of {allowed_actions_str}), "
-                        "candidate_actions (JSON array of seriously considered allowed policy actions, with candidate_actions[0] equal to policy_action), "
-                        "confidence (0-100 integer), reasoning (brief explanation string), amount (decimal number for position size). "
-                        "Never omit policy_action or candidate_actions for debate requests. "
-                        "Calibrate confidence honestly: 80-89 means strong actionable setup that should clear strict judged-open gates; 70-79 means borderline and below the strict entry bar; do not use 75 as a generic synonym for high confidence. "
-                        "Never output an action outside the allowed policy-action list in the prompt.\n\n"
-                        f"{prompt}"
-                    )
-                else:
-                    full_prompt = (
-                        "You are a professional day trading advisor. "
-                        "Analyze market data and provide trading recommendations. "
-                        "Respond ONLY with valid JSON containing these exact keys: "
-                        f"action (one of {allowed_actions_str}), confidence (0-100 integer), "
-                        "reasoning (brief explanation string), "
-                        "amount (decimal number for position size). "
-                        "Never output an action outside the allowed policy-action list in the prompt.\n\n"
-                        f"{prompt}"
-                    )
+                full_prompt = _build_decision_prompt(prompt, request_label)
 
                 # Call Ollama via HTTP API with timeout protection
                 import asyncio
@@ -916,6 +972,11 @@ class LocalLLMProvider:
                         f"model={active_model} ensure_connection_s={ensure_connection_s:.3f} generate_s={generate_s:.3f}"
                     )
 
+                    # Generated token count feeds provider throughput telemetry
+                    eval_count = response.get("eval_count")
+                    if isinstance(eval_count, int):
+                        decision["eval_tokens"] = eval_count
+
                     # Unload model from memory to free GPU resources for next model
                     self._unload_model()
 
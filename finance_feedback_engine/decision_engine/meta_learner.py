@@ -0,0 +1,160 @@
+"""
+NumPy inference kernel for the stacking meta-learner.
+
+The stacking model is a standard scaler followed by a logistic regression.
+Training happens offline (``scripts/retrain_meta_learner.py``) and writes the
+fitted parameters to ``meta_learner_model.json``; at runtime all we need is
+the affine transform and a softmax, so sklearn stays off the decision path.
+
+``MetaFeatureScaler`` and ``StackingMetaLearner`` mirror the attributes and
+methods of sklearn's ``StandardScaler``/``LogisticRegression`` that the voting
+code relies on (``mean_``, ``scale_``, ``classes_``, ``coef_``, ``intercept_``,
+``transform``, ``predict``, ``predict_proba``) and accept 2D batches, so a
+backtest or replay can score thousands of decisions in a single call.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Tuple, Union
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+REQUIRED_MODEL_KEYS = ("classes", "coef", "intercept", "scaler_mean", "scaler_scale")
+
+
+class MetaFeatureScaler:
+    """Standardizes meta-feature rows with a fitted mean and scale."""
+
+    def __init__(self, mean: Any, scale: Any):
+        self.mean_ = np.asarray(mean, dtype=float)
+        scale = np.asarray(scale, dtype=float)
+        # StandardScaler stores a scale of 1.0 for constant features
+        self.scale_ = np.where(scale == 0.0, 1.0, scale)
+
+    @property
+    def n_features_in_(self) -> int:
+        return int(self.mean_.shape[0])
+
+    def transform(self, X: Any) -> np.ndarray:
+        """Scale a (n_samples, n_features) array (a single row is promoted)."""
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        return (X - self.mean_) / self.scale_
+
+
+class StackingMetaLearner:
+    """Logistic-regression inference over scaled meta-features.
+
+    Follows sklearn's conventions: a binary model stores one coefficient row
+    for ``classes_[1]`` and uses a sigmoid, multiclass models use a softmax
+    over one row per class.
+    """
+
+    def __init__(self, classes: Any, coef: Any, intercept: Any):
+        self.classes_ = np.asarray(classes)
+        self.coef_ = np.asarray(coef, dtype=float)
+        self.intercept_ = np.asarray(intercept, dtype=float)
+
+    @property
+    def n_features_in_(self) -> int:
+        return int(self.coef_.shape[1])
+
+    def decision_function(self, X: Any) -> np.ndarray:
+        """Raw logits: shape (n,) for a one-row binary model, else (n, n_classes)."""
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        scores = X @ self.coef_.T + self.intercept_
+        if self.coef_.shape[0] == 1:
+            return scores[:, 0]
+        return scores
+
+    def predict_proba(self, X: Any) -> np.ndarray:
+        """Class probabilities, shape (n_samples, n_classes)."""
+        scores = self.decision_function(X)
+        if scores.ndim == 1:
+            positive = 1.0 / (1.0 + np.exp(-scores))
+            return np.column_stack([1.0 - positive, positive])
+        scores = scores - scores.max(axis=1, keepdims=True)
+        np.exp(scores, out=scores)
+        scores /= scores.sum(axis=1, keepdims=True)
+        return scores
+
+    def predict(self, X: Any) -> np.ndarray:
+        """Most likely class label per row."""
+        scores = self.decision_function(X)
+        if scores.ndim == 1:
+            return self.classes_[(scores > 0).astype(int)]
+        return self.classes_[scores.argmax(axis=1)]
+
+
+def _validate_shapes(model: StackingMetaLearner, scaler: MetaFeatureScaler) -> None:
+    expected_n_features = scaler.mean_.shape[0]
+    n_classes = len(model.classes_)
+
+    # scikit-learn binary LogisticRegression uses:
+    #   coef_.shape == (1, n_features) and intercept_.shape == (1,)
+    # while multiclass uses:
+    #   coef_.shape == (n_classes, n_features) and intercept_.shape == (n_classes,)
+    coef_shape = model.coef_.shape
+    intercept_shape = model.intercept_.shape
+
+    if n_classes == 2:
+        allowed_coef_shapes = {(1, expected_n_features), (2, expected_n_features)}
+        if coef_shape not in allowed_coef_shapes:
+            raise ValueError(
+                "Invalid coef shape for binary classifier: expected one of "
+                f"{sorted(allowed_coef_shapes)}, got {coef_shape}"
+            )
+        allowed_intercept_shapes = {(1,), (2,)}
+        if intercept_shape not in allowed_intercept_shapes:
+            raise ValueError(
+                "Invalid intercept shape for binary classifier: expected one of "
+                f"{sorted(allowed_intercept_shapes)}, got {intercept_shape}"
+            )
+    else:
+        if coef_shape != (n_classes, expected_n_features):
+            raise ValueError(
+                f"Invalid coef shape: expected ({n_classes}, {expected_n_features}), got {coef_shape}"
+            )
+        if intercept_shape != (n_classes,):
+            raise ValueError(
+                f"Invalid intercept shape: expected ({n_classes},), got {intercept_shape}"
+            )
+
+    if scaler.scale_.shape != (expected_n_features,):
+        raise ValueError(
+            f"Invalid scaler_scale shape: expected ({expected_n_features},), got {scaler.scale_.shape}"
+        )
+
+
+def meta_learner_from_dict(
+    model_data: Dict[str, Any],
+) -> Tuple[StackingMetaLearner, MetaFeatureScaler]:
+    """Build the kernel from a model payload, validating keys and shapes.
+
+    Raises:
+        KeyError: If a required key is missing.
+        ValueError: If the parameter shapes are inconsistent.
+    """
+    missing_keys = [k for k in REQUIRED_MODEL_KEYS if k not in model_data]
+    if missing_keys:
+        raise KeyError(f"Missing required keys: {missing_keys}")
+
+    model = StackingMetaLearner(
+        model_data["classes"], model_data["coef"], model_data["intercept"]
+    )
+    if np.asarray(model_data["scaler_mean"]).ndim != 1:
+        raise ValueError("Invalid scaler_mean shape: expected a 1D array")
+    scaler = MetaFeatureScaler(model_data["scaler_mean"], model_data["scaler_scale"])
+    _validate_shapes(model, scaler)
+    return model, scaler
+
+
+def load_meta_learner(
+    path: Union[str, Path],
+) -> Tuple[StackingMetaLearner, MetaFeatureScaler]:
+    """Load a trained meta-learner from its JSON model file."""
+    with open(path, "r") as f:
+        model_data = json.load(f)
+    return meta_learner_from_dict(model_data)
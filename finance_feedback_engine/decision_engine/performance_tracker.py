@@ -14,6 +14,11 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 
 from finance_feedback_engine.utils.file_io import FileIOError, FileIOManager
+from finance_feedback_engine.utils.learning_state_store import (
+    DEFAULT_FLUSH_EVERY,
+    DEFAULT_FLUSH_INTERVAL_SECONDS,
+    LearningStateStore,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -41,6 +46,18 @@ class PerformanceTracker:
         storage_path = self.config.get("persistence", {}).get("storage_path", "data/decisions")
         self.history_path = Path(storage_path) / "ensemble_history.json"
 
+        # Outcome updates are delta-logged; full rewrites are coalesced
+        learning_cfg = self.config.get("persistence", {}).get("learning_state", {})
+        self._store = LearningStateStore(
+            self.history_path,
+            snapshot=lambda: self.performance_history,
+            flush_interval_seconds=learning_cfg.get(
+                "flush_interval_seconds", DEFAULT_FLUSH_INTERVAL_SECONDS
+            ),
+            flush_every=learning_cfg.get("flush_every", DEFAULT_FLUSH_EVERY),
+            file_io=self.file_io,
+        )
+
         # Adaptive blend constants (configurable via ensemble config)
         ensemble_cfg = self.config.get("ensemble", {})
         self.accuracy_weight = float(ensemble_cfg.get("adaptive_accuracy_weight", 0.75))
@@ -55,7 +72,7 @@ class PerformanceTracker:
         actual_outcome: str,
         performance_metric: float,
         enabled_providers: Optional[list] = None,
-    ) -> None:
+    ) -> Dict[str, bool]:
         """
         Update performance metrics for providers based on actual outcome.
 
@@ -64,10 +81,15 @@ class PerformanceTracker:
             actual_outcome: Actual market outcome (for backtesting)
             performance_metric: Performance score (e.g., profit/loss %)
             enabled_providers: List of currently enabled providers
+
+        Returns:
+            Whether each provider's recommendation was judged correct
         """
         enabled_providers = enabled_providers or []
 
         # Update performance history
+        updated = []
+        graded = {}
         for provider, decision in provider_decisions.items():
             # OPT-4: Fix correctness tracking. Previously compared provider action
             # string (e.g. "OPEN_SMALL_SHORT") against actual executed action (e.g. "SELL")
@@ -115,15 +137,21 @@ class PerformanceTracker:
             history["total"] += 1
             if was_correct:
                 history["correct"] += 1
+            graded[provider] = was_correct
 
             # Update average performance
             alpha = self.learning_rate
             history["avg_performance"] = (1 - alpha) * history[
                 "avg_performance"
             ] + alpha * performance_metric
+            updated.append(((provider,), history))
 
-        # Save updated history
-        self._save_performance_history()
+        # Delta-log the touched providers; the snapshot rewrite is coalesced
+        try:
+            self._store.record(*updated)
+        except FileIOError as e:
+            logger.error(f"Failed to save performance history: {e}")
+        return graded
 
     def calculate_adaptive_weights(
         self, enabled_providers: list, base_weights: Optional[Dict[str, float]] = None
@@ -209,26 +237,25 @@ class PerformanceTracker:
 
         return stats
 
+    def flush(self) -> None:
+        """Write any delta-logged updates into the history snapshot."""
+        try:
+            self._store.close()
+        except FileIOError as e:
+            logger.error(f"Failed to save performance history: {e}")
+
     def _load_performance_history(self) -> Dict[str, Any]:
         """Load provider performance history from disk."""
         try:
-            # Read with FileIOManager (returns {} if file doesn't exist)
-            return self.file_io.read_json(self.history_path, default={})
+            # Snapshot plus any delta-logged updates ({} if neither exists)
+            return self._store.load()
         except FileIOError as e:
             logger.warning(f"Failed to load performance history: {e}")
             return {}
 
     def _save_performance_history(self) -> None:
-        """Save provider performance history to disk."""
+        """Save provider performance history to disk now."""
         try:
-            # Write atomically using FileIOManager
-            self.file_io.write_json(
-                self.history_path,
-                self.performance_history,
-                atomic=True,
-                backup=False,  # No backup for high-frequency updates
-                create_dirs=True,
-                indent=2,
-            )
+            self._store.flush()
         except FileIOError as e:
             logger.error(f"Failed to save performance history: {e}")
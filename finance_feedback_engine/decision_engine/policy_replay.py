@@ -0,0 +1,457 @@
+"""Replay-based offline evaluation of policies over stored decisions.
+
+The ``build_policy_evaluation_*`` builders in ``policy_actions`` walk Python
+lists of dicts, which is fine for one decision but too slow to score a
+candidate policy over a year of history. ``PolicyReplayDataset`` streams the
+decision files in ``data/decisions`` into one typed column frame once and
+caches it as Parquet keyed by the content hash of its sources; later loads
+only re-read decision files whose size or mtime changed.
+
+A candidate policy is a gate over recorded decisions: a boolean mask (or a
+``DataFrame.query`` expression) selecting the decisions it would have let
+through. ``evaluate`` and ``compare`` return the same shapes as the list
+builders, computed with vectorized group-bys, plus realized P&L joined from
+trade outcomes by ``decision_id``.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Union
+
+import numpy as np
+import pandas as pd
+
+from ..utils.file_io import FileIOManager
+from .policy_actions import (
+    build_policy_dataset_row_from_decision,
+    build_policy_evaluation_aggregate,
+    build_policy_evaluation_comparison,
+    build_policy_evaluation_result,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = "data/cache/policy_replay"
+MANIFEST_FILENAME = "manifest.json"
+
+STRING_COLUMNS = (
+    "decision_id",
+    "asset_pair",
+    "ai_provider",
+    "action",
+    "policy_action",
+    "policy_family",
+    "decision_mode",
+    "coverage_bucket",
+    "control_outcome_status",
+    "control_outcome_reason_code",
+    "source_file",
+)
+NUMERIC_COLUMNS = ("confidence",)
+COLUMNS = STRING_COLUMNS + NUMERIC_COLUMNS + ("timestamp",)
+
+# Counted statuses, in build_policy_evaluation_summary order
+STATUSES = ("executed", "vetoed", "rejected", "invalid")
+
+Candidate = Union[None, str, pd.Series, np.ndarray, Callable[[pd.DataFrame], pd.Series]]
+
+
+def decision_to_row(
+    decision: Dict, source_file: Optional[str] = None
+) -> Optional[Dict]:
+    """Flatten one stored decision into a dataset row, or None if it has no policy trace."""
+    row = build_policy_dataset_row_from_decision(decision)
+    if row is None:
+        return None
+    control_outcome = row.get("control_outcome")
+    control_outcome = control_outcome if isinstance(control_outcome, dict) else {}
+    envelope = (decision.get("policy_trace") or {}).get("decision_envelope")
+    confidence = (
+        envelope.get("confidence")
+        if isinstance(envelope, dict)
+        else decision.get("confidence")
+    )
+    return {
+        **{column: row.get(column) for column in STRING_COLUMNS[:8]},
+        "control_outcome_status": control_outcome.get("status"),
+        "control_outcome_reason_code": control_outcome.get("reason_code"),
+        "source_file": source_file,
+        "confidence": confidence,
+        "timestamp": row.get("timestamp"),
+    }
+
+
+def rows_to_frame(rows: List[Dict]) -> pd.DataFrame:
+    """Convert dataset rows into the typed replay frame."""
+    if not rows:
+        return empty_frame()
+    raw = pd.DataFrame.from_records(rows)
+    frame = pd.DataFrame(index=raw.index)
+    for column in STRING_COLUMNS:
+        frame[column] = raw[column].astype("string")
+    frame["confidence"] = pd.to_numeric(raw["confidence"], errors="coerce").astype(
+        "float64"
+    )
+    frame["timestamp"] = pd.to_datetime(
+        raw["timestamp"], utc=True, errors="coerce", format="ISO8601"
+    )
+    return frame.reset_index(drop=True)
+
+
+def empty_frame() -> pd.DataFrame:
+    """Return an empty frame with the replay schema."""
+    frame = pd.DataFrame(
+        {column: pd.Series(dtype="string") for column in STRING_COLUMNS}
+    )
+    frame["confidence"] = pd.Series(dtype="float64")
+    frame["timestamp"] = pd.Series(dtype="datetime64[ns, UTC]")
+    return frame[list(COLUMNS)]
+
+
+class PolicyReplayDataset:
+    """Column-cached view of stored decisions for offline policy evaluation."""
+
+    def __init__(
+        self,
+        decisions_dir: Union[str, Path] = "data/decisions",
+        cache_dir: Union[str, Path] = DEFAULT_CACHE_DIR,
+        outcomes_dir: Optional[Union[str, Path]] = None,
+    ):
+        """Initialize the dataset.
+
+        Args:
+            decisions_dir: Directory of ``DecisionStore`` JSON files
+            cache_dir: Directory for the Parquet dataset and sync manifest
+            outcomes_dir: Optional ``trade_outcomes`` directory joined for P&L
+        """
+        self.decisions_dir = Path(decisions_dir)
+        self.cache_dir = Path(cache_dir)
+        self.outcomes_dir = Path(outcomes_dir) if outcomes_dir else None
+        self._manifest_path = self.cache_dir / MANIFEST_FILENAME
+        self._file_io = FileIOManager()
+        self._manifest: Dict = self._load_manifest()
+        self._frame: Optional[pd.DataFrame] = None
+        self._outcome_store = None
+        self._lock = threading.RLock()
+
+    @classmethod
+    def from_decision_store(cls, store, cache_dir=DEFAULT_CACHE_DIR, outcomes_dir=None):
+        """Build a dataset over a ``DecisionStore``'s storage path."""
+        return cls(store.storage_path, cache_dir=cache_dir, outcomes_dir=outcomes_dir)
+
+    @property
+    def content_hash(self) -> Optional[str]:
+        """Hash of the decision files backing the cached dataset."""
+        return self._manifest.get("content_hash")
+
+    def _load_manifest(self) -> Dict:
+        try:
+            with open(self._manifest_path, "r") as f:
+                manifest = json.load(f)
+            return manifest if isinstance(manifest, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable policy replay manifest: {e}")
+            return {}
+
+    def _save_manifest(self) -> None:
+        try:
+            with self._file_io.atomic_write_context(self._manifest_path) as tmp_path:
+                with open(tmp_path, "w") as f:
+                    json.dump(self._manifest, f)
+        except Exception as e:
+            logger.warning(f"Could not persist policy replay manifest: {e}")
+
+    def _dataset_path(self, content_hash: str) -> Path:
+        return self.cache_dir / f"{content_hash}.parquet"
+
+    def _cached_frame(self) -> Optional[pd.DataFrame]:
+        if self._frame is not None:
+            return self._frame
+        content_hash = self.content_hash
+        if not content_hash:
+            return None
+        try:
+            frame = pd.read_parquet(self._dataset_path(content_hash))
+        except Exception as e:
+            logger.warning(f"Rebuilding unreadable policy replay dataset: {e}")
+            return None
+        if set(COLUMNS) - set(frame.columns):
+            return None
+        return frame
+
+    def _read_file(self, file: Path) -> tuple[str, List[Dict]]:
+        data = file.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        try:
+            decision = json.loads(data)
+        except json.JSONDecodeError as e:
+            logger.error(f"Skipping malformed decision file {file}: {e}")
+            return digest, []
+        if not isinstance(decision, dict):
+            return digest, []
+        row = decision_to_row(decision, source_file=file.name)
+        return digest, [row] if row is not None else []
+
+    def sync(self) -> pd.DataFrame:
+        """Bring the cached dataset up to date with the decision files.
+
+        Unchanged files (same size and mtime) are never re-read; a file that
+        was touched but whose bytes hash the same keeps its cached rows.
+        """
+        with self._lock:
+            files = (
+                {f.name: f for f in sorted(self.decisions_dir.glob("*.json"))}
+                if self.decisions_dir.exists()
+                else {}
+            )
+            known = self._manifest.get("files") or {}
+            frame = self._cached_frame()
+            if frame is None:
+                frame, known = empty_frame(), {}
+
+            entries: Dict[str, Dict] = {}
+            stale = set(known) - set(files)
+            new_rows: List[Dict] = []
+            for name, file in files.items():
+                try:
+                    stat = file.stat()
+                except OSError:
+                    stale.add(name)
+                    continue
+                entry = known.get(name)
+                if (
+                    entry
+                    and entry["size"] == stat.st_size
+                    and entry["mtime_ns"] == stat.st_mtime_ns
+                ):
+                    entries[name] = entry
+                    continue
+                try:
+                    digest, rows = self._read_file(file)
+                except OSError as e:
+                    logger.error(f"Could not read decision file {file}: {e}")
+                    stale.add(name)
+                    continue
+                entries[name] = {
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "sha256": digest,
+                }
+                if entry and entry.get("sha256") == digest:
+                    continue
+                if entry:
+                    stale.add(name)
+                new_rows.extend(rows)
+
+            content_hash = hashlib.sha256(
+                "".join(
+                    f"{name}:{entries[name]['sha256']}\n" for name in sorted(entries)
+                ).encode()
+            ).hexdigest()
+            if content_hash == self.content_hash and self._frame is not None:
+                if entries != known:
+                    self._manifest["files"] = entries
+                    self._save_manifest()
+                return self._frame
+
+            if stale:
+                frame = frame[~frame["source_file"].isin(stale)]
+            if new_rows:
+                frame = pd.concat([frame, rows_to_frame(new_rows)], ignore_index=True)
+            frame = frame.sort_values(
+                ["timestamp", "decision_id"], kind="stable", na_position="last"
+            ).reset_index(drop=True)
+
+            previous_hash = self.content_hash
+            if (
+                content_hash != previous_hash
+                or not self._dataset_path(content_hash).exists()
+            ):
+                try:
+                    # Unique temp file + rename: a crash never leaves a truncated dataset
+                    with self._file_io.atomic_write_context(
+                        self._dataset_path(content_hash)
+                    ) as tmp_path:
+                        frame.to_parquet(tmp_path, index=False, engine="pyarrow")
+                    if previous_hash and previous_hash != content_hash:
+                        self._dataset_path(previous_hash).unlink(missing_ok=True)
+                except Exception as e:
+                    logger.warning(f"Could not write policy replay dataset: {e}")
+            self._manifest = {"files": entries, "content_hash": content_hash}
+            self._save_manifest()
+            self._frame = frame
+            return frame
+
+    def _outcomes(self) -> Optional[pd.DataFrame]:
+        if self.outcomes_dir is None:
+            return None
+        if self._outcome_store is None:
+            from ..monitoring.trade_outcome_store import TradeOutcomeColumnStore
+
+            self._outcome_store = TradeOutcomeColumnStore(
+                self.outcomes_dir, self.cache_dir / "outcomes"
+            )
+        outcomes = self._outcome_store.load_frame()
+        outcomes = outcomes[outcomes["decision_id"].notna()]
+        grouped = outcomes.groupby("decision_id", sort=False)["realized_pnl"]
+        return pd.DataFrame(
+            {"realized_pnl": grouped.sum(min_count=1), "trade_count": grouped.size()}
+        )
+
+    def load_frame(self, start=None, end=None) -> pd.DataFrame:
+        """Return the synced decision frame, optionally within a timestamp range.
+
+        When an outcomes directory is configured the frame also carries
+        ``realized_pnl`` and ``trade_count`` per decision (NaN / 0 if none).
+        """
+        frame = self.sync()
+        if start is not None:
+            frame = frame[frame["timestamp"] >= pd.Timestamp(start, tz="UTC")]
+        if end is not None:
+            frame = frame[frame["timestamp"] <= pd.Timestamp(end, tz="UTC")]
+        outcomes = self._outcomes()
+        if outcomes is not None:
+            frame = frame.join(outcomes, on="decision_id")
+            frame["trade_count"] = frame["trade_count"].fillna(0).astype("int64")
+        return frame
+
+    def evaluate(
+        self,
+        candidate: Candidate = None,
+        by: Optional[Union[str, Sequence[str]]] = None,
+        frame: Optional[pd.DataFrame] = None,
+    ) -> List[Dict]:
+        """Evaluation results for the decisions a candidate lets through.
+
+        Returns one ``build_policy_evaluation_result`` shaped dict per group
+        of ``by`` (a single overall result when ``by`` is None), extended
+        with ``group`` and, when outcomes are joined, ``outcomes``.
+        """
+        frame = self.load_frame() if frame is None else frame
+        return evaluate_frame(select(frame, candidate), by=by)
+
+    def compare(
+        self,
+        candidate: Candidate,
+        baseline: Candidate = None,
+        by: Optional[Union[str, Sequence[str]]] = None,
+    ) -> List[Dict]:
+        """``build_policy_evaluation_comparison`` of candidate vs baseline per group."""
+        frame = self.load_frame()
+        left = {_group_key(r): r for r in self.evaluate(candidate, by=by, frame=frame)}
+        right = {_group_key(r): r for r in self.evaluate(baseline, by=by, frame=frame)}
+        comparisons = []
+        for key in sorted(set(left) | set(right), key=str):
+            comparison = build_policy_evaluation_comparison(
+                _aggregate(left.get(key)), _aggregate(right.get(key))
+            )
+            if by is not None:
+                comparison["group"] = dict(key)
+            comparisons.append(comparison)
+        return comparisons
+
+
+def select(frame: pd.DataFrame, candidate: Candidate) -> pd.DataFrame:
+    """Rows of ``frame`` a candidate gate lets through (all rows for None)."""
+    if candidate is None:
+        return frame
+    if isinstance(candidate, str):
+        return frame.query(candidate)
+    mask = candidate(frame) if callable(candidate) else candidate
+    mask = (
+        pd.Series(mask, index=frame.index) if not isinstance(mask, pd.Series) else mask
+    )
+    return frame[mask.fillna(False).astype(bool)]
+
+
+def evaluate_frame(
+    frame: pd.DataFrame, by: Optional[Union[str, Sequence[str]]] = None
+) -> List[Dict]:
+    """Vectorized equivalent of the evaluation record → result builder chain."""
+    keys = [by] if isinstance(by, str) else list(by or [])
+    # build_policy_evaluation_run drops records without a control outcome status
+    scored = frame[frame["control_outcome_status"].notna()]
+    status = scored["control_outcome_status"].astype(object)
+    counts = pd.DataFrame(
+        {f"{s}_count": (status == s).astype("int64") for s in STATUSES},
+        index=scored.index,
+    )
+    counts["record_count"] = 1
+    if "realized_pnl" in frame:
+        outcome_columns = frame[["realized_pnl", "trade_count"]].assign(
+            decision_count=1,
+            win=(frame["realized_pnl"] > 0).astype("int64"),
+            closed=frame["realized_pnl"].notna().astype("int64"),
+        )
+    else:
+        outcome_columns = None
+
+    grouped = _group_sum(counts, scored, keys)
+    outcome_groups = (
+        _group_sum(outcome_columns, frame, keys)
+        if outcome_columns is not None
+        else None
+    )
+
+    results = []
+    for group, row in grouped.iterrows():
+        record_count = int(row["record_count"])
+        summary = {
+            "record_count": record_count,
+            **{f"{s}_count": int(row[f"{s}_count"]) for s in STATUSES},
+            "summary_version": 1,
+        }
+        scorecard = {
+            "record_count": record_count,
+            **{
+                f"{s}_rate": (
+                    (row[f"{s}_count"] / record_count) if record_count > 0 else 0.0
+                )
+                for s in STATUSES
+            },
+            "scorecard_version": 1,
+        }
+        result = build_policy_evaluation_result(summary, scorecard)
+        group_values = group if isinstance(group, tuple) else (group,)
+        result["group"] = {
+            k: (None if pd.isna(v) else v) for k, v in zip(keys, group_values)
+        }
+        if outcome_groups is not None and group in outcome_groups.index:
+            result["outcomes"] = _outcome_summary(outcome_groups.loc[group])
+        results.append(result)
+    return results
+
+
+def _group_sum(
+    values: pd.DataFrame, source: pd.DataFrame, keys: List[str]
+) -> pd.DataFrame:
+    if keys:
+        return values.join(source[keys]).groupby(keys, dropna=False, sort=True).sum()
+    # A single overall group, present even when there are no rows
+    return values.sum().to_frame().T
+
+
+def _outcome_summary(row: pd.Series) -> Dict:
+    closed = int(row["closed"])
+    return {
+        "decision_count": int(row["decision_count"]),
+        "trade_count": int(row["trade_count"]),
+        "realized_pnl": float(row["realized_pnl"]),
+        "win_rate": (int(row["win"]) / closed) if closed else 0.0,
+    }
+
+
+def _group_key(result: Dict) -> tuple:
+    return tuple(sorted((result.get("group") or {}).items()))
+
+
+def _aggregate(result: Optional[Dict]) -> Dict:
+    aggregate = build_policy_evaluation_aggregate([result] if result else [])
+    if result and "outcomes" in result:
+        aggregate["outcomes"] = dict(result["outcomes"])
+    return aggregate
@@ -19,12 +19,19 @@ Safety features (from architecture reviews — Claude + GPT 5.4):
 Track E1 — see docs/plans/FFE_EFFICIENCY_ROADMAP_2026-04-04.md
 """
 
+import atexit
+import json
 import logging
 import math
 import time
+import weakref
+from collections import OrderedDict
 from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
+from finance_feedback_engine.utils.file_io import FileIOError, FileIOManager
+
 logger = logging.getLogger(__name__)
 
 # Valid enum values for validation
@@ -44,6 +51,14 @@ DEFAULT_MIN_REASONING_LENGTH = 20  # Chars — below this → force debate
 DEFAULT_DATA_DEGRADED_AGE_S = 300  # 5 min → degraded
 DEFAULT_DATA_STALE_AGE_S = 900  # 15 min → stale
 
+# Brief cache defaults
+DEFAULT_BRIEF_CACHE_MAX_ENTRIES = 64
+DEFAULT_BRIEF_CACHE_PATH = "data/cache/pre_reason_briefs.json"
+DEFAULT_BRIEF_CACHE_TIMEFRAME = "1h"  # When the asset has no decision timeframe
+DEFAULT_BRIEF_CACHE_FLUSH_EVERY = 16  # Unsaved changes before a rewrite
+
+_open_brief_caches: "weakref.WeakSet[PreReasonBriefCache]" = weakref.WeakSet()
+
 
 @dataclass(frozen=True)
 class MarketBrief:
@@ -115,6 +130,7 @@ class PreReasonGatekeeper:
         volatility_ceiling: float = DEFAULT_VOLATILITY_CEILING,
         recent_close_window_s: float = DEFAULT_RECENT_CLOSE_WINDOW_S,
         min_reasoning_length: int = DEFAULT_MIN_REASONING_LENGTH,
+        brief_cache: Optional["PreReasonBriefCache"] = None,
     ):
         self.max_consecutive_skips = max_consecutive_skips
         self.forced_debate_interval = forced_debate_interval
@@ -122,11 +138,13 @@ class PreReasonGatekeeper:
         self.volatility_ceiling = volatility_ceiling
         self.recent_close_window_s = recent_close_window_s
         self.min_reasoning_length = min_reasoning_length
+        self.brief_cache = brief_cache
 
         # Separate counters (GPT 5.4 finding #1)
         self._consecutive_skips = 0
         self._cycles_since_last_debate = 0
         self._total_skips = 0
+        self._cached_brief_skips = 0
         self._total_debates = 0
         self._last_forced_reason: Optional[str] = None
         self._last_position_close_time: Optional[float] = None
@@ -210,11 +228,13 @@ class PreReasonGatekeeper:
         # OK to skip
         return False, None
 
-    def record_skip(self) -> None:
-        """Record that a cycle was skipped."""
+    def record_skip(self, from_cache: bool = False) -> None:
+        """Record that a cycle was skipped (``from_cache``: on a cached brief)."""
         self._consecutive_skips += 1
         self._cycles_since_last_debate += 1
         self._total_skips += 1
+        if from_cache:
+            self._cached_brief_skips += 1
         self._shadow_skip_count += 1
 
     def record_debate(self) -> None:
@@ -230,15 +250,242 @@ class PreReasonGatekeeper:
 
     @property
     def skip_stats(self) -> Dict[str, Any]:
-        return {
+        stats = {
             "consecutive_skips": self._consecutive_skips,
             "cycles_since_last_debate": self._cycles_since_last_debate,
             "total_skips": self._total_skips,
+            "cached_brief_skips": self._cached_brief_skips,
             "total_debates": self._total_debates,
             "last_forced_reason": self._last_forced_reason,
             "shadow_skip_count": self._shadow_skip_count,
             "shadow_would_have_debated": self._shadow_would_have_debated,
         }
+        if self.brief_cache is not None:
+            stats["brief_cache"] = self.brief_cache.stats
+        return stats
+
+
+def last_closed_candle(market_data: Dict[str, Any], timeframe: str) -> Optional[str]:
+    """Start of the last closed ``timeframe`` candle when the data was taken.
+
+    The snapshot time is ``timestamp`` (falling back to ``date``). The candle
+    still forming at that moment is skipped, so providers that stamp the
+    in-progress bar or today's date keep one key until a candle closes.
+    """
+    from finance_feedback_engine.persistence.ohlcv_lake import bar_interval
+
+    as_of = market_data.get("timestamp") or market_data.get("date")
+    if as_of is None:
+        return None
+    try:
+        if isinstance(as_of, (int, float)):
+            seconds = float(as_of)
+        else:
+            parsed = datetime.fromisoformat(str(as_of).replace("Z", "+00:00"))
+            if parsed.tzinfo is None:
+                parsed = parsed.replace(tzinfo=timezone.utc)
+            seconds = parsed.timestamp()
+    except (TypeError, ValueError, OverflowError):
+        return None
+    bar = int(bar_interval(timeframe).total_seconds())
+    start = (int(seconds) // bar - 1) * bar
+    return datetime.fromtimestamp(start, tz=timezone.utc).isoformat()
+
+
+class PreReasonBriefCache:
+    """Bounded LRU cache of pre-reasoning LLM responses.
+
+    A brief only depends on the last closed candle, the detected regime and
+    the position, so the parsed LLM response is cached under those inputs
+    and reused until the next candle of the decision timeframe closes.
+    Price-dependent brief fields (current price, PnL, data quality) are
+    recomputed on every hit by ``parse_pre_reason_response``.
+
+    Invalidation and persistence:
+    1. A new closed candle for an asset evicts that asset's older entries
+    2. Beyond ``max_entries`` the least recently used entry is evicted
+    3. Lookups without a snapshot time or a detected regime are not cached
+    4. With ``path`` set, entries are reloaded on start and written
+       atomically every ``flush_every`` changes, on ``close()`` and at exit
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_BRIEF_CACHE_MAX_ENTRIES,
+        path: Optional[str] = None,
+        file_io: Optional[FileIOManager] = None,
+        timeframe: str = DEFAULT_BRIEF_CACHE_TIMEFRAME,
+        flush_every: int = DEFAULT_BRIEF_CACHE_FLUSH_EVERY,
+    ):
+        self.max_entries = max(1, int(max_entries))
+        self.path = path
+        self.file_io = file_io or (FileIOManager() if path else None)
+        self.timeframe = timeframe
+        self.flush_every = max(1, int(flush_every))
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._pending = 0
+        self._hits = 0
+        self._misses = 0
+        self._uncacheable = 0
+        self._evictions = 0
+        self._invalidations = 0
+        if path:
+            self._load()
+            _open_brief_caches.add(self)
+
+    def cache_key(
+        self,
+        asset_pair: str,
+        market_data: Dict[str, Any],
+        regime: Optional[str] = None,
+        position_state: Optional[Dict[str, Any]] = None,
+        timeframe: Optional[str] = None,
+    ) -> Optional[tuple[str, str]]:
+        """(candle, key) for these inputs, or None when they are not cacheable."""
+        candle = last_closed_candle(market_data, timeframe or self.timeframe)
+        if candle is None or not regime or str(regime).lower() == "unknown":
+            return None
+        position = None
+        if position_state and position_state.get("has_position"):
+            position = [
+                position_state.get("side"),
+                position_state.get("contracts"),
+                position_state.get("entry_price"),
+            ]
+        key = json.dumps([asset_pair, candle, str(regime), position], default=str)
+        return candle, key
+
+    def get(
+        self,
+        asset_pair: str,
+        market_data: Dict[str, Any],
+        regime: Optional[str] = None,
+        position_state: Optional[Dict[str, Any]] = None,
+        timeframe: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """Cached pre-reasoning response for these inputs, if any."""
+        cache_key = self.cache_key(
+            asset_pair, market_data, regime, position_state, timeframe
+        )
+        if cache_key is None:
+            self._uncacheable += 1
+            return None
+        candle, key = cache_key
+        self._invalidate_older_candles(asset_pair, candle)
+
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return dict(entry["response"])
+
+    def put(
+        self,
+        asset_pair: str,
+        market_data: Dict[str, Any],
+        response: Dict[str, Any],
+        regime: Optional[str] = None,
+        position_state: Optional[Dict[str, Any]] = None,
+        timeframe: Optional[str] = None,
+    ) -> None:
+        """Store a parsed pre-reasoning response for these inputs."""
+        cache_key = self.cache_key(
+            asset_pair, market_data, regime, position_state, timeframe
+        )
+        if cache_key is None or not response:
+            return
+        candle, key = cache_key
+        self._entries[key] = {
+            "asset_pair": asset_pair,
+            "candle": candle,
+            "response": dict(response),
+        }
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+        self._mark_changed()
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        lookups = self._hits + self._misses
+        return {
+            "size": len(self._entries),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": self._hits / lookups if lookups else 0.0,
+            "uncacheable": self._uncacheable,
+            "evictions": self._evictions,
+            "invalidations": self._invalidations,
+        }
+
+    def flush(self) -> None:
+        """Write all entries now; a no-op for in-memory caches."""
+        self._pending = 0
+        self._save()
+
+    def close(self) -> None:
+        """Write unsaved changes; safe to call more than once."""
+        if self._pending:
+            self.flush()
+
+    def _mark_changed(self) -> None:
+        self._pending += 1
+        if self._pending >= self.flush_every:
+            self.flush()
+
+    def _invalidate_older_candles(self, asset_pair: str, candle: str) -> None:
+        stale = [
+            key
+            for key, entry in self._entries.items()
+            if entry["asset_pair"] == asset_pair and entry["candle"] != candle
+        ]
+        for key in stale:
+            del self._entries[key]
+        if stale:
+            self._invalidations += len(stale)
+            self._mark_changed()
+
+    def _load(self) -> None:
+        try:
+            data = self.file_io.read_json(self.path, default={})
+        except FileIOError as e:
+            logger.warning("Pre-reason brief cache unreadable, starting empty: %s", e)
+            return
+        for entry in data.get("entries", [])[-self.max_entries :]:
+            try:
+                self._entries[entry["key"]] = {
+                    "asset_pair": entry["asset_pair"],
+                    "candle": entry["candle"],
+                    "response": dict(entry["response"]),
+                }
+            except (KeyError, TypeError, ValueError):
+                continue
+        logger.debug("Loaded %d pre-reason briefs from %s", len(self._entries), self.path)
+
+    def _save(self) -> None:
+        if not self.path:
+            return
+        try:
+            self.file_io.write_json(
+                self.path,
+                {"entries": [{"key": key, **entry} for key, entry in self._entries.items()]},
+                backup=False,
+                indent=None,
+            )
+        except FileIOError as e:
+            logger.warning("Failed to persist pre-reason brief cache: %s", e)
+
+
+def _close_brief_caches() -> None:
+    """Write every persistent brief cache with unsaved changes (runs at exit)."""
+    for cache in list(_open_brief_caches):
+        cache.close()
+
+
+atexit.register(_close_brief_caches)
 
 
 def build_pre_reason_prompt(
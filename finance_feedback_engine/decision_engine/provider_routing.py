@@ -0,0 +1,158 @@
+"""
+Latency-aware routing of ensemble members and debate seats.
+
+Hardware is fixed, so the main throughput lever is which models we ask.
+``ProviderRouter`` scores each provider by expected quality per second from
+``ProviderTelemetry``:
+
+    quality = accuracy x (1 - failure_rate - timeout_rate)
+    score   = quality / p95 latency
+
+and picks the best providers whose latency fits the budget. Providers with
+too few samples are always kept so they can earn telemetry, and configured
+choices are the fallback whenever nothing measured fits. Debate seats only
+run one model per role, so with probability ``exploration_rate`` one seat is
+handed to a candidate not yet measured in that role.
+"""
+
+import logging
+import random
+from itertools import product
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ..monitoring.provider_telemetry import DEFAULT_ROLE, ProviderTelemetry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LATENCY_BUDGET_SECONDS = 60.0
+DEFAULT_MIN_SAMPLES = 5
+DEFAULT_MIN_MEMBERS = 2
+DEFAULT_EXPLORATION_RATE = 0.1
+
+DEBATE_ROLES = ("bull", "bear", "judge")
+
+
+class ProviderRouter:
+    """Pick ensemble members and debate seats by quality per second."""
+
+    def __init__(
+        self,
+        telemetry: ProviderTelemetry,
+        latency_budget_seconds: float = DEFAULT_LATENCY_BUDGET_SECONDS,
+        min_samples: int = DEFAULT_MIN_SAMPLES,
+        min_members: int = DEFAULT_MIN_MEMBERS,
+        max_members: Optional[int] = None,
+        exploration_rate: float = DEFAULT_EXPLORATION_RATE,
+        rng: Optional[random.Random] = None,
+    ):
+        self.telemetry = telemetry
+        self.latency_budget_seconds = float(latency_budget_seconds)
+        self.min_samples = max(1, int(min_samples))
+        self.min_members = max(1, int(min_members))
+        self.max_members = max_members
+        self.exploration_rate = min(1.0, max(0.0, float(exploration_rate)))
+        self._rng = rng or random.Random()
+
+    def profile(
+        self, provider: str, role: str = DEFAULT_ROLE
+    ) -> Tuple[Optional[float], float]:
+        """
+        (p95 latency, quality) for a provider in a role.
+
+        Latency is None while the provider has fewer than ``min_samples``
+        successful queries in that role.
+        """
+        stats = self.telemetry.summary(provider, role=role)
+        reliability = max(0.0, 1.0 - stats.failure_rate - stats.timeout_rate)
+        latency = stats.p95_seconds if stats.successes >= self.min_samples else None
+        return latency, stats.accuracy * reliability
+
+    def select_ensemble_members(self, candidates: Sequence[str]) -> List[str]:
+        """
+        Ensemble members for one decision, in candidate order.
+
+        Members run in parallel, so each measured member must fit the budget
+        on its own. Unmeasured candidates are kept; if fewer than
+        ``min_members`` remain, the fastest over-budget ones are added back.
+        """
+        candidates = list(candidates)
+        profiles = {p: self.profile(p) for p in candidates}
+        cold = [p for p in candidates if profiles[p][0] is None]
+        measured = [p for p in candidates if p not in cold]
+        fits = [p for p in measured if profiles[p][0] <= self.latency_budget_seconds]
+        fits.sort(
+            key=lambda p: profiles[p][1] / max(profiles[p][0], 1e-3), reverse=True
+        )
+        if self.max_members is not None:
+            fits = fits[: max(0, self.max_members - len(cold))]
+
+        chosen = set(cold) | set(fits)
+        if len(chosen) < self.min_members:
+            too_slow = sorted(
+                (p for p in measured if p not in chosen), key=lambda p: profiles[p][0]
+            )
+            chosen.update(too_slow[: self.min_members - len(chosen)])
+
+        members = [p for p in candidates if p in chosen]
+        if len(members) < len(candidates):
+            logger.info(
+                "Routing ensemble to %s (dropped %s over %.1fs budget)",
+                members,
+                [p for p in candidates if p not in chosen],
+                self.latency_budget_seconds,
+            )
+        return members
+
+    def select_debate_seats(
+        self, configured: Dict[str, str], candidates: Sequence[str]
+    ) -> Dict[str, str]:
+        """
+        Debate seats maximizing mean seat quality per second of critical path.
+
+        Bull and bear run in parallel before the judge, so the critical path
+        is ``max(bull, bear) + judge``. Only candidates measured in a role are
+        ranked for it; the configured seats are kept when a role has no
+        measured candidate or no measured assignment fits the budget. A seat
+        is then occasionally given to an unmeasured candidate so it can earn
+        telemetry in that role.
+        """
+        options, cold = {}, {}
+        for role in DEBATE_ROLES:
+            seat_options = [configured[role]] if configured.get(role) else []
+            seat_options += [p for p in candidates if p not in seat_options]
+            profiles = {p: self.profile(p, role) for p in seat_options}
+            options[role] = {
+                p: prof for p, prof in profiles.items() if prof[0] is not None
+            }
+            cold[role] = [p for p in seat_options if p not in options[role]]
+
+        best, best_score = None, None
+        if all(options.values()):
+            for bull, bear, judge in product(*(options[r] for r in DEBATE_ROLES)):
+                seats = {"bull": bull, "bear": bear, "judge": judge}
+                latency = {r: options[r][p][0] for r, p in seats.items()}
+                critical_path = max(latency["bull"], latency["bear"]) + latency["judge"]
+                if critical_path > self.latency_budget_seconds:
+                    continue
+                quality = sum(options[r][p][1] for r, p in seats.items()) / len(seats)
+                score = quality / max(critical_path, 1e-3)
+                if best_score is None or score > best_score:
+                    best, best_score = seats, score
+
+        seats = {**configured, **(best or {})}
+        explorable = [
+            r for r in DEBATE_ROLES if any(p != seats.get(r) for p in cold[r])
+        ]
+        if explorable and self._rng.random() < self.exploration_rate:
+            role = self._rng.choice(explorable)
+            seats[role] = self._rng.choice(
+                [p for p in cold[role] if p != seats.get(role)]
+            )
+            logger.info(
+                "Exploring %s as debate %s (no telemetry yet)", seats[role], role
+            )
+        if {r: seats.get(r) for r in DEBATE_ROLES} != {
+            r: configured.get(r) for r in DEBATE_ROLES
+        }:
+            logger.info("Routing debate seats to %s (configured %s)", seats, configured)
+        return seats
@@ -0,0 +1,281 @@
+"""
+Streaming ensemble collection with early exit and adaptive provider timeouts.
+
+Provider results are consumed as they complete instead of waiting for the
+slowest one. After each result the vote is checked: once the providers that
+are still running cannot change the winning action under the configured
+weights and voting strategy, they are cancelled and reported as cut short.
+
+Per-provider timeouts adapt to each provider's observed latency percentile
+so a provider that usually answers in 2s is not given the whole ensemble
+budget when it stalls.
+"""
+
+import asyncio
+import logging
+import math
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from itertools import combinations
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LATENCY_WINDOW = 50
+DEFAULT_LATENCY_PERCENTILE = 0.95
+DEFAULT_TIMEOUT_MULTIPLIER = 1.5
+DEFAULT_MIN_LATENCY_SAMPLES = 5
+DEFAULT_MIN_PROVIDER_TIMEOUT_SECONDS = 5.0
+
+# Subset enumeration is exponential in the number of outstanding providers
+MAX_PENDING_FOR_SETTLE_CHECK = 10
+
+VOTE_ACTIONS = ("BUY", "SELL", "HOLD")
+
+
+class ProviderLatencyTracker:
+    """Rolling latency samples per provider and the timeouts derived from them."""
+
+    def __init__(
+        self,
+        window: int = DEFAULT_LATENCY_WINDOW,
+        percentile: float = DEFAULT_LATENCY_PERCENTILE,
+        multiplier: float = DEFAULT_TIMEOUT_MULTIPLIER,
+        min_samples: int = DEFAULT_MIN_LATENCY_SAMPLES,
+        min_timeout_seconds: float = DEFAULT_MIN_PROVIDER_TIMEOUT_SECONDS,
+    ):
+        self.window = max(1, int(window))
+        self.percentile = min(1.0, max(0.0, float(percentile)))
+        self.multiplier = max(1.0, float(multiplier))
+        self.min_samples = max(1, int(min_samples))
+        self.min_timeout_seconds = max(0.0, float(min_timeout_seconds))
+        self._samples: Dict[str, Deque[float]] = {}
+
+    def observe(self, provider: str, seconds: float) -> None:
+        samples = self._samples.get(provider)
+        if samples is None:
+            samples = self._samples[provider] = deque(maxlen=self.window)
+        samples.append(float(seconds))
+
+    def latency_percentile(self, provider: str) -> Optional[float]:
+        """Observed latency at the configured percentile, once enough samples exist."""
+        samples = self._samples.get(provider)
+        if not samples or len(samples) < self.min_samples:
+            return None
+        ordered = sorted(samples)
+        rank = max(0, math.ceil(self.percentile * len(ordered)) - 1)
+        return ordered[rank]
+
+    def timeout_for(self, provider: str, ceiling: Optional[float]) -> Optional[float]:
+        """Per-provider timeout: percentile x multiplier, within [min, ceiling]."""
+        observed = self.latency_percentile(provider)
+        if observed is None:
+            return ceiling
+        timeout = max(self.min_timeout_seconds, observed * self.multiplier)
+        if ceiling is not None:
+            timeout = min(timeout, ceiling)
+        return timeout
+
+    def snapshot(self) -> Dict[str, Optional[float]]:
+        return {p: self.latency_percentile(p) for p in self._samples}
+
+
+def settled_action(
+    votes: Dict[str, Dict[str, Any]],
+    pending: Sequence[str],
+    voting_strategy: str,
+    weight_fn: Optional[Callable[[List[str]], Dict[str, float]]] = None,
+) -> Optional[str]:
+    """
+    Return the winning action if no outcome of ``pending`` can change it.
+
+    Pending providers are assumed adversarial: any subset of them may answer,
+    all voting for the strongest challenger at 100% confidence. Weights are
+    recomputed for each subset because ``weight_fn`` may renormalize over
+    the providers that actually responded. Ties count as not settled.
+
+    Only ``weighted`` and ``majority`` voting can be bounded this way; other
+    strategies (e.g. stacking) never settle early.
+    """
+    if not votes:
+        return None
+    pending = list(pending)
+    if not pending:
+        return None
+    if len(pending) > MAX_PENDING_FOR_SETTLE_CHECK:
+        return None
+
+    actions: Dict[str, str] = {}
+    confidences: Dict[str, float] = {}
+    for provider, decision in votes.items():
+        action = decision.get("action")
+        if action not in VOTE_ACTIONS:
+            return None
+        try:
+            confidence = float(decision.get("confidence", 50))
+        except (TypeError, ValueError):
+            return None
+        actions[provider] = action
+        confidences[provider] = min(100.0, max(0.0, confidence)) / 100.0
+
+    if voting_strategy == "majority":
+        counts = {a: 0 for a in VOTE_ACTIONS}
+        for action in actions.values():
+            counts[action] += 1
+        leader = max(counts, key=counts.get)
+        runner_up = max(c for a, c in counts.items() if a != leader)
+        return leader if counts[leader] - runner_up > len(pending) else None
+
+    if voting_strategy != "weighted" or weight_fn is None:
+        return None
+
+    responders = list(votes)
+    leader = None
+    for size in range(len(pending) + 1):
+        for joined in combinations(pending, size):
+            weights = weight_fn(responders + list(joined))
+            scores = {a: 0.0 for a in VOTE_ACTIONS}
+            for provider in responders:
+                scores[actions[provider]] += (
+                    weights.get(provider, 1.0) * confidences[provider]
+                )
+            if leader is None:
+                leader = max(scores, key=scores.get)
+                if scores[leader] <= 0:
+                    return None
+            challenger_boost = sum(weights.get(p, 1.0) for p in joined)
+            for action, score in scores.items():
+                if action != leader and score + challenger_boost >= scores[leader]:
+                    return None
+    return leader
+
+
+@dataclass
+class StreamedVotes:
+    """Outcome of a streaming provider collection."""
+
+    decisions: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    failed: List[str] = field(default_factory=list)
+    timed_out: List[str] = field(default_factory=list)
+    cut_short: List[str] = field(default_factory=list)
+    latencies: Dict[str, float] = field(default_factory=dict)
+    settled_action: Optional[str] = None
+
+
+async def collect_provider_votes(
+    providers: Iterable[str],
+    query: Callable[[str], Awaitable[Dict[str, Any]]],
+    is_valid: Callable[[Dict[str, Any], str], bool],
+    settle: Optional[
+        Callable[[Dict[str, Dict[str, Any]], List[str]], Optional[str]]
+    ] = None,
+    timeout_for: Optional[Callable[[str], Optional[float]]] = None,
+    max_concurrency: Optional[int] = None,
+    latency_tracker: Optional[ProviderLatencyTracker] = None,
+    on_result: Optional[Callable[[str, str], None]] = None,
+) -> StreamedVotes:
+    """
+    Query providers concurrently and consume their results as they complete.
+
+    Args:
+        providers: Provider names, in aggregation order
+        query: Coroutine factory returning a provider's decision
+        is_valid: Validates a decision for a provider
+        settle: ``settle(decisions, pending)`` returns the winning action when
+            the vote can no longer change; outstanding queries are then cancelled
+        timeout_for: Per-provider timeout in seconds (None for no limit)
+        max_concurrency: Cap on simultaneous provider queries
+        latency_tracker: Records latencies of successful queries
+        on_result: ``on_result(provider, "success" | "failure")`` callback
+
+    Returns:
+        StreamedVotes with decisions and failures in provider order.
+        Cancellation of the caller cancels every outstanding query.
+    """
+    providers = list(providers)
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+    result = StreamedVotes()
+
+    async def run(provider: str) -> Dict[str, Any]:
+        timeout = timeout_for(provider) if timeout_for else None
+        if semaphore is not None:
+            await semaphore.acquire()
+        try:
+            started = time.perf_counter()
+            if timeout is None:
+                decision = await query(provider)
+            else:
+                decision = await asyncio.wait_for(query(provider), timeout)
+            result.latencies[provider] = time.perf_counter() - started
+            return decision
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+
+    tasks = {asyncio.create_task(run(p)): p for p in providers}
+    decisions: Dict[str, Dict[str, Any]] = {}
+    failed = set()
+    try:
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                provider = tasks[task]
+                error = task.exception()
+                if error is not None:
+                    if isinstance(error, asyncio.TimeoutError):
+                        result.timed_out.append(provider)
+                        logger.warning(
+                            f"Provider {provider} exceeded its adaptive timeout"
+                        )
+                    else:
+                        logger.error(f"Provider {provider} failed: {error}")
+                    failed.add(provider)
+                elif is_valid(task.result(), provider):
+                    decisions[provider] = task.result()
+                    if latency_tracker is not None:
+                        latency_tracker.observe(provider, result.latencies[provider])
+                    logger.debug(
+                        f"Provider {provider} -> {task.result().get('action')} "
+                        f"({task.result().get('confidence')}%)"
+                    )
+                else:
+                    logger.warning(f"Provider {provider} returned invalid response")
+                    failed.add(provider)
+                if on_result is not None:
+                    on_result(provider, "failure" if provider in failed else "success")
+
+            if settle is not None and pending and decisions:
+                outstanding = [tasks[t] for t in pending]
+                winner = settle(decisions, outstanding)
+                if winner is not None:
+                    result.settled_action = winner
+                    result.cut_short = [p for p in providers if p in outstanding]
+                    logger.info(
+                        f"Ensemble vote settled on {winner}; cutting short "
+                        f"{result.cut_short}"
+                    )
+                    break
+    finally:
+        unfinished = [t for t in tasks if not t.done()]
+        for task in unfinished:
+            task.cancel()
+        if unfinished:
+            await asyncio.gather(*unfinished, return_exceptions=True)
+
+    result.decisions = {p: decisions[p] for p in providers if p in decisions}
+    result.failed = [p for p in providers if p in failed]
+    return result
@@ -44,6 +44,11 @@ from typing import Any, Dict, List, Optional
 from scipy.stats import beta
 
 from finance_feedback_engine.utils.file_io import FileIOError, FileIOManager
+from finance_feedback_engine.utils.learning_state_store import (
+    DEFAULT_FLUSH_EVERY,
+    DEFAULT_FLUSH_INTERVAL_SECONDS,
+    LearningStateStore,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -77,6 +82,8 @@ class ThompsonSamplingWeightOptimizer:
         self,
         providers: List[str],
         persistence_path: Optional[str] = None,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        flush_every: int = DEFAULT_FLUSH_EVERY,
     ) -> None:
         """
         Initialize Thompson Sampling optimizer.
@@ -85,6 +92,9 @@ class ThompsonSamplingWeightOptimizer:
             providers: List of provider names to optimize weights for
             persistence_path: Optional path to persist stats. If None,
                               defaults to "data/thompson_sampling_stats.json"
+            flush_interval_seconds: Max age of the stats snapshot while updates
+                                    are pending (updates are always delta-logged)
+            flush_every: Rewrite the snapshot after this many updates
         """
         self.providers = list(providers)
 
@@ -107,6 +117,13 @@ class ThompsonSamplingWeightOptimizer:
 
         # Initialize FileIOManager for atomic file operations
         self.file_io = FileIOManager()
+        self._store = LearningStateStore(
+            self.persistence_path,
+            snapshot=self._stats_payload,
+            flush_interval_seconds=flush_interval_seconds,
+            flush_every=flush_every,
+            file_io=self.file_io,
+        )
 
         # Load existing stats if available
         self._load_stats()
@@ -175,8 +192,14 @@ class ThompsonSamplingWeightOptimizer:
                     f"Regime '{regime}' multiplier unchanged (clamped): {updated:.4f}"
                 )
 
-        # Auto-save after each update
-        self._save_stats()
+        # Delta-log the update; the snapshot rewrite is coalesced
+        ops = [(("provider_stats", provider), self.provider_stats[provider])]
+        if regime and regime in self.regime_multipliers:
+            ops.append((("regime_multipliers", regime), self.regime_multipliers[regime]))
+        try:
+            self._store.record(*ops)
+        except FileIOError as e:
+            logger.warning(f"Failed to persist Thompson Sampling update: {e}")
 
     def sample_weights(self, market_regime: str = "trending") -> Dict[str, float]:
         """
@@ -277,29 +300,21 @@ class ThompsonSamplingWeightOptimizer:
 
         return win_rates
 
+    def _stats_payload(self) -> Dict[str, Any]:
+        return {
+            "provider_stats": self.provider_stats,
+            "regime_multipliers": self.regime_multipliers,
+            "providers": self.providers,
+        }
+
     def _save_stats(self) -> None:
         """
-        Persist provider stats to disk.
+        Persist provider stats to disk now.
 
-        Uses atomic write pattern to prevent corruption.
+        Writes the full snapshot atomically and truncates the delta log.
         """
         try:
-            # Prepare data for serialization
-            data = {
-                "provider_stats": self.provider_stats,
-                "regime_multipliers": self.regime_multipliers,
-                "providers": self.providers,
-            }
-
-            # Write atomically using FileIOManager
-            self.file_io.write_json(
-                self.persistence_path,
-                data,
-                atomic=True,
-                backup=False,  # No backup for stats updates (high frequency)
-                create_dirs=True,
-                indent=2,
-            )
+            self._store.flush()
 
             logger.debug(f"Thompson Sampling stats saved to {self.persistence_path}")
 
@@ -314,8 +329,8 @@ class ThompsonSamplingWeightOptimizer:
         weren't in the saved file.
         """
         try:
-            # Read with FileIOManager (returns {} if file doesn't exist)
-            data = self.file_io.read_json(self.persistence_path, default={})
+            # Snapshot plus any delta-logged updates ({} if neither exists)
+            data = self._store.load()
 
             if not data:
                 logger.debug(
@@ -380,6 +395,13 @@ class ThompsonSamplingWeightOptimizer:
         self._save_stats()
         logger.info("Reset all Thompson Sampling stats")
 
+    def flush(self) -> None:
+        """Write any delta-logged updates into the stats snapshot."""
+        try:
+            self._store.close()
+        except FileIOError as e:
+            logger.warning(f"Failed to flush Thompson Sampling stats: {e}")
+
     def get_summary(self) -> Dict[str, Any]:
         """
         Get summary of current optimizer state.
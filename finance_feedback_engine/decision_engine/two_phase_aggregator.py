@@ -6,11 +6,11 @@ Implements a two-phase decision making process:
 - Phase 2: Escalate to premium providers if needed
 """
 
-import asyncio
 import logging
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional
 
 from ..exceptions import InsufficientProvidersError
+from .streaming_ensemble import ProviderLatencyTracker, collect_provider_votes
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +58,9 @@ class TwoPhaseAggregator:
         asset_pair: str,
         market_data: Dict[str, Any],
         query_function: callable,
+        settle: Optional[Callable[[Dict[str, Any], List[str]], Optional[str]]] = None,
+        timeout_for: Optional[Callable[[str], Optional[float]]] = None,
+        latency_tracker: Optional[ProviderLatencyTracker] = None,
     ) -> Dict[str, Any]:
         """
         Two-phase ensemble aggregation with smart premium API escalation.
@@ -85,6 +88,10 @@ class TwoPhaseAggregator:
             asset_pair: Asset pair being analyzed
             market_data: Market data dict (must include 'type' field)
             query_function: Function to query individual providers
+            settle: ``settle(decisions, pending)`` returns the Phase 1 action once
+                outstanding providers cannot flip it; they are then cut short
+            timeout_for: Per-provider Phase 1 timeout in seconds
+            latency_tracker: Records Phase 1 provider latencies
 
         Returns:
             Decision dict with two-phase metadata
@@ -166,31 +173,34 @@ class TwoPhaseAggregator:
         free_tier = get_free_providers()
         phase1_quorum = self.two_phase_config.get("phase1_min_quorum", 2)
 
-        # Create tasks for Phase 1 providers only
-        phase1_tasks = [query_function(provider, prompt) for provider in free_tier]
-
-        # Execute Phase 1 queries in parallel
-        results = await asyncio.gather(*phase1_tasks, return_exceptions=True)
-
-        # Process Phase 1 results (free tier)
-        phase1_decisions = {}
-        phase1_failed = []
+        confidence_threshold = self.two_phase_config.get(
+            "phase1_confidence_threshold", 0.75
+        )
+        agreement_threshold = self.two_phase_config.get(
+            "phase1_agreement_threshold", 0.6
+        )
 
-        for i, provider in enumerate(free_tier):
-            result = results[i]
-            if isinstance(result, Exception):
-                logger.error(f"Phase 1: {provider} failed: {result}")
-                phase1_failed.append(provider)
-            else:
-                decision = result
-                if self._is_valid_provider_response(decision, provider):
-                    phase1_decisions[provider] = decision
-                    logger.info(
-                        f"Phase 1: {provider} -> {decision.get('action')} ({decision.get('confidence')}%)"
-                    )
-                else:
-                    logger.warning(f"Phase 1: {provider} returned invalid response")
-                    phase1_failed.append(provider)
+        # Consume Phase 1 results as they complete
+        phase1_votes = await collect_provider_votes(
+            free_tier,
+            lambda provider: query_function(provider, prompt),
+            self._is_valid_provider_response,
+            settle=(
+                self._phase1_settle(
+                    settle, phase1_quorum, confidence_threshold, agreement_threshold
+                )
+                if settle is not None
+                else None
+            ),
+            timeout_for=timeout_for,
+            latency_tracker=latency_tracker,
+        )
+        phase1_decisions = phase1_votes.decisions
+        phase1_failed = phase1_votes.failed
+        for provider, decision in phase1_decisions.items():
+            logger.info(
+                f"Phase 1: {provider} -> {decision.get('action')} ({decision.get('confidence')}%)"
+            )
 
         # Check Phase 1 quorum
         phase1_success_count = len(phase1_decisions)
@@ -225,15 +235,10 @@ class TwoPhaseAggregator:
             "num_success": phase1_success_count,
             "quorum_met": True,
             "phase1_metrics": phase1_metrics,
+            "cut_short_providers": phase1_votes.cut_short,
         }
 
         # Process Phase 2 results
-        confidence_threshold = self.two_phase_config.get(
-            "phase1_confidence_threshold", 0.75
-        )
-        agreement_threshold = self.two_phase_config.get(
-            "phase1_agreement_threshold", 0.6
-        )
         require_premium_for_high_stakes = self.two_phase_config.get(
             "require_premium_for_high_stakes", True
         )
@@ -460,6 +465,44 @@ class TwoPhaseAggregator:
 
         return True
 
+    @staticmethod
+    def _phase1_settle(
+        settle: Callable[[Dict[str, Any], List[str]], Optional[str]],
+        quorum: int,
+        confidence_threshold: float,
+        agreement_threshold: float,
+    ) -> Callable[[Dict[str, Any], List[str]], Optional[str]]:
+        """
+        Wrap ``settle`` so Phase 1 only exits early when cutting providers short
+        cannot change the quorum or the escalation decision.
+
+        Escalation bounds assume every outstanding provider would have
+        dissented at zero confidence.
+        """
+        from collections import Counter
+
+        def check(decisions: Dict[str, Any], pending: List[str]) -> Optional[str]:
+            if len(decisions) < quorum:
+                return None
+            actions = [d.get("action") for d in decisions.values()]
+            confidences = [
+                float(d["confidence"])
+                for d in decisions.values()
+                if isinstance(d.get("confidence"), (int, float))
+            ]
+            worst_agreement = Counter(actions).most_common(1)[0][1] / (
+                len(actions) + len(pending)
+            )
+            worst_confidence = sum(confidences) / (len(confidences) + len(pending))
+            if (
+                worst_agreement < agreement_threshold
+                or worst_confidence / 100.0 < confidence_threshold
+            ):
+                return None
+            return settle(decisions, pending)
+
+        return check
+
     def _calculate_phase1_metrics(
         self, decisions: Dict[str, Dict[str, Any]]
     ) -> Dict[str, Any]:
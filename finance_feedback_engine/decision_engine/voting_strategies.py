@@ -8,14 +8,31 @@ import json
 import logging
 from collections import Counter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
-from sklearn.linear_model import LogisticRegression
-from sklearn.preprocessing import StandardScaler
+
+from finance_feedback_engine.decision_engine.meta_learner import (
+    MetaFeatureScaler,
+    StackingMetaLearner,
+    load_meta_learner,
+)
 
 logger = logging.getLogger(__name__)
 
+# Column order of the enhanced stacking model; the first five are the standard set
+ENHANCED_META_FEATURES = (
+    "buy_ratio",
+    "sell_ratio",
+    "hold_ratio",
+    "avg_confidence",
+    "confidence_std",
+    "action_diversity_ratio",
+    "confidence_range",
+    "avg_amount",
+    "amount_std",
+)
+
 
 class VotingStrategies:
     """
@@ -33,98 +50,30 @@ class VotingStrategies:
             voting_strategy: Default strategy ('weighted', 'majority', 'stacking')
         """
         self.voting_strategy = voting_strategy
-        self.meta_learner: LogisticRegression | None = None
-        self.meta_feature_scaler: StandardScaler | None = None
+        self.meta_learner: StackingMetaLearner | None = None
+        self.meta_feature_scaler: MetaFeatureScaler | None = None
 
         if self.voting_strategy == "stacking":
             self._initialize_meta_learner()
 
-    def _initialize_meta_learner(self) -> None:  # noqa: C901
+    def _initialize_meta_learner(self) -> None:
         """
         Initializes the meta-learner model for the stacking ensemble.
 
         It tries to load a trained model from 'meta_learner_model.json'.
         If the file doesn't exist, it falls back to hardcoded mock parameters.
+        Inference runs on the NumPy kernel in ``meta_learner``; training stays
+        offline in ``scripts/retrain_meta_learner.py``.
         """
         logger.info("Initializing meta-learner for stacking ensemble.")
-        meta_learner: LogisticRegression = LogisticRegression()
-        meta_feature_scaler: StandardScaler = StandardScaler()
-        self.meta_learner = meta_learner
-        self.meta_feature_scaler = meta_feature_scaler
 
         model_path = Path(__file__).parent / "meta_learner_model.json"
 
         if model_path.exists():
             try:
-                with open(model_path, "r") as f:
-                    model_data = json.load(f)
-
-                # Validate required keys
-                required_keys = [
-                    "classes",
-                    "coef",
-                    "intercept",
-                    "scaler_mean",
-                    "scaler_scale",
-                ]
-                missing_keys = [k for k in required_keys if k not in model_data]
-                if missing_keys:
-                    raise KeyError(f"Missing required keys: {missing_keys}")
-
-                meta_learner.classes_ = np.array(model_data["classes"])
-                meta_learner.coef_ = np.array(model_data["coef"])
-                meta_learner.intercept_ = np.array(model_data["intercept"])
-
-                # Validate shapes
-                expected_n_features = len(model_data["scaler_mean"])
-                n_classes = len(meta_learner.classes_)
-
-                # scikit-learn binary LogisticRegression uses:
-                #   coef_.shape == (1, n_features) and intercept_.shape == (1,)
-                # while multiclass uses:
-                #   coef_.shape == (n_classes, n_features) and intercept_.shape == (n_classes,)
-                coef_shape = meta_learner.coef_.shape
-                intercept_shape = meta_learner.intercept_.shape
-
-                if n_classes == 2:
-                    allowed_coef_shapes = {
-                        (1, expected_n_features),
-                        (2, expected_n_features),
-                    }
-                    if coef_shape not in allowed_coef_shapes:
-                        raise ValueError(
-                            "Invalid coef shape for binary classifier: expected one of "
-                            f"{sorted(allowed_coef_shapes)}, got {coef_shape}"
-                        )
-
-                    allowed_intercept_shapes = {(1,), (2,)}
-                    if intercept_shape not in allowed_intercept_shapes:
-                        raise ValueError(
-                            "Invalid intercept shape for binary classifier: expected one of "
-                            f"{sorted(allowed_intercept_shapes)}, got {intercept_shape}"
-                        )
-                else:
-                    if coef_shape != (n_classes, expected_n_features):
-                        raise ValueError(
-                            f"Invalid coef shape: expected ({n_classes}, {expected_n_features}), got {coef_shape}"
-                        )
-                    if intercept_shape != (n_classes,):
-                        raise ValueError(
-                            f"Invalid intercept shape: expected ({n_classes},), got {intercept_shape}"
-                        )
-
-                meta_feature_scaler.mean_ = np.array(model_data["scaler_mean"])
-                meta_feature_scaler.scale_ = np.array(model_data["scaler_scale"])
-
-                if meta_feature_scaler.mean_.shape != (expected_n_features,):
-                    raise ValueError(
-                        f"Invalid scaler_mean shape: expected ({expected_n_features},), got {meta_feature_scaler.mean_.shape}"
-                    )
-                if meta_feature_scaler.scale_.shape != (expected_n_features,):
-                    raise ValueError(
-                        f"Invalid scaler_scale shape: expected ({expected_n_features},), got {meta_feature_scaler.scale_.shape}"
-                    )
-
+                self.meta_learner, self.meta_feature_scaler = load_meta_learner(
+                    model_path
+                )
                 logger.info(f"Meta-learner loaded from {model_path}")
                 return
             except (json.JSONDecodeError, KeyError, IOError) as e:
@@ -135,23 +84,21 @@ class VotingStrategies:
 
         # Fallback to mock-trained parameters if file doesn't exist or is invalid
         logger.info("Using mock-trained parameters for meta-learner.")
-        meta_learner.classes_ = np.array(["BUY", "HOLD", "SELL"])
         # For enhanced stacking, we have 9 features instead of 5
         # Features: buy_ratio, sell_ratio, hold_ratio, avg_confidence, confidence_std, action_diversity_ratio, confidence_range, avg_amount, amount_std
-        meta_learner.coef_ = np.array(
-            [
+        self.meta_learner = StackingMetaLearner(
+            classes=["BUY", "HOLD", "SELL"],
+            coef=[
                 [2.0, -1.0, -1.0, 0.8, -0.5, 0.3, -0.2, 0.1, -0.1],  # BUY coefficients
                 [-1.0, -1.0, 2.0, -0.2, 0.8, -0.1, 0.4, -0.1, 0.1],  # HOLD coefficients
                 [-1.0, 2.0, -1.0, 0.8, -0.5, -0.2, -0.2, 0.1, 0.1],  # SELL coefficients
-            ]
+            ],
+            intercept=[0.0, 0.0, 0.0],
         )
-        meta_learner.intercept_ = np.array([0.0, 0.0, 0.0])
         # For 9 features instead of 5
-        meta_feature_scaler.mean_ = np.array(
-            [0.33, 0.33, 0.33, 75.0, 10.0, 0.67, 20.0, 800.0, 250.0]
-        )
-        meta_feature_scaler.scale_ = np.array(
-            [0.17, 0.17, 0.17, 10.0, 5.0, 0.23, 10.0, 200.0, 100.0]
+        self.meta_feature_scaler = MetaFeatureScaler(
+            mean=[0.33, 0.33, 0.33, 75.0, 10.0, 0.67, 20.0, 800.0, 250.0],
+            scale=[0.17, 0.17, 0.17, 10.0, 5.0, 0.23, 10.0, 200.0, 100.0],
         )
         logger.info(
             "Meta-learner initialized with mock-trained parameters for enhanced features."
@@ -540,49 +487,17 @@ class VotingStrategies:
         # Check if our model expects 9 features (enhanced) or 5 features (standard)
         expected_features = self.meta_feature_scaler.mean_.shape[0]
 
-        if expected_features == 9:
-            # Model expects 9 features, use all enhanced features
-            feature_vector = np.array(
-                [
-                    meta_features["buy_ratio"],
-                    meta_features["sell_ratio"],
-                    meta_features["hold_ratio"],
-                    meta_features["avg_confidence"],
-                    meta_features["confidence_std"],
-                    meta_features["action_diversity_ratio"],
-                    meta_features["confidence_range"],
-                    meta_features["avg_amount"],
-                    meta_features["amount_std"],
-                ]
-            ).reshape(1, -1)
-        elif expected_features == 5:
-            # Model expects 5 features, use only the standard features
+        if expected_features == 5:
             logger.warning(
                 "Model has 5 features but enhanced stacking was requested. Using standard features only."
             )
-            feature_vector = np.array(
-                [
-                    meta_features["buy_ratio"],
-                    meta_features["sell_ratio"],
-                    meta_features["hold_ratio"],
-                    meta_features["avg_confidence"],
-                    meta_features["confidence_std"],
-                ]
-            ).reshape(1, -1)
-        else:
+        elif expected_features != 9:
             logger.error(
                 f"Unexpected number of features in model: {expected_features}, expected 5 or 9"
             )
-            # Fallback to standard 5 features
-            feature_vector = np.array(
-                [
-                    meta_features["buy_ratio"],
-                    meta_features["sell_ratio"],
-                    meta_features["hold_ratio"],
-                    meta_features["avg_confidence"],
-                    meta_features["confidence_std"],
-                ]
-            ).reshape(1, -1)
+        feature_vector = self._enhanced_feature_row(
+            meta_features, expected_features
+        ).reshape(1, -1)
 
         # Scale the features
         scaled_features = self.meta_feature_scaler.transform(feature_vector)
@@ -615,6 +530,73 @@ class VotingStrategies:
             == 9,  # Only True if using 9 features
         }
 
+    @staticmethod
+    def _enhanced_feature_row(
+        meta_features: Dict[str, Any], expected_features: int
+    ) -> np.ndarray:
+        """Order enhanced meta-features for a 9-feature model, else the standard 5."""
+        names = (
+            ENHANCED_META_FEATURES
+            if expected_features == 9
+            else ENHANCED_META_FEATURES[:5]
+        )
+        return np.array([meta_features[name] for name in names], dtype=float)
+
+    def stacking_predict_batch(
+        self,
+        votes: Sequence[Tuple[List[str], List[int], List[float]]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Score many ensemble votes with the meta-learner in one pass.
+
+        Intended for backtests and decision replays: meta-features are built
+        per vote, then scaling and inference run once over the whole matrix.
+
+        Args:
+            votes: ``(actions, confidences, amounts)`` per decision
+
+        Returns:
+            One dict per vote with ``action``, ``confidence``, ``amount``,
+            ``meta_features`` and ``stacking_probabilities``, matching the
+            fields of a single stacking decision.
+        """
+        if not votes:
+            return []
+        if self.meta_learner is None or self.meta_feature_scaler is None:
+            self._initialize_meta_learner()
+
+        expected_features = self.meta_feature_scaler.mean_.shape[0]
+        all_meta_features = [
+            self._generate_enhanced_meta_features(actions, confidences, amounts)
+            for actions, confidences, amounts in votes
+        ]
+        matrix = np.vstack(
+            [
+                self._enhanced_feature_row(meta_features, expected_features)
+                for meta_features in all_meta_features
+            ]
+        )
+
+        scaled = self.meta_feature_scaler.transform(matrix)
+        predicted = self.meta_learner.predict(scaled)
+        probabilities = self.meta_learner.predict_proba(scaled)
+        model_classes = list(self.meta_learner.classes_)
+
+        results = []
+        for action, probs, meta_features in zip(
+            predicted, probabilities, all_meta_features
+        ):
+            results.append(
+                {
+                    "action": action,
+                    "confidence": int(probs[model_classes.index(action)] * 100),
+                    "amount": meta_features["avg_amount"],
+                    "meta_features": meta_features,
+                    "stacking_probabilities": dict(zip(model_classes, probs)),
+                }
+            )
+        return results
+
     def _generate_enhanced_meta_features(
         self, actions: List[str], confidences: List[int], amounts: List[float]
     ) -> Dict[str, Any]:
@@ -1,6 +1,6 @@
 """Comprehensive performance metrics collection and analysis."""
 
-from collections import deque
+from bisect import bisect_left
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from typing import Any, Dict, List, Optional
@@ -89,8 +89,92 @@ class TradingPerformanceMetrics:
         }
 
 
+def _to_epoch_seconds(value: Any) -> float:
+    """Normalize a trade timestamp (datetime, ISO string or epoch) to epoch seconds."""
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=UTC)
+        return value.timestamp()
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return _to_epoch_seconds(
+                datetime.fromisoformat(value.replace("Z", "+00:00"))
+            )
+        except ValueError:
+            pass
+    return datetime.now(UTC).timestamp()
+
+
+def _welford_update(state: np.ndarray, value: float) -> None:
+    """Fold one value into a ``(count, mean, M2)`` state in place (Welford)."""
+    state[0] += 1.0
+    delta = value - state[1]
+    state[1] += delta / state[0]
+    state[2] += delta * (value - state[1])
+
+
+def _unmerge_moments(total: np.ndarray, head: np.ndarray) -> tuple:
+    """``(count, mean, M2)`` of ``total`` with the leading ``head`` removed.
+
+    Inverse of Chan et al.'s pairwise combination. Works on centered moments,
+    so unlike E[x²] - E[x]² it does not cancel catastrophically when the mean
+    is large relative to the spread.
+    """
+    count = total[0] - head[0]
+    if count <= 0:
+        return 0.0, 0.0, 0.0
+    if head[0] <= 0:
+        return float(total[0]), float(total[1]), float(total[2])
+    mean = total[1] + (total[1] - head[1]) * head[0] / count
+    delta = mean - head[1]
+    m2 = total[2] - head[2] - delta * delta * head[0] * count / total[0]
+    return float(count), float(mean), max(0.0, float(m2))
+
+
+def _column_moments(values: np.ndarray) -> tuple:
+    """Two-pass ``(count, mean, M2)`` of an array."""
+    if not values.size:
+        return 0.0, 0.0, 0.0
+    mean = float(values.mean())
+    centered = values - mean
+    return float(values.size), mean, float((centered * centered).sum())
+
+
+def _longest_run(mask: np.ndarray) -> int:
+    """Length of the longest run of True values in a boolean array."""
+    if mask.size == 0 or not mask.any():
+        return 0
+    padded = np.concatenate(([0], mask.astype(np.int8), [0]))
+    edges = np.diff(padded)
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    return int((ends - starts).max())
+
+
 class PerformanceMetricsCollector:
-    """Collects and calculates comprehensive performance metrics."""
+    """Collects and calculates comprehensive performance metrics.
+
+    Trades are kept in fixed-capacity NumPy ring-buffer columns. Alongside
+    each value the collector stores running cumulative sums (P&L, wins/losses,
+    durations) and running Welford ``(count, mean, M2)`` states for returns
+    and downside returns, so recording a trade is O(1). Sums over any suffix
+    of the window are a difference of two prefix sums; suffix moments are
+    recovered from two Welford states with Chan's combination formula.
+    """
+
+    # Running prefix sums maintained per recorded trade
+    _PREFIX_FIELDS = (
+        "pnl",
+        "down_count",
+        "wins",
+        "win_pnl",
+        "loss_abs_pnl",
+        "duration",
+    )
+    # Running Welford states maintained per recorded trade
+    _MOMENT_FIELDS = ("ret", "down_ret")
 
     def __init__(self, window_size: int = 10000):
         """
@@ -99,9 +183,83 @@ class PerformanceMetricsCollector:
         Args:
             window_size: Number of recent trades to keep in memory
         """
-        self.trade_history = deque(maxlen=window_size)
+        self.window_size = max(1, int(window_size))
+        cap = self.window_size
+        self._timestamps = np.zeros(cap, dtype=np.float64)
+        self._pnl = np.zeros(cap, dtype=np.float64)
+        self._pnl_pct = np.zeros(cap, dtype=np.float64)
+        self._profitable = np.zeros(cap, dtype=bool)
+        self._duration = np.zeros(cap, dtype=np.float64)
+        self._position_size = np.zeros(cap, dtype=np.float64)
+        self._entry_price = np.zeros(cap, dtype=np.float64)
+        self._exit_price = np.zeros(cap, dtype=np.float64)
+        self._asset_pair = np.empty(cap, dtype=object)
+        self._prefix = {
+            name: np.zeros(cap, dtype=np.float64) for name in self._PREFIX_FIELDS
+        }
+        self._running = dict.fromkeys(self._PREFIX_FIELDS, 0.0)
+        self._moment_prefix = {
+            name: np.zeros((cap, 3), dtype=np.float64) for name in self._MOMENT_FIELDS
+        }
+        self._moments = {name: np.zeros(3) for name in self._MOMENT_FIELDS}
+        # Cumulative totals at the most recently evicted trade
+        self._evicted = dict.fromkeys(self._PREFIX_FIELDS, 0.0)
+        self._evicted_moments = {name: np.zeros(3) for name in self._MOMENT_FIELDS}
+        self._recorded = 0  # total trades ever recorded
+        self._timestamps_monotonic = True
+
         self.equity_curve = []
         self.initial_balance = None
+        # Incremental drawdown state over the equity curve
+        self._equity_peak = 0.0
+        self._max_drawdown_frac = 0.0
+        self._drawdown_run = 0
+        self._max_drawdown_run = 0
+
+    def __len__(self) -> int:
+        return min(self._recorded, self.window_size)
+
+    def _slot(self, logical_index: int) -> int:
+        return (self._recorded - len(self) + logical_index) % self.window_size
+
+    def _ordered(self, column: np.ndarray, start: int = 0) -> np.ndarray:
+        """Return ``column`` in recording order from logical index ``start``."""
+        size = len(self)
+        if start >= size:
+            return column[:0].copy()
+        first = self._slot(start)
+        last = self._slot(size - 1)
+        if first <= last:
+            return column[first : last + 1].copy()
+        return np.concatenate((column[first:], column[: last + 1]))
+
+    @property
+    def trade_history(self) -> List[Dict[str, Any]]:
+        """Trades in the current window as dictionaries (oldest first)."""
+        return [
+            {
+                "timestamp": datetime.fromtimestamp(ts, UTC),
+                "pnl": pnl,
+                "pnl_pct": pnl_pct,
+                "was_profitable": bool(profitable),
+                "duration_hours": duration,
+                "position_size": size,
+                "entry_price": entry,
+                "exit_price": exit_,
+                "asset_pair": pair,
+            }
+            for ts, pnl, pnl_pct, profitable, duration, size, entry, exit_, pair in zip(
+                self._ordered(self._timestamps).tolist(),
+                self._ordered(self._pnl).tolist(),
+                self._ordered(self._pnl_pct).tolist(),
+                self._ordered(self._profitable).tolist(),
+                self._ordered(self._duration).tolist(),
+                self._ordered(self._position_size).tolist(),
+                self._ordered(self._entry_price).tolist(),
+                self._ordered(self._exit_price).tolist(),
+                self._ordered(self._asset_pair).tolist(),
+            )
+        ]
 
     def record_trade(self, trade_outcome: Dict[str, Any]):
         """
@@ -110,27 +268,185 @@ class PerformanceMetricsCollector:
         Args:
             trade_outcome: Trade outcome dictionary with pnl, entry/exit prices, etc.
         """
-        self.trade_history.append(
-            {
-                "timestamp": trade_outcome.get("exit_timestamp", datetime.now(UTC)),
-                "pnl": trade_outcome.get("realized_pnl", 0.0),
-                "pnl_pct": trade_outcome.get("pnl_percentage", 0.0),
-                "was_profitable": trade_outcome.get("was_profitable", False),
-                "duration_hours": trade_outcome.get("holding_period_hours", 0.0),
-                "position_size": trade_outcome.get("position_size", 0.0),
-                "entry_price": trade_outcome.get("entry_price", 0.0),
-                "exit_price": trade_outcome.get("exit_price", 0.0),
-                "asset_pair": trade_outcome.get("asset_pair", "UNKNOWN"),
-            }
+        timestamp = _to_epoch_seconds(
+            trade_outcome.get("exit_timestamp", datetime.now(UTC))
         )
+        pnl = float(trade_outcome.get("realized_pnl", 0.0) or 0.0)
+        pnl_pct = float(trade_outcome.get("pnl_percentage", 0.0) or 0.0)
+        profitable = bool(trade_outcome.get("was_profitable", False))
+        duration = float(trade_outcome.get("holding_period_hours", 0.0) or 0.0)
+
+        slot = self._recorded % self.window_size
+        if self._recorded:
+            previous = self._timestamps[(self._recorded - 1) % self.window_size]
+            if timestamp < previous:
+                self._timestamps_monotonic = False
+        if self._recorded >= self.window_size:
+            for name, prefix in self._prefix.items():
+                self._evicted[name] = prefix[slot]
+            for name, prefix in self._moment_prefix.items():
+                self._evicted_moments[name] = prefix[slot].copy()
+
+        self._timestamps[slot] = timestamp
+        self._pnl[slot] = pnl
+        self._pnl_pct[slot] = pnl_pct
+        self._profitable[slot] = profitable
+        self._duration[slot] = duration
+        self._position_size[slot] = float(
+            trade_outcome.get("position_size", 0.0) or 0.0
+        )
+        self._entry_price[slot] = float(trade_outcome.get("entry_price", 0.0) or 0.0)
+        self._exit_price[slot] = float(trade_outcome.get("exit_price", 0.0) or 0.0)
+        self._asset_pair[slot] = trade_outcome.get("asset_pair", "UNKNOWN")
+
+        downside = pnl_pct < 0
+        increments = {
+            "pnl": pnl,
+            "down_count": 1.0 if downside else 0.0,
+            "wins": 1.0 if profitable else 0.0,
+            "win_pnl": pnl if profitable else 0.0,
+            "loss_abs_pnl": 0.0 if profitable else abs(pnl),
+            "duration": duration,
+        }
+        for name, increment in increments.items():
+            self._running[name] += increment
+            self._prefix[name][slot] = self._running[name]
+        _welford_update(self._moments["ret"], pnl_pct)
+        if downside:
+            _welford_update(self._moments["down_ret"], pnl_pct)
+        for name, state in self._moments.items():
+            self._moment_prefix[name][slot] = state
+        self._recorded += 1
 
         # Update equity curve
         if not self.equity_curve:
             self.initial_balance = trade_outcome.get("initial_balance", 10000.0)
-            self.equity_curve.append(self.initial_balance)
+            self._append_equity(self.initial_balance)
+
+        self._append_equity(self.equity_curve[-1] + pnl)
+
+    def _append_equity(self, equity: float) -> None:
+        """Append an equity point and update drawdown depth/duration in O(1)."""
+        self.equity_curve.append(equity)
+        if len(self.equity_curve) == 1 or equity > self._equity_peak:
+            self._equity_peak = equity
+        drawdown = (
+            (equity - self._equity_peak) / self._equity_peak
+            if self._equity_peak > 0
+            else 0.0
+        )
+        self._max_drawdown_frac = max(self._max_drawdown_frac, -drawdown)
+        if drawdown < -0.01:  # In drawdown (>1%)
+            self._drawdown_run += 1
+            self._max_drawdown_run = max(self._max_drawdown_run, self._drawdown_run)
+        else:
+            self._drawdown_run = 0
+
+    def _window_start(self, cutoff: float) -> Optional[int]:
+        """Logical index of the first trade at or after ``cutoff``.
+
+        Returns None when timestamps were recorded out of order and the
+        window has to be selected with a mask instead.
+        """
+        if not self._timestamps_monotonic:
+            return None
+        return bisect_left(
+            range(len(self)), cutoff, key=lambda i: self._timestamps[self._slot(i)]
+        )
 
-        current_equity = self.equity_curve[-1] + trade_outcome.get("realized_pnl", 0.0)
-        self.equity_curve.append(current_equity)
+    def _suffix_sums(self, start: int) -> Dict[str, float]:
+        """Sums of the prefix fields over logical indices ``start..end``."""
+        if start >= len(self):
+            return dict.fromkeys(self._PREFIX_FIELDS, 0.0)
+        if start > 0:
+            before = self._slot(start - 1)
+            base = {name: self._prefix[name][before] for name in self._PREFIX_FIELDS}
+        elif self._recorded > self.window_size:
+            base = self._evicted
+        else:
+            base = dict.fromkeys(self._PREFIX_FIELDS, 0.0)
+        return {
+            name: float(self._running[name] - base[name])
+            for name in self._PREFIX_FIELDS
+        }
+
+    def _suffix_moments(self, start: int) -> Dict[str, tuple]:
+        """Welford ``(count, mean, M2)`` states over logical indices ``start..end``."""
+        if start > 0:
+            before = self._slot(start - 1)
+            base = {name: self._moment_prefix[name][before] for name in self._moments}
+        elif self._recorded > self.window_size:
+            base = self._evicted_moments
+        else:
+            return {
+                name: tuple(float(v) for v in state)
+                for name, state in self._moments.items()
+            }
+        return {
+            name: _unmerge_moments(state, base[name])
+            for name, state in self._moments.items()
+        }
+
+    def _window(self, window_days: Optional[int]) -> Optional[Dict[str, Any]]:
+        """Select the trades for a metrics window as ordered column slices."""
+        if not len(self):
+            return None
+
+        start = 0
+        mask = None
+        if window_days:
+            cutoff = (datetime.now(UTC) - timedelta(days=window_days)).timestamp()
+            start = self._window_start(cutoff)
+            if start is None:
+                start = 0
+                mask = self._ordered(self._timestamps) >= cutoff
+
+        columns = {
+            "timestamp": self._ordered(self._timestamps, start),
+            "pnl": self._ordered(self._pnl, start),
+            "pnl_pct": self._ordered(self._pnl_pct, start),
+            "profitable": self._ordered(self._profitable, start),
+            "duration": self._ordered(self._duration, start),
+        }
+        if mask is not None:
+            columns = {name: values[mask] for name, values in columns.items()}
+            sums = self._column_sums(columns)
+            ret = columns["pnl_pct"]
+            moments = {
+                "ret": _column_moments(ret),
+                "down_ret": _column_moments(ret[ret < 0]),
+            }
+        else:
+            sums = self._suffix_sums(start)
+            moments = self._suffix_moments(start)
+
+        if not columns["pnl"].size:
+            return None
+        if not self._timestamps_monotonic:
+            order = np.argsort(columns["timestamp"], kind="stable")
+            columns = {name: values[order] for name, values in columns.items()}
+        columns["sums"] = sums
+        columns["moments"] = moments
+        return columns
+
+    @staticmethod
+    def _column_sums(columns: Dict[str, np.ndarray]) -> Dict[str, float]:
+        pnl = columns["pnl"]
+        profitable = columns["profitable"]
+        return {
+            "pnl": float(pnl.sum()),
+            "down_count": float((columns["pnl_pct"] < 0).sum()),
+            "wins": float(profitable.sum()),
+            "win_pnl": float(pnl[profitable].sum()),
+            "loss_abs_pnl": float(np.abs(pnl[~profitable]).sum()),
+            "duration": float(columns["duration"].sum()),
+        }
+
+    @staticmethod
+    def _std_from_moments(moments: tuple) -> float:
+        """Population standard deviation from a ``(count, mean, M2)`` state."""
+        count, _, m2 = moments
+        return float(np.sqrt(m2 / count)) if count > 0 else 0.0
 
     def calculate_metrics(
         self, window_days: Optional[int] = None
@@ -144,65 +460,68 @@ class PerformanceMetricsCollector:
         Returns:
             TradingPerformanceMetrics object
         """
-        if not self.trade_history:
+        window = self._window(window_days)
+        if window is None:
             return TradingPerformanceMetrics()
 
-        # Filter by time window if specified
-        if window_days:
-            cutoff_time = datetime.now(UTC) - timedelta(days=window_days)
-            trades = [t for t in self.trade_history if t["timestamp"] >= cutoff_time]
-        else:
-            trades = list(self.trade_history)
-
-        if not trades:
-            return TradingPerformanceMetrics()
+        sums = window["sums"]
+        count = float(window["pnl"].size)
+        moments = window["moments"]
+        mean_return = moments["ret"][1]
+        std_return = self._std_from_moments(moments["ret"])
+        downside_std = self._std_from_moments(moments["down_ret"])
 
         # Calculate returns
         total_return = self._calculate_total_return()
-        annualized_return = self._calculate_annualized_return(total_return, trades)
+        annualized_return = self._calculate_annualized_return(
+            total_return, window["timestamp"]
+        )
 
-        # Calculate risk metrics
-        sharpe_ratio = self._calculate_sharpe_ratio(trades)
-        sortino_ratio = self._calculate_sortino_ratio(trades)
+        # Calculate risk metrics (annualized assuming ~250 trading days/year)
+        sharpe_ratio = (mean_return / std_return) * np.sqrt(250) if std_return else 0.0
+        if not sums["down_count"]:
+            sortino_ratio = float("inf") if mean_return > 0 else 0.0
+        else:
+            sortino_ratio = (
+                (mean_return / downside_std) * np.sqrt(250) if downside_std else 0.0
+            )
         max_drawdown, dd_duration = self._calculate_max_drawdown()
-        volatility = self._calculate_volatility(trades)
-        downside_deviation = self._calculate_downside_deviation(trades)
+        volatility = std_return * np.sqrt(250)
+        downside_deviation = downside_std * np.sqrt(250)
 
         # Calculate VaR
-        var_95 = self._calculate_var(trades, confidence=0.95)
-        var_99 = self._calculate_var(trades, confidence=0.99)
+        var_95 = self._calculate_var(window["pnl"], confidence=0.95)
+        var_99 = self._calculate_var(window["pnl"], confidence=0.99)
 
         # Win/Loss metrics
-        profitable_trades = [t for t in trades if t["was_profitable"]]
-        losing_trades = [t for t in trades if not t["was_profitable"]]
+        profitable_count = int(sums["wins"])
+        losing_count = int(count) - profitable_count
 
-        win_rate = len(profitable_trades) / len(trades) if trades else 0.0
-        avg_win = (
-            np.mean([t["pnl"] for t in profitable_trades]) if profitable_trades else 0.0
-        )
-        avg_loss = (
-            np.mean([abs(t["pnl"]) for t in losing_trades]) if losing_trades else 0.0
-        )
+        win_rate = profitable_count / count
+        avg_win = sums["win_pnl"] / profitable_count if profitable_count else 0.0
+        avg_loss = sums["loss_abs_pnl"] / losing_count if losing_count else 0.0
 
         profit_factor = (
-            sum(t["pnl"] for t in profitable_trades)
-            / sum(abs(t["pnl"]) for t in losing_trades)
-            if losing_trades and sum(abs(t["pnl"]) for t in losing_trades) > 0
-            else float("inf") if profitable_trades else 0.0
+            sums["win_pnl"] / sums["loss_abs_pnl"]
+            if losing_count and sums["loss_abs_pnl"] > 0
+            else float("inf") if profitable_count else 0.0
         )
 
         win_loss_ratio = avg_win / avg_loss if avg_loss > 0 else float("inf")
 
         # Streaks
-        longest_win_streak, longest_lose_streak = self._calculate_streaks(trades)
+        longest_win_streak = _longest_run(window["profitable"])
+        longest_lose_streak = _longest_run(~window["profitable"])
 
         # Monthly returns
-        monthly_returns = self._calculate_monthly_returns(trades)
+        monthly_returns = self._calculate_monthly_returns(
+            window["timestamp"], window["pnl"]
+        )
         winning_months = sum(1 for r in monthly_returns if r > 0)
         losing_months = sum(1 for r in monthly_returns if r < 0)
 
         # Trade statistics
-        avg_duration = np.mean([t["duration_hours"] for t in trades]) if trades else 0.0
+        avg_duration = sums["duration"] / count
 
         # Calmar ratio
         calmar_ratio = (
@@ -226,11 +545,11 @@ class PerformanceMetricsCollector:
             avg_win=avg_win,
             avg_loss=avg_loss,
             win_loss_ratio=win_loss_ratio,
-            largest_win=max([t["pnl"] for t in trades]) if trades else 0.0,
-            largest_loss=min([t["pnl"] for t in trades]) if trades else 0.0,
-            total_trades=len(trades),
-            profitable_trades=len(profitable_trades),
-            losing_trades=len(losing_trades),
+            largest_win=float(window["pnl"].max()),
+            largest_loss=float(window["pnl"].min()),
+            total_trades=int(count),
+            profitable_trades=profitable_count,
+            losing_trades=losing_count,
             avg_trade_duration_hours=avg_duration,
             monthly_returns=monthly_returns,
             winning_months=winning_months,
@@ -250,16 +569,13 @@ class PerformanceMetricsCollector:
         return ((final - initial) / initial) * 100 if initial > 0 else 0.0
 
     def _calculate_annualized_return(
-        self, total_return: float, trades: List[Dict]
+        self, total_return: float, timestamps: np.ndarray
     ) -> float:
         """Calculate annualized return."""
-        if not trades or len(trades) < 2:
+        if timestamps.size < 2:
             return 0.0
 
-        first_trade = min(trades, key=lambda x: x["timestamp"])
-        last_trade = max(trades, key=lambda x: x["timestamp"])
-
-        days = (last_trade["timestamp"] - first_trade["timestamp"]).days
+        days = int((timestamps.max() - timestamps.min()) // 86400)
 
         if days == 0:
             return 0.0
@@ -269,168 +585,36 @@ class PerformanceMetricsCollector:
 
         return annualized
 
-    def _calculate_sharpe_ratio(self, trades: List[Dict]) -> float:
-        """Calculate Sharpe ratio (assuming 0% risk-free rate)."""
-        if not trades:
-            return 0.0
-
-        returns = [t["pnl_pct"] for t in trades]
-
-        mean_return = np.mean(returns)
-        std_return = np.std(returns)
-
-        if std_return == 0:
-            return 0.0
-
-        # Annualize (assuming ~250 trading days/year)
-        sharpe = (mean_return / std_return) * np.sqrt(250)
-
-        return sharpe
-
-    def _calculate_sortino_ratio(self, trades: List[Dict]) -> float:
-        """Calculate Sortino ratio (downside risk only)."""
-        if not trades:
-            return 0.0
-
-        returns = [t["pnl_pct"] for t in trades]
-        mean_return = np.mean(returns)
-
-        downside_returns = [r for r in returns if r < 0]
-        if not downside_returns:
-            return float("inf") if mean_return > 0 else 0.0
-
-        downside_std = np.std(downside_returns)
-
-        if downside_std == 0:
-            return 0.0
-
-        sortino = (mean_return / downside_std) * np.sqrt(250)
-
-        return sortino
-
     def _calculate_max_drawdown(self) -> tuple[float, int]:
-        """Calculate maximum drawdown and its duration."""
+        """Return maximum drawdown (%) and its duration, maintained incrementally."""
         if len(self.equity_curve) < 2:
             return 0.0, 0
+        return self._max_drawdown_frac * 100, self._max_drawdown_run
 
-        equity = np.array(self.equity_curve)
-        running_max = np.maximum.accumulate(equity)
-        drawdown = (equity - running_max) / running_max
-
-        max_dd = abs(np.min(drawdown)) * 100  # Convert to percentage
-
-        # Calculate drawdown duration
-        in_drawdown = False
-        current_dd_length = 0
-        max_dd_length = 0
-
-        for dd in drawdown:
-            if dd < -0.01:  # In drawdown (>1%)
-                if not in_drawdown:
-                    in_drawdown = True
-                    current_dd_length = 1
-                else:
-                    current_dd_length += 1
-            else:
-                if in_drawdown:
-                    max_dd_length = max(max_dd_length, current_dd_length)
-                    in_drawdown = False
-
-        if in_drawdown:
-            max_dd_length = max(max_dd_length, current_dd_length)
-
-        return max_dd, max_dd_length
-
-    def _calculate_volatility(self, trades: List[Dict]) -> float:
-        """Calculate annualized volatility."""
-        if not trades:
-            return 0.0
-
-        returns = [t["pnl_pct"] for t in trades]
-        std = np.std(returns)
-
-        # Annualize
-        annualized_vol = std * np.sqrt(250)
-
-        return annualized_vol
-
-    def _calculate_downside_deviation(self, trades: List[Dict]) -> float:
-        """Calculate downside deviation (volatility of negative returns)."""
-        if not trades:
-            return 0.0
-
-        returns = [t["pnl_pct"] for t in trades]
-        downside_returns = [r for r in returns if r < 0]
-
-        if not downside_returns:
-            return 0.0
-
-        downside_std = np.std(downside_returns)
-
-        # Annualize
-        annualized_dd = downside_std * np.sqrt(250)
-
-        return annualized_dd
-
-    def _calculate_var(self, trades: List[Dict], confidence: float = 0.95) -> float:
+    def _calculate_var(self, pnl: np.ndarray, confidence: float = 0.95) -> float:
         """Calculate Value at Risk at given confidence level."""
-        if not trades:
+        if not pnl.size:
             return 0.0
 
-        returns = [t["pnl"] for t in trades]
-
-        var = np.percentile(returns, (1 - confidence) * 100)
+        var = np.percentile(pnl, (1 - confidence) * 100)
 
         return abs(var)
 
-    def _calculate_streaks(self, trades: List[Dict]) -> tuple[int, int]:
-        """Calculate longest winning and losing streaks."""
-        if not trades:
-            return 0, 0
-
-        current_win_streak = 0
-        current_lose_streak = 0
-        max_win_streak = 0
-        max_lose_streak = 0
-
-        for trade in sorted(trades, key=lambda x: x["timestamp"]):
-            if trade["was_profitable"]:
-                current_win_streak += 1
-                current_lose_streak = 0
-                max_win_streak = max(max_win_streak, current_win_streak)
-            else:
-                current_lose_streak += 1
-                current_win_streak = 0
-                max_lose_streak = max(max_lose_streak, current_lose_streak)
-
-        return max_win_streak, max_lose_streak
-
-    def _calculate_monthly_returns(self, trades: List[Dict]) -> List[float]:
+    def _calculate_monthly_returns(
+        self, timestamps: np.ndarray, pnl: np.ndarray
+    ) -> List[float]:
         """Calculate monthly return series."""
-        if not trades:
+        if not pnl.size:
             return []
 
-        # Group trades by month
-        monthly_pnl = {}
-
-        for trade in trades:
-            month_key = trade["timestamp"].strftime("%Y-%m")
-            if month_key not in monthly_pnl:
-                monthly_pnl[month_key] = 0.0
+        months = timestamps.astype("datetime64[s]").astype("datetime64[M]")
+        unique_months, inverse = np.unique(months, return_inverse=True)
+        monthly_pnl = np.bincount(inverse, weights=pnl, minlength=unique_months.size)
 
-            monthly_pnl[month_key] += trade["pnl"]
-
-        # Convert to percentage returns (simplified)
-        monthly_returns = []
-        running_balance = self.initial_balance or 10000.0
-
-        for month in sorted(monthly_pnl.keys()):
-            pnl = monthly_pnl[month]
-            ret_pct = (pnl / running_balance) * 100
-            monthly_returns.append(ret_pct)
-            running_balance += pnl
-
-        return monthly_returns
+        # Convert to percentage returns (simplified) against the running balance
+        initial = self.initial_balance or 10000.0
+        balances = initial + np.concatenate(([0.0], np.cumsum(monthly_pnl)[:-1]))
+        return ((monthly_pnl / balances) * 100).tolist()
 
 
 class RollingMetricsCalculator:
@@ -452,25 +636,22 @@ class RollingMetricsCalculator:
 
     def calculate_rolling_win_rate(self, window_trades: int = 20) -> float:
         """Calculate win rate for last N trades."""
-        if len(self.collector.trade_history) < window_trades:
-            trades = list(self.collector.trade_history)
-        else:
-            trades = list(self.collector.trade_history)[-window_trades:]
-
-        if not trades:
+        collector = self.collector
+        size = len(collector)
+        if not size:
             return 0.0
 
-        profitable = sum(1 for t in trades if t["was_profitable"])
-        return profitable / len(trades)
+        window = min(size, max(1, window_trades))
+        wins = collector._suffix_sums(size - window)["wins"]
+        return wins / window
 
     def calculate_current_drawdown(self) -> float:
         """Calculate current drawdown from peak."""
         if len(self.collector.equity_curve) < 2:
             return 0.0
 
-        equity = np.array(self.collector.equity_curve)
-        peak = np.max(equity)
-        current = equity[-1]
+        peak = self.collector._equity_peak
+        current = self.collector.equity_curve[-1]
 
         drawdown = ((current - peak) / peak) * 100
 
@@ -1,6 +1,6 @@
 """Live trade monitoring system."""
 
-from .context_provider import MonitoringContextProvider
+from .context_provider import MonitoringContextProvider, PortfolioSnapshot
 from .metrics_collector import TradeMetricsCollector
 from .trade_monitor import TradeMonitor
 from .trade_tracker import TradeTrackerThread
@@ -10,4 +10,5 @@ __all__ = [
     "TradeTrackerThread",
     "TradeMetricsCollector",
     "MonitoringContextProvider",
+    "PortfolioSnapshot",
 ]
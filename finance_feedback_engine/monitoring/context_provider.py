@@ -1,12 +1,15 @@
 """Monitoring context provider for AI decision pipeline integration."""
 
+import asyncio
+import copy
+import dataclasses
 import json
 import logging
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
 from finance_feedback_engine.utils.shape_normalization import extract_portfolio_positions
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from finance_feedback_engine.decision_engine.policy_actions import (
     get_policy_action_family,
@@ -107,6 +110,31 @@ def enforce_slot_constraints(decision: Dict[str, Any], context: Optional[Dict[st
     return normalized
 
 
+@dataclasses.dataclass(frozen=True)
+class PortfolioSnapshot:
+    """Portfolio state captured once and shared by every context built from it.
+
+    The agent captures one per cycle so that reasoning, risk checks and the
+    decision engine all see the same positions without each asking the
+    exchange again. Treat the contents as read-only: the per-asset views
+    handed out by ``MonitoringContextProvider`` are copies.
+    """
+
+    portfolio: Dict[str, Any]
+    futures_positions: Tuple[Dict[str, Any], ...]
+    holdings: Tuple[Dict[str, Any], ...]
+    position_concentration: Dict[str, Any]
+    captured_at: datetime = dataclasses.field(default_factory=lambda: datetime.now(UTC))
+    # Per-asset (futures, holdings, risk_metrics), filled on first request
+    _asset_views: Dict[Optional[str], Tuple[list, list, Dict[str, Any]]] = dataclasses.field(
+        default_factory=dict, repr=False, compare=False
+    )
+
+    @property
+    def age_seconds(self) -> float:
+        return (datetime.now(UTC) - self.captured_at).total_seconds()
+
+
 class MonitoringContextProvider:
     """
     Provides real-time monitoring context for AI decision making.
@@ -141,9 +169,65 @@ class MonitoringContextProvider:
         self.trade_monitor = trade_monitor
         self.metrics_collector = metrics_collector
         self.portfolio_initial_balance = portfolio_initial_balance
+        self._snapshot: Optional[PortfolioSnapshot] = None
 
         logger.info("MonitoringContextProvider initialized")
 
+    @property
+    def snapshot(self) -> Optional[PortfolioSnapshot]:
+        """The snapshot in use, or None when every call fetches live."""
+        return self._snapshot
+
+    async def capture_snapshot(self) -> Optional[PortfolioSnapshot]:
+        """Fetch the portfolio once and build a snapshot (without installing it)."""
+        if hasattr(self.platform, "aget_portfolio_breakdown"):
+            portfolio = await self.platform.aget_portfolio_breakdown()
+        elif hasattr(self.platform, "get_portfolio_breakdown"):
+            portfolio = await asyncio.to_thread(self.platform.get_portfolio_breakdown)
+        else:
+            return None
+        return self._build_snapshot(portfolio)
+
+    def use_snapshot(self, snapshot: Optional[PortfolioSnapshot]) -> None:
+        """Serve contexts from ``snapshot`` until ``invalidate_snapshot()``."""
+        self._snapshot = snapshot
+
+    def invalidate_snapshot(self) -> None:
+        """Drop the snapshot (e.g. after an execution) so calls fetch live again."""
+        self._snapshot = None
+
+    def _build_snapshot(self, portfolio: Dict[str, Any]) -> PortfolioSnapshot:
+        futures_positions, holdings = self._extract_active_positions_from_portfolio(
+            portfolio
+        )
+        return PortfolioSnapshot(
+            portfolio=portfolio,
+            futures_positions=tuple(futures_positions),
+            holdings=tuple(holdings),
+            position_concentration=self._analyze_concentration(portfolio),
+        )
+
+    def _asset_view(
+        self, snapshot: PortfolioSnapshot, asset_pair: Optional[str]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]], Dict[str, Any]]:
+        """Positions and risk metrics for ``asset_pair`` (None = all), as copies."""
+        view = snapshot._asset_views.get(asset_pair)
+        if view is None:
+            futures_positions = list(snapshot.futures_positions)
+            holdings = list(snapshot.holdings)
+            if asset_pair:
+                futures_positions = self._filter_positions_by_asset(
+                    futures_positions, asset_pair
+                )
+                holdings = [h for h in holdings if asset_pair in h.get("asset", "")]
+            view = (
+                futures_positions,
+                holdings,
+                self._calculate_risk_metrics(futures_positions, snapshot.portfolio),
+            )
+            snapshot._asset_views[asset_pair] = view
+        return copy.deepcopy(view)
+
     async def get_monitoring_context_async(
         self, asset_pair: Optional[str] = None, lookback_hours: int = 24
     ) -> Dict[str, Any]:
@@ -160,21 +244,22 @@ class MonitoringContextProvider:
         }
 
         try:
-            if hasattr(self.platform, "aget_portfolio_breakdown"):
-                portfolio = await self.platform.aget_portfolio_breakdown()
-
-                futures_positions, holdings = self._extract_active_positions_from_portfolio(portfolio)
-
-                if asset_pair:
-                    futures_positions = self._filter_positions_by_asset(
-                        futures_positions, asset_pair
-                    )
-                    holdings = [h for h in holdings if asset_pair in h.get("asset", "")]
+            snapshot = self._snapshot
+            if snapshot is None and hasattr(self.platform, "aget_portfolio_breakdown"):
+                snapshot = await self.capture_snapshot()
 
+            if snapshot is not None:
+                futures_positions, holdings, risk_metrics = self._asset_view(
+                    snapshot, asset_pair
+                )
                 context["active_positions"] = {
                     "futures": futures_positions,
                     "spot": holdings,
                 }
+                context["risk_metrics"] = risk_metrics
+                context["position_concentration"] = copy.deepcopy(
+                    snapshot.position_concentration
+                )
                 context["has_monitoring_data"] = True
 
             # Active trades count from monitor
@@ -188,16 +273,6 @@ class MonitoringContextProvider:
                 )
                 context["recent_performance"] = recent_metrics
 
-            # Risk metrics
-            context["risk_metrics"] = self._calculate_risk_metrics_from_dict(
-                portfolio if hasattr(self.platform, "aget_portfolio_breakdown") else {}
-            )
-
-            # Position concentration
-            context["position_concentration"] = self._calculate_concentration_from_dict(
-                portfolio if hasattr(self.platform, "aget_portfolio_breakdown") else {}
-            )
-
         except Exception as e:
             logger.error(f"Error getting async monitoring context: {e}", exc_info=True)
             context["error"] = str(e)
@@ -205,14 +280,21 @@ class MonitoringContextProvider:
         return context
 
     def get_monitoring_context(
-        self, asset_pair: Optional[str] = None, lookback_hours: int = 24
+        self,
+        asset_pair: Optional[str] = None,
+        lookback_hours: int = 24,
+        snapshot: Optional[PortfolioSnapshot] = None,
     ) -> Dict[str, Any]:
         """
         Get comprehensive monitoring context for AI decision making.
 
+        Portfolio data comes from ``snapshot``, else the installed snapshot
+        (see ``use_snapshot``), else a live ``get_portfolio_breakdown()``.
+
         Args:
             asset_pair: Specific asset to focus on (None = all assets)
             lookback_hours: Hours to look back for recent trades
+            snapshot: Portfolio snapshot to build the context from
 
         Returns:
             Dictionary with monitoring context including:
@@ -241,36 +323,28 @@ class MonitoringContextProvider:
         }
 
         try:
-            # Get active positions from platform
-            if hasattr(self.platform, "get_portfolio_breakdown"):
+            snapshot = snapshot or self._snapshot
+            if snapshot is None and hasattr(self.platform, "get_portfolio_breakdown"):
                 # Use sync method for backward compatibility
-                portfolio = self.platform.get_portfolio_breakdown()
-
-                context["portfolio_breakdown"] = portfolio
-
-                # Extract active positions
-                futures_positions, holdings = self._extract_active_positions_from_portfolio(portfolio)
+                snapshot = self._build_snapshot(self.platform.get_portfolio_breakdown())
 
-                # Filter by asset pair if specified
-                if asset_pair:
-                    futures_positions = self._filter_positions_by_asset(
-                        futures_positions, asset_pair
-                    )
-                    holdings = [h for h in holdings if asset_pair in h.get("asset", "")]
+            if snapshot is not None:
+                context["portfolio_breakdown"] = copy.deepcopy(snapshot.portfolio)
 
+                # Active positions (filtered by asset pair if specified) and
+                # their risk metrics
+                futures_positions, holdings, risk_metrics = self._asset_view(
+                    snapshot, asset_pair
+                )
                 context["active_positions"] = {
                     "futures": futures_positions,
                     "spot": holdings,
                 }
-
-                # Calculate risk metrics from active positions
-                context["risk_metrics"] = self._calculate_risk_metrics(
-                    futures_positions, portfolio
-                )
+                context["risk_metrics"] = risk_metrics
 
                 # Position concentration analysis
-                context["position_concentration"] = self._analyze_concentration(
-                    portfolio
+                context["position_concentration"] = copy.deepcopy(
+                    snapshot.position_concentration
                 )
 
                 context["has_monitoring_data"] = True
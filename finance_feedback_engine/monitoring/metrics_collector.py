@@ -34,6 +34,7 @@ class TradeMetricsCollector:
 
         self.active_metrics: List[Dict[str, Any]] = []
         self.completed_count = 0
+        self._reset_aggregates()
 
         logger.info(f"TradeMetricsCollector initialized: {self.storage_dir}")
 
@@ -53,6 +54,7 @@ class TradeMetricsCollector:
             # Store in memory
             self.active_metrics.append(metrics)
             self.completed_count += 1
+            self._accumulate(metrics)
 
             # Persist to disk
             filename = (
@@ -75,6 +77,24 @@ class TradeMetricsCollector:
         except Exception as e:
             logger.error(f"Error recording trade metrics: {e}", exc_info=True)
 
+    def _reset_aggregates(self) -> None:
+        """Reset running totals over the in-memory metrics."""
+        self._winning_trades = 0
+        self._total_pnl = 0.0
+        self._total_holding_hours = 0.0
+        self._best_pnl: Optional[float] = None
+        self._worst_pnl: Optional[float] = None
+
+    def _accumulate(self, metrics: Dict[str, Any]) -> None:
+        """Fold one trade into the running totals (O(1) per trade)."""
+        pnl = metrics.get("realized_pnl", 0)
+        if pnl > 0:
+            self._winning_trades += 1
+        self._total_pnl += pnl
+        self._total_holding_hours += metrics.get("holding_duration_hours", 0)
+        self._best_pnl = pnl if self._best_pnl is None else max(self._best_pnl, pnl)
+        self._worst_pnl = pnl if self._worst_pnl is None else min(self._worst_pnl, pnl)
+
     def _update_aggregates(self, metrics: Dict[str, Any]):
         """
         Update aggregate statistics for performance tracking.
@@ -82,27 +102,17 @@ class TradeMetricsCollector:
         Args:
             metrics: New trade metrics to include
         """
-        # Calculate win/loss ratio
-        winning_trades = sum(
-            1 for m in self.active_metrics if m.get("realized_pnl", 0) > 0
-        )
+        # Running totals are maintained in _accumulate()
         win_rate = (
-            (winning_trades / self.completed_count * 100)
+            (self._winning_trades / self.completed_count * 100)
             if self.completed_count > 0
             else 0
         )
-
-        # Calculate average metrics
         avg_pnl = (
-            sum(m.get("realized_pnl", 0) for m in self.active_metrics)
-            / self.completed_count
-            if self.completed_count > 0
-            else 0
+            self._total_pnl / self.completed_count if self.completed_count > 0 else 0
         )
-
         avg_holding_hours = (
-            sum(m.get("holding_duration_hours", 0) for m in self.active_metrics)
-            / self.completed_count
+            self._total_holding_hours / self.completed_count
             if self.completed_count > 0
             else 0
         )
@@ -143,16 +153,10 @@ class TradeMetricsCollector:
                 "avg_holding_hours": 0.0,
             }
 
-        winning_trades = sum(
-            1 for m in self.active_metrics if m.get("realized_pnl", 0) > 0
-        )
-
-        total_pnl = sum(m.get("realized_pnl", 0) for m in self.active_metrics)
+        winning_trades = self._winning_trades
+        total_pnl = self._total_pnl
         avg_pnl = total_pnl / len(self.active_metrics)
-
-        avg_holding = sum(
-            m.get("holding_duration_hours", 0) for m in self.active_metrics
-        ) / len(self.active_metrics)
+        avg_holding = self._total_holding_hours / len(self.active_metrics)
 
         return {
             "total_trades": len(self.active_metrics),
@@ -162,12 +166,8 @@ class TradeMetricsCollector:
             "avg_pnl": avg_pnl,
             "total_pnl": total_pnl,
             "avg_holding_hours": avg_holding,
-            "best_trade_pnl": max(
-                (m.get("realized_pnl", 0) for m in self.active_metrics), default=0
-            ),
-            "worst_trade_pnl": min(
-                (m.get("realized_pnl", 0) for m in self.active_metrics), default=0
-            ),
+            "best_trade_pnl": self._best_pnl if self._best_pnl is not None else 0,
+            "worst_trade_pnl": self._worst_pnl if self._worst_pnl is not None else 0,
         }
 
     def export_for_model_training(
@@ -218,6 +218,7 @@ class TradeMetricsCollector:
         """Clear in-memory metrics (files remain on disk)."""
         logger.info(f"Clearing {len(self.active_metrics)} in-memory metrics")
         self.active_metrics = []
+        self._reset_aggregates()
 
     def get_metrics_summary(self) -> str:
         """
@@ -9,13 +9,17 @@ Provides comprehensive trading performance analysis including:
 
 import json
 import logging
-from collections import defaultdict
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
 import numpy as np
+import pandas as pd
+
+from finance_feedback_engine.monitoring.trade_outcome_store import (
+    TradeOutcomeColumnStore,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -32,6 +36,9 @@ class PnLAnalytics:
         self.data_dir = Path(data_dir)
         self.trade_outcomes_dir = self.data_dir / "trade_outcomes"
         self.pnl_snapshots_dir = self.data_dir / "pnl_snapshots"
+        self.outcome_store = TradeOutcomeColumnStore(
+            self.trade_outcomes_dir, self.data_dir / "pnl_analytics_cache"
+        )
 
     def load_trade_outcomes(
         self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None
@@ -77,6 +84,108 @@ class PnLAnalytics:
 
         return trades
 
+    def load_trade_outcomes_frame(
+        self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None
+    ) -> pd.DataFrame:
+        """Load trade outcomes as a typed DataFrame from the columnar cache.
+
+        Same date semantics as ``load_trade_outcomes``; only lines appended
+        since the previous call are parsed from JSONL.
+        """
+        return self.outcome_store.load_frame(start_date=start_date, end_date=end_date)
+
+    @staticmethod
+    def _empty_metrics() -> Dict:
+        return {
+            "total_trades": 0,
+            "winning_trades": 0,
+            "losing_trades": 0,
+            "win_rate": 0.0,
+            "total_pnl": 0.0,
+            "avg_win": 0.0,
+            "avg_loss": 0.0,
+            "profit_factor": 0.0,
+            "sharpe_ratio": 0.0,
+            "max_drawdown": 0.0,
+            "avg_holding_duration_hours": 0.0,
+        }
+
+    def calculate_metrics_frame(self, trades: pd.DataFrame) -> Dict:
+        """Vectorized equivalent of ``calculate_metrics`` for a typed frame."""
+        return self._grouped_metrics(trades, by=None).get(None, self._empty_metrics())
+
+    def _grouped_metrics(
+        self, trades: pd.DataFrame, by: Optional[str]
+    ) -> Dict[Optional[str], Dict]:
+        """Compute metrics per group with group-by aggregations."""
+        if trades.empty:
+            return {}
+
+        keys = trades[by] if by else pd.Series(0, index=trades.index)
+        pnl = trades["realized_pnl"]
+        valid = pnl.notna()
+        wins = pnl.where(pnl > 0)
+        losses = (-pnl).where(pnl < 0)
+
+        frame = pd.DataFrame(
+            {
+                "key": keys,
+                "pnl": pnl,
+                "valid": valid,
+                "win": wins,
+                "loss": losses,
+                "hours": trades["holding_duration_hours"],
+            }
+        )
+        grouped = frame.groupby("key", sort=False)
+        agg = grouped.agg(
+            total_trades=("key", "size"),
+            pnl_count=("pnl", "count"),
+            total_pnl=("pnl", "sum"),
+            pnl_mean=("pnl", "mean"),
+            winning_trades=("win", "count"),
+            win_sum=("win", "sum"),
+            avg_win=("win", "mean"),
+            losing_trades=("loss", "count"),
+            loss_sum=("loss", "sum"),
+            avg_loss=("loss", "mean"),
+            avg_holding=("hours", "mean"),
+        )
+        pnl_std = grouped["pnl"].std(ddof=0)
+
+        # Drawdown over the cumulative P&L curve of each group (valid rows only)
+        curve = frame[valid]
+        cumulative = curve.groupby("key", sort=False)["pnl"].cumsum()
+        running_max = cumulative.groupby(curve["key"]).cummax()
+        max_drawdown = (running_max - cumulative).groupby(curve["key"]).max()
+
+        results: Dict[Optional[str], Dict] = {}
+        for key, row in agg.iterrows():
+            total_trades = int(row["total_trades"])
+            loss_sum = float(row["loss_sum"])
+            std = float(pnl_std.get(key, 0.0) or 0.0)
+            sharpe = (
+                float(row["pnl_mean"]) / std * np.sqrt(252)
+                if row["pnl_count"] > 1 and std > 0
+                else 0.0
+            )
+            results[key if by else None] = {
+                "total_trades": total_trades,
+                "winning_trades": int(row["winning_trades"]),
+                "losing_trades": int(row["losing_trades"]),
+                "win_rate": int(row["winning_trades"]) / total_trades * 100,
+                "total_pnl": float(row["total_pnl"]),
+                "avg_win": float(row["avg_win"]) if row["winning_trades"] else 0.0,
+                "avg_loss": float(row["avg_loss"]) if row["losing_trades"] else 0.0,
+                "profit_factor": float(row["win_sum"]) / loss_sum if loss_sum > 0 else 0.0,
+                "sharpe_ratio": sharpe,
+                "max_drawdown": float(max_drawdown.get(key, 0.0)),
+                "avg_holding_duration_hours": (
+                    float(row["avg_holding"]) if pd.notna(row["avg_holding"]) else 0.0
+                ),
+            }
+        return results
+
     def calculate_metrics(self, trades: List[Dict]) -> Dict:
         """Calculate comprehensive performance metrics.
         
@@ -189,8 +298,8 @@ class PnLAnalytics:
         start = date.replace(hour=0, minute=0, second=0, microsecond=0)
         end = start + timedelta(days=1)
 
-        trades = self.load_trade_outcomes(start_date=start, end_date=end)
-        metrics = self.calculate_metrics(trades)
+        trades = self.load_trade_outcomes_frame(start_date=start, end_date=end)
+        metrics = self.calculate_metrics_frame(trades)
         metrics["date"] = start.strftime("%Y-%m-%d")
         
         return metrics
@@ -212,8 +321,8 @@ class PnLAnalytics:
         start = start.replace(hour=0, minute=0, second=0, microsecond=0)
         end = start + timedelta(days=7)
 
-        trades = self.load_trade_outcomes(start_date=start, end_date=end)
-        metrics = self.calculate_metrics(trades)
+        trades = self.load_trade_outcomes_frame(start_date=start, end_date=end)
+        metrics = self.calculate_metrics_frame(trades)
         metrics["week_start"] = start.strftime("%Y-%m-%d")
         metrics["week_end"] = (end - timedelta(days=1)).strftime("%Y-%m-%d")
         
@@ -240,8 +349,8 @@ class PnLAnalytics:
         else:
             end = start.replace(month=start.month + 1)
 
-        trades = self.load_trade_outcomes(start_date=start, end_date=end)
-        metrics = self.calculate_metrics(trades)
+        trades = self.load_trade_outcomes_frame(start_date=start, end_date=end)
+        metrics = self.calculate_metrics_frame(trades)
         metrics["month"] = start.strftime("%Y-%m")
         
         return metrics
@@ -255,20 +364,11 @@ class PnLAnalytics:
         Returns:
             Dictionary mapping asset pairs to their metrics
         """
-        trades = self.load_trade_outcomes(start_date=start_date)
-        
-        # Group trades by asset
-        asset_trades = defaultdict(list)
-        for trade in trades:
-            product = trade.get("product", "UNKNOWN")
-            asset_trades[product].append(trade)
-
-        # Calculate metrics for each asset
-        breakdown = {}
-        for asset, asset_specific_trades in asset_trades.items():
-            breakdown[asset] = self.calculate_metrics(asset_specific_trades)
-
-        return breakdown
+        trades = self.load_trade_outcomes_frame(start_date=start_date)
+        return {
+            str(asset): metrics
+            for asset, metrics in self._grouped_metrics(trades, by="product").items()
+        }
 
     def export_to_csv(self, output_file: str, start_date: Optional[datetime] = None) -> None:
         """Export trade outcomes to CSV for Metabase integration.
@@ -110,6 +110,58 @@ dashboard_events_dropped_total = Counter(
     ["queue"],
 )
 
+# Shared HTTP transport (per upstream host)
+http_request_latency_ms = Gauge(
+    "ffe_http_request_latency_ms",
+    "Upstream HTTP request latency in milliseconds",
+    ["host", "stat"],  # stat: avg, p95, max
+)
+
+http_connections = Gauge(
+    "ffe_http_connections",
+    "Pooled HTTP connections opened and reused per host",
+    ["host", "kind"],  # kind: opened, reused
+)
+
+# Batch ingestion validation
+ingestion_rows_total = Counter(
+    "ffe_ingestion_rows_total",
+    "Candles validated by batch ingestion",
+    ["timeframe", "outcome"],  # outcome: valid, rejected
+)
+
+ingestion_validation_seconds = Histogram(
+    "ffe_ingestion_validation_seconds",
+    "Time spent in one batch ingestion validation pass",
+    ["timeframe"],
+)
+
+ingestion_validation_rows_per_second = Gauge(
+    "ffe_ingestion_validation_rows_per_second",
+    "Throughput of the most recent batch ingestion validation pass",
+    ["timeframe"],
+)
+
+# Per-provider telemetry (see monitoring/provider_telemetry.py)
+provider_latency_seconds = Histogram(
+    "ffe_provider_latency_seconds",
+    "Successful provider query latency",
+    ["provider", "model", "role"],  # role: ensemble, bull, bear, judge
+    buckets=(0.5, 1, 2, 4, 8, 15, 30, 45, 60, 90, 120, 180, 300),
+)
+
+provider_tokens_total = Counter(
+    "ffe_provider_tokens_total",
+    "Tokens reported by provider queries",
+    ["provider", "model", "role"],
+)
+
+provider_outcomes_total = Counter(
+    "ffe_provider_outcomes_total",
+    "Graded provider recommendations",
+    ["provider", "role", "result"],  # result: correct, incorrect
+)
+
 
 def generate_metrics() -> str:
     """
@@ -122,6 +174,7 @@ def generate_metrics() -> str:
     if not _PROM_AVAILABLE:
         # Minimal stub keeps endpoint alive for environments without prometheus_client
         return "# HELP ffe_metrics_available Indicates if prometheus_client is installed (1=yes,0=no)\n# TYPE ffe_metrics_available gauge\nffe_metrics_available 0\n"
+    update_http_transport_metrics()
     return generate_latest().decode("utf-8")
 
 
@@ -234,3 +287,87 @@ def increment_dashboard_events_dropped(queue_name: str) -> None:
         dashboard_events_dropped_total.labels(queue=queue_name).inc()
     except Exception as e:  # pragma: no cover - metrics failures should not break flow
         logger.debug(f"Failed to increment dashboard events dropped: {e}")
+
+
+def update_http_transport_metrics() -> None:
+    """Copy per-host latency and connection reuse from the shared HTTP transport."""
+
+    try:
+        from ..utils.http_transport import shared_transport_metrics
+
+        for host, stats in shared_transport_metrics().items():
+            for stat in ("avg", "p95", "max"):
+                http_request_latency_ms.labels(host=host, stat=stat).set(
+                    stats[f"{stat}_latency_ms"]
+                )
+            http_connections.labels(host=host, kind="opened").set(
+                stats["connections_opened"]
+            )
+            http_connections.labels(host=host, kind="reused").set(
+                stats["connections_reused"]
+            )
+    except Exception as e:  # pragma: no cover - metrics failures should not break flow
+        logger.debug(f"Failed to update HTTP transport metrics: {e}")
+
+
+def record_ingestion_validation(
+    timeframe: str,
+    valid: int,
+    rejected: int,
+    duration_seconds: float,
+    rows_per_second: float,
+) -> None:
+    """Record row counts and throughput for a batch ingestion validation pass."""
+
+    try:
+        ingestion_rows_total.labels(timeframe=timeframe, outcome="valid").inc(valid)
+        ingestion_rows_total.labels(timeframe=timeframe, outcome="rejected").inc(
+            rejected
+        )
+        ingestion_validation_seconds.labels(timeframe=timeframe).observe(
+            duration_seconds
+        )
+        ingestion_validation_rows_per_second.labels(timeframe=timeframe).set(
+            rows_per_second
+        )
+    except Exception as e:  # pragma: no cover - metrics failures should not break flow
+        logger.debug(f"Failed to record ingestion validation metrics: {e}")
+
+
+def record_provider_telemetry(
+    provider: str,
+    model: str,
+    role: str,
+    duration_seconds: float,
+    status: str,
+    tokens: int = 0,
+) -> None:
+    """Record one provider query's latency and token count.
+
+    Request status counts stay with ``increment_provider_request``.
+    """
+
+    try:
+        if status == "success":
+            provider_latency_seconds.labels(
+                provider=provider, model=model, role=role
+            ).observe(duration_seconds)
+            if tokens:
+                provider_tokens_total.labels(
+                    provider=provider, model=model, role=role
+                ).inc(tokens)
+    except Exception as e:  # pragma: no cover - metrics failures should not break flow
+        logger.debug(f"Failed to record provider telemetry: {e}")
+
+
+def record_provider_outcome(provider: str, role: str, correct: bool) -> None:
+    """Count a graded provider recommendation."""
+
+    try:
+        provider_outcomes_total.labels(
+            provider=provider,
+            role=role,
+            result="correct" if correct else "incorrect",
+        ).inc()
+    except Exception as e:  # pragma: no cover - metrics failures should not break flow
+        logger.debug(f"Failed to record provider outcome: {e}")
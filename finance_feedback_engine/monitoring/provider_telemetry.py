@@ -0,0 +1,405 @@
+"""
+Per-provider latency and quality telemetry.
+
+Records every provider query per (provider, model, role) series, where role
+is ``ensemble`` or a debate seat (``bull``, ``bear``, ``judge``):
+
+- latency in an HDR-style log-bucketed histogram (~4% relative error,
+  constant memory, mergeable across windows),
+- request, failure and timeout counts, tokens and estimated cost,
+- correctness once the trade outcome is known.
+
+Series are kept in fixed rolling windows (hourly by default) and persisted
+through a ``LearningStateStore`` so the routing policy starts warm after a
+restart. Each recorded event is also mirrored to Prometheus.
+
+Usage:
+    telemetry = get_provider_telemetry(config)
+    telemetry.record_request("gemma2:9b", 4.2, "success", role="judge")
+    telemetry.summary("gemma2:9b", role="judge").p95_seconds
+"""
+
+import logging
+import math
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from finance_feedback_engine.utils.file_io import FileIOError
+from finance_feedback_engine.utils.learning_state_store import LearningStateStore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TELEMETRY_PATH = "data/provider_telemetry.json"
+DEFAULT_WINDOW_SECONDS = 3600
+DEFAULT_RETENTION_WINDOWS = 24
+
+HISTOGRAM_MIN_SECONDS = 0.001
+HISTOGRAM_SUB_BUCKETS = 16  # Buckets per doubling
+HISTOGRAM_MAX_INDEX = 1 + 20 * HISTOGRAM_SUB_BUCKETS  # ~17 minutes
+
+DEFAULT_ROLE = "ensemble"
+REQUEST_STATUSES = ("success", "failure", "timeout")
+
+_telemetry_instances: Dict[str, "ProviderTelemetry"] = {}
+_instances_lock = threading.Lock()
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram with bounded relative error."""
+
+    def __init__(self):
+        self.counts: Dict[int, int] = {}
+        self.total = 0
+        self.sum_seconds = 0.0
+        self.max_seconds = 0.0
+
+    @staticmethod
+    def bucket_index(seconds: float) -> int:
+        if seconds <= HISTOGRAM_MIN_SECONDS:
+            return 0
+        index = 1 + int(
+            math.log2(seconds / HISTOGRAM_MIN_SECONDS) * HISTOGRAM_SUB_BUCKETS
+        )
+        return min(index, HISTOGRAM_MAX_INDEX)
+
+    @staticmethod
+    def bucket_upper_bound(index: int) -> float:
+        return HISTOGRAM_MIN_SECONDS * 2 ** (index / HISTOGRAM_SUB_BUCKETS)
+
+    def record(self, seconds: float) -> None:
+        seconds = max(0.0, float(seconds))
+        index = self.bucket_index(seconds)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.total += 1
+        self.sum_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.total += other.total
+        self.sum_seconds += other.sum_seconds
+        self.max_seconds = max(self.max_seconds, other.max_seconds)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """Highest equivalent value at quantile ``q`` (0-1), or None if empty."""
+        if self.total == 0:
+            return None
+        rank = max(1, math.ceil(min(1.0, max(0.0, q)) * self.total))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(self.bucket_upper_bound(index), self.max_seconds)
+        return self.max_seconds
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "counts": {str(i): c for i, c in self.counts.items()},
+            "sum_seconds": self.sum_seconds,
+            "max_seconds": self.max_seconds,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        histogram = cls()
+        histogram.counts = {int(i): int(c) for i, c in data.get("counts", {}).items()}
+        histogram.total = sum(histogram.counts.values())
+        histogram.sum_seconds = float(data.get("sum_seconds", 0.0))
+        histogram.max_seconds = float(data.get("max_seconds", 0.0))
+        return histogram
+
+
+@dataclass
+class TelemetryWindow:
+    """Counters for one series in one rolling window."""
+
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    requests: int = 0
+    failures: int = 0
+    timeouts: int = 0
+    tokens: int = 0
+    cost: float = 0.0
+    graded: int = 0
+    correct: int = 0
+
+    def merge(self, other: "TelemetryWindow") -> None:
+        self.latency.merge(other.latency)
+        self.requests += other.requests
+        self.failures += other.failures
+        self.timeouts += other.timeouts
+        self.tokens += other.tokens
+        self.cost += other.cost
+        self.graded += other.graded
+        self.correct += other.correct
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "latency": self.latency.to_dict(),
+            "requests": self.requests,
+            "failures": self.failures,
+            "timeouts": self.timeouts,
+            "tokens": self.tokens,
+            "cost": self.cost,
+            "graded": self.graded,
+            "correct": self.correct,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TelemetryWindow":
+        return cls(
+            latency=LatencyHistogram.from_dict(data.get("latency", {})),
+            requests=int(data.get("requests", 0)),
+            failures=int(data.get("failures", 0)),
+            timeouts=int(data.get("timeouts", 0)),
+            tokens=int(data.get("tokens", 0)),
+            cost=float(data.get("cost", 0.0)),
+            graded=int(data.get("graded", 0)),
+            correct=int(data.get("correct", 0)),
+        )
+
+
+@dataclass
+class ProviderStats:
+    """Telemetry summary for one provider over the retained windows."""
+
+    requests: int
+    successes: int
+    p50_seconds: Optional[float]
+    p95_seconds: Optional[float]
+    p99_seconds: Optional[float]
+    failure_rate: float
+    timeout_rate: float
+    tokens_per_second: Optional[float]
+    cost_per_decision: float
+    accuracy: float  # Laplace-smoothed, 0.5 with no graded outcomes
+    graded: int
+
+
+class ProviderTelemetry:
+    """Rolling-window latency/quality telemetry for every provider series."""
+
+    def __init__(
+        self,
+        path: str = DEFAULT_TELEMETRY_PATH,
+        window_seconds: int = DEFAULT_WINDOW_SECONDS,
+        retention_windows: int = DEFAULT_RETENTION_WINDOWS,
+        clock: Callable[[], float] = time.time,
+        **store_kwargs: Any,
+    ):
+        """
+        Args:
+            path: Snapshot file for persisted windows
+            window_seconds: Length of one rolling window
+            retention_windows: Number of windows kept for summaries
+            clock: Wall-clock source (injectable for tests)
+            store_kwargs: ``flush_interval_seconds`` / ``flush_every`` for the store
+        """
+        self.window_seconds = max(1, int(window_seconds))
+        self.retention_windows = max(1, int(retention_windows))
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._windows: Dict[int, Dict[str, TelemetryWindow]] = {}
+        self._store = LearningStateStore(path, snapshot=self._snapshot, **store_kwargs)
+        try:
+            for start, series in self._store.load().get("windows", {}).items():
+                self._windows[int(start)] = {
+                    key: TelemetryWindow.from_dict(data) for key, data in series.items()
+                }
+        except (FileIOError, AttributeError, TypeError, ValueError) as e:
+            logger.warning(f"Discarding unreadable provider telemetry {path}: {e}")
+            self._windows = {}
+        self._prune()
+
+    @staticmethod
+    def series_key(provider: str, model: Optional[str], role: str) -> str:
+        return f"{provider}|{model or provider}|{role}"
+
+    def _snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "window_seconds": self.window_seconds,
+                "windows": {
+                    str(start): {key: w.to_dict() for key, w in series.items()}
+                    for start, series in self._windows.items()
+                },
+            }
+
+    def _prune(self) -> None:
+        oldest = (
+            self._window_start() - (self.retention_windows - 1) * self.window_seconds
+        )
+        for start in [s for s in self._windows if s < oldest]:
+            del self._windows[start]
+
+    def _window_start(self) -> int:
+        now = int(self._clock())
+        return now - now % self.window_seconds
+
+    def _update(
+        self,
+        provider: str,
+        model: Optional[str],
+        role: str,
+        apply: Callable[[TelemetryWindow], None],
+    ) -> None:
+        key = self.series_key(provider, model, role)
+        with self._lock:
+            start = self._window_start()
+            if start not in self._windows:
+                self._windows[start] = {}
+                self._prune()
+            window = self._windows[start].setdefault(key, TelemetryWindow())
+            apply(window)
+            try:
+                self._store.record((("windows", str(start), key), window.to_dict()))
+            except FileIOError as e:
+                logger.debug(f"Failed to persist provider telemetry: {e}")
+
+    def record_request(
+        self,
+        provider: str,
+        seconds: float,
+        status: str = "success",
+        role: str = DEFAULT_ROLE,
+        model: Optional[str] = None,
+        tokens: int = 0,
+        cost: float = 0.0,
+    ) -> None:
+        """Record one provider query; ``status`` is success, failure or timeout."""
+        if status not in REQUEST_STATUSES:
+            raise ValueError(f"Unknown request status: {status}")
+
+        def apply(window: TelemetryWindow) -> None:
+            window.requests += 1
+            if status == "success":
+                window.latency.record(seconds)
+                window.tokens += int(tokens or 0)
+                window.cost += float(cost or 0.0)
+            elif status == "timeout":
+                window.timeouts += 1
+            else:
+                window.failures += 1
+
+        self._update(provider, model, role, apply)
+
+        from .prometheus import record_provider_telemetry
+
+        record_provider_telemetry(
+            provider, model or provider, role, seconds, status, tokens
+        )
+
+    def record_outcome(
+        self,
+        provider: str,
+        correct: bool,
+        role: str = DEFAULT_ROLE,
+        model: Optional[str] = None,
+    ) -> None:
+        """Record whether a provider's recommendation proved correct."""
+
+        def apply(window: TelemetryWindow) -> None:
+            window.graded += 1
+            window.correct += int(bool(correct))
+
+        self._update(provider, model, role, apply)
+
+        from .prometheus import record_provider_outcome
+
+        record_provider_outcome(provider, role, correct)
+
+    def _merged(
+        self, provider: str, role: Optional[str], model: Optional[str]
+    ) -> TelemetryWindow:
+        merged = TelemetryWindow()
+        with self._lock:
+            self._prune()
+            for series in self._windows.values():
+                for key, window in series.items():
+                    p, m, r = key.split("|", 2)
+                    if p != provider or (role and r != role) or (model and m != model):
+                        continue
+                    merged.merge(window)
+        return merged
+
+    def summary(
+        self, provider: str, role: Optional[str] = None, model: Optional[str] = None
+    ) -> ProviderStats:
+        """Summarize a provider over the retained windows (all roles by default)."""
+        merged = self._merged(provider, role, model)
+        latency = merged.latency
+        requests = merged.requests
+        return ProviderStats(
+            requests=requests,
+            successes=latency.total,
+            p50_seconds=latency.percentile(0.50),
+            p95_seconds=latency.percentile(0.95),
+            p99_seconds=latency.percentile(0.99),
+            failure_rate=merged.failures / requests if requests else 0.0,
+            timeout_rate=merged.timeouts / requests if requests else 0.0,
+            tokens_per_second=(
+                merged.tokens / latency.sum_seconds
+                if merged.tokens and latency.sum_seconds > 0
+                else None
+            ),
+            cost_per_decision=merged.cost / latency.total if latency.total else 0.0,
+            accuracy=(merged.correct + 1) / (merged.graded + 2),
+            graded=merged.graded,
+        )
+
+    def providers(self) -> Iterable[str]:
+        with self._lock:
+            return sorted(
+                {
+                    key.split("|", 1)[0]
+                    for series in self._windows.values()
+                    for key in series
+                }
+            )
+
+    def flush(self) -> None:
+        """Persist the current windows immediately."""
+        self._store.flush()
+
+
+def telemetry_enabled(config: Dict[str, Any]) -> bool:
+    """True when provider telemetry is on, or required by ensemble routing."""
+    telemetry_cfg = config.get("monitoring", {}).get("provider_telemetry", {}) or {}
+    routing_cfg = config.get("ensemble", {}).get("routing", {}) or {}
+    return bool(
+        telemetry_cfg.get("enabled", False) or routing_cfg.get("enabled", False)
+    )
+
+
+def get_provider_telemetry(
+    config: Optional[Dict[str, Any]] = None,
+) -> ProviderTelemetry:
+    """
+    Get the shared ProviderTelemetry for the configured path.
+
+    Reads ``monitoring.provider_telemetry`` (path, window_seconds,
+    retention_windows) and ``persistence.learning_state`` flush settings.
+    """
+    config = config or {}
+    telemetry_cfg = config.get("monitoring", {}).get("provider_telemetry", {}) or {}
+    learning_cfg = config.get("persistence", {}).get("learning_state", {}) or {}
+    path = telemetry_cfg.get("path", DEFAULT_TELEMETRY_PATH)
+    with _instances_lock:
+        if path not in _telemetry_instances:
+            _telemetry_instances[path] = ProviderTelemetry(
+                path=path,
+                window_seconds=telemetry_cfg.get(
+                    "window_seconds", DEFAULT_WINDOW_SECONDS
+                ),
+                retention_windows=telemetry_cfg.get(
+                    "retention_windows", DEFAULT_RETENTION_WINDOWS
+                ),
+                **{
+                    k: learning_cfg[k]
+                    for k in ("flush_interval_seconds", "flush_every")
+                    if k in learning_cfg
+                },
+            )
+        return _telemetry_instances[path]
@@ -0,0 +1,262 @@
+"""Columnar cache of trade outcomes for fast P&L analytics.
+
+``TradeOutcomeRecorder`` appends one JSON line per closed trade to
+``trade_outcomes/YYYY-MM-DD.jsonl``. This store mirrors each day file into a
+typed Parquet segment under ``pnl_analytics_cache/`` and remembers the byte
+offset it has consumed. On every read only the bytes appended since the last
+sync are parsed, so summaries never re-read the full history as JSON.
+"""
+
+import json
+import logging
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from ..utils.file_io import FileIOManager
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_FILENAME = "manifest.json"
+
+# Typed analytics columns derived from each outcome record
+NUMERIC_COLUMNS = (
+    "entry_price",
+    "entry_size",
+    "exit_price",
+    "exit_size",
+    "realized_pnl",
+    "fees",
+    "roi_percent",
+)
+STRING_COLUMNS = ("trade_id", "decision_id", "product", "side")
+COLUMNS = (
+    STRING_COLUMNS
+    + NUMERIC_COLUMNS
+    + ("entry_time", "exit_time", "holding_duration_hours")
+)
+
+
+def _parse_times(values: pd.Series) -> pd.Series:
+    return pd.to_datetime(values, utc=True, errors="coerce", format="ISO8601")
+
+
+def records_to_frame(records: List[Dict]) -> pd.DataFrame:
+    """Convert raw outcome dicts into the typed analytics frame.
+
+    Unparseable numeric fields become NaN rather than dropping the row so
+    that trade counts match the raw JSONL.
+    """
+    if not records:
+        return empty_frame()
+
+    raw = pd.DataFrame.from_records(records)
+    frame = pd.DataFrame(index=raw.index)
+
+    for column in STRING_COLUMNS:
+        if column in raw:
+            frame[column] = raw[column].astype("string")
+        else:
+            frame[column] = pd.Series(pd.NA, index=raw.index, dtype="string")
+    if "product" in raw:
+        frame["product"] = frame["product"].fillna("UNKNOWN")
+    else:
+        frame["product"] = "UNKNOWN"
+
+    for column in NUMERIC_COLUMNS:
+        if column in raw:
+            frame[column] = pd.to_numeric(raw[column], errors="coerce").astype(
+                "float64"
+            )
+        else:
+            frame[column] = np.nan
+
+    nat = pd.Series(pd.NaT, index=raw.index, dtype="datetime64[ns, UTC]")
+    frame["entry_time"] = (
+        _parse_times(raw["entry_time"]) if "entry_time" in raw else nat
+    )
+    frame["exit_time"] = _parse_times(raw["exit_time"]) if "exit_time" in raw else nat
+
+    # Prefer explicit timestamps; fall back to the recorded duration.
+    hours = (frame["exit_time"] - frame["entry_time"]).dt.total_seconds() / 3600
+    if "holding_duration_seconds" in raw:
+        fallback = (
+            pd.to_numeric(raw["holding_duration_seconds"], errors="coerce") / 3600
+        )
+        hours = hours.where(hours.notna(), fallback)
+    frame["holding_duration_hours"] = hours.astype("float64")
+
+    return frame.reset_index(drop=True)
+
+
+def empty_frame() -> pd.DataFrame:
+    """Return an empty frame with the analytics schema."""
+    frame = pd.DataFrame(
+        {column: pd.Series(dtype="string") for column in STRING_COLUMNS}
+    )
+    for column in NUMERIC_COLUMNS + ("holding_duration_hours",):
+        frame[column] = pd.Series(dtype="float64")
+    for column in ("entry_time", "exit_time"):
+        frame[column] = pd.Series(dtype="datetime64[ns, UTC]")
+    return frame[list(COLUMNS)]
+
+
+class TradeOutcomeColumnStore:
+    """Incrementally synced Parquet segments, one per trade-outcome day file."""
+
+    def __init__(self, outcomes_dir: Path, cache_dir: Path):
+        """Initialize the store.
+
+        Args:
+            outcomes_dir: Directory holding the ``YYYY-MM-DD.jsonl`` files
+            cache_dir: Directory for Parquet segments and the sync manifest
+        """
+        self.outcomes_dir = Path(outcomes_dir)
+        self.cache_dir = Path(cache_dir)
+        self._manifest_path = self.cache_dir / MANIFEST_FILENAME
+        self._file_io = FileIOManager()
+        self._manifest: Dict[str, Dict] = self._load_manifest()
+        self._frames: Dict[str, pd.DataFrame] = {}
+        self._lock = threading.RLock()
+
+    def _load_manifest(self) -> Dict[str, Dict]:
+        try:
+            with open(self._manifest_path, "r") as f:
+                manifest = json.load(f)
+            return manifest if isinstance(manifest, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable P&L cache manifest: {e}")
+            return {}
+
+    def _save_manifest(self) -> None:
+        try:
+            with self._file_io.atomic_write_context(self._manifest_path) as tmp_path:
+                with open(tmp_path, "w") as f:
+                    json.dump(self._manifest, f)
+        except Exception as e:
+            logger.warning(f"Could not persist P&L cache manifest: {e}")
+
+    def _segment_path(self, day: str) -> Path:
+        return self.cache_dir / f"{day}.parquet"
+
+    def _day_files(
+        self, start_date: Optional[datetime], end_date: Optional[datetime]
+    ) -> List[Path]:
+        files = []
+        for file in sorted(self.outcomes_dir.glob("*.jsonl")):
+            try:
+                file_date = datetime.strptime(file.stem, "%Y-%m-%d").replace(
+                    tzinfo=timezone.utc
+                )
+            except ValueError:
+                logger.warning(f"Could not parse date from filename: {file}")
+                continue
+            if start_date and file_date < start_date:
+                continue
+            if end_date and file_date > end_date:
+                continue
+            files.append(file)
+        return files
+
+    def _read_lines(self, file: Path, offset: int) -> tuple[List[Dict], int]:
+        """Parse complete JSON lines appended after ``offset``."""
+        records: List[Dict] = []
+        with open(file, "rb") as f:
+            f.seek(offset)
+            data = f.read()
+        # Leave a partially written trailing line for the next sync
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            if not line.strip():
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError as e:
+                logger.error(f"Skipping malformed trade outcome line in {file}: {e}")
+        return records, offset + end
+
+    def _cached_frame(self, day: str) -> Optional[pd.DataFrame]:
+        frame = self._frames.get(day)
+        if frame is not None:
+            return frame
+        segment = self._segment_path(day)
+        if not segment.exists():
+            return None
+        try:
+            frame = pd.read_parquet(segment)
+        except Exception as e:
+            logger.warning(f"Rebuilding unreadable P&L segment {segment}: {e}")
+            return None
+        if set(COLUMNS) - set(frame.columns):
+            logger.info(
+                f"Rebuilding P&L segment {segment} written with an older schema"
+            )
+            return None
+        self._frames[day] = frame
+        return frame
+
+    def _sync_day(self, file: Path) -> pd.DataFrame:
+        day = file.stem
+        size = file.stat().st_size
+        entry = self._manifest.get(day) or {}
+        offset = int(entry.get("offset", 0))
+
+        frame = self._cached_frame(day) if entry else None
+        if frame is None or size < offset:
+            # Missing segment or truncated source: rebuild the day from scratch
+            frame, offset = empty_frame(), 0
+
+        if size == offset:
+            self._frames[day] = frame
+            return frame
+
+        records, new_offset = self._read_lines(file, offset)
+        if records:
+            frame = pd.concat([frame, records_to_frame(records)], ignore_index=True)
+        self._frames[day] = frame
+        self._manifest[day] = {"offset": new_offset, "rows": len(frame)}
+
+        try:
+            # Unique temp file + rename: a crash never leaves a truncated segment
+            with self._file_io.atomic_write_context(
+                self._segment_path(day)
+            ) as tmp_path:
+                frame.to_parquet(tmp_path, index=False, engine="pyarrow")
+        except Exception as e:
+            logger.warning(f"Could not write P&L segment for {day}: {e}")
+            self._manifest.pop(day, None)
+        return frame
+
+    def load_frame(
+        self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None
+    ) -> pd.DataFrame:
+        """Return typed outcomes for day files within the (inclusive) date range.
+
+        Row order follows day file and line order, matching
+        ``PnLAnalytics.load_trade_outcomes``.
+        """
+        if not self.outcomes_dir.exists():
+            logger.warning(f"Trade outcomes directory not found: {self.outcomes_dir}")
+            return empty_frame()
+
+        with self._lock:
+            frames = []
+            manifest_before = dict(self._manifest)
+            for file in self._day_files(start_date, end_date):
+                try:
+                    frames.append(self._sync_day(file))
+                except Exception as e:
+                    logger.error(f"Error loading trades from {file}: {e}")
+            if self._manifest != manifest_before:
+                self._save_manifest()
+
+        frames = [frame for frame in frames if not frame.empty]
+        if not frames:
+            return empty_frame()
+        return pd.concat(frames, ignore_index=True)
@@ -1,12 +1,21 @@
 """Optuna hyperparameter optimization for trading strategy."""
 
 import logging
+import tempfile
 from copy import deepcopy
 from typing import Any, Dict, List, Optional, Tuple, Union
 
 import optuna
+import pandas as pd
 import yaml
 
+from finance_feedback_engine.optimization.parallel import (
+    load_shared_ohlcv,
+    resolve_storage,
+    run_parallel_trials,
+    share_ohlcv,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -59,6 +68,11 @@ class OptunaOptimizer:
             "take_profit_percentage": (0.02, 0.08),  # THR-226 fix: Add TP optimization
         }
 
+        # OHLCV is fetched once and reused by every trial; in process-parallel
+        # mode workers memory-map the shared Arrow copy at _data_path instead.
+        self._ohlcv: Optional[pd.DataFrame] = None
+        self._data_path: Optional[str] = None
+
         logger.info(
             f"Initialized OptunaOptimizer for {asset_pair} ({start_date} to {end_date})"
         )
@@ -183,7 +197,7 @@ class OptunaOptimizer:
         commission_per_trade = float(ab.get("commission_per_trade", 0.0))
         stop_loss_percentage = float(ab.get("stop_loss_percentage", 0.02))
         take_profit_percentage = float(ab.get("take_profit_percentage", 0.05))
-        timeframe = str(ab.get("timeframe", "1h")).lower()
+        timeframe = self._timeframe(config)
 
         # If decision_engine overrides are present, prefer them.
         # Normalize decision_engine config to support nested/flat shapes consistently.
@@ -226,6 +240,7 @@ class OptunaOptimizer:
                 start_date=self.start_date,
                 end_date=self.end_date,
                 decision_engine=engine.decision_engine,
+                data_override=self._trial_data(engine, timeframe),
             )
             return results
         except Exception as e:
@@ -255,6 +270,54 @@ class OptunaOptimizer:
                     except Exception:
                         pass
 
+    @staticmethod
+    def _timeframe(config: Dict[str, Any]) -> str:
+        ab = (config or {}).get("advanced_backtesting", {}) or {}
+        return str(ab.get("timeframe", "1h")).lower()
+
+    def _fetch_ohlcv(self, engine: Any, timeframe: str) -> pd.DataFrame:
+        return engine.historical_data_provider.get_historical_data(
+            self.asset_pair, self.start_date, self.end_date, timeframe=timeframe
+        )
+
+    def _trial_data(self, engine: Any, timeframe: str) -> Optional[pd.DataFrame]:
+        """Return OHLCV for a trial, fetching it only on the first trial."""
+        if self._data_path:
+            return load_shared_ohlcv(self._data_path)
+        if self._ohlcv is None:
+            data = self._fetch_ohlcv(engine, timeframe)
+            if data is None or data.empty:
+                return None
+            self._ohlcv = data
+        return self._ohlcv
+
+    def _load_ohlcv_once(self) -> pd.DataFrame:
+        """Fetch OHLCV in the parent process before fanning out to workers."""
+        import asyncio
+
+        from finance_feedback_engine.core import FinanceFeedbackEngine
+
+        if self._ohlcv is not None:
+            return self._ohlcv
+
+        config = deepcopy(self.config)
+        config["is_backtest"] = True
+        engine = FinanceFeedbackEngine(config)
+        try:
+            self._ohlcv = self._fetch_ohlcv(engine, self._timeframe(config))
+        finally:
+            close = getattr(engine, "close", None)
+            if close is not None:
+                asyncio.run(close())
+        return self._ohlcv
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Workers read the shared Arrow copy rather than a pickled frame."""
+        state = self.__dict__.copy()
+        if state.get("_data_path"):
+            state["_ohlcv"] = None
+        return state
+
     def optimize(
         self,
         n_trials: int = 50,
@@ -262,6 +325,8 @@ class OptunaOptimizer:
         show_progress: bool = True,
         study_name: Optional[str] = None,
         seed: Optional[int] = None,
+        n_jobs: int = 1,
+        storage: Optional[str] = None,
     ) -> optuna.Study:
         """
         Run optimization.
@@ -271,26 +336,38 @@ class OptunaOptimizer:
             timeout: Timeout in seconds (None = no timeout)
             show_progress: Show progress bar
             study_name: Name for the study (for persistence)
+            seed: Sampler seed (worker ``i`` uses ``seed + i`` when parallel)
+            n_jobs: Worker processes; >1 runs trials in a process pool that
+                shares one study storage and one memory-mapped OHLCV file
+            storage: Optuna storage (RDB URL such as ``sqlite:///study.db`` or
+                a journal file path). Existing studies are resumed. Defaults
+                to in-memory, or a temporary journal file when ``n_jobs > 1``.
 
         Returns:
             Optuna Study object with results
         """
-        # Create study
+        study_name = study_name or f"optuna_{self.asset_pair}"
         sampler = optuna.samplers.TPESampler(seed=seed) if seed is not None else None
-        if self.multi_objective:
-            directions = ["maximize", "maximize"]  # Sharpe, -drawdown
-            study = optuna.create_study(
-                directions=directions,
-                study_name=study_name or f"optuna_{self.asset_pair}",
-                sampler=sampler,
-            )
-        else:
-            study = optuna.create_study(
-                direction="maximize",
-                study_name=study_name or f"optuna_{self.asset_pair}",
-                sampler=sampler,
+        direction_kwargs: Dict[str, Any] = (
+            {"directions": ["maximize", "maximize"]}  # Sharpe, -drawdown
+            if self.multi_objective
+            else {"direction": "maximize"}
+        )
+
+        if n_jobs > 1:
+            return self._optimize_parallel(
+                n_trials, timeout, study_name, seed, n_jobs, storage, direction_kwargs
             )
 
+        # Create study
+        study = optuna.create_study(
+            study_name=study_name,
+            sampler=sampler,
+            storage=resolve_storage(storage) if storage else None,
+            load_if_exists=storage is not None,
+            **direction_kwargs,
+        )
+
         # Optimize
         study.optimize(
             self.objective,
@@ -299,14 +376,68 @@ class OptunaOptimizer:
             show_progress_bar=show_progress,
         )
 
+        self._log_summary(study)
+        return study
+
+    def _optimize_parallel(
+        self,
+        n_trials: int,
+        timeout: Optional[int],
+        study_name: str,
+        seed: Optional[int],
+        n_jobs: int,
+        storage: Optional[str],
+        direction_kwargs: Dict[str, Any],
+    ) -> optuna.Study:
+        with tempfile.TemporaryDirectory(prefix="ffe_optuna_") as work_dir:
+            storage_spec = storage or f"{work_dir}/study.journal"
+            optuna.create_study(
+                study_name=study_name,
+                storage=resolve_storage(storage_spec),
+                load_if_exists=True,
+                **direction_kwargs,
+            )
+
+            data = self._load_ohlcv_once()
+            if data is not None and not data.empty:
+                self._data_path = share_ohlcv(data, f"{work_dir}/ohlcv.arrow")
+            try:
+                run_parallel_trials(
+                    study_name=study_name,
+                    storage_spec=storage_spec,
+                    objective=self.objective,
+                    n_trials=n_trials,
+                    n_workers=n_jobs,
+                    timeout=timeout,
+                    seed=seed,
+                )
+            finally:
+                self._data_path = None
+
+            if storage:
+                study = optuna.load_study(
+                    study_name=study_name, storage=resolve_storage(storage)
+                )
+            else:
+                # Keep the study usable after the temporary journal is removed
+                in_memory = optuna.storages.InMemoryStorage()
+                optuna.copy_study(
+                    from_study_name=study_name,
+                    from_storage=resolve_storage(storage_spec),
+                    to_storage=in_memory,
+                )
+                study = optuna.load_study(study_name=study_name, storage=in_memory)
+
+        self._log_summary(study)
+        return study
+
+    def _log_summary(self, study: optuna.Study) -> None:
         logger.info(f"Optimization complete: {len(study.trials)} trials")
 
         if not self.multi_objective:
             logger.info(f"Best Sharpe ratio: {study.best_value:.3f}")
             logger.info(f"Best params: {study.best_params}")
 
-        return study
-
     def get_best_params(self, study: optuna.Study) -> Dict[str, Any]:
         """
         Get best parameters from study.
@@ -0,0 +1,178 @@
+"""Process-parallel Optuna trials over a shared local study storage.
+
+Trials run in worker processes that all attach to the same study through a
+file-backed storage (an Optuna journal file by default, or any RDB URL such as
+``sqlite:///study.db``). OHLCV data is written once to an uncompressed Arrow
+IPC file and each worker memory-maps it on first use. Columns are wrapped
+zero-copy around the mapped pages, so every worker shares the page cache
+instead of decoding (or pickling) its own copy of the dataset.
+"""
+
+import logging
+import multiprocessing
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import optuna
+import pandas as pd
+import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+# Per-process cache of memory-mapped OHLCV frames keyed by Arrow file path
+_SHARED_FRAMES: Dict[str, pd.DataFrame] = {}
+
+
+def resolve_storage(spec: str) -> Union[str, optuna.storages.BaseStorage]:
+    """Turn a storage spec into something ``optuna.load_study`` accepts.
+
+    Args:
+        spec: RDB URL (``sqlite:///...``) or a filesystem path for a
+            journal-file storage
+
+    Returns:
+        The URL unchanged, or a ``JournalStorage`` for a plain path
+    """
+    if "://" in spec:
+        return spec
+
+    from optuna.storages.journal import JournalFileBackend, JournalStorage
+
+    Path(spec).parent.mkdir(parents=True, exist_ok=True)
+    return JournalStorage(JournalFileBackend(spec))
+
+
+def share_ohlcv(data: pd.DataFrame, path: Union[str, Path]) -> str:
+    """Persist ``data`` once so worker processes can memory-map it.
+
+    Args:
+        data: OHLCV frame to share read-only
+        path: Destination Arrow IPC (Feather v2) file, written uncompressed
+
+    Returns:
+        The file path as a string (cheap to pickle into workers)
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    table = pa.Table.from_pandas(data)
+    with pa.OSFile(str(path), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    return str(path)
+
+
+def load_shared_ohlcv(path: str) -> pd.DataFrame:
+    """Return the shared OHLCV frame for ``path``, mapping it once per process.
+
+    Numeric columns are read-only views of the memory-mapped file; callers
+    that need to modify values must ``copy()`` first.
+    """
+    frame = _SHARED_FRAMES.get(path)
+    if frame is None:
+        table = pa.ipc.open_file(pa.memory_map(path, "r")).read_all()
+        # One block per column keeps null-free numeric columns zero-copy
+        frame = table.to_pandas(split_blocks=True)
+        _SHARED_FRAMES[path] = frame
+    return frame
+
+
+def is_picklable(obj: Any) -> bool:
+    """Check whether ``obj`` can be shipped to a worker process."""
+    try:
+        pickle.dumps(obj)
+        return True
+    except Exception:
+        return False
+
+
+def default_worker_count() -> int:
+    """Use every available core except one for the parent process."""
+    return max(1, (os.cpu_count() or 1) - 1)
+
+
+def _run_worker(
+    study_name: str,
+    storage_spec: str,
+    objective: Callable[[optuna.Trial], Any],
+    n_trials: int,
+    timeout: Optional[float],
+    seed: Optional[int],
+    sampler_kwargs: Dict[str, Any],
+    pruner: Optional[optuna.pruners.BasePruner],
+) -> int:
+    """Attach to the shared study and run ``n_trials`` trials in this process."""
+    optuna.logging.set_verbosity(optuna.logging.WARNING)
+    study = optuna.load_study(
+        study_name=study_name,
+        storage=resolve_storage(storage_spec),
+        sampler=optuna.samplers.TPESampler(seed=seed, **sampler_kwargs),
+        pruner=pruner,
+    )
+    study.optimize(objective, n_trials=n_trials, timeout=timeout)
+    return n_trials
+
+
+def run_parallel_trials(
+    study_name: str,
+    storage_spec: str,
+    objective: Callable[[optuna.Trial], Any],
+    n_trials: int,
+    n_workers: int,
+    timeout: Optional[float] = None,
+    seed: Optional[int] = None,
+    sampler_kwargs: Optional[Dict[str, Any]] = None,
+    pruner: Optional[optuna.pruners.BasePruner] = None,
+) -> None:
+    """Spread ``n_trials`` across ``n_workers`` processes sharing one study.
+
+    The study must already exist in ``storage_spec``. ``objective`` is pickled
+    into each worker, so it must be a module-level function or a picklable
+    object. Each worker gets its own TPE sampler; with ``seed`` set, worker
+    ``i`` uses ``seed + i`` so workers do not propose identical parameters.
+
+    Raises:
+        RuntimeError: If any worker process fails
+    """
+    n_workers = max(1, min(n_workers, n_trials))
+    shares: List[int] = [n_trials // n_workers] * n_workers
+    for i in range(n_trials % n_workers):
+        shares[i] += 1
+
+    logger.info(
+        f"Running {n_trials} Optuna trials across {n_workers} processes "
+        f"(study={study_name}, storage={storage_spec})"
+    )
+
+    errors = []
+    # Spawned workers do not inherit the parent's threads, event loops or locks
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=n_workers, mp_context=context) as pool:
+        futures = [
+            pool.submit(
+                _run_worker,
+                study_name,
+                storage_spec,
+                objective,
+                share,
+                timeout,
+                None if seed is None else seed + i,
+                sampler_kwargs or {},
+                pruner,
+            )
+            for i, share in enumerate(shares)
+            if share > 0
+        ]
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                logger.error(f"Optuna worker process failed: {e}")
+                errors.append(e)
+
+    if errors:
+        raise RuntimeError(
+            f"{len(errors)} of {len(futures)} optimization workers failed: {errors[0]}"
+        ) from errors[0]
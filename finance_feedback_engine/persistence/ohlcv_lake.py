@@ -0,0 +1,350 @@
+"""Partitioned local store of OHLCV candles keyed by bar timestamp.
+
+Candles are stored one Parquet file per asset, timeframe and calendar month::
+
+    <root>/asset=BTCUSD/timeframe=1h/month=2024-01/data.parquet
+
+Range reads open only the month partitions they touch and push the timestamp
+predicate down to the Parquet reader. Alongside the candles each
+asset/timeframe keeps a small ``coverage.json`` listing the intervals that
+have already been fetched, so callers can ask for just the missing intervals
+instead of refetching a whole window. Coverage (rather than bar presence) is
+what makes market-closed periods such as FX weekends count as "known".
+
+Partition and coverage updates are read-modify-write, so writers hold an
+exclusive ``fcntl`` lock on ``<root>/.lock``; that serializes lake instances
+in other threads and processes (backfills, optimizer workers) as well.
+"""
+
+import fcntl
+import json
+import logging
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_LAKE_PATH = Path("data/historical_cache/ohlcv_lake")
+
+OHLCV_COLUMNS = ["open", "high", "low", "close", "volume"]
+
+# Canonical timeframe -> bar length; broker codes (M5, H1, ...) map onto these
+TIMEFRAME_SECONDS = {
+    "1m": 60,
+    "5m": 300,
+    "15m": 900,
+    "30m": 1800,
+    "1h": 3600,
+    "4h": 14400,
+    "1d": 86400,
+}
+_TIMEFRAME_ALIASES = {
+    "M1": "1m",
+    "M5": "5m",
+    "M15": "15m",
+    "M30": "30m",
+    "H1": "1h",
+    "H4": "4h",
+    "D": "1d",
+    "1D": "1d",
+    "1H": "1h",
+    "4H": "4h",
+}
+
+Interval = Tuple[pd.Timestamp, pd.Timestamp]
+
+
+def normalize_asset(asset_pair: str) -> str:
+    """Use one key for BTCUSD, BTC-USD, BTC_USD and BTC/USD."""
+    return "".join(ch for ch in str(asset_pair).upper() if ch.isalnum())
+
+
+def normalize_timeframe(timeframe: str) -> str:
+    """Map broker granularity codes (``M5``, ``H1``, ``D``) to ``5m``/``1h``/``1d``."""
+    tf = str(timeframe).strip()
+    return _TIMEFRAME_ALIASES.get(tf, _TIMEFRAME_ALIASES.get(tf.upper(), tf.lower()))
+
+
+def bar_interval(timeframe: str) -> timedelta:
+    """Length of one bar; unknown timeframes are treated as hourly."""
+    return timedelta(
+        seconds=TIMEFRAME_SECONDS.get(normalize_timeframe(timeframe), 3600)
+    )
+
+
+def to_utc(value: Union[str, datetime, pd.Timestamp]) -> pd.Timestamp:
+    """Parse ``value`` as a UTC timestamp (naive values are assumed UTC)."""
+    ts = pd.Timestamp(value)
+    return ts.tz_localize("UTC") if ts.tzinfo is None else ts.tz_convert("UTC")
+
+
+def _merge_intervals(intervals: Iterable[Interval]) -> List[Interval]:
+    merged: List[Interval] = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def to_ohlcv_frame(df: pd.DataFrame) -> pd.DataFrame:
+    """Coerce a candle frame to a UTC ``timestamp`` index and OHLCV float columns.
+
+    Accepts either a DatetimeIndex or a ``time``/``timestamp``/``date`` column.
+    """
+    frame = df.copy()
+    if not isinstance(frame.index, pd.DatetimeIndex):
+        for column in ("timestamp", "time", "date"):
+            if column in frame.columns:
+                frame = frame.set_index(column)
+                break
+    frame.index = pd.to_datetime(frame.index, utc=True)
+    frame.index.name = "timestamp"
+    for column in OHLCV_COLUMNS:
+        if column not in frame.columns:
+            frame[column] = float("nan")
+    frame = frame[OHLCV_COLUMNS].astype("float64")
+    return frame[~frame.index.duplicated(keep="last")].sort_index()
+
+
+class OHLCVLake:
+    """Month-partitioned Parquet candle store with fetched-range coverage."""
+
+    def __init__(self, root: Union[str, Path] = DEFAULT_LAKE_PATH):
+        self.root = Path(root)
+        self._lock = threading.RLock()
+        self._lock_file = None
+        self._lock_depth = 0
+
+    @contextmanager
+    def _write_lock(self) -> Iterator[None]:
+        """Exclusive lake-wide lock; re-entrant within this instance."""
+        with self._lock:
+            if self._lock_depth == 0:
+                self.root.mkdir(parents=True, exist_ok=True)
+                self._lock_file = open(self.root / ".lock", "a")
+                fcntl.flock(self._lock_file, fcntl.LOCK_EX)
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+                if self._lock_depth == 0:
+                    fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+                    self._lock_file.close()
+                    self._lock_file = None
+
+    def _series_dir(self, asset_pair: str, timeframe: str) -> Path:
+        return (
+            self.root
+            / f"asset={normalize_asset(asset_pair)}"
+            / f"timeframe={normalize_timeframe(timeframe)}"
+        )
+
+    def _partition_path(self, asset_pair: str, timeframe: str, month: str) -> Path:
+        return (
+            self._series_dir(asset_pair, timeframe) / f"month={month}" / "data.parquet"
+        )
+
+    def _coverage_path(self, asset_pair: str, timeframe: str) -> Path:
+        return self._series_dir(asset_pair, timeframe) / "coverage.json"
+
+    @staticmethod
+    def _months(start: pd.Timestamp, end: pd.Timestamp) -> List[str]:
+        periods = pd.period_range(
+            start.tz_localize(None).to_period("M"),
+            end.tz_localize(None).to_period("M"),
+            freq="M",
+        )
+        return [str(p) for p in periods]
+
+    @staticmethod
+    @contextmanager
+    def _atomic_path(path: Path) -> Iterator[str]:
+        """Yield a unique temp file next to ``path``; replace ``path`` on success."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+        )
+        os.close(fd)
+        try:
+            yield tmp_path
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @classmethod
+    def _atomic_write_table(cls, table: pa.Table, path: Path) -> None:
+        with cls._atomic_path(path) as tmp_path:
+            pq.write_table(table, tmp_path)
+
+    # ------------------------------------------------------------------
+    # Coverage
+    # ------------------------------------------------------------------
+    def coverage(self, asset_pair: str, timeframe: str) -> List[Interval]:
+        """Merged intervals already fetched for ``asset_pair``/``timeframe``."""
+        path = self._coverage_path(asset_pair, timeframe)
+        try:
+            with open(path, "r") as f:
+                raw = json.load(f)
+            return [(to_utc(start), to_utc(end)) for start, end in raw]
+        except FileNotFoundError:
+            return []
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable OHLCV coverage {path}: {e}")
+            return []
+
+    def mark_covered(
+        self,
+        asset_pair: str,
+        timeframe: str,
+        start: Union[str, datetime],
+        end: Union[str, datetime],
+    ) -> None:
+        """Record that ``[start, end]`` has been fetched (even if it holds no bars)."""
+        start_ts, end_ts = to_utc(start), to_utc(end)
+        if end_ts < start_ts:
+            return
+        with self._write_lock():
+            merged = _merge_intervals(
+                self.coverage(asset_pair, timeframe) + [(start_ts, end_ts)]
+            )
+            path = self._coverage_path(asset_pair, timeframe)
+            with self._atomic_path(path) as tmp_path:
+                with open(tmp_path, "w") as f:
+                    json.dump([[s.isoformat(), e.isoformat()] for s, e in merged], f)
+
+    def missing_ranges(
+        self,
+        asset_pair: str,
+        timeframe: str,
+        start: Union[str, datetime],
+        end: Union[str, datetime],
+    ) -> List[Tuple[datetime, datetime]]:
+        """Sub-intervals of ``[start, end]`` that have not been fetched yet."""
+        start_ts, end_ts = to_utc(start), to_utc(end)
+        gaps: List[Tuple[datetime, datetime]] = []
+        cursor = start_ts
+        for covered_start, covered_end in self.coverage(asset_pair, timeframe):
+            if covered_end < cursor:
+                continue
+            if covered_start > end_ts:
+                break
+            if covered_start > cursor:
+                gaps.append((cursor.to_pydatetime(), covered_start.to_pydatetime()))
+            cursor = max(cursor, covered_end)
+            if cursor >= end_ts:
+                break
+        if cursor < end_ts:
+            gaps.append((cursor.to_pydatetime(), end_ts.to_pydatetime()))
+        return gaps
+
+    # ------------------------------------------------------------------
+    # Candles
+    # ------------------------------------------------------------------
+    def write(
+        self,
+        asset_pair: str,
+        timeframe: str,
+        df: pd.DataFrame,
+        covered: Optional[Tuple[datetime, datetime]] = None,
+    ) -> int:
+        """Upsert candles into their month partitions.
+
+        Existing bars with the same timestamp are replaced, so re-fetching a
+        partially formed bar overwrites it.
+
+        Args:
+            asset_pair: Asset pair symbol
+            timeframe: Candle timeframe (``1h``, ``H1``, ...)
+            df: Candles with a DatetimeIndex or a ``time``/``timestamp`` column
+            covered: Optional fetched interval to record as coverage
+
+        Returns:
+            Number of candles written
+        """
+        frame = to_ohlcv_frame(df) if not df.empty else df
+        with self._write_lock():
+            if not frame.empty:
+                months = frame.index.tz_localize(None).to_period("M").astype(str)
+                for month, chunk in frame.groupby(months):
+                    path = self._partition_path(asset_pair, timeframe, month)
+                    if path.exists():
+                        existing = pd.read_parquet(path)
+                        chunk = pd.concat([existing, chunk])
+                        chunk = chunk[~chunk.index.duplicated(keep="last")].sort_index()
+                    self._atomic_write_table(
+                        pa.Table.from_pandas(chunk, preserve_index=True), path
+                    )
+            if covered is not None:
+                self.mark_covered(asset_pair, timeframe, covered[0], covered[1])
+        return len(frame)
+
+    def read(
+        self,
+        asset_pair: str,
+        timeframe: str,
+        start: Union[str, datetime],
+        end: Union[str, datetime],
+        columns: Optional[Sequence[str]] = None,
+    ) -> pd.DataFrame:
+        """Load candles in ``[start, end]`` from only the partitions it touches."""
+        start_ts, end_ts = to_utc(start), to_utc(end)
+        if end_ts < start_ts:
+            return pd.DataFrame(columns=list(columns or OHLCV_COLUMNS))
+        wanted = list(columns or OHLCV_COLUMNS)
+        filters = [("timestamp", ">=", start_ts), ("timestamp", "<=", end_ts)]
+
+        tables = []
+        for month in self._months(start_ts, end_ts):
+            path = self._partition_path(asset_pair, timeframe, month)
+            if not path.exists():
+                continue
+            try:
+                tables.append(
+                    pq.read_table(path, columns=wanted + ["timestamp"], filters=filters)
+                )
+            except Exception as e:
+                logger.warning(f"Skipping unreadable OHLCV partition {path}: {e}")
+
+        if not tables:
+            empty = pd.DataFrame(
+                {c: pd.Series(dtype="float64") for c in wanted},
+                index=pd.DatetimeIndex([], tz="UTC", name="timestamp"),
+            )
+            return empty
+        frame = pa.concat_tables(tables).to_pandas()
+        if "timestamp" in frame.columns:
+            frame = frame.set_index("timestamp")
+        frame.index = pd.to_datetime(frame.index, utc=True)
+        frame.index.name = "timestamp"
+        return frame[wanted].sort_index()
+
+    def covers(
+        self,
+        asset_pair: str,
+        timeframe: str,
+        start: Union[str, datetime],
+        end: Union[str, datetime],
+    ) -> bool:
+        """True when ``[start, end]`` can be served without any fetch."""
+        return not self.missing_ranges(asset_pair, timeframe, start, end)
+
+
+def coverage_end(timeframe: str, end: Union[str, datetime]) -> datetime:
+    """Clamp a fetched range so the still-forming bar is never marked covered."""
+    now = pd.Timestamp(datetime.now(timezone.utc))
+    current_bar_open = now.floor(bar_interval(timeframe))
+    return min(to_utc(end), current_bar_open).to_pydatetime()
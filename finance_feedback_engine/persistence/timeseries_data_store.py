@@ -7,6 +7,8 @@ from typing import Any, Dict, List, Optional
 
 import pandas as pd
 
+from .ohlcv_lake import OHLCVLake, coverage_end
+
 logger = logging.getLogger(__name__)
 
 
@@ -16,12 +18,15 @@ class TimeSeriesDataStore:
 
     This class provides methods to save and load time-series data, with each
     entry timestamped and stored in a structured format. Supports both JSONL
-    for individual entries and Parquet for DataFrame storage.
+    for individual entries and Parquet for DataFrame storage. OHLCV frames
+    are kept in a month-partitioned :class:`OHLCVLake` under
+    ``<storage_path>/ohlcv_lake`` so overlapping ranges share stored candles.
     """
 
     def __init__(self, storage_path: str = "data/time_series_data"):
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(parents=True, exist_ok=True)
+        self.lake = OHLCVLake(self.storage_path / "ohlcv_lake")
 
     def _get_filepath(self, symbol: str) -> str:
         """Generates a file path for a given symbol (JSONL format)."""
@@ -108,7 +113,10 @@ class TimeSeriesDataStore:
         timeframe: str,
     ) -> None:
         """
-        Save a DataFrame of historical OHLCV data to Parquet format.
+        Save a DataFrame of historical OHLCV data into the partitioned lake.
+
+        ``[start_date, end_date]`` is recorded as fetched coverage (up to the
+        still-forming bar), so later loads of any sub-range are served locally.
 
         Args:
             asset_pair: Asset pair symbol
@@ -122,12 +130,14 @@ class TimeSeriesDataStore:
             return
 
         try:
-            filepath = self._get_dataframe_filepath(
-                asset_pair, start_date, end_date, timeframe
+            written = self.lake.write(
+                asset_pair,
+                timeframe,
+                df,
+                covered=(start_date, coverage_end(timeframe, end_date)),
             )
-            df.to_parquet(filepath)
             logger.info(
-                f"✅ Saved {len(df)} candles for {asset_pair} ({timeframe}) to {filepath.name}"
+                f"✅ Saved {written} candles for {asset_pair} ({timeframe}) to OHLCV lake"
             )
         except Exception as e:
             logger.error(f"❌ Failed to save DataFrame for {asset_pair}: {e}")
@@ -139,6 +149,9 @@ class TimeSeriesDataStore:
         """
         Load a DataFrame of historical OHLCV data from Parquet format.
 
+        Served from the OHLCV lake when the whole range has been fetched
+        before; otherwise falls back to a legacy per-range file.
+
         Args:
             asset_pair: Asset pair symbol
             start_date: Start date of the data
@@ -149,6 +162,13 @@ class TimeSeriesDataStore:
             DataFrame if found and fresh, None otherwise
         """
         try:
+            if self.lake.covers(asset_pair, timeframe, start_date, end_date):
+                df = self.lake.read(asset_pair, timeframe, start_date, end_date)
+                logger.info(
+                    f"✅ Loaded {len(df)} candles for {asset_pair} ({timeframe}) from OHLCV lake"
+                )
+                return df
+
             filepath = self._get_dataframe_filepath(
                 asset_pair, start_date, end_date, timeframe
             )
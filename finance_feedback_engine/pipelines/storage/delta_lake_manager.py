@@ -7,17 +7,55 @@ Features:
 - Z-ordering for query performance
 - Time travel queries
 - MERGE operations (upserts)
+- Parquet fallback without Spark: hive partitions, filter pushdown,
+  column projection, streamed reads and file compaction
 """
 
 import logging
+import operator
+import re
+import threading
+import uuid
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import quote
 
 import pandas as pd
 
 logger = logging.getLogger(__name__)
 
+# Fallback Parquet layout: rows per row group, and the size a partition
+# buffer (or a compacted file) grows to before it is written out
+DEFAULT_ROW_GROUP_SIZE = 64_000
+DEFAULT_TARGET_FILE_ROWS = 256_000
+DEFAULT_READ_BATCH_SIZE = 64_000
+
+# Fallback file names carry their write time: data_<YYYYmmdd_HHMMSS>[_<id>].parquet
+_FILE_TIME_FORMAT = "%Y%m%d_%H%M%S"
+_FILE_TIME_RE = re.compile(r"^data_(\d{8}_\d{6})")
+# Compacted files mix rows from several writes; each row keeps its own
+# write time here so time travel stays exact (hidden from reads)
+_WRITTEN_AT_COLUMN = "_written_at"
+
+# ``read_table`` filters: 'column op value' with an optionally quoted value
+_FILTER_RE = re.compile(
+    r"""^\s*(\w+)\s*(==|=|!=|<>|<=|>=|<|>)\s*(?:"([^"]*)"|'([^']*)'|(\S+))\s*$"""
+)
+_FILTER_OPS = {
+    "=": operator.eq,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<>": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+Filter = Union[str, Tuple[str, str, Any]]
+
 
 class DeltaLakeManager:
     """
@@ -26,14 +64,31 @@ class DeltaLakeManager:
     Handles table creation, updates, optimization, and time travel queries.
     """
 
-    def __init__(self, storage_path: str = "s3://finance-lake"):
+    def __init__(
+        self,
+        storage_path: str = "s3://finance-lake",
+        row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+        target_file_rows: int = DEFAULT_TARGET_FILE_ROWS,
+    ):
         """
         Initialize Delta Lake manager.
 
         Args:
             storage_path: Base path for Delta tables (S3, MinIO, or local path)
+            row_group_size: Parquet row group size in fallback mode
+            target_file_rows: Rows per file that fallback buffering and
+                compaction aim for
         """
         self.storage_path = storage_path
+        self.row_group_size = row_group_size
+        self.target_file_rows = target_file_rows
+
+        # Fallback write buffers keyed by (table_name, partition path)
+        self._buffers: Dict[Tuple[str, str], List[pd.DataFrame]] = {}
+        self._buffered_rows: Dict[Tuple[str, str], int] = {}
+        self._buffer_depth = 0
+        self._buffer_lock = threading.RLock()
+
         self.use_spark = self._check_spark_available()
 
         if self.use_spark:
@@ -111,7 +166,7 @@ class DeltaLakeManager:
         """
         if not self.use_spark:
             # Fallback: save as Parquet files
-            self._save_as_parquet(df, table_name, mode)
+            self._save_as_parquet(df, table_name, mode, partition_columns)
             return
 
         table_path = f"{self.storage_path}/{table_name}"
@@ -137,24 +192,130 @@ class DeltaLakeManager:
             logger.error(f"Failed to write Delta table {table_name}: {e}")
             raise
 
-    def _save_as_parquet(self, df: pd.DataFrame, table_name: str, mode: str):
-        """Fallback: save as Parquet files when Spark unavailable."""
-        table_dir = Path(self.storage_path) / table_name
-        table_dir.mkdir(parents=True, exist_ok=True)
+    def _save_as_parquet(
+        self,
+        df: pd.DataFrame,
+        table_name: str,
+        mode: str,
+        partition_columns: Optional[List[str]] = None,
+    ):
+        """Fallback: save as Parquet files when Spark unavailable.
 
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-        filename = f"data_{timestamp}.parquet"
-        filepath = table_dir / filename
+        Files are laid out hive-style (``col=value/``) by ``partition_columns``.
+        Inside ``buffered_writes()`` rows are held per partition and written
+        once a partition reaches ``target_file_rows`` or the block exits.
+        """
+        if df.empty:
+            return
 
-        df.to_parquet(filepath, index=False, engine="pyarrow")
+        for partition_dir, part_df in self._split_partitions(df, partition_columns):
+            key = (table_name, partition_dir)
+            with self._buffer_lock:
+                if self._buffer_depth == 0:
+                    self._write_parquet_file(table_name, partition_dir, [part_df])
+                    continue
+                self._buffers.setdefault(key, []).append(part_df)
+                self._buffered_rows[key] = self._buffered_rows.get(key, 0) + len(
+                    part_df
+                )
+                if self._buffered_rows[key] >= self.target_file_rows:
+                    self._flush_partition(key)
+
+    @staticmethod
+    def _split_partitions(
+        df: pd.DataFrame, partition_columns: Optional[List[str]]
+    ) -> List[Tuple[str, pd.DataFrame]]:
+        """Split ``df`` into (relative hive directory, rows) pairs."""
+        columns = [c for c in (partition_columns or []) if c in df.columns]
+        if not columns:
+            return [("", df)]
+
+        parts = []
+        for values, part_df in df.groupby(columns, sort=False, dropna=False):
+            if not isinstance(values, tuple):
+                values = (values,)
+            partition_dir = "/".join(
+                f"{column}={quote(str(value), safe='')}"
+                for column, value in zip(columns, values)
+            )
+            parts.append((partition_dir, part_df))
+        return parts
 
-        logger.info(f"Saved Parquet file: {filepath} (fallback mode)")
+    def _write_parquet_file(
+        self,
+        table_name: str,
+        partition_dir: str,
+        frames: List[pd.DataFrame],
+        written_at: Optional[str] = None,
+    ) -> Path:
+        """Write ``frames`` as one Parquet file with sized row groups.
+
+        ``written_at`` overrides the write time encoded in the file name
+        (used by compaction so merged rows keep a time-travel position).
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        target_dir = Path(self.storage_path) / table_name / partition_dir
+        target_dir.mkdir(parents=True, exist_ok=True)
+
+        timestamp = written_at or datetime.now(timezone.utc).strftime(_FILE_TIME_FORMAT)
+        # Unique suffix: concurrent writers used to collide within one second
+        filepath = target_dir / f"data_{timestamp}_{uuid.uuid4().hex[:8]}.parquet"
+
+        df = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        pq.write_table(table, filepath, row_group_size=self.row_group_size)
+
+        logger.info(f"Saved Parquet file: {filepath} ({len(df)} rows, fallback mode)")
+        return filepath
+
+    def _flush_partition(self, key: Tuple[str, str]):
+        """Write one buffered partition. Caller holds ``_buffer_lock``."""
+        frames = self._buffers.pop(key, None)
+        self._buffered_rows.pop(key, None)
+        if frames:
+            self._write_parquet_file(key[0], key[1], frames)
+
+    def flush(self, table_name: Optional[str] = None):
+        """Write buffered fallback rows (for one table, or all of them)."""
+        with self._buffer_lock:
+            for key in list(self._buffers):
+                if table_name is None or key[0] == table_name:
+                    self._flush_partition(key)
+
+    @contextmanager
+    def buffered_writes(self):
+        """Hold fallback appends in memory and write them per partition on exit.
+
+        Many small appends to the same partition (one per asset/timeframe
+        fetch) become a few right-sized files. Buffered rows are discarded
+        if the block raises, so callers must not commit watermarks for
+        them. No-op when Spark is available.
+        """
+        with self._buffer_lock:
+            self._buffer_depth += 1
+        try:
+            yield self
+        except BaseException:
+            with self._buffer_lock:
+                self._buffer_depth -= 1
+                if self._buffer_depth == 0:
+                    self._buffers.clear()
+                    self._buffered_rows.clear()
+            raise
+        else:
+            with self._buffer_lock:
+                self._buffer_depth -= 1
+                if self._buffer_depth == 0:
+                    self.flush()
 
     def read_table(
         self,
         table_name: str,
         as_of_timestamp: Optional[str] = None,
-        filters: Optional[List[str]] = None,
+        filters: Optional[List[Filter]] = None,
+        columns: Optional[List[str]] = None,
     ) -> pd.DataFrame:
         """
         Read Delta table with optional time travel.
@@ -163,12 +324,19 @@ class DeltaLakeManager:
             table_name: Delta table name
             as_of_timestamp: ISO timestamp for time travel (e.g., '2025-01-01T00:00:00')
             filters: SQL-like filter expressions (e.g., ['asset_pair = "BTCUSD"', 'timestamp > "2024-01-01"'])
+                or ``(column, op, value)`` tuples
+            columns: Columns to return (None = all)
 
         Returns:
             Pandas DataFrame
         """
         if not self.use_spark:
-            return self._read_parquet_fallback(table_name)
+            return self._read_parquet_fallback(
+                table_name,
+                as_of_timestamp=as_of_timestamp,
+                filters=filters,
+                columns=columns,
+            )
 
         table_path = f"{self.storage_path}/{table_name}"
 
@@ -184,8 +352,14 @@ class DeltaLakeManager:
             # Apply filters
             if filters:
                 for filter_expr in filters:
+                    if not isinstance(filter_expr, str):
+                        column, op, value = filter_expr
+                        filter_expr = f"{column} {op} {value!r}"
                     df = df.filter(filter_expr)
 
+            if columns:
+                df = df.select(*columns)
+
             pandas_df = df.toPandas()
 
             logger.info(f"Read {len(pandas_df)} rows from Delta table '{table_name}'")
@@ -195,25 +369,218 @@ class DeltaLakeManager:
             logger.error(f"Failed to read Delta table {table_name}: {e}")
             raise
 
-    def _read_parquet_fallback(self, table_name: str) -> pd.DataFrame:
-        """Fallback: read Parquet files when Spark unavailable."""
-        table_dir = Path(self.storage_path) / table_name
+    def _read_parquet_fallback(
+        self,
+        table_name: str,
+        as_of_timestamp: Optional[str] = None,
+        filters: Optional[List[Filter]] = None,
+        columns: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        """Fallback: read Parquet files when Spark unavailable.
 
-        if not table_dir.exists():
-            logger.warning(f"Table directory not found: {table_dir}")
-            return pd.DataFrame()
+        Batches are streamed from the scanner, so only rows that pass
+        ``filters`` (and only the projected ``columns``) are held in memory.
+        """
+        import pyarrow as pa
 
-        parquet_files = list(table_dir.glob("*.parquet"))
-        if not parquet_files:
+        dataset = self._fallback_dataset(table_name, as_of_timestamp)
+        if dataset is None:
             return pd.DataFrame()
 
-        # Read all Parquet files and concatenate
-        dfs = [pd.read_parquet(f) for f in parquet_files]
-        combined_df = pd.concat(dfs, ignore_index=True)
+        scanner = self._fallback_scanner(dataset, filters, columns)
+        table = pa.Table.from_batches(
+            list(scanner.to_batches()), scanner.projected_schema
+        )
+        combined_df = table.to_pandas()
 
         logger.info(f"Read {len(combined_df)} rows from Parquet files (fallback mode)")
         return combined_df
 
+    def iter_table_batches(
+        self,
+        table_name: str,
+        as_of_timestamp: Optional[str] = None,
+        filters: Optional[List[Filter]] = None,
+        columns: Optional[List[str]] = None,
+        batch_size: int = DEFAULT_READ_BATCH_SIZE,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Stream a table as DataFrames of at most ``batch_size`` rows.
+
+        Takes the same arguments as ``read_table``. Use this for reads too
+        large to hold in memory at once.
+        """
+        if self.use_spark:
+            df = self.read_table(table_name, as_of_timestamp, filters, columns)
+            for start in range(0, len(df), batch_size):
+                yield df.iloc[start : start + batch_size]
+            return
+
+        dataset = self._fallback_dataset(table_name, as_of_timestamp)
+        if dataset is None:
+            return
+
+        scanner = self._fallback_scanner(dataset, filters, columns, batch_size)
+        for batch in scanner.to_batches():
+            if batch.num_rows:
+                yield batch.to_pandas()
+
+    def _fallback_dataset(self, table_name: str, as_of_timestamp: Optional[str]):
+        """Build a pyarrow dataset over a fallback table's Parquet files.
+
+        Hive directory keys (``col=value``) become partition fields typed
+        like the matching file column, so filters on them skip whole
+        directories. ``as_of_timestamp`` drops files written after it, and
+        rows of compacted files whose ``_written_at`` is after it.
+        """
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+        import pyarrow.parquet as pq
+
+        table_dir = Path(self.storage_path) / table_name
+
+        if not table_dir.exists():
+            logger.warning(f"Table directory not found: {table_dir}")
+            return None
+
+        self.flush(table_name)
+        parquet_files = sorted(table_dir.rglob("*.parquet"))
+        if as_of_timestamp:
+            cutoff = pd.Timestamp(as_of_timestamp)
+            cutoff = (
+                cutoff.tz_localize("UTC") if cutoff.tzinfo is None else cutoff
+            ).strftime(_FILE_TIME_FORMAT)
+            parquet_files = [
+                f for f in parquet_files if self._file_written_at(f) <= cutoff
+            ]
+        if not parquet_files:
+            return None
+
+        # Footers only: files written by different runs may differ in columns
+        schema = pa.unify_schemas(
+            [pq.read_schema(f) for f in parquet_files], promote_options="permissive"
+        ).remove_metadata()
+
+        partition_keys: List[str] = []
+        for path in parquet_files:
+            for part in path.parent.relative_to(table_dir).parts:
+                key = part.split("=", 1)[0]
+                if "=" in part and key not in partition_keys:
+                    partition_keys.append(key)
+
+        partitioning = None
+        if partition_keys:
+            partition_schema = pa.schema(
+                [
+                    (
+                        schema.field(key)
+                        if key in schema.names
+                        else pa.field(key, pa.string())
+                    )
+                    for key in partition_keys
+                ]
+            )
+            partitioning = ds.partitioning(partition_schema, flavor="hive")
+            schema = pa.unify_schemas([schema, partition_schema])
+
+        dataset = ds.dataset(
+            [str(f) for f in parquet_files],
+            schema=schema,
+            format="parquet",
+            partitioning=partitioning,
+            partition_base_dir=str(table_dir),
+        )
+        if as_of_timestamp and _WRITTEN_AT_COLUMN in schema.names:
+            written_at = ds.field(_WRITTEN_AT_COLUMN)
+            dataset = dataset.filter((written_at <= cutoff) | written_at.is_null())
+        return dataset
+
+    @classmethod
+    def _fallback_scanner(
+        cls,
+        dataset,
+        filters: Optional[List[Filter]],
+        columns: Optional[List[str]],
+        batch_size: int = DEFAULT_READ_BATCH_SIZE,
+    ):
+        """Scanner with filters pushed down and ``columns`` projected."""
+        expression = None
+        for filter_spec in filters or []:
+            condition = cls._filter_expression(dataset.schema, filter_spec)
+            expression = condition if expression is None else expression & condition
+
+        if columns:
+            missing = [c for c in columns if c not in dataset.schema.names]
+            if missing:
+                raise ValueError(f"Unknown columns: {missing}")
+        elif _WRITTEN_AT_COLUMN in dataset.schema.names:
+            columns = [n for n in dataset.schema.names if n != _WRITTEN_AT_COLUMN]
+
+        return dataset.scanner(
+            columns=list(columns) if columns else None,
+            filter=expression,
+            batch_size=batch_size,
+        )
+
+    @staticmethod
+    def _filter_expression(schema, filter_spec: Filter):
+        """Turn ``'col op value'`` or ``(col, op, value)`` into a dataset expression."""
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+
+        if isinstance(filter_spec, str):
+            match = _FILTER_RE.match(filter_spec)
+            if not match:
+                raise ValueError(f"Unsupported filter expression: {filter_spec!r}")
+            column, op, double_quoted, single_quoted, bare = match.groups()
+            if double_quoted is not None or single_quoted is not None:
+                value = double_quoted if double_quoted is not None else single_quoted
+            else:
+                try:
+                    value = float(bare) if "." in bare else int(bare)
+                except ValueError:
+                    value = bare
+        else:
+            column, op, value = filter_spec
+
+        if column not in schema.names:
+            raise ValueError(f"Unknown filter column: {column!r}")
+        field_type = schema.field(column).type
+
+        op = op.lower()
+        if op in ("in", "not in"):
+            values = pa.array(list(value)).cast(field_type)
+            condition = ds.field(column).isin(values)
+            return ~condition if op == "not in" else condition
+        if op not in _FILTER_OPS:
+            raise ValueError(f"Unsupported filter operator: {op!r}")
+
+        # Compare in the column's type ('timestamp > "2024-01-01"')
+        scalar = pa.scalar(value)
+        if scalar.type != field_type:
+            scalar = scalar.cast(field_type)
+        return _FILTER_OPS[op](ds.field(column), scalar)
+
+    @staticmethod
+    def _file_written_at(path: Path) -> str:
+        """Write time encoded in a fallback file name ('' if absent)."""
+        match = _FILE_TIME_RE.match(path.name)
+        return match.group(1) if match else ""
+
+    @classmethod
+    def _read_with_written_at(cls, path: Path):
+        """Read a fallback file, tagging rows with its write time if untagged."""
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pq.read_table(path)
+        if _WRITTEN_AT_COLUMN in table.column_names:
+            return table
+        written_at = pa.array(
+            [cls._file_written_at(path)] * table.num_rows, type=pa.string()
+        )
+        return table.append_column(_WRITTEN_AT_COLUMN, written_at)
+
     def optimize_table(
         self, table_name: str, zorder_columns: Optional[List[str]] = None
     ):
@@ -225,7 +592,7 @@ class DeltaLakeManager:
             zorder_columns: Columns to Z-order by (improves query performance)
         """
         if not self.use_spark:
-            logger.warning("Optimize requires Spark (not available)")
+            self.compact_table(table_name)
             return
 
         from delta.tables import DeltaTable
@@ -250,6 +617,81 @@ class DeltaLakeManager:
             logger.error(f"Failed to optimize table {table_name}: {e}")
             raise
 
+    def compact_table(
+        self, table_name: str, target_file_rows: Optional[int] = None
+    ) -> Dict[str, int]:
+        """
+        Merge small fallback Parquet files within each partition directory.
+
+        Files below ``target_file_rows`` are combined into files of up to that
+        size. The merged file is written before the originals are removed, so
+        an interrupted compaction can leave duplicates but never loses rows.
+        It is named after its earliest write, and every row keeps its source
+        write time in ``_written_at`` so ``as_of_timestamp`` reads still see
+        exactly the rows that existed then.
+
+        Args:
+            table_name: Table name
+            target_file_rows: Size threshold (defaults to ``self.target_file_rows``)
+
+        Returns:
+            Dict with ``files_before`` and ``files_after`` counts
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        target = target_file_rows or self.target_file_rows
+        table_dir = Path(self.storage_path) / table_name
+        stats = {"files_before": 0, "files_after": 0}
+        if not table_dir.exists():
+            return stats
+
+        self.flush(table_name)
+
+        by_dir: Dict[Path, List[Path]] = {}
+        for path in sorted(table_dir.rglob("*.parquet")):
+            by_dir.setdefault(path.parent, []).append(path)
+
+        for directory, files in by_dir.items():
+            stats["files_before"] += len(files)
+            row_counts = [(f, pq.ParquetFile(f).metadata.num_rows) for f in files]
+            small = [(f, rows) for f, rows in row_counts if rows < target]
+            stats["files_after"] += len(files) - len(small)
+
+            # Greedily pack small files into groups of up to ``target`` rows
+            groups: List[List[Path]] = []
+            group_rows = 0
+            for path, rows in small:
+                if not groups or group_rows + rows > target:
+                    groups.append([])
+                    group_rows = 0
+                groups[-1].append(path)
+                group_rows += rows
+
+            for group in groups:
+                stats["files_after"] += 1
+                if len(group) < 2:
+                    continue
+                merged = pa.concat_tables(
+                    [self._read_with_written_at(f) for f in group],
+                    promote_options="default",
+                )
+                relative = directory.relative_to(table_dir).as_posix()
+                self._write_parquet_file(
+                    table_name,
+                    "" if relative == "." else relative,
+                    [merged.to_pandas()],
+                    written_at=min(self._file_written_at(f) for f in group) or None,
+                )
+                for path in group:
+                    path.unlink()
+
+        logger.info(
+            f"Compacted table '{table_name}': "
+            f"{stats['files_before']} -> {stats['files_after']} files (fallback mode)"
+        )
+        return stats
+
     def vacuum_table(
         self, table_name: str, retention_hours: int = 168  # 7 days default
     ):
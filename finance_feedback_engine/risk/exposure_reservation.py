@@ -17,7 +17,7 @@ import logging
 import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Dict, Optional, Tuple
+from typing import Collection, Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -59,6 +59,10 @@ class ExposureReservationManager:
             return
 
         self._reservations: Dict[str, ReservedExposure] = {}
+        # Running totals so per-asset lookups don't scan every reservation
+        self._reserved_by_asset: Dict[str, float] = {}
+        self._reservation_counts: Dict[str, int] = {}
+        self._reserved_total = 0.0
         self._reservations_lock = threading.Lock()
         self._initialized = True
         logger.info("ExposureReservationManager initialized")
@@ -102,6 +106,7 @@ class ExposureReservationManager:
                 notional_value=notional_value,
             )
             self._reservations[decision_id] = reservation
+            self._add_to_totals(reservation)
 
             logger.info(
                 f"Reserved exposure: {action} {position_size} {asset_pair} "
@@ -123,7 +128,7 @@ class ExposureReservationManager:
         """
         with self._reservations_lock:
             if decision_id in self._reservations:
-                reservation = self._reservations.pop(decision_id)
+                reservation = self._release(decision_id)
                 logger.info(
                     f"Committed reservation for decision {decision_id}: "
                     f"{reservation.action} {reservation.asset_pair}"
@@ -147,7 +152,7 @@ class ExposureReservationManager:
         """
         with self._reservations_lock:
             if decision_id in self._reservations:
-                reservation = self._reservations.pop(decision_id)
+                reservation = self._release(decision_id)
                 logger.warning(
                     f"Rolled back reservation for decision {decision_id}: "
                     f"{reservation.action} {reservation.asset_pair} (trade failed)"
@@ -179,7 +184,7 @@ class ExposureReservationManager:
                     stale_ids.append(decision_id)
 
             for decision_id in stale_ids:
-                reservation = self._reservations.pop(decision_id)
+                reservation = self._release(decision_id)
                 logger.warning(
                     f"Cleared stale reservation for decision {decision_id}: "
                     f"{reservation.action} {reservation.asset_pair} "
@@ -205,8 +210,38 @@ class ExposureReservationManager:
                     f"Force clearing {count} reservations (batch cleanup)"
                 )
             self._reservations.clear()
+            self._reserved_by_asset.clear()
+            self._reservation_counts.clear()
+            self._reserved_total = 0.0
             return count
 
+    def _add_to_totals(self, reservation: ReservedExposure) -> None:
+        asset = reservation.asset_pair
+        self._reserved_by_asset[asset] = (
+            self._reserved_by_asset.get(asset, 0.0) + reservation.notional_value
+        )
+        self._reservation_counts[asset] = self._reservation_counts.get(asset, 0) + 1
+        self._reserved_total += reservation.notional_value
+
+    def _release(self, decision_id: str) -> ReservedExposure:
+        """Pop a reservation and take it out of the running totals (lock held)."""
+        reservation = self._reservations.pop(decision_id)
+        asset = reservation.asset_pair
+        remaining = self._reservation_counts.get(asset, 1) - 1
+        if remaining > 0:
+            self._reservation_counts[asset] = remaining
+            self._reserved_by_asset[asset] -= reservation.notional_value
+        else:
+            # Drop the key rather than leave float residue behind
+            self._reservation_counts.pop(asset, None)
+            self._reserved_by_asset.pop(asset, None)
+        self._reserved_total = (
+            self._reserved_total - reservation.notional_value
+            if self._reservations
+            else 0.0
+        )
+        return reservation
+
     def get_reserved_exposure(self) -> Tuple[float, Dict[str, float]]:
         """
         Get total reserved exposure and breakdown by asset.
@@ -215,15 +250,29 @@ class ExposureReservationManager:
             Tuple of (total_notional_usd, {asset_pair: notional_usd})
         """
         with self._reservations_lock:
-            total = 0.0
-            by_asset: Dict[str, float] = {}
+            return self._reserved_total, dict(self._reserved_by_asset)
+
+    def get_reserved_notional(
+        self, asset_pair: str, exclude: Collection[str] = ()
+    ) -> float:
+        """
+        Get reserved notional for one asset.
 
-            for reservation in self._reservations.values():
-                total += reservation.notional_value
-                asset = reservation.asset_pair
-                by_asset[asset] = by_asset.get(asset, 0.0) + reservation.notional_value
+        Args:
+            asset_pair: Asset as passed to ``reserve_exposure``
+            exclude: Decision IDs whose reservations should not be counted
+                (e.g. decisions the caller already accounts for itself)
 
-            return total, by_asset
+        Returns:
+            Reserved notional in USD
+        """
+        with self._reservations_lock:
+            notional = self._reserved_by_asset.get(asset_pair, 0.0)
+            for decision_id in exclude:
+                reservation = self._reservations.get(decision_id)
+                if reservation is not None and reservation.asset_pair == asset_pair:
+                    notional -= reservation.notional_value
+            return max(notional, 0.0)
 
     def get_reserved_concentration(self, portfolio_value: float) -> Dict[str, float]:
         """
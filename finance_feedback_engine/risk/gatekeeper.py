@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 
 from finance_feedback_engine.decision_engine.policy_actions import (
     get_legacy_action_compatibility,
@@ -12,6 +12,7 @@ from finance_feedback_engine.decision_engine.policy_actions import (
 )
 from finance_feedback_engine.observability.metrics import create_counters, get_meter
 from finance_feedback_engine.risk.exposure_reservation import get_exposure_manager
+from finance_feedback_engine.risk.risk_state import RiskState, TradeBatch
 from finance_feedback_engine.utils.market_schedule import MarketSchedule
 from finance_feedback_engine.utils.validation import validate_data_freshness
 from finance_feedback_engine.monitoring.context_provider import _coerce_monitoring_float
@@ -39,6 +40,7 @@ class RiskGatekeeper:
         max_var_pct: float = 0.05,  # 5% max daily VaR
         var_confidence: float = 0.95,
         is_backtest: bool = False,
+        risk_state: Optional[RiskState] = None,
     ):
         """
         Initialize risk gatekeeper.
@@ -50,6 +52,8 @@ class RiskGatekeeper:
             max_var_pct: Maximum portfolio VaR as % of portfolio value
             var_confidence: VaR confidence level (0.95 or 0.99)
             is_backtest: If True, raise errors on timestamp parsing failures instead of falling back
+            risk_state: Maintained position/exposure state (synced by the
+                agent each cycle); shared with callers for exposure queries
         """
         self.max_drawdown_pct = max_drawdown_pct
         self.correlation_threshold = correlation_threshold
@@ -57,6 +61,7 @@ class RiskGatekeeper:
         self.max_var_pct = max_var_pct
         self.var_confidence = var_confidence
         self.is_backtest = is_backtest
+        self.risk_state = risk_state if risk_state is not None else RiskState()
 
         # Initialize Prometheus metrics
         self._meter = get_meter(__name__)
@@ -210,10 +215,43 @@ class RiskGatekeeper:
             "version": 1,
         }
 
+    def validate_trades(
+        self,
+        decisions: Sequence[Dict],
+        contexts: Sequence[Dict],
+    ) -> List[Tuple[bool, str]]:
+        """
+        Validate a cycle's decisions together.
+
+        Each decision is checked with the exposure of the decisions approved
+        before it in ``decisions`` counted as pending, so several signals
+        that individually fit the limits cannot jointly exceed them.
+
+        Args:
+            decisions: Trade decisions, in priority order
+            contexts: Portfolio context for each decision (same order)
+
+        Returns:
+            One ``(is_allowed, message)`` tuple per decision
+        """
+        if len(decisions) != len(contexts):
+            raise ValueError(
+                f"Got {len(decisions)} decisions but {len(contexts)} contexts"
+            )
+        batch = TradeBatch()
+        results = []
+        for decision, context in zip(decisions, contexts):
+            result = self.validate_trade(decision, context, batch=batch)
+            if result[0]:
+                batch.add(decision)
+            results.append(result)
+        return results
+
     def validate_trade(
         self,
         decision: Dict,
         context: Dict,
+        batch: Optional[TradeBatch] = None,
     ) -> Tuple[bool, str]:
         """
         Validate a trade decision against risk constraints.
@@ -235,6 +273,8 @@ class RiskGatekeeper:
                 ``holdings`` (asset_id → category),
                 ``var_analysis`` (optional, from VaRCalculator),
                 ``correlation_analysis`` (optional, from CorrelationAnalyzer).
+            batch: Decisions already approved this cycle; their exposure is
+                added to the correlation and concentration checks.
 
         Returns:
             Tuple ``(is_allowed, message)`` where ``is_allowed`` is ``True``
@@ -438,7 +478,7 @@ class RiskGatekeeper:
             return False, f"Max drawdown exceeded ({drawdown_frac*100:.2f}%)"
 
         # 3. Per-Platform Correlation Check (Enhanced)
-        correlation_check_result = self._validate_correlation(decision, context)
+        correlation_check_result = self._validate_correlation(decision, context, batch)
         if not correlation_check_result[0]:
             return correlation_check_result
 
@@ -452,7 +492,7 @@ class RiskGatekeeper:
 
         # 6. Leverage and Concentration Check (Consolidated from pre-execution)
         leverage_check_result = self._validate_leverage_and_concentration(
-            decision, context
+            decision, context, batch
         )
         if not leverage_check_result[0]:
             return leverage_check_result
@@ -482,7 +522,9 @@ class RiskGatekeeper:
         logger.info("Trade approved by RiskGatekeeper")
         return True, "Trade approved"
 
-    def _validate_correlation(self, decision: Dict, context: Dict) -> Tuple[bool, str]:
+    def _validate_correlation(
+        self, decision: Dict, context: Dict, batch: Optional[TradeBatch] = None
+    ) -> Tuple[bool, str]:
         """
         Validate per-platform correlation constraints.
 
@@ -492,6 +534,7 @@ class RiskGatekeeper:
         Args:
             decision: Trade decision
             context: Portfolio context
+            batch: Decisions already approved this cycle (optional)
 
         Returns:
             Tuple (is_allowed, message)
@@ -535,13 +578,19 @@ class RiskGatekeeper:
             asset_category = decision.get("asset_category")
             if asset_category is not None:
                 holdings = context.get("holdings", {})
-                category_counts = self._count_holdings_by_category(holdings)
+                category_count = self._count_holdings_by_category(holdings).get(
+                    asset_category, 0
+                )
+                if batch is not None:
+                    category_count += batch.pending_entries(
+                        asset_category, exclude_asset=decision.get("asset_pair", "")
+                    )
                 if (
-                    category_counts.get(asset_category, 0) >= self.max_correlated_assets
+                    category_count >= self.max_correlated_assets
                     and self._is_entry_trade_action(decision)
                 ):
                     logger.warning(
-                        f"Category correlation limit: {category_counts.get(asset_category, 0)} "
+                        f"Category correlation limit: {category_count} "
                         f"assets in {asset_category} (limit: {self.max_correlated_assets})"
                     )
                     return False, "Correlation limit exceeded"
@@ -612,7 +661,7 @@ class RiskGatekeeper:
             # Note: This is warning-only, doesn't block trade
 
     def _validate_leverage_and_concentration(
-        self, decision: Dict, context: Dict
+        self, decision: Dict, context: Dict, batch: Optional[TradeBatch] = None
     ) -> Tuple[bool, str]:
         """
         Validate leverage and position concentration.
@@ -626,6 +675,8 @@ class RiskGatekeeper:
         Args:
             decision: Trade decision
             context: Portfolio context with risk_metrics and position_concentration
+            batch: Decisions already approved this cycle; their notional counts
+                as pending unless it is already reserved
 
         Returns:
             Tuple (is_allowed, message)
@@ -671,13 +722,6 @@ class RiskGatekeeper:
             "portfolio_breakdown", {}
         ).get("total_value_usd", 0)
 
-        reserved_concentration = {}
-        if portfolio_value > 0:
-            exposure_manager = get_exposure_manager()
-            reserved_concentration = exposure_manager.get_reserved_concentration(
-                portfolio_value
-            )
-
         normalized_action = str(
             decision.get("policy_action") or decision.get("action") or ""
         ).upper()
@@ -720,9 +764,19 @@ class RiskGatekeeper:
         asset_pair = decision.get("asset_pair", "UNKNOWN")
         normalized_asset_pair = str(asset_pair).upper().replace("-", "").replace("_", "")
         current_asset_pct = asset_position_pct.get(normalized_asset_pair, largest_pct if not asset_position_pct else 0.0)
-        asset_reserved_pct = reserved_concentration.get(asset_pair, 0.0)
-        if not asset_reserved_pct:
-            asset_reserved_pct = reserved_concentration.get(normalized_asset_pair, 0.0)
+        asset_reserved_pct = 0.0
+        if portfolio_value > 0:
+            # Batch decisions that were already reserved are counted once, as pending
+            batch_ids = batch.decision_ids if batch is not None else ()
+            exposure_manager = get_exposure_manager()
+            reserved_notional = exposure_manager.get_reserved_notional(
+                asset_pair, exclude=batch_ids
+            ) or exposure_manager.get_reserved_notional(
+                normalized_asset_pair, exclude=batch_ids
+            )
+            if batch is not None:
+                reserved_notional += batch.pending_notional(asset_pair)
+            asset_reserved_pct = reserved_notional / portfolio_value * 100
 
         # Calculate effective concentration for the target asset only
         # This includes existing exposure in the same asset + reserved exposure from pending trades
@@ -0,0 +1,457 @@
+"""Incrementally maintained portfolio risk state for the gatekeeper.
+
+``RiskState`` holds the open positions (futures positions and non-cash spot
+holdings) once and keeps per-category and per-platform aggregates current as
+fills and mark-to-market prices arrive, so exposure queries are O(1). ``TradeBatch`` carries the exposure of
+decisions already approved in the same cycle, so ``validate_trades`` can
+check a cycle's decisions against their combined exposure.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any, Dict, Iterable, Mapping, Optional, Set
+
+from finance_feedback_engine.decision_engine.policy_actions import (
+    get_policy_action_family,
+    is_policy_action,
+)
+from finance_feedback_engine.monitoring.context_provider import (
+    _coerce_monitoring_float,
+    _estimate_position_notional_usd,
+    _normalize_asset_key,
+)
+from finance_feedback_engine.risk.exposure_reservation import get_exposure_manager
+from finance_feedback_engine.utils.product_id import product_id_to_asset_pair
+
+logger = logging.getLogger(__name__)
+
+_FIAT_CODES = {"USD", "EUR", "GBP", "JPY", "CHF", "AUD", "CAD", "NZD"}
+# Spot balances that are cash, not exposure
+_CASH_ASSETS = _FIAT_CODES | {"USDC", "USDT", "DAI"}
+# Signed quantity change per unit for each policy action family
+_FAMILY_DIRECTION = {
+    "open_long": 1.0,
+    "add_long": 1.0,
+    "reduce_short": 1.0,
+    "close_short": 1.0,
+    "open_short": -1.0,
+    "add_short": -1.0,
+    "reduce_long": -1.0,
+    "close_long": -1.0,
+}
+_ENTRY_FAMILIES = {"open_long", "add_long", "open_short", "add_short"}
+
+
+def infer_asset_category(asset_pair: str, platform: str = "") -> str:
+    """Best-effort category: ``forex`` for Oanda/fiat pairs, else ``crypto``."""
+    raw = str(asset_pair or "").upper()
+    if "oanda" in str(platform or "").lower() or "_" in raw:
+        return "forex"
+    normalized = _normalize_asset_key(raw)
+    if len(normalized) == 6 and {normalized[:3], normalized[3:]} <= _FIAT_CODES:
+        return "forex"
+    return "crypto"
+
+
+def decision_direction(decision: Mapping[str, Any]) -> float:
+    """+1 if the decision adds long exposure, -1 if short, 0 for HOLD/unknown."""
+    raw_action = decision.get("policy_action") or decision.get("action") or "HOLD"
+    if is_policy_action(raw_action):
+        return _FAMILY_DIRECTION.get(get_policy_action_family(raw_action), 0.0)
+    return {"BUY": 1.0, "SELL": -1.0}.get(str(raw_action).upper(), 0.0)
+
+
+def is_entry_decision(decision: Mapping[str, Any]) -> bool:
+    """Whether the decision opens or adds to a position."""
+    raw_action = decision.get("policy_action") or decision.get("action") or "HOLD"
+    if is_policy_action(raw_action):
+        return get_policy_action_family(raw_action) in _ENTRY_FAMILIES
+    return str(raw_action).upper() in {"BUY", "SELL"}
+
+
+@dataclass
+class PositionState:
+    """One asset's net position. ``quantity`` is signed (negative = short)."""
+
+    asset_pair: str
+    quantity: float
+    price: float
+    category: str
+    platform: str = "unknown"
+
+    @property
+    def notional(self) -> float:
+        return abs(self.quantity) * self.price
+
+    @property
+    def side(self) -> str:
+        return "LONG" if self.quantity >= 0 else "SHORT"
+
+
+class RiskState:
+    """
+    Open positions plus running exposure aggregates.
+
+    Every mutation replaces one asset's ``PositionState`` and adjusts the
+    aggregates by the difference, so updates cost O(1) per asset and
+    queries never rescan the portfolio. Thread-safe.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._positions: Dict[str, PositionState] = {}
+        self._exposure_by_category: Dict[str, float] = {}
+        self._count_by_category: Dict[str, int] = {}
+        self._exposure_by_platform: Dict[str, float] = {}
+        self._count_by_platform: Dict[str, int] = {}
+        self._long_exposure = 0.0
+        self._short_exposure = 0.0
+        self.account_value = 0.0
+        self.updated_at: Optional[datetime] = None
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def sync_positions(
+        self, positions: Iterable[Mapping[str, Any]], account_value: float
+    ) -> None:
+        """Rebuild from position payloads (futures-position dict shape)."""
+        with self._lock:
+            for key in list(self._positions):
+                self._replace(key, None)
+            for payload in positions:
+                position = self._position_from_payload(payload)
+                if position is None:
+                    continue
+                key = _normalize_asset_key(position.asset_pair)
+                existing = self._positions.get(key)
+                if existing is not None:
+                    position.quantity += existing.quantity
+                self._replace(key, position)
+            self.account_value = max(float(account_value or 0.0), 0.0)
+            self._touch()
+
+    def sync_snapshot(self, snapshot) -> None:
+        """Rebuild from a monitoring ``PortfolioSnapshot`` (futures and spot)."""
+        self.sync_positions(
+            [*snapshot.futures_positions, *_spot_position_payloads(snapshot.holdings)],
+            _portfolio_account_value(snapshot.portfolio),
+        )
+
+    def apply_fill(
+        self,
+        asset_pair: str,
+        quantity: float,
+        price: float,
+        category: Optional[str] = None,
+        platform: Optional[str] = None,
+    ) -> None:
+        """Apply a fill of signed ``quantity`` (positive buys) at ``price``."""
+        key = _normalize_asset_key(asset_pair)
+        with self._lock:
+            existing = self._positions.get(key)
+            new_quantity = quantity + (existing.quantity if existing else 0.0)
+            if abs(new_quantity) < 1e-12:
+                self._replace(key, None)
+            else:
+                self._replace(
+                    key,
+                    PositionState(
+                        asset_pair=existing.asset_pair if existing else key,
+                        quantity=new_quantity,
+                        price=(
+                            price
+                            if price > 0
+                            else (existing.price if existing else 0.0)
+                        ),
+                        category=category
+                        or (
+                            existing.category
+                            if existing
+                            else infer_asset_category(asset_pair, platform or "")
+                        ),
+                        platform=platform
+                        or (existing.platform if existing else "unknown"),
+                    ),
+                )
+            self._touch()
+
+    def apply_decision_fill(self, decision: Mapping[str, Any]) -> None:
+        """Apply an executed decision using its size and entry price."""
+        direction = decision_direction(decision)
+        size = _coerce_monitoring_float(decision.get("recommended_position_size"), 0.0)
+        price = _coerce_monitoring_float(decision.get("entry_price"), 0.0)
+        if size <= 0 and price > 0:
+            size = (
+                _coerce_monitoring_float(decision.get("suggested_amount"), 0.0) / price
+            )
+        if not direction or size <= 0:
+            return
+        self.apply_fill(
+            str(decision.get("asset_pair") or ""),
+            direction * size,
+            price,
+            category=decision.get("asset_category"),
+            platform=decision.get("platform"),
+        )
+
+    def mark_to_market(self, prices: Mapping[str, float]) -> None:
+        """Reprice held assets; unknown assets and non-positive prices are ignored."""
+        with self._lock:
+            for asset_pair, price in prices.items():
+                key = _normalize_asset_key(asset_pair)
+                existing = self._positions.get(key)
+                if existing is None or not price or price <= 0:
+                    continue
+                self._replace(
+                    key,
+                    PositionState(
+                        asset_pair=existing.asset_pair,
+                        quantity=existing.quantity,
+                        price=float(price),
+                        category=existing.category,
+                        platform=existing.platform,
+                    ),
+                )
+            self._touch()
+
+    def set_account_value(self, account_value: float) -> None:
+        with self._lock:
+            self.account_value = max(float(account_value or 0.0), 0.0)
+            self._touch()
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def position(self, asset_pair: str) -> Optional[PositionState]:
+        return self._positions.get(_normalize_asset_key(asset_pair))
+
+    def exposure(self, asset_pair: str) -> float:
+        position = self.position(asset_pair)
+        return position.notional if position else 0.0
+
+    def category_count(self, category: str) -> int:
+        return self._count_by_category.get(category, 0)
+
+    def category_counts(self) -> Dict[str, int]:
+        return dict(self._count_by_category)
+
+    def exposure_by_category(self, category: str) -> float:
+        return self._exposure_by_category.get(category, 0.0)
+
+    def exposure_by_platform(self, platform: str) -> float:
+        return self._exposure_by_platform.get(str(platform).lower(), 0.0)
+
+    @property
+    def gross_exposure(self) -> float:
+        return self._long_exposure + self._short_exposure
+
+    @property
+    def net_exposure(self) -> float:
+        return self._long_exposure - self._short_exposure
+
+    @property
+    def leverage(self) -> float:
+        return (
+            self.gross_exposure / self.account_value if self.account_value > 0 else 0.0
+        )
+
+    def concentration_pct(
+        self,
+        asset_pair: str,
+        include_reserved: bool = True,
+        pending_notional: float = 0.0,
+        exclude_reservations: Iterable[str] = (),
+    ) -> float:
+        """Position plus reserved/pending notional as % of account value."""
+        if self.account_value <= 0:
+            return 0.0
+        notional = self.exposure(asset_pair) + pending_notional
+        if include_reserved:
+            exclude = tuple(exclude_reservations)
+            manager = get_exposure_manager()
+            notional += manager.get_reserved_notional(
+                asset_pair, exclude=exclude
+            ) or manager.get_reserved_notional(
+                _normalize_asset_key(asset_pair), exclude=exclude
+            )
+        return notional / self.account_value * 100
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _touch(self) -> None:
+        self.updated_at = datetime.now(UTC)
+
+    def _replace(self, key: str, position: Optional[PositionState]) -> None:
+        """Swap one asset's position and adjust the aggregates (lock held)."""
+        old = self._positions.pop(key, None)
+        if old is not None:
+            self._account(key, old, -1)
+        if position is not None and position.quantity:
+            self._positions[key] = position
+            self._account(key, position, 1)
+
+    def _account(self, key: str, position: PositionState, sign: int) -> None:
+        notional = position.notional
+        _bump(
+            self._exposure_by_category,
+            self._count_by_category,
+            position.category,
+            notional,
+            sign,
+        )
+        _bump(
+            self._exposure_by_platform,
+            self._count_by_platform,
+            position.platform.lower(),
+            notional,
+            sign,
+        )
+        if position.quantity > 0:
+            self._long_exposure = max(self._long_exposure + sign * notional, 0.0)
+        else:
+            self._short_exposure = max(self._short_exposure + sign * notional, 0.0)
+        if not self._positions:
+            self._long_exposure = self._short_exposure = 0.0
+
+    @staticmethod
+    def _position_from_payload(payload: Mapping[str, Any]) -> Optional[PositionState]:
+        raw_id = ""
+        for field_name in ("asset_pair", "product_id", "instrument", "symbol", "asset"):
+            raw_id = str(payload.get(field_name) or "").strip()
+            if raw_id:
+                break
+        contracts = abs(
+            _coerce_monitoring_float(
+                payload.get("contracts")
+                or payload.get("number_of_contracts")
+                or payload.get("units")
+                or payload.get("amount")
+                or payload.get("size")
+                or payload.get("quantity")
+                or payload.get("balance"),
+                0.0,
+            )
+        )
+        # Same count the notional estimate uses, whichever field carried it
+        notional = _estimate_position_notional_usd({**payload, "contracts": contracts})
+        if not raw_id or notional <= 0:
+            return None
+        asset_pair = product_id_to_asset_pair(raw_id.upper()) or _normalize_asset_key(
+            raw_id
+        )
+        contract_size = _coerce_monitoring_float(
+            payload.get("contract_size") or payload.get("contract_multiplier"), 1.0
+        )
+        quantity = contracts * (contract_size if contract_size > 0 else 1.0)
+        side = str(payload.get("side", "LONG")).upper()
+        platform = str(payload.get("platform") or "unknown")
+        return PositionState(
+            asset_pair=asset_pair,
+            quantity=-quantity if side in {"SHORT", "SELL"} else quantity,
+            price=notional / quantity if quantity > 0 else 0.0,
+            category=str(
+                payload.get("asset_category") or infer_asset_category(raw_id, platform)
+            ),
+            platform=platform,
+        )
+
+
+def _bump(
+    exposure: Dict[str, float],
+    counts: Dict[str, int],
+    key: str,
+    notional: float,
+    sign: int,
+) -> None:
+    count = counts.get(key, 0) + sign
+    if count > 0:
+        counts[key] = count
+        exposure[key] = exposure.get(key, 0.0) + sign * notional
+    else:
+        # Drop the key rather than leave float residue behind
+        counts.pop(key, None)
+        exposure.pop(key, None)
+
+
+def _spot_position_payloads(holdings: Iterable[Mapping[str, Any]]) -> list:
+    """Spot holdings (``{"asset": "BTC", "balance": ...}``) as long positions.
+
+    Cash balances (fiat, stablecoins) are skipped; a bare currency code is
+    quoted in USD so ``BTC`` keys the same as ``BTCUSD`` fills.
+    """
+    payloads = []
+    for holding in holdings or ():
+        asset = str(holding.get("asset") or holding.get("currency") or "").upper()
+        if not asset or asset in _CASH_ASSETS:
+            continue
+        payloads.append(
+            {
+                **holding,
+                "asset_pair": holding.get("asset_pair") or f"{asset}USD",
+                "side": "LONG",
+            }
+        )
+    return payloads
+
+
+def _portfolio_account_value(portfolio: Mapping[str, Any]) -> float:
+    total_value = _coerce_monitoring_float(portfolio.get("total_value_usd"), 0.0)
+    if total_value > 0:
+        return total_value
+    for breakdown in (portfolio.get("platform_breakdowns") or {}).values():
+        if not isinstance(breakdown, dict):
+            continue
+        summary = breakdown.get("futures_summary") or {}
+        total_value += _coerce_monitoring_float(
+            breakdown.get("total_value_usd") or summary.get("total_balance_usd"), 0.0
+        )
+    return total_value
+
+
+@dataclass
+class TradeBatch:
+    """Exposure of decisions approved so far in one validation cycle."""
+
+    notional_by_asset: Dict[str, float] = field(default_factory=dict)
+    entry_assets_by_category: Dict[str, Set[str]] = field(default_factory=dict)
+    decision_ids: Set[str] = field(default_factory=set)
+
+    def add(self, decision: Mapping[str, Any]) -> None:
+        """Record an approved decision's exposure."""
+        from finance_feedback_engine.agent.trade_execution_safety import (
+            DecisionReservationPayload,
+        )
+
+        payload = DecisionReservationPayload.from_decision(dict(decision))
+        if payload.decision_id:
+            self.decision_ids.add(payload.decision_id)
+        if not is_entry_decision(decision):
+            return
+        key = _normalize_asset_key(payload.asset_pair)
+        self.notional_by_asset[key] = self.notional_by_asset.get(key, 0.0) + abs(
+            payload.notional_value
+        )
+        category = decision.get("asset_category")
+        if category is not None:
+            self.entry_assets_by_category.setdefault(category, set()).add(key)
+
+    def pending_notional(self, asset_pair: str) -> float:
+        return self.notional_by_asset.get(_normalize_asset_key(asset_pair), 0.0)
+
+    def pending_entries(self, category: str, exclude_asset: str = "") -> int:
+        """Distinct assets in ``category`` entered by this batch, excluding one."""
+        assets = self.entry_assets_by_category.get(category, set())
+        return len(assets - {_normalize_asset_key(exclude_asset)})
+
+    @property
+    def total_notional(self) -> float:
+        return sum(self.notional_by_asset.values())
@@ -7,6 +7,7 @@ from typing import Any, Dict, List, Optional
 
 from ..exceptions import TradingError
 from ..observability.context import get_trace_headers
+from ..utils.http_transport import get_http_transport
 from .base_platform import BaseTradingPlatform, PositionInfo, PositionsResponse
 from .retry_handler import standardize_platform_error
 from finance_feedback_engine.decision_engine.policy_actions import get_legacy_action_compatibility, get_policy_action_family, is_policy_action
@@ -97,6 +98,9 @@ class OandaPlatform(BaseTradingPlatform):
                 self._client = API(
                     access_token=self.api_key, environment=self.environment
                 )
+                # Share the pooled keep-alive transport (and its per-host metrics)
+                if hasattr(self._client, "client"):
+                    get_http_transport().mount(self._client.client)
                 # Inject correlation ID headers if client has requests session
                 if hasattr(self._client, "session"):
                     try:
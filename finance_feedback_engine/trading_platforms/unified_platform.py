@@ -1,7 +1,11 @@
 """Unified trading platform to manage multiple accounts."""
 
+import copy
 import logging
-from typing import Any, Dict, List
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 
 from finance_feedback_engine.utils.asset_classifier import classify_asset_pair
@@ -17,6 +21,69 @@ from .oanda_platform import OandaPlatform
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_PLATFORM_TIMEOUT_SECONDS = 10.0
+DEFAULT_PORTFOLIO_CACHE_TTL_SECONDS = 2.0
+_PLATFORM_POOL_WORKERS = 8
+
+_platform_pool: Optional[ThreadPoolExecutor] = None
+_platform_pool_lock = threading.Lock()
+
+
+def _get_platform_pool() -> ThreadPoolExecutor:
+    """Worker pool shared by every unified platform for sub-platform reads."""
+    global _platform_pool
+    with _platform_pool_lock:
+        if _platform_pool is None:
+            _platform_pool = ThreadPoolExecutor(
+                max_workers=_PLATFORM_POOL_WORKERS, thread_name_prefix="ffe-platform"
+            )
+        return _platform_pool
+
+
+class _SingleFlightCache:
+    """Short-TTL cache where concurrent misses for a key share one call.
+
+    Callers get deep copies, since aggregated payloads are mutated downstream.
+    """
+
+    def __init__(self, ttl_seconds: float):
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Tuple[float, Any]] = {}
+        self._inflight: Dict[str, Future] = {}
+
+    def get(self, key: str, loader: Callable[[], Tuple[Any, bool]]) -> Any:
+        """Return the cached value or load it; ``loader`` returns (value, cacheable)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] < self.ttl_seconds:
+                return copy.deepcopy(entry[1])
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+
+        if not owner:
+            return copy.deepcopy(future.result())
+
+        try:
+            value, cacheable = loader()
+        except BaseException as e:
+            with self._lock:
+                self._inflight.pop(key, None)
+            future.set_exception(e)
+            raise
+        with self._lock:
+            self._inflight.pop(key, None)
+            if cacheable and self.ttl_seconds > 0:
+                self._entries[key] = (time.monotonic(), value)
+        future.set_result(value)
+        return copy.deepcopy(value)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
 
 class UnifiedTradingPlatform(BaseTradingPlatform):
     """
@@ -41,6 +108,22 @@ class UnifiedTradingPlatform(BaseTradingPlatform):
         # transient upstream/auth/network failures.
         self._last_good_balances: Dict[str, Dict[str, float]] = {}
 
+        # Sub-platform reads fan out concurrently; a timed-out platform is left
+        # out of the result instead of holding up the others.
+        aggregation_config = self.config.get("portfolio_aggregation", {}) or {}
+        self._platform_timeout = float(
+            aggregation_config.get(
+                "platform_timeout_seconds", DEFAULT_PLATFORM_TIMEOUT_SECONDS
+            )
+        )
+        self._read_cache = _SingleFlightCache(
+            float(
+                aggregation_config.get(
+                    "cache_ttl_seconds", DEFAULT_PORTFOLIO_CACHE_TTL_SECONDS
+                )
+            )
+        )
+
         # Support both 'coinbase' and 'coinbase_advanced' keys
         coinbase_creds = credentials.get("coinbase") or credentials.get(
             "coinbase_advanced"
@@ -152,25 +235,68 @@ class UnifiedTradingPlatform(BaseTradingPlatform):
             return [(active_name, self.platforms[active_name])]
         return list(self.platforms.items())
 
+    def _fan_out(self, method: str) -> List[Tuple[str, BaseTradingPlatform, Callable[[], Any]]]:
+        """Start ``method`` on every telemetry platform at once.
+
+        Returns ``(name, platform, result)`` where ``result()`` waits for that
+        platform until the shared deadline and raises ``TimeoutError`` past it.
+        A single platform is called inline.
+        """
+        platforms = self._iter_portfolio_telemetry_platforms()
+        if len(platforms) <= 1:
+            return [
+                (name, platform, getattr(platform, method))
+                for name, platform in platforms
+            ]
+
+        pool = _get_platform_pool()
+        deadline = time.monotonic() + self._platform_timeout
+        calls = []
+        for name, platform in platforms:
+            future = pool.submit(getattr(platform, method))
+
+            def result(future=future, name=name):
+                try:
+                    return future.result(timeout=max(0.0, deadline - time.monotonic()))
+                except TimeoutError:
+                    raise TimeoutError(
+                        f"{name}.{method} did not finish within {self._platform_timeout}s"
+                    ) from None
+
+            calls.append((name, platform, result))
+        return calls
+
+    def invalidate_cache(self) -> None:
+        """Drop cached balance/position/portfolio reads (e.g. after a trade)."""
+        self._read_cache.invalidate()
+
     def get_balance(self) -> Dict[str, float]:
         """
         Get combined account balances from all configured platforms.
 
+        Platforms are queried concurrently and concurrent callers within the
+        cache TTL share one fetch.
+
         Returns:
             Dictionary mapping asset symbols to balances, prefixed with
             platform name. e.g., {'coinbase_FUTURES_USD': 1000.0,
             'oanda_USD': 50000.0}
         """
+        return self._read_cache.get("balance", self._load_balance)
+
+    def _load_balance(self) -> Tuple[Dict[str, float], bool]:
         combined_balances = {}
-        for name, platform in self._iter_portfolio_telemetry_platforms():
+        complete = True
+        for name, platform, result in self._fan_out("get_balance"):
             try:
-                balances = platform.get_balance() or {}
+                balances = result() or {}
                 if balances:
                     # Keep a per-platform last known-good snapshot for fail-closed context continuity
                     self._last_good_balances[name] = dict(balances)
                 for asset, balance in balances.items():
                     combined_balances[f"{name}_{asset}"] = balance
             except ConnectionError as e:
+                complete = False
                 logger.error(
                     "Connection error getting balance from platform",
                     extra={
@@ -191,6 +317,7 @@ class UnifiedTradingPlatform(BaseTradingPlatform):
                         combined_balances[f"{name}_{asset}"] = balance
                 # TODO: Alert on repeated platform connection failures (THR-XXX)
             except (ValueError, TypeError, KeyError) as e:
+                complete = False
                 logger.error(
                     "Data validation error getting balance from platform",
                     extra={
@@ -210,6 +337,7 @@ class UnifiedTradingPlatform(BaseTradingPlatform):
                         combined_balances[f"{name}_{asset}"] = balance
                 # TODO: Track data validation errors for platform health monitoring (THR-XXX)
             except TradingError as e:
+                complete = False
                 logger.warning(
                     "Trading error getting balance from platform; using cached snapshot when available",
                     extra={
@@ -228,6 +356,7 @@ class UnifiedTradingPlatform(BaseTradingPlatform):
                     for asset, balance in cached.items():
                         combined_balances[f"{name}_{asset}"] = balance
             except Exception as e:
+                complete = False
                 logger.error(
                     "Unexpected error getting balance from platform",
                     extra={
@@ -248,7 +377,7 @@ class UnifiedTradingPlatform(BaseTradingPlatform):
                         combined_balances[f"{name}_{asset}"] = balance
                 # TODO: Alert on unknown platform errors (THR-XXX)
 
-        return combined_balances
+        return combined_balances, complete
 
     def execute_trade(self, decision: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -296,7 +425,10 @@ class UnifiedTradingPlatform(BaseTradingPlatform):
                     setattr(target_platform, "_execute_breaker", cb)
 
             # Use breaker for sync execution path
-            result = cb.call_sync(target_platform.execute_trade, decision)
+            try:
+                result = cb.call_sync(target_platform.execute_trade, decision)
+            finally:
+                self.invalidate_cache()
             # Emit circuit breaker state metric (low cardinality)
             try:
                 from finance_feedback_engine.monitoring.prometheus import (
@@ -346,16 +478,21 @@ class UnifiedTradingPlatform(BaseTradingPlatform):
             by a dictionary with details like instrument, units, PnL, etc.
             Each position will also include a 'platform' key indicating its source.
         """
+        return self._read_cache.get("positions", self._load_active_positions)
+
+    def _load_active_positions(self) -> Tuple[PositionsResponse, bool]:
         all_positions: List[PositionInfo] = []
-        for name, platform_instance in self._iter_portfolio_telemetry_platforms():
+        complete = True
+        for name, platform_instance, result in self._fan_out("get_active_positions"):
             try:
                 # Call get_active_positions on the sub-platform
-                platform_positions_data = platform_instance.get_active_positions()
+                platform_positions_data = result()
                 for pos in platform_positions_data.get("positions", []):
                     # Add platform name to each position for context in CLI display
                     pos["platform"] = name
                     all_positions.append(pos)
             except ConnectionError as e:
+                complete = False
                 logger.error(
                     "Connection error fetching active positions from platform",
                     extra={
@@ -369,6 +506,7 @@ class UnifiedTradingPlatform(BaseTradingPlatform):
                 # Continue with other platforms - fail-safe mode
                 # TODO: Alert when position fetching fails (THR-XXX)
             except (ValueError, TypeError, KeyError) as e:
+                complete = False
                 logger.error(
                     "Data validation error fetching active positions",
                     extra={
@@ -381,6 +519,7 @@ class UnifiedTradingPlatform(BaseTradingPlatform):
                 # Continue with other platforms
                 # TODO: Track validation errors for platform health (THR-XXX)
             except Exception as e:
+                complete = False
                 logger.error(
                     "Unexpected error fetching active positions from platform",
                     extra={
@@ -393,14 +532,19 @@ class UnifiedTradingPlatform(BaseTradingPlatform):
                 )
                 # Continue with other platforms - fail-safe mode
                 # TODO: Alert on unknown platform errors (THR-XXX)
-        return {"positions": all_positions}
+        return {"positions": all_positions}, complete
 
     def get_portfolio_breakdown(self) -> Dict[str, Any]:
         """
         Get a combined portfolio breakdown from all platforms.
 
         Merges portfolio data from Coinbase (futures) and Oanda (forex).
+        Platforms are queried concurrently; one that fails or times out is
+        left out of the totals.
         """
+        return self._read_cache.get("portfolio", self._load_portfolio_breakdown)
+
+    def _load_portfolio_breakdown(self) -> Tuple[Dict[str, Any], bool]:
         total_value_usd = 0
         total_unrealized = 0.0
         all_holdings = []
@@ -408,12 +552,13 @@ class UnifiedTradingPlatform(BaseTradingPlatform):
         cash_balances = {}
         futures_value_usd = 0
         spot_value_usd = 0
+        complete = True
 
         platform_breakdowns = {}
 
-        for name, platform in self._iter_portfolio_telemetry_platforms():
+        for name, platform, result in self._fan_out("get_portfolio_breakdown"):
             try:
-                breakdown = platform.get_portfolio_breakdown()
+                breakdown = result()
                 platform_breakdowns[name] = breakdown
 
                 total_value_usd += breakdown.get("total_value_usd", 0)
@@ -442,7 +587,11 @@ class UnifiedTradingPlatform(BaseTradingPlatform):
 
             except (ValueError, TypeError, KeyError, AttributeError) as e:
                 # Added AttributeError for None returns
+                complete = False
                 logger.error("Failed to get portfolio breakdown from %s: %s", name, e)
+            except TimeoutError as e:
+                complete = False
+                logger.warning("Partial portfolio breakdown: %s", e)
 
         # Recalculate allocation percentages across the entire portfolio.
         # Use total notional exposure (sum of all holdings' values) rather
@@ -471,7 +620,7 @@ class UnifiedTradingPlatform(BaseTradingPlatform):
             "holdings": all_holdings,
             "platform_breakdowns": platform_breakdowns,
             "unrealized_pnl": total_unrealized,
-        })
+        }), complete
 
     async def aget_portfolio_breakdown(self) -> Dict[str, Any]:
         """
@@ -574,6 +723,7 @@ class UnifiedTradingPlatform(BaseTradingPlatform):
 
     def update_position_prices(self, price_updates: Dict[str, float]) -> None:
         """Forward mark-to-market updates to sub-platforms, especially paper/mock."""
+        self.invalidate_cache()
         for name, platform in self.platforms.items():
             try:
                 platform.update_position_prices(price_updates)
@@ -3,7 +3,6 @@ import logging
 from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional
 
-import requests
 from requests.exceptions import HTTPError, RequestException, Timeout
 from tenacity import (
     retry,
@@ -12,6 +11,7 @@ from tenacity import (
     wait_exponential,
 )
 
+from .http_transport import get_http_transport
 from .rate_limiter import RateLimiter
 
 logger = logging.getLogger(__name__)
@@ -146,7 +146,7 @@ class APIClientBase(ABC):
                     f"Sending {method} request to {url} with params={params}, data={data}, json={json_data}"
                 )
 
-                response = requests.request(
+                response = get_http_transport().request(
                     method,
                     url,
                     params=params,
@@ -0,0 +1,79 @@
+"""A long-lived event loop on a daemon thread for calling async code from sync code.
+
+``asyncio.run`` per call builds and tears down a loop (and, from inside a
+running loop, needs a throwaway thread as well). Clients such as aiohttp
+sessions are bound to the loop that created them, so they cannot outlive
+it either. ``BackgroundEventLoop`` keeps one loop alive so those clients
+can be reused across calls.
+"""
+
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Coroutine, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class BackgroundEventLoop:
+    """Runs coroutines on a dedicated loop thread, started on first use."""
+
+    def __init__(self, name: str = "ffe-background-loop"):
+        self.name = name
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """The loop, starting its thread if needed."""
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._loop.run_forever, name=self.name, daemon=True
+                )
+                self._thread.start()
+            return self._loop
+
+    def is_current(self) -> bool:
+        """True when called from code already running on this loop."""
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def submit(self, coro: Coroutine[Any, Any, T]) -> "Future[T]":
+        """Schedule ``coro`` and return a thread-safe future."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+        """Run ``coro`` to completion and return its result (blocking)."""
+        if self.is_current():
+            coro.close()
+            raise RuntimeError(f"{self.name}: run() would deadlock on its own loop")
+        return self.submit(coro).result(timeout)
+
+    async def run_async(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Await ``coro`` on this loop from any other loop."""
+        if self.is_current():
+            return await coro
+        return await asyncio.wrap_future(self.submit(coro))
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Stop the loop and join its thread. Safe to call more than once."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None or loop.is_closed():
+            return
+        loop.call_soon_threadsafe(loop.stop)
+        if thread is not None:
+            thread.join(timeout)
+        if thread is None or not thread.is_alive():
+            loop.close()
+        else:
+            logger.warning(f"{self.name} did not stop within {timeout}s")
@@ -0,0 +1,250 @@
+"""Shared, connection-pooled HTTP transport for exchange and data-provider calls.
+
+Every provider that talks to the same host reuses one keep-alive connection
+pool instead of paying TCP/TLS setup on each ``requests.get``. Pool sizes are
+configurable; per-host latency and connection reuse are tracked so slow or
+churning endpoints show up in metrics.
+
+The transport optionally runs a request through a caller's
+:class:`RateLimiter` and :class:`CircuitBreaker`, so providers keep their own
+limits while sharing connections.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .circuit_breaker import CircuitBreaker
+from .rate_limiter import RateLimiter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_POOL_CONNECTIONS = 16  # Distinct hosts kept pooled
+DEFAULT_POOL_MAXSIZE = 10  # Keep-alive connections per host
+DEFAULT_TIMEOUT = 10.0
+
+
+@dataclass
+class HostMetrics:
+    """Request latency and error counts for one host."""
+
+    requests: int = 0
+    errors: int = 0
+    total_latency: float = 0.0
+    max_latency: float = 0.0
+    recent_latencies: Deque[float] = field(default_factory=lambda: deque(maxlen=512))
+
+    def record(self, latency: float, error: bool) -> None:
+        self.requests += 1
+        self.errors += int(error)
+        self.total_latency += latency
+        self.max_latency = max(self.max_latency, latency)
+        self.recent_latencies.append(latency)
+
+
+class MeteredHTTPAdapter(HTTPAdapter):
+    """``HTTPAdapter`` that times every request per host."""
+
+    def __init__(self, *args, **kwargs):
+        self._host_metrics: Dict[str, HostMetrics] = {}
+        self._metrics_lock = threading.Lock()
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, *args, **kwargs):
+        host = urlsplit(request.url).netloc
+        started = time.perf_counter()
+        error = True
+        try:
+            response = super().send(request, *args, **kwargs)
+            error = response.status_code >= 500
+            return response
+        finally:
+            elapsed = time.perf_counter() - started
+            with self._metrics_lock:
+                self._host_metrics.setdefault(host, HostMetrics()).record(
+                    elapsed, error
+                )
+
+    def host_metrics(self) -> Dict[str, HostMetrics]:
+        with self._metrics_lock:
+            return dict(self._host_metrics)
+
+    def pool_counts(self) -> Dict[str, Dict[str, int]]:
+        """Connections opened vs requests served by each live host pool."""
+        counts: Dict[str, Dict[str, int]] = {}
+        pools = self.poolmanager.pools
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            host = (
+                pool.host
+                if pool.port in (None, 80, 443)
+                else f"{pool.host}:{pool.port}"
+            )
+            entry = counts.setdefault(
+                host, {"connections_opened": 0, "pooled_requests": 0}
+            )
+            entry["connections_opened"] += pool.num_connections
+            entry["pooled_requests"] += pool.num_requests
+        return counts
+
+
+class HTTPTransport:
+    """Pooled ``requests.Session`` with per-host metrics.
+
+    Example:
+        transport = get_http_transport()
+        response = transport.get(url, params=params, rate_limiter=limiter,
+                                 circuit_breaker=breaker)
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        max_retries: int = 0,
+        timeout: float = DEFAULT_TIMEOUT,
+    ):
+        """
+        Args:
+            pool_connections: Number of hosts whose pools are kept alive
+            pool_maxsize: Keep-alive connections per host
+            max_retries: Connection-level retries (urllib3); request retries
+                stay with the callers
+            timeout: Default timeout applied when a call does not pass one
+        """
+        self.timeout = timeout
+        self.settings = {
+            "pool_connections": pool_connections,
+            "pool_maxsize": pool_maxsize,
+            "max_retries": max_retries,
+            "timeout": timeout,
+        }
+        self.adapter = MeteredHTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            max_retries=max_retries,
+        )
+        self.session = requests.Session()
+        self.mount(self.session)
+
+    def mount(self, session: requests.Session) -> requests.Session:
+        """Route another session (e.g. a vendor SDK's) through the shared pools."""
+        session.mount("https://", self.adapter)
+        session.mount("http://", self.adapter)
+        return session
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        rate_limiter: Optional[RateLimiter] = None,
+        circuit_breaker: Optional[CircuitBreaker] = None,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """Send a request over the pooled session.
+
+        Args:
+            method: HTTP method
+            url: Absolute URL
+            rate_limiter: Optional limiter to take a token from first
+            circuit_breaker: Optional breaker the request runs under
+            **kwargs: Passed to ``requests.Session.request``
+
+        Returns:
+            The response (status is not checked)
+        """
+        kwargs.setdefault("timeout", self.timeout)
+        if rate_limiter is not None:
+            rate_limiter.wait_for_token()
+        if circuit_breaker is not None:
+            return circuit_breaker.call_sync(
+                self.session.request, method, url, **kwargs
+            )
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def get_metrics(self) -> Dict[str, Dict[str, Any]]:
+        """Per-host latency (ms), error and connection reuse statistics."""
+        pool_counts = self.adapter.pool_counts()
+        metrics: Dict[str, Dict[str, Any]] = {}
+        for host, stats in self.adapter.host_metrics().items():
+            recent = sorted(stats.recent_latencies)
+            p95 = (
+                recent[min(len(recent) - 1, int(len(recent) * 0.95))] if recent else 0.0
+            )
+            pooled = pool_counts.get(host, {})
+            opened = pooled.get("connections_opened", 0)
+            served = pooled.get("pooled_requests", 0)
+            metrics[host] = {
+                "requests": stats.requests,
+                "errors": stats.errors,
+                "avg_latency_ms": 1000 * stats.total_latency / max(stats.requests, 1),
+                "p95_latency_ms": 1000 * p95,
+                "max_latency_ms": 1000 * stats.max_latency,
+                "connections_opened": opened,
+                "connections_reused": max(served - opened, 0),
+            }
+        return metrics
+
+    def close(self) -> None:
+        """Close all pooled connections."""
+        self.session.close()
+
+
+_transport: Optional[HTTPTransport] = None
+_transport_lock = threading.Lock()
+
+
+def get_http_transport() -> HTTPTransport:
+    """Return the process-wide shared transport, creating it on first use."""
+    global _transport
+    if _transport is None:
+        with _transport_lock:
+            if _transport is None:
+                _transport = HTTPTransport()
+    return _transport
+
+
+def shared_transport_metrics() -> Dict[str, Dict[str, Any]]:
+    """Metrics of the shared transport, or ``{}`` if nothing has used it yet."""
+    transport = _transport
+    return transport.get_metrics() if transport is not None else {}
+
+
+def configure_http_transport(**kwargs: Any) -> HTTPTransport:
+    """Replace the shared transport, e.g. with larger pools from config.
+
+    Providers created afterwards pick up the new transport; existing ones
+    keep the instance they were built with. Re-applying the current settings
+    (e.g. one engine per optimizer trial) keeps the existing pools.
+    """
+    global _transport
+    with _transport_lock:
+        current = _transport
+        requested = {
+            "pool_connections": DEFAULT_POOL_CONNECTIONS,
+            "pool_maxsize": DEFAULT_POOL_MAXSIZE,
+            "max_retries": 0,
+            "timeout": DEFAULT_TIMEOUT,
+            **kwargs,
+        }
+        if current is not None and current.settings == requested:
+            return current
+        previous, _transport = current, HTTPTransport(**kwargs)
+    if previous is not None:
+        previous.close()
+    return _transport
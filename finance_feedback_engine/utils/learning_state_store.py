@@ -0,0 +1,193 @@
+"""
+Coalesced persistence for learning state (bandit stats, provider history).
+
+Learning components used to rewrite their whole JSON file after every
+outcome, which turns a backtest or outcome replay into thousands of full
+rewrites. ``LearningStateStore`` keeps the owner's in-memory state as the
+source of truth and persists it in two layers:
+
+- each update is appended as a small delta line to ``<file>.delta.jsonl``,
+  so an unexpected exit loses nothing;
+- the full snapshot is rewritten atomically only when enough updates have
+  accumulated or enough time has passed since the last snapshot, and once
+  more at interpreter shutdown. A snapshot truncates the delta log.
+
+Deltas are "set value at path" operations, so replaying a log on top of a
+snapshot that already contains it is harmless.
+
+Usage:
+    store = LearningStateStore("data/stats.json", snapshot=lambda: state)
+    state = store.load()
+    store.record((("providers", "local"), {"alpha": 2, "beta": 1}))
+"""
+
+import atexit
+import json
+import logging
+import threading
+import time
+import weakref
+from pathlib import Path
+from typing import Any, Callable, Optional, Sequence, Tuple, Union
+
+from finance_feedback_engine.utils.file_io import FileIOError, FileIOManager
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FLUSH_INTERVAL_SECONDS = 5.0
+DEFAULT_FLUSH_EVERY = 50
+
+DeltaOp = Tuple[Sequence[str], Any]
+
+_open_stores: "weakref.WeakSet[LearningStateStore]" = weakref.WeakSet()
+
+
+def _apply_op(state: Any, path: Sequence[str], value: Any) -> Any:
+    if not path:
+        return value
+    if not isinstance(state, dict):
+        state = {}
+    node = state
+    for key in path[:-1]:
+        child = node.get(key)
+        if not isinstance(child, dict):
+            child = node[key] = {}
+        node = child
+    node[path[-1]] = value
+    return state
+
+
+class LearningStateStore:
+    """Snapshot file plus append-only delta log with coalesced snapshots."""
+
+    def __init__(
+        self,
+        path: Union[str, Path],
+        snapshot: Callable[[], Any],
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        flush_every: int = DEFAULT_FLUSH_EVERY,
+        file_io: Optional[FileIOManager] = None,
+    ):
+        """
+        Args:
+            path: Snapshot JSON file
+            snapshot: Returns the owner's full state for a snapshot write
+            flush_interval_seconds: Snapshot when the last one is older than this
+            flush_every: Snapshot after this many unflushed updates
+            file_io: FileIOManager used for reads and atomic writes
+        """
+        self.path = Path(path)
+        self.delta_path = self.path.with_name(self.path.name + ".delta.jsonl")
+        self.flush_interval_seconds = max(0.0, float(flush_interval_seconds))
+        self.flush_every = max(1, int(flush_every))
+        self.file_io = file_io or FileIOManager()
+        self._snapshot = snapshot
+        self._lock = threading.RLock()
+        self._pending = 0
+        self._last_flush: Optional[float] = None
+        _open_stores.add(self)
+
+    @property
+    def dirty(self) -> bool:
+        """True when the delta log holds updates not yet in the snapshot."""
+        return self._pending > 0
+
+    def load(self, default: Any = None) -> Any:
+        """Read the snapshot and replay any delta log written after it.
+
+        Raises:
+            FileIOError: If the snapshot exists but cannot be read
+        """
+        with self._lock:
+            state = self.file_io.read_json(
+                self.path, default={} if default is None else default
+            )
+            replayed = 0
+            try:
+                with open(self.delta_path, "r", encoding="utf-8") as f:
+                    for line in f:
+                        try:
+                            ops = json.loads(line)["set"]
+                        except (ValueError, KeyError, TypeError):
+                            # A torn final line from an interrupted append
+                            continue
+                        for path, value in ops:
+                            state = _apply_op(state, path, value)
+                        replayed += 1
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.warning(f"Could not replay delta log {self.delta_path}: {e}")
+
+            if replayed:
+                logger.info(
+                    f"Replayed {replayed} learning-state updates from {self.delta_path}"
+                )
+            self._pending = replayed
+            return state
+
+    def record(self, *ops: DeltaOp) -> None:
+        """Append one update and snapshot if the flush policy says so.
+
+        Raises:
+            FileIOError: If the delta or snapshot cannot be written
+        """
+        if not ops:
+            return
+        line = json.dumps({"ts": time.time(), "set": [[list(p), v] for p, v in ops]})
+        with self._lock:
+            try:
+                self.delta_path.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.delta_path, "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+            except OSError as e:
+                raise FileIOError(f"Failed to append to {self.delta_path}: {e}") from e
+            self._pending += 1
+            if self._should_flush():
+                self.flush()
+
+    def _should_flush(self) -> bool:
+        if self._pending >= self.flush_every or self._last_flush is None:
+            return True
+        return time.monotonic() - self._last_flush >= self.flush_interval_seconds
+
+    def flush(self) -> None:
+        """Write the full snapshot atomically and truncate the delta log.
+
+        Raises:
+            FileIOError: If the snapshot cannot be written
+        """
+        with self._lock:
+            self.file_io.write_json(
+                self.path,
+                self._snapshot(),
+                atomic=True,
+                backup=False,  # Delta log covers crash recovery
+                create_dirs=True,
+                indent=2,
+            )
+            try:
+                self.delta_path.unlink(missing_ok=True)
+            except OSError as e:
+                # Stale deltas replay to the same values; safe to leave
+                logger.debug(f"Could not truncate {self.delta_path}: {e}")
+            self._pending = 0
+            self._last_flush = time.monotonic()
+
+    def close(self) -> None:
+        """Flush outstanding updates; safe to call more than once."""
+        with self._lock:
+            if self.dirty:
+                self.flush()
+
+
+def flush_all_learning_state() -> None:
+    """Flush every live store with unsnapshotted updates (runs at exit)."""
+    for store in list(_open_stores):
+        try:
+            store.close()
+        except FileIOError as e:
+            logger.warning(f"Failed to flush learning state {store.path}: {e}")
+
+
+atexit.register(flush_all_learning_state)
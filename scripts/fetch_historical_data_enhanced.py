@@ -15,6 +15,10 @@ import pandas as pd
 import requests
 from dotenv import load_dotenv
 
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from finance_feedback_engine.persistence.ohlcv_lake import OHLCVLake
+
 # Load environment variables
 load_dotenv()
 
@@ -278,6 +282,9 @@ def main():
     output_dir = Path('data/historical/curriculum_2020_2023')
     output_dir.mkdir(parents=True, exist_ok=True)
     
+    # Also write into the shared OHLCV lake so backtests read these candles
+    lake = OHLCVLake()
+    
     timeframes = ['M5', 'M15', 'H1']
     
     # Crypto pairs (Coinbase)
@@ -306,6 +313,7 @@ def main():
                 if not df.empty:
                     output_file = output_dir / f"{file_prefix}_{timeframe}_2020_2023.parquet"
                     df.to_parquet(output_file, index=False)
+                    lake.write(coinbase_symbol, timeframe, df, covered=(start_date, end_date))
                     
                     validation = validate_data(df, coinbase_symbol, timeframe, start_date, end_date)
                     validation_results.append({
@@ -339,6 +347,7 @@ def main():
                 if not df.empty:
                     output_file = output_dir / f"{file_prefix}_{timeframe}_2020_2023.parquet"
                     df.to_parquet(output_file, index=False)
+                    lake.write(oanda_symbol, timeframe, df, covered=(start_date, end_date))
                     
                     validation = validate_data(df, oanda_symbol, timeframe, start_date, end_date)
                     validation_results.append({
@@ -1,18 +1,28 @@
 #!/usr/bin/env python3
 """Retrain stacking meta-learner as 3-class BUY/HOLD/SELL classifier.
 
+This is the offline half of the stacking model: sklearn is only used here.
+The runtime loads the written parameters into the NumPy kernel in
+finance_feedback_engine/decision_engine/meta_learner.py.
+
 Data strategy:
 1) Use historical decision logs with ensemble provider decisions to build real meta-features.
-2) If class imbalance/missing SELL, augment with balanced synthetic examples using
+2) Where a recorded trade outcome exists for a decision (data/trade_outcomes/*.jsonl,
+   joined on decision_id), label losing BUY/SELL entries as HOLD so the model
+   learns from realized results rather than from its own past votes.
+3) If class imbalance/missing SELL, augment with balanced synthetic examples using
    technical indicator patterns (RSI/MACD/price-vs-20MA) mapped to ensemble meta-features.
 
-Output model file format matches decision_engine/voting_strategies.py expectations.
+Before writing, the exported parameters are checked against the fitted sklearn model
+through the NumPy kernel so runtime predictions match training.
 """
 
 from __future__ import annotations
 
+import argparse
 import json
 import random
+import sys
 from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
@@ -24,7 +34,15 @@ from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import StandardScaler
 
 ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from finance_feedback_engine.decision_engine.meta_learner import (  # noqa: E402
+    meta_learner_from_dict,
+)
+
 DECISIONS_DIR = ROOT / "data" / "decisions"
+OUTCOMES_DIR = ROOT / "data" / "trade_outcomes"
 MODEL_PATH = ROOT / "finance_feedback_engine" / "decision_engine" / "meta_learner_model.json"
 
 FEATURE_NAMES = [
@@ -38,7 +56,36 @@ CLASSES = ["BUY", "HOLD", "SELL"]
 RNG = random.Random(42)
 
 
-def _extract_meta_features_from_decision(path: Path) -> tuple[list[float], str] | None:
+def _load_outcome_pnl(outcomes_dir: Path) -> dict[str, float]:
+    """Realized P&L per decision_id, summed over partial closes."""
+    pnl: dict[str, float] = {}
+    for path in sorted(outcomes_dir.glob("*.jsonl")):
+        try:
+            lines = path.read_text().splitlines()
+        except OSError:
+            continue
+        for line in lines:
+            try:
+                outcome = json.loads(line)
+                decision_id = outcome.get("decision_id")
+                realized = float(outcome.get("realized_pnl"))
+            except (TypeError, ValueError, AttributeError):
+                continue
+            if decision_id:
+                pnl[decision_id] = pnl.get(decision_id, 0.0) + realized
+    return pnl
+
+
+def _outcome_label(action: str, realized_pnl: float | None) -> str:
+    """Keep profitable entries; a losing BUY/SELL should have been a HOLD."""
+    if realized_pnl is not None and action in {"BUY", "SELL"} and realized_pnl <= 0:
+        return "HOLD"
+    return action
+
+
+def _extract_meta_features_from_decision(
+    path: Path, outcome_pnl: dict[str, float] | None = None
+) -> tuple[list[float], str] | None:
     try:
         payload = json.loads(path.read_text())
     except Exception:
@@ -47,6 +94,8 @@ def _extract_meta_features_from_decision(path: Path) -> tuple[list[float], str]
     label = payload.get("action")
     if label not in {"BUY", "HOLD", "SELL"}:
         return None
+    if outcome_pnl:
+        label = _outcome_label(label, outcome_pnl.get(payload.get("id")))
 
     ensemble = payload.get("ensemble_metadata") or {}
     provider_decisions = ensemble.get("provider_decisions")
@@ -140,12 +189,42 @@ def _generate_balanced_synthetic(target_per_class: int) -> tuple[list[list[float
     return xs, ys
 
 
-def main() -> None:
+def _check_kernel_parity(
+    output: dict[str, Any], model: LogisticRegression, scaler: StandardScaler, X: np.ndarray
+) -> None:
+    """Fail loudly if the exported parameters do not reproduce sklearn's output."""
+    kernel, kernel_scaler = meta_learner_from_dict(output)
+    expected = model.predict_proba(scaler.transform(X))
+    actual = kernel.predict_proba(kernel_scaler.transform(X))
+    if not np.allclose(expected, actual, atol=1e-9):
+        raise RuntimeError("NumPy meta-learner kernel disagrees with the trained model")
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--decisions-dir", type=Path, default=DECISIONS_DIR)
+    parser.add_argument("--outcomes-dir", type=Path, default=OUTCOMES_DIR)
+    parser.add_argument("--output", type=Path, default=MODEL_PATH)
+    parser.add_argument(
+        "--no-outcomes",
+        action="store_true",
+        help="Label decisions by their logged action only",
+    )
+    parser.add_argument(
+        "--dry-run", action="store_true", help="Train and validate without writing the model"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> None:
+    args = _parse_args(argv)
     real_x: list[list[float]] = []
     real_y: list[str] = []
 
-    for p in DECISIONS_DIR.glob("*.json"):
-        item = _extract_meta_features_from_decision(p)
+    outcome_pnl = {} if args.no_outcomes else _load_outcome_pnl(args.outcomes_dir)
+
+    for p in args.decisions_dir.glob("*.json"):
+        item = _extract_meta_features_from_decision(p, outcome_pnl)
         if item is None:
             continue
         x, y = item
@@ -182,9 +261,9 @@ def main() -> None:
     test_acc = float(model.score(X_test, y_test))
 
     existing: dict[str, Any] = {}
-    if MODEL_PATH.exists():
+    if args.output.exists():
         try:
-            existing = json.loads(MODEL_PATH.read_text())
+            existing = json.loads(args.output.read_text())
         except Exception:
             existing = {}
 
@@ -228,10 +307,15 @@ def main() -> None:
         ],
     }
 
-    MODEL_PATH.write_text(json.dumps(output, indent=2) + "\n")
+    _check_kernel_parity(output, model, scaler, X)
 
     final_counts = Counter(y.tolist())
-    print(f"Trained 3-class model at: {MODEL_PATH}")
+    if args.dry_run:
+        print("Dry run: model not written")
+    else:
+        args.output.write_text(json.dumps(output, indent=2) + "\n")
+        print(f"Trained 3-class model at: {args.output}")
+    print(f"Decisions with recorded outcomes: {len(outcome_pnl)}")
     print(f"Class distribution: {dict(final_counts)}")
     print(f"Test accuracy: {test_acc:.4f}")
 
@@ -0,0 +1,148 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from finance_feedback_engine.agent.config import (
+    AutonomousAgentConfig,
+    TradingAgentConfig,
+)
+from finance_feedback_engine.agent.reasoning_scheduler import ReasoningPriorityScheduler
+from finance_feedback_engine.agent.trading_loop_agent import (
+    AgentState,
+    TradingLoopAgent,
+)
+
+
+def test_open_positions_and_exits_rank_first():
+    scheduler = ReasoningPriorityScheduler()
+    now = 1_000_000.0
+    for pair in ["BTCUSD", "ETHUSD", "EURUSD", "GBPUSD"]:
+        scheduler.record_analysis(pair, {"volatility": 0.01}, now=now)
+
+    scheduler.set_open_positions(["EURUSD"])
+    scheduler.record_analysis(
+        "GBPUSD", {"policy_action": "CLOSE_LONG"}, exit_pending=True, now=now
+    )
+
+    ordered = scheduler.prioritize(
+        [(0, "BTCUSD"), (1, "ETHUSD"), (2, "EURUSD"), (3, "GBPUSD")], now=now + 60
+    )
+
+    assert [pair for _, pair in ordered] == ["GBPUSD", "EURUSD", "BTCUSD", "ETHUSD"]
+
+
+def test_staleness_and_volatility_raise_priority():
+    scheduler = ReasoningPriorityScheduler(high_volatility_threshold=0.04)
+    now = 1_000_000.0
+    scheduler.record_analysis("BTCUSD", {"volatility": 0.01}, now=now)
+    scheduler.record_analysis("ETHUSD", {"volatility": 0.01}, now=now - 1800)
+    scheduler.record_analysis("SOLUSD", {"volatility": 0.08}, now=now)
+
+    btc = scheduler.score("BTCUSD", now=now)
+    eth = scheduler.score("ETHUSD", now=now)
+    sol = scheduler.score("SOLUSD", now=now)
+    never = scheduler.score("ADAUSD", now=now)
+
+    assert eth.score > btc.score
+    assert "high_volatility" in sol.components
+    assert sol.score > btc.score
+    assert never.score == pytest.approx(scheduler.max_staleness_minutes)
+
+
+def test_carry_over_is_cleared_once_analyzed():
+    scheduler = ReasoningPriorityScheduler()
+    scheduler.defer(["ETHUSD"])
+    assert scheduler.carried_over == ["ETHUSD"]
+    assert "carry_over" in scheduler.score("ETHUSD").components
+
+    scheduler.record_analysis("ETHUSD", {"action": "HOLD"})
+
+    assert scheduler.carried_over == []
+
+
+@pytest.mark.asyncio
+async def test_reasoning_defers_pairs_past_cycle_budget():
+    engine = MagicMock()
+    engine.validate_agent_readiness.return_value = (True, [])
+    engine.get_portfolio_breakdown_async = AsyncMock(return_value={})
+    trade_monitor = MagicMock()
+
+    config = TradingAgentConfig(
+        asset_pairs=["BTCUSD", "ETHUSD", "EURUSD"],
+        autonomous=AutonomousAgentConfig(enabled=True),
+        require_notifications_for_signal_only=False,
+        reasoning_max_concurrent_assets=1,
+        reasoning_rate_limit_requests_per_minute=0.0,
+        reasoning_priority_scheduling_enabled=True,
+        reasoning_cycle_time_budget_seconds=0.05,
+    )
+    agent = TradingLoopAgent(
+        config=config,
+        engine=engine,
+        trade_monitor=trade_monitor,
+        portfolio_memory=MagicMock(),
+        trading_platform=MagicMock(),
+    )
+    agent._reasoning_scheduler.set_open_positions(["EURUSD"])
+    agent.state = AgentState.REASONING
+
+    analyzed: list[str] = []
+
+    async def analyze(asset_pair: str, **kwargs):
+        analyzed.append(asset_pair)
+        await asyncio.sleep(0.1)
+        return {"asset_pair": asset_pair, "action": "HOLD", "confidence": 50}
+
+    engine.analyze_asset_async = AsyncMock(side_effect=analyze)
+
+    await agent.handle_reasoning_state()
+
+    # The open-position pair goes first and is cut off at the 50ms budget;
+    # the rest are never dispatched. Overruns are not counted as failures.
+    assert analyzed == ["EURUSD"]
+    assert agent._reasoning_scheduler.carried_over == ["BTCUSD", "ETHUSD", "EURUSD"]
+    assert agent.analysis_failures == {}
+
+
+@pytest.mark.asyncio
+async def test_reasoning_budget_cuts_off_running_analysis():
+    engine = MagicMock()
+    engine.validate_agent_readiness.return_value = (True, [])
+    engine.get_portfolio_breakdown_async = AsyncMock(return_value={})
+
+    config = TradingAgentConfig(
+        asset_pairs=["BTCUSD", "ETHUSD"],
+        autonomous=AutonomousAgentConfig(enabled=True),
+        require_notifications_for_signal_only=False,
+        reasoning_max_concurrent_assets=2,
+        reasoning_rate_limit_requests_per_minute=0.0,
+        reasoning_priority_scheduling_enabled=True,
+        reasoning_cycle_time_budget_seconds=0.1,
+    )
+    agent = TradingLoopAgent(
+        config=config,
+        engine=engine,
+        trade_monitor=MagicMock(),
+        portfolio_memory=MagicMock(),
+        trading_platform=MagicMock(),
+    )
+    agent.state = AgentState.REASONING
+    cancelled: list[str] = []
+
+    async def analyze(asset_pair: str, **kwargs):
+        try:
+            await asyncio.sleep(0.0 if asset_pair == "BTCUSD" else 30)
+        except asyncio.CancelledError:
+            cancelled.append(asset_pair)
+            raise
+        return {"asset_pair": asset_pair, "action": "HOLD", "confidence": 50}
+
+    engine.analyze_asset_async = AsyncMock(side_effect=analyze)
+
+    started = asyncio.get_running_loop().time()
+    await agent.handle_reasoning_state()
+
+    assert asyncio.get_running_loop().time() - started < 5
+    assert cancelled == ["ETHUSD"]
+    assert agent._reasoning_scheduler.carried_over == ["ETHUSD"]
@@ -0,0 +1,172 @@
+import asyncio
+import datetime
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from finance_feedback_engine.agent.config import (
+    AutonomousAgentConfig,
+    TradingAgentConfig,
+)
+from finance_feedback_engine.agent.trading_loop_agent import (
+    AgentState,
+    TradingLoopAgent,
+)
+
+
+def _build_agent(**config_overrides) -> tuple[TradingLoopAgent, MagicMock, MagicMock]:
+    engine = MagicMock()
+    engine.validate_agent_readiness.return_value = (True, [])
+    engine.get_portfolio_breakdown.return_value = {"futures_positions": []}
+
+    trade_monitor = MagicMock()
+    provider = MagicMock()
+    provider.get_monitoring_context.return_value = {
+        "asset_type": "crypto",
+        "market_data_timestamp": datetime.datetime.now(
+            datetime.timezone.utc
+        ).isoformat(),
+        "unrealized_pnl_percent": 0.0,
+    }
+    trade_monitor.monitoring_context_provider = provider
+
+    config_kwargs = {
+        "asset_pairs": ["BTCUSD"],
+        "autonomous": AutonomousAgentConfig(enabled=True),
+        "require_notifications_for_signal_only": False,
+        "kill_switch_loss_pct": 0.0,
+        "pipelined_perception_enabled": True,
+    }
+    config_kwargs.update(config_overrides)
+    config = TradingAgentConfig(**config_kwargs)
+
+    agent = TradingLoopAgent(
+        config=config,
+        engine=engine,
+        trade_monitor=trade_monitor,
+        portfolio_memory=MagicMock(),
+        trading_platform=MagicMock(),
+    )
+    return agent, engine, provider
+
+
+@pytest.mark.asyncio
+async def test_prefetch_is_reused_by_next_perception():
+    agent, engine, provider = _build_agent()
+
+    agent._start_perception_prefetch()
+    await agent._perception_prefetch_task
+    assert provider.get_monitoring_context.call_count == 1
+    assert engine.get_portfolio_breakdown.call_count == 1
+
+    agent.state = AgentState.PERCEPTION
+    await agent.handle_perception_state()
+
+    assert agent.state == AgentState.REASONING
+    # Perception reused the prefetched MTM and context instead of refetching
+    assert provider.get_monitoring_context.call_count == 1
+    assert engine.get_portfolio_breakdown.call_count == 1
+    assert agent.get_loop_metrics()["perception_prefetch"]["used"] == 1
+
+
+@pytest.mark.asyncio
+async def test_prefetch_discarded_after_execution():
+    agent, engine, provider = _build_agent()
+
+    agent._start_perception_prefetch()
+    await agent._perception_prefetch_task
+
+    agent.state = AgentState.EXECUTION
+    await agent.handle_execution_state()  # no decisions -> IDLE, bumps epoch
+    assert agent.state == AgentState.IDLE
+
+    agent.state = AgentState.PERCEPTION
+    await agent.handle_perception_state()
+
+    assert provider.get_monitoring_context.call_count == 2
+    assert engine.get_portfolio_breakdown.call_count == 2
+    assert agent.get_loop_metrics()["perception_prefetch"]["discarded"] == 1
+
+
+@pytest.mark.asyncio
+async def test_prefetch_from_before_pause_resume_is_discarded():
+    agent, _, provider = _build_agent()
+
+    agent._start_perception_prefetch()
+    task = agent._perception_prefetch_task
+    await task
+
+    agent.is_running = True
+    assert agent.pause() and agent.resume()
+    assert agent._perception_prefetch_task is None
+    # Even if a pre-resume prefetch is still referenced, it is not consumed
+    agent._perception_prefetch_task = task
+
+    agent.state = AgentState.PERCEPTION
+    await agent.handle_perception_state()
+
+    assert provider.get_monitoring_context.call_count == 2
+    assert agent.get_loop_metrics()["perception_prefetch"]["discarded"] == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_prefetch_is_discarded():
+    agent, _, provider = _build_agent(pipelined_perception_max_age_seconds=0.01)
+
+    agent._start_perception_prefetch()
+    await agent._perception_prefetch_task
+    await asyncio.sleep(0.05)
+
+    agent.state = AgentState.PERCEPTION
+    await agent.handle_perception_state()
+
+    assert provider.get_monitoring_context.call_count == 2
+    assert agent.get_loop_metrics()["perception_prefetch"]["discarded"] == 1
+
+
+@pytest.mark.asyncio
+async def test_reasoning_overlaps_prefetch_with_analysis():
+    agent, engine, provider = _build_agent()
+    overlapped = False
+
+    async def analyze(asset_pair: str, **kwargs):
+        nonlocal overlapped
+        await asyncio.sleep(0.05)
+        overlapped = provider.get_monitoring_context.call_count >= 1
+        return {"asset_pair": asset_pair, "action": "HOLD", "confidence": 50}
+
+    engine.analyze_asset_async = AsyncMock(side_effect=analyze)
+    engine.get_portfolio_breakdown_async = AsyncMock(return_value={})
+
+    agent.state = AgentState.REASONING
+    await agent.handle_reasoning_state()
+
+    assert overlapped
+    assert agent._perception_prefetch_task is not None
+
+
+@pytest.mark.asyncio
+async def test_prefetch_disabled_by_default():
+    agent, _, _ = _build_agent(pipelined_perception_enabled=False)
+
+    agent._start_perception_prefetch()
+
+    assert agent._perception_prefetch_task is None
+
+
+@pytest.mark.asyncio
+async def test_perception_installs_snapshot_and_execution_invalidates_it():
+    agent, engine, provider = _build_agent(pipelined_perception_enabled=False)
+    snapshot = object()
+    provider.capture_snapshot = AsyncMock(return_value=snapshot)
+
+    agent.state = AgentState.PERCEPTION
+    await agent.handle_perception_state()
+
+    provider.capture_snapshot.assert_awaited_once()
+    provider.use_snapshot.assert_called_once_with(snapshot)
+
+    agent.state = AgentState.EXECUTION
+    await agent.handle_execution_state()
+
+    provider.invalidate_snapshot.assert_called()
@@ -0,0 +1,66 @@
+"""Import-time budget for the ``ffe`` CLI entry point."""
+
+import subprocess
+import sys
+
+from click.testing import CliRunner
+
+from finance_feedback_engine.cli.main import LAZY_COMMANDS, cli
+
+# Cumulative import time of the entry module; eager imports used to cost ~2s
+IMPORT_BUDGET_US = 750_000
+HEAVY_MODULES = ("finance_feedback_engine.core", "pandas", "sklearn", "numpy")
+
+
+def _import_profile(module: str):
+    """Run ``python -X importtime`` and return (cumulative us, imported names)."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cum, name = line.split("|")
+        if cum.strip().isdigit():
+            cumulative[name.strip()] = int(cum)
+    return cumulative[module], set(cumulative)
+
+
+def test_cli_import_stays_within_budget():
+    elapsed_us, imported = _import_profile("finance_feedback_engine.cli.main")
+
+    assert not imported & set(HEAVY_MODULES), sorted(imported & set(HEAVY_MODULES))
+    assert elapsed_us < IMPORT_BUDGET_US, f"CLI import took {elapsed_us / 1000:.0f} ms"
+
+
+def test_help_lists_lazy_commands_without_loading_them():
+    result = CliRunner().invoke(cli, ["--help"])
+
+    assert result.exit_code == 0
+    for name in LAZY_COMMANDS:
+        assert name in result.output
+
+
+def test_lazy_help_matches_command_docstrings():
+    ctx = cli.make_context("ffe", ["--help"], resilient_parsing=True)
+    for name, (_, short_help) in LAZY_COMMANDS.items():
+        command = cli.get_command(ctx, name)
+        assert command is not None, name
+        assert command.get_short_help_str(200) == short_help, name
+
+
+def test_interactive_menu_lists_lazy_commands_without_loading_them():
+    from finance_feedback_engine.cli.interactive import _build_command_index
+    from finance_feedback_engine.cli.lazy_group import LazyGroup
+
+    group = LazyGroup(name="ffe", lazy_commands=LAZY_COMMANDS)
+
+    index = dict(_build_command_index(group))
+
+    assert set(index) == set(LAZY_COMMANDS)
+    assert index["backtest"] == LAZY_COMMANDS["backtest"][1]
+    assert group.commands == {}
@@ -0,0 +1,62 @@
+"""Tests for the columnar CandleSeries container."""
+
+import json
+
+import numpy as np
+import pytest
+
+from finance_feedback_engine.data_providers.candle_series import CandleSeries
+
+
+@pytest.fixture
+def records():
+    return [
+        {
+            "timestamp": 1700000000 + 60 * i,
+            "open": 100.0 + i,
+            "high": 101.0 + i,
+            "low": 99.0 + i,
+            "close": 100.5 + i,
+            "volume": 10 * i,
+        }
+        for i in range(10)
+    ]
+
+
+def test_round_trips_records_and_serialises(records):
+    series = CandleSeries.from_records(records)
+
+    assert len(series) == 10
+    assert series[-1] == records[-1]
+    assert series.to_records() == records
+    assert series == records
+    assert json.loads(json.dumps(series.to_records())) == records
+    assert [c["close"] for c in series] == [r["close"] for r in records]
+
+
+def test_slices_are_views_over_the_same_buffers(records):
+    series = CandleSeries.from_records(records)
+
+    tail = series[-4:]
+
+    assert isinstance(tail, CandleSeries)
+    assert len(tail) == 4
+    assert np.shares_memory(tail.close, series.close)
+    assert tail[0]["close"] == records[6]["close"]
+    assert tail.close.dtype == np.float64
+
+
+def test_partial_records_and_coerce():
+    series = CandleSeries.coerce([{"close": 1.0}, {"close": 2.0, "date": "2024-01-01"}])
+
+    assert series.fields == ["close", "date"]
+    assert series[0] == {"close": 1.0, "date": None}
+    assert CandleSeries.coerce(series) is series
+    assert not CandleSeries.coerce([])
+    with pytest.raises(IndexError):
+        series[2]
+
+
+def test_mismatched_column_lengths_rejected():
+    with pytest.raises(ValueError):
+        CandleSeries({"close": [1.0, 2.0], "open": [1.0]})
@@ -0,0 +1,122 @@
+"""Tests for speculative judge prefill and judge skipping in debate mode."""
+
+import asyncio
+
+from finance_feedback_engine.decision_engine.ai_decision_manager import (
+    AIDecisionManager,
+)
+
+# Use Ollama-style names (contain ':') to bypass enabled_providers validation
+BULL_MODEL = "gemma2:9b"
+BEAR_MODEL = "llama3.1:8b"
+JUDGE_MODEL = "deepseek-r1:8b"
+
+
+class _StubEnsemble:
+    debate_providers = {
+        "bull": BULL_MODEL,
+        "bear": BEAR_MODEL,
+        "judge": JUDGE_MODEL,
+    }
+
+    def _is_valid_provider_response(self, *args, **kwargs):
+        return True
+
+    def debate_decisions(self, **kwargs):
+        return kwargs["judge_decision"]
+
+
+def _manager(debate_judge):
+    manager = AIDecisionManager.__new__(AIDecisionManager)
+    manager.config = {"ensemble": {"debate_judge": debate_judge}}
+    manager.ensemble_manager = _StubEnsemble()
+    manager.ensemble_timeout = 90
+    return manager
+
+
+def _hold(confidence):
+    return {
+        "action": "HOLD",
+        "policy_action": "HOLD",
+        "candidate_actions": ["HOLD"],
+        "confidence": confidence,
+        "reasoning": "ok",
+        "amount": 0,
+    }
+
+
+def _open_long(confidence):
+    return {
+        "action": "OPEN_SMALL_LONG",
+        "policy_action": "OPEN_SMALL_LONG",
+        "candidate_actions": ["OPEN_SMALL_LONG", "HOLD"],
+        "confidence": confidence,
+        "reasoning": "ok",
+        "amount": 0,
+    }
+
+
+def test_judge_skipped_when_advocates_agree_on_hold_with_high_confidence():
+    manager = _manager(
+        {"skip_on_hold_agreement": {"enabled": True, "min_confidence": 80}}
+    )
+    labels = []
+
+    async def fake_query(provider, prompt, request_label=None, request_timeout_s=None):
+        labels.append(request_label)
+        return _hold(85 if request_label == "debate:bull" else 90)
+
+    manager._query_single_provider = fake_query
+    decision = asyncio.run(manager._debate_mode_inference(prompt="BASE PROMPT"))
+
+    assert "debate:judge" not in labels
+    assert decision["action"] == "HOLD"
+    assert decision["confidence"] == 85
+    assert decision["decision_origin"] == "debate_consensus"
+
+    # Below the agreement threshold the judge still decides
+    labels.clear()
+
+    async def hesitant_query(
+        provider, prompt, request_label=None, request_timeout_s=None
+    ):
+        labels.append(request_label)
+        return _hold(70)
+
+    manager._query_single_provider = hesitant_query
+    decision = asyncio.run(manager._debate_mode_inference(prompt="BASE PROMPT"))
+    assert labels[-1] == "debate:judge"
+    assert decision["confidence"] == 70
+
+
+def test_speculative_prefill_runs_alongside_advocates_and_prefixes_judge_prompt():
+    manager = _manager({"speculative_prefill": True})
+    events = []
+
+    async def fake_prefill(judge_provider, prompt_head):
+        events.append(("prefill", prompt_head))
+        return 0.5
+
+    async def fake_query(provider, prompt, request_label=None, request_timeout_s=None):
+        await asyncio.sleep(0.01)
+        events.append((request_label, prompt))
+        if request_label == "debate:bull":
+            return _open_long(82)
+        return _hold(60)
+
+    manager._prefill_judge = fake_prefill
+    manager._query_single_provider = fake_query
+    asyncio.run(manager._debate_mode_inference(prompt="BASE PROMPT"))
+
+    assert [label for label, _ in events] == [
+        "prefill",
+        "debate:bull",
+        "debate:bear",
+        "debate:judge",
+    ]
+    prompt_head, judge_prompt = events[0][1], events[-1][1]
+    assert judge_prompt.startswith(prompt_head)
+    appended = judge_prompt[len(prompt_head) :]
+    assert "Bull case summary:" in appended
+    assert "Action: OPEN_SMALL_LONG" in appended
+    assert "Decision rules:" in prompt_head
@@ -0,0 +1,81 @@
+"""Tests for the NumPy stacking meta-learner kernel."""
+
+import numpy as np
+import pytest
+from sklearn.linear_model import LogisticRegression
+from sklearn.preprocessing import StandardScaler
+
+from finance_feedback_engine.decision_engine.meta_learner import (
+    meta_learner_from_dict,
+)
+from finance_feedback_engine.decision_engine.voting_strategies import VotingStrategies
+
+
+def _fit(labels):
+    rng = np.random.default_rng(7)
+    X = rng.normal(size=(240, 5)) * [0.2, 0.2, 0.2, 10.0, 4.0] + [
+        0.3,
+        0.3,
+        0.3,
+        65.0,
+        8.0,
+    ]
+    y = np.array(labels)[(X[:, 0] * 3 + X[:, 3] / 30).astype(int) % len(labels)]
+    scaler = StandardScaler().fit(X)
+    model = LogisticRegression(max_iter=500).fit(scaler.transform(X), y)
+    payload = {
+        "classes": model.classes_.tolist(),
+        "coef": model.coef_.tolist(),
+        "intercept": model.intercept_.tolist(),
+        "scaler_mean": scaler.mean_.tolist(),
+        "scaler_scale": scaler.scale_.tolist(),
+    }
+    return X, scaler, model, payload
+
+
+@pytest.mark.parametrize("labels", [["BUY", "HOLD", "SELL"], ["BUY", "HOLD"]])
+def test_kernel_matches_sklearn(labels):
+    X, scaler, model, payload = _fit(labels)
+
+    kernel, kernel_scaler = meta_learner_from_dict(payload)
+    scaled = kernel_scaler.transform(X)
+
+    np.testing.assert_allclose(scaled, scaler.transform(X))
+    np.testing.assert_allclose(
+        kernel.predict_proba(scaled), model.predict_proba(scaled)
+    )
+    assert (kernel.predict(scaled) == model.predict(scaled)).all()
+    # A single row works like sklearn's (1, n_features) input
+    assert kernel.predict_proba(scaled[0]).shape == (1, len(labels))
+
+
+def test_invalid_payloads_rejected():
+    _, _, _, payload = _fit(["BUY", "HOLD", "SELL"])
+
+    with pytest.raises(KeyError):
+        meta_learner_from_dict({k: v for k, v in payload.items() if k != "coef"})
+    with pytest.raises(ValueError):
+        meta_learner_from_dict({**payload, "intercept": [0.0]})
+
+
+def test_batch_prediction_matches_single_decisions():
+    strategies = VotingStrategies("stacking")
+    votes = [
+        (["BUY", "BUY", "HOLD"], [80, 75, 50], [0.1, 0.2, 0.1]),
+        (["SELL", "SELL", "SELL"], [70, 85, 90], [0.3, 0.3, 0.2]),
+        (["HOLD", "BUY", "SELL"], [55, 60, 40], [0.0, 0.1, 0.2]),
+    ]
+
+    batch = strategies.stacking_predict_batch(votes)
+
+    assert len(batch) == len(votes)
+    for (actions, confidences, amounts), scored in zip(votes, batch):
+        single = strategies.apply_voting_strategy(
+            ["a", "b", "c"], actions, confidences, ["r"] * 3, amounts
+        )
+        assert scored["action"] == single["action"]
+        assert scored["confidence"] == single["confidence"]
+        assert scored["stacking_probabilities"] == pytest.approx(
+            single["stacking_probabilities"]
+        )
+    assert strategies.stacking_predict_batch([]) == []
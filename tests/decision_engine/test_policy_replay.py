@@ -0,0 +1,179 @@
+"""Tests for replay-based offline policy evaluation."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from finance_feedback_engine.decision_engine.policy_actions import (
+    build_policy_evaluation_record,
+    build_policy_evaluation_result,
+    build_policy_evaluation_run,
+    build_policy_evaluation_scorecard,
+    build_policy_evaluation_summary,
+    extract_policy_dataset_rows,
+)
+from finance_feedback_engine.decision_engine.policy_replay import PolicyReplayDataset
+
+
+def _decision(index, asset_pair, status, confidence):
+    decision_id = f"d{index}"
+    return {
+        "id": decision_id,
+        "asset_pair": asset_pair,
+        "timestamp": f"2026-01-{index + 1:02d}T00:00:00+00:00",
+        "confidence": confidence,
+        "policy_trace": {
+            "decision_metadata": {
+                "decision_id": decision_id,
+                "asset_pair": asset_pair,
+                "timestamp": f"2026-01-{index + 1:02d}T00:00:00+00:00",
+                "ai_provider": "ensemble",
+            },
+            "decision_envelope": {"action": "BUY", "confidence": confidence},
+            "policy_package": {"control_outcome": {"status": status, "version": 1}},
+        },
+    }
+
+
+DECISIONS = [
+    _decision(0, "BTCUSD", "executed", 85),
+    _decision(1, "BTCUSD", "vetoed", 60),
+    _decision(2, "ETHUSD", "executed", 90),
+    _decision(3, "ETHUSD", "rejected", 55),
+    _decision(4, "ETHUSD", None, 70),
+    _decision(5, "BTCUSD", "proposed", 75),
+]
+
+
+def _write(decisions_dir, decision):
+    path = decisions_dir / f"2026-01-01_{decision['id']}.json"
+    path.write_text(json.dumps(decision))
+    return path
+
+
+def _builder_result(decisions):
+    records = [
+        build_policy_evaluation_record(r)
+        for r in extract_policy_dataset_rows(decisions)
+    ]
+    summary = build_policy_evaluation_summary(build_policy_evaluation_run(records))
+    return build_policy_evaluation_result(
+        summary, build_policy_evaluation_scorecard(summary)
+    )
+
+
+@pytest.fixture
+def dataset(tmp_path):
+    decisions_dir = tmp_path / "decisions"
+    decisions_dir.mkdir()
+    for decision in DECISIONS:
+        _write(decisions_dir, decision)
+    outcomes_dir = tmp_path / "trade_outcomes"
+    outcomes_dir.mkdir()
+    (outcomes_dir / "2026-01-02.jsonl").write_text(
+        "".join(
+            json.dumps(
+                {
+                    "trade_id": t,
+                    "decision_id": d,
+                    "product": "BTC-USD",
+                    "realized_pnl": p,
+                }
+            )
+            + "\n"
+            for t, d, p in [
+                ("t1", "d0", "12.5"),
+                ("t2", "d0", "-2.5"),
+                ("t3", "d2", "-4"),
+            ]
+        )
+    )
+    return PolicyReplayDataset(
+        decisions_dir, tmp_path / "cache", outcomes_dir=outcomes_dir
+    )
+
+
+def test_vectorized_evaluation_matches_builder_chain(dataset):
+    (overall,) = dataset.evaluate()
+    assert {
+        k: overall[k] for k in ("summary", "scorecard", "result_version")
+    } == _builder_result(DECISIONS)
+    assert overall["outcomes"] == {
+        "decision_count": 6,
+        "trade_count": 3,
+        "realized_pnl": 6.0,
+        "win_rate": 0.5,
+    }
+
+    by_asset = dataset.evaluate(by="asset_pair")
+    assert [r["group"] for r in by_asset] == [
+        {"asset_pair": "BTCUSD"},
+        {"asset_pair": "ETHUSD"},
+    ]
+    eth = [d for d in DECISIONS if d["asset_pair"] == "ETHUSD"]
+    assert by_asset[1]["summary"] == _builder_result(eth)["summary"]
+
+    (comparison,) = dataset.compare("confidence >= 80")
+    assert comparison["left"]["avg_executed_rate"] == 1.0
+    assert comparison["right"] == {
+        "result_count": 1,
+        **{
+            f"avg_{k}": v
+            for k, v in _builder_result(DECISIONS)["scorecard"].items()
+            if k.endswith("_rate")
+        },
+        "aggregate_version": 1,
+        "outcomes": overall["outcomes"],
+    }
+    assert comparison["left"]["outcomes"]["realized_pnl"] == 6.0
+
+
+def test_dataset_cache_is_reused_and_refreshed_on_change(dataset, tmp_path):
+    frame = dataset.load_frame()
+    content_hash = dataset.content_hash
+    assert len(frame) == len(DECISIONS)
+    assert (tmp_path / "cache" / f"{content_hash}.parquet").exists()
+
+    # A fresh instance serves the Parquet cache without re-reading unchanged files
+    restored = PolicyReplayDataset(dataset.decisions_dir, tmp_path / "cache")
+    restored._read_file = lambda file: pytest.fail(f"re-read unchanged {file}")
+    assert (
+        restored.load_frame()["decision_id"].tolist() == frame["decision_id"].tolist()
+    )
+    assert restored.content_hash == content_hash
+
+    # Touched-but-identical files keep the same content hash
+    path = dataset.decisions_dir / "2026-01-01_d1.json"
+    os.utime(path, ns=(0, 0))
+    restored = PolicyReplayDataset(dataset.decisions_dir, tmp_path / "cache")
+    restored.sync()
+    assert restored.content_hash == content_hash
+
+    _write(dataset.decisions_dir, _decision(1, "BTCUSD", "executed", 60))
+    (dataset.decisions_dir / "2026-01-01_d5.json").unlink()
+    refreshed = dataset.sync()
+    assert dataset.content_hash != content_hash
+    assert not (tmp_path / "cache" / f"{content_hash}.parquet").exists()
+    assert refreshed["decision_id"].tolist() == ["d0", "d1", "d2", "d3", "d4"]
+    (overall,) = dataset.evaluate()
+    assert overall["summary"]["executed_count"] == 3
+
+
+def test_failed_dataset_write_leaves_no_partial_files(dataset, tmp_path, monkeypatch):
+    cache_dir = tmp_path / "cache"
+
+    def crash(self, path, **kwargs):
+        Path(path).write_bytes(b"PAR1 truncated")
+        raise OSError("disk full")
+
+    monkeypatch.setattr("pandas.DataFrame.to_parquet", crash)
+    assert len(dataset.load_frame()) == len(DECISIONS)
+    assert not list(cache_dir.glob("*.parquet"))
+    assert not list(cache_dir.glob("*.tmp"))
+
+    monkeypatch.undo()
+    restored = PolicyReplayDataset(dataset.decisions_dir, cache_dir)
+    assert len(restored.load_frame()) == len(DECISIONS)
+    assert (cache_dir / f"{restored.content_hash}.parquet").exists()
@@ -1,8 +1,12 @@
 import asyncio
+import time
 
 from finance_feedback_engine.decision_engine.ai_decision_manager import AIDecisionManager
 from finance_feedback_engine.decision_engine.engine import DecisionEngine
-from finance_feedback_engine.decision_engine.pre_reasoner import PreReasonGatekeeper
+from finance_feedback_engine.decision_engine.pre_reasoner import (
+    PreReasonBriefCache,
+    PreReasonGatekeeper,
+)
 
 
 def test_ai_decision_manager_can_route_single_provider_raw_to_local():
@@ -125,3 +129,60 @@ def test_generate_decision_uses_raw_pre_reason_query_and_can_skip():
     assert decision["action"] == "HOLD"
     assert decision["pre_reason_skipped"] is True
     assert decision["market_brief"]["regime"] == "dead"
+
+
+def test_generate_decision_reuses_cached_brief_until_candle_closes():
+    engine = DecisionEngine.__new__(DecisionEngine)
+    engine.backtest_mode = False
+    engine.monitoring_provider = None
+    engine.vector_memory = None
+    engine._counters = {}
+    engine._histograms = {}
+    engine._pre_reason_gatekeeper = PreReasonGatekeeper(
+        max_consecutive_skips=10,
+        forced_debate_interval=999,
+        brief_cache=PreReasonBriefCache(),
+    )
+
+    async def fake_create_decision_context(*args, **kwargs):
+        return {"regime": "ranging"}
+
+    engine._create_decision_context = fake_create_decision_context
+    engine._extract_position_state = lambda context, asset_pair: {"has_position": False}
+    engine._create_decision = lambda asset_pair, context, ai_response: dict(ai_response)
+
+    raw_calls = []
+
+    async def fake_raw(provider_name, prompt, system_prompt=None, response_format="json"):
+        raw_calls.append(prompt)
+        return (
+            '{"regime":"dead","regime_confidence":82,"actionable":false,'
+            '"skip_reason":"Dead market","reasoning":"Market is quiet and not actionable right now."}'
+        )
+
+    engine.ai_manager = type("FakeAIManager", (), {"_query_single_provider_raw": fake_raw})()
+
+    def run(candle):
+        return asyncio.run(
+            engine.generate_decision(
+                asset_pair="BTCUSD",
+                market_data={"close": 67000.0, "high": 67500.0, "low": 66500.0, "volume": 1234567, "trend": "flat", "rsi": 50, "date": candle, "timeframe": "M5"},
+                balance={"USD": 1000.0},
+                portfolio={},
+                memory_context={},
+                monitoring_context={},
+            )
+        )
+
+    candle = float(int(time.time()))
+    run(candle)
+    decision = run(candle)
+    assert len(raw_calls) == 1
+    assert decision["pre_reason_skipped"] is True
+    assert decision["pre_reasoning"]["brief_cached"] is True
+
+    run(candle + 300)
+    assert len(raw_calls) == 2
+    stats = engine._pre_reason_gatekeeper.skip_stats
+    assert stats["cached_brief_skips"] == 1
+    assert stats["brief_cache"]["hits"] == 1
@@ -1,5 +1,6 @@
 """Tests for pre-reasoning layer v3 — all GPT 5.4 + Claude review feedback."""
 
+import os
 import time
 import pytest
 
@@ -12,6 +13,7 @@ from finance_feedback_engine.decision_engine.pre_reasoner import (
     DEFAULT_MIN_REASONING_LENGTH,
     DEFAULT_VOLATILITY_CEILING,
     MarketBrief,
+    PreReasonBriefCache,
     PreReasonGatekeeper,
     build_pre_reason_prompt,
     parse_pre_reason_response,
@@ -304,3 +306,70 @@ class TestMarketBrief:
         d = _brief().to_dict()
         assert d["regime"] == "dead"
         assert "data_timestamp" in d
+
+
+# ============================================================
+# Brief cache
+# ============================================================
+class TestPreReasonBriefCache:
+    RESPONSE = {"regime": "dead", "actionable": False, "reasoning": "Quiet tape."}
+
+    def _market(self, as_of="2026-04-04T10:02:00Z"):
+        return {"close": 67000.0, "timestamp": as_of}
+
+    def test_hit_until_candle_closes(self):
+        cache = PreReasonBriefCache(timeframe="5m")
+        flat = {"has_position": False}
+        assert cache.get("BTCUSD", self._market(), "ranging", flat) is None
+        cache.put("BTCUSD", self._market(), self.RESPONSE, "ranging", flat)
+
+        assert cache.get("BTCUSD", self._market(), "ranging", flat) == self.RESPONSE
+        # The forming 10:00 candle is not part of the key
+        assert cache.get("BTCUSD", self._market("2026-04-04T10:04:59Z"), "ranging", flat) == self.RESPONSE
+        # Regime or position changes are different inputs
+        assert cache.get("BTCUSD", self._market(), "trending_up", flat) is None
+        assert cache.get("BTCUSD", self._market(), "ranging", {"has_position": True, "side": "LONG"}) is None
+        # A new closed candle invalidates the asset's older briefs
+        assert cache.get("BTCUSD", self._market("2026-04-04T10:07:00Z"), "ranging", flat) is None
+        assert cache.stats["invalidations"] == 1
+        assert cache.stats["size"] == 0
+        # No snapshot time or no detected regime: never cached
+        assert cache.get("BTCUSD", {"close": 1.0}, "ranging") is None
+        assert cache.get("BTCUSD", self._market(), None) is None
+        assert cache.get("BTCUSD", self._market(), "UNKNOWN") is None
+        assert cache.stats["uncacheable"] == 3
+
+        # The decision timeframe decides when a candle closes
+        hourly = PreReasonBriefCache(timeframe="5m")
+        hourly.put("BTCUSD", self._market(), self.RESPONSE, "ranging", timeframe="H1")
+        assert hourly.get("BTCUSD", self._market("2026-04-04T10:59:00Z"), "ranging", timeframe="H1") == self.RESPONSE
+
+    def test_lru_eviction_and_persistence(self, tmp_path):
+        path = str(tmp_path / "briefs.json")
+        cache = PreReasonBriefCache(max_entries=2, path=path, flush_every=3)
+        for asset in ("BTCUSD", "ETHUSD"):
+            cache.put(asset, self._market(), self.RESPONSE, "ranging")
+        assert not os.path.exists(path)  # Writes are batched
+        cache.get("BTCUSD", self._market(), "ranging")  # ETHUSD is now least recently used
+        cache.put("EURUSD", self._market(), self.RESPONSE, "ranging")
+        assert cache.stats["evictions"] == 1
+        assert os.path.exists(path)
+
+        restored = PreReasonBriefCache(max_entries=2, path=path)
+        assert restored.get("ETHUSD", self._market(), "ranging") is None
+        assert restored.get("BTCUSD", self._market(), "ranging") == self.RESPONSE
+        assert restored.get("EURUSD", self._market(), "ranging") == self.RESPONSE
+
+        # Invalidations are written on close
+        restored.get("BTCUSD", self._market("2026-04-04T11:30:00Z"), "ranging")
+        restored.close()
+        assert PreReasonBriefCache(path=path).stats["size"] == 1
+
+    def test_skip_stats_include_cache_stats(self):
+        gate = PreReasonGatekeeper(brief_cache=PreReasonBriefCache())
+        gate.record_skip(from_cache=True)
+        gate.record_skip()
+        stats = gate.skip_stats
+        assert stats["total_skips"] == 2
+        assert stats["cached_brief_skips"] == 1
+        assert stats["brief_cache"]["hits"] == 0
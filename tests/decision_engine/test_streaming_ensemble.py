@@ -0,0 +1,120 @@
+"""Tests for streaming ensemble collection with early exit."""
+
+import asyncio
+
+import pytest
+
+from finance_feedback_engine.decision_engine.ensemble_manager import (
+    EnsembleDecisionManager,
+)
+from finance_feedback_engine.decision_engine.streaming_ensemble import (
+    ProviderLatencyTracker,
+    collect_provider_votes,
+    settled_action,
+)
+
+
+def _vote(action, confidence=80):
+    return {"action": action, "confidence": confidence, "reasoning": "r", "amount": 0}
+
+
+def _equal_weights(providers):
+    return {p: 1.0 / len(providers) for p in providers}
+
+
+def test_settled_action_bounds_remaining_votes():
+    votes = {"a": _vote("BUY"), "b": _vote("BUY"), "c": _vote("BUY")}
+
+    assert settled_action(votes, ["d", "e"], "weighted", _equal_weights) == "BUY"
+    # Three outstanding full-confidence dissenters could still win
+    assert settled_action(votes, ["d", "e", "f"], "weighted", _equal_weights) is None
+    assert settled_action(votes, ["d", "e"], "majority") == "BUY"
+    assert settled_action(votes, ["d", "e", "f"], "majority") is None
+    assert settled_action(votes, ["d"], "stacking", _equal_weights) is None
+    assert settled_action({"a": _vote("OPEN_SMALL_LONG")}, ["d"], "majority") is None
+
+
+@pytest.mark.asyncio
+async def test_collect_cuts_short_and_cancels_outstanding_providers():
+    cancelled = []
+
+    async def query(provider):
+        if provider == "slow":
+            try:
+                await asyncio.sleep(30)
+            except asyncio.CancelledError:
+                cancelled.append(provider)
+                raise
+        return _vote("SELL")
+
+    votes = await collect_provider_votes(
+        ["a", "slow", "b", "c"],
+        query,
+        lambda decision, provider: True,
+        settle=lambda decisions, pending: settled_action(
+            decisions, pending, "majority"
+        ),
+    )
+
+    assert votes.settled_action == "SELL"
+    assert list(votes.decisions) == ["a", "b", "c"]
+    assert votes.cut_short == ["slow"]
+    assert cancelled == ["slow"]
+
+
+@pytest.mark.asyncio
+async def test_adaptive_timeout_from_observed_latency():
+    tracker = ProviderLatencyTracker(
+        min_samples=3, multiplier=2.0, min_timeout_seconds=0.0
+    )
+    assert tracker.timeout_for("slow", 10.0) == 10.0
+    for _ in range(3):
+        tracker.observe("slow", 0.01)
+    assert tracker.timeout_for("slow", 10.0) == pytest.approx(0.02)
+
+    async def query(provider):
+        await asyncio.sleep(0.2 if provider == "slow" else 0)
+        return _vote("HOLD")
+
+    votes = await collect_provider_votes(
+        ["fast", "slow"],
+        query,
+        lambda decision, provider: True,
+        timeout_for=lambda p: tracker.timeout_for(p, 10.0),
+        latency_tracker=tracker,
+    )
+
+    assert votes.timed_out == ["slow"]
+    assert votes.failed == ["slow"]
+    assert list(votes.decisions) == ["fast"]
+
+
+@pytest.mark.asyncio
+async def test_manager_records_cut_short_providers_without_failure_penalty():
+    config = {
+        "ensemble": {
+            "enabled_providers": ["llama3.1:8b", "gemma2:9b", "qwen", "gemini"],
+            "provider_weights": {
+                "llama3.1:8b": 0.25,
+                "gemma2:9b": 0.25,
+                "qwen": 0.25,
+                "gemini": 0.25,
+            },
+            "early_exit": {"enabled": True},
+        }
+    }
+    manager = EnsembleDecisionManager(config)
+    decisions = {p: _vote("BUY", 90) for p in ["llama3.1:8b", "gemma2:9b", "qwen"]}
+
+    assert manager.settled_action(decisions, ["gemini"]) == "BUY"
+    # A pending local model is needed for the local quorum
+    assert manager.settled_action({"qwen": _vote("BUY")}, ["llama3.1:8b"]) is None
+
+    result = await manager.aggregate_decisions(
+        decisions, failed_providers=[], cut_short_providers=["gemini"]
+    )
+
+    meta = result["ensemble_metadata"]
+    assert meta["providers_cut_short"] == ["gemini"]
+    assert meta["early_exit"] is True
+    assert meta["confidence_adjustment_factor"] == 1.0
@@ -2,12 +2,13 @@
 
 import tempfile
 from pathlib import Path
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from finance_feedback_engine.pipelines.batch.batch_ingestion import (
     BatchDataIngester,
+    MultiAssetBatchIngester,
     WatermarkStore,
 )
 from finance_feedback_engine.pipelines.storage.delta_lake_manager import (
@@ -243,3 +244,253 @@ class TestBatchIngestionIntegration:
                     watermark = watermark_store.get("BTCUSD", tf)
                     # The watermark will be the max timestamp from the processed records
                     assert watermark is not None
+
+
+class TestConcurrentBatchIngestion:
+    """Concurrent multi-asset ingestion and fallback file layout."""
+
+    def setup_method(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.storage_path = Path(self.temp_dir) / "delta_lake"
+
+    def teardown_method(self):
+        import shutil
+
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    @pytest.mark.asyncio
+    async def test_ingest_all_assets_shares_provider_and_bounds_concurrency(self):
+        import asyncio
+
+        delta_manager = DeltaLakeManager(storage_path=str(self.storage_path))
+        config = {
+            "alpha_vantage": {"api_key": "test_key"},
+            "batch_ingestion": {"provider_concurrency": {"alpha_vantage": 3}},
+        }
+        multi = MultiAssetBatchIngester(delta_manager, config)
+        multi.ingester.watermark_store = WatermarkStore(f"{self.temp_dir}/wm")
+
+        in_flight = 0
+        peak = 0
+
+        async def fake_history(asset_pair, start, end, timeframe):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return [
+                {
+                    "date": f"2024-01-01 0{h}:00:00",
+                    "open": 100.0,
+                    "high": 101.0,
+                    "low": 99.0,
+                    "close": 100.5,
+                    "volume": 1.0,
+                }
+                for h in range(3)
+            ]
+
+        mock_provider = AsyncMock()
+        mock_provider.get_historical_data.side_effect = fake_history
+        assets = ["BTCUSD", "ETHUSD", "EURUSD", "GBPUSD"]
+        timeframes = ["1h", "1d"]
+
+        with patch.object(
+            BatchDataIngester, "_get_data_provider", return_value=mock_provider
+        ) as mock_get_provider:
+            summary = await multi.ingest_all_assets(
+                assets, timeframes, "2024-01-01", "2024-01-02"
+            )
+
+        assert mock_get_provider.await_count == 1
+        assert 1 < peak <= 3
+        assert summary["total_records"] == 3 * len(assets) * len(timeframes)
+        assert [(r["asset_pair"], r["timeframe"]) for r in summary["results"]] == [
+            (a, tf) for a in assets for tf in timeframes
+        ]
+        # Buffered: one file per (date, asset) partition per table
+        files = list((self.storage_path / "raw_market_data_1h").rglob("*.parquet"))
+        assert len(files) == len(assets)
+        assert WatermarkStore(f"{self.temp_dir}/wm").get("ETHUSD", "1d") is not None
+
+    def test_compact_table_merges_small_partition_files(self):
+        import pandas as pd
+
+        delta_manager = DeltaLakeManager(storage_path=str(self.storage_path))
+        for hour in range(5):
+            df = pd.DataFrame(
+                {"asset_pair": ["BTCUSD"], "close": [float(hour)], "day": ["d1"]}
+            )
+            delta_manager.create_or_update_table(df, "candles", ["day", "asset_pair"])
+
+        table_dir = self.storage_path / "candles"
+        assert len(list(table_dir.rglob("*.parquet"))) == 5
+
+        stats = delta_manager.compact_table("candles")
+
+        assert stats == {"files_before": 5, "files_after": 1}
+        assert [p.parent.name for p in table_dir.rglob("*.parquet")] == [
+            "asset_pair=BTCUSD"
+        ]
+        df = delta_manager.read_table("candles")
+        assert sorted(df["close"]) == [0.0, 1.0, 2.0, 3.0, 4.0]
+
+    def test_compaction_keeps_time_travel_to_between_writes(self):
+        import pandas as pd
+
+        delta_manager = DeltaLakeManager(storage_path=str(self.storage_path))
+        for a, written_at in [(1, "20250101_000000"), (2, "20250103_000000")]:
+            delta_manager._write_parquet_file(
+                "events", "", [pd.DataFrame({"a": [a]})], written_at=written_at
+            )
+
+        assert delta_manager.compact_table("events")["files_after"] == 1
+
+        as_of = delta_manager.read_table("events", as_of_timestamp="2025-01-02")
+        assert list(as_of.columns) == ["a"]
+        assert as_of["a"].tolist() == [1]
+        latest = delta_manager.read_table("events")
+        assert sorted(latest["a"]) == [1, 2]
+        assert delta_manager.read_table("events", as_of_timestamp="2024-12-31").empty
+
+
+class TestParquetFallbackReads:
+    """Partition pruning, projection and streaming in Parquet fallback mode."""
+
+    def setup_method(self):
+        import pandas as pd
+
+        self.temp_dir = tempfile.mkdtemp()
+        self.manager = DeltaLakeManager(storage_path=str(Path(self.temp_dir) / "dl"))
+        for asset in ["BTCUSD", "ETHUSD"]:
+            df = pd.DataFrame(
+                {
+                    "timestamp": pd.date_range("2024-01-01", periods=48, freq="h"),
+                    "close": [float(i) for i in range(48)],
+                    "asset_pair": asset,
+                }
+            )
+            df["partition_date"] = df["timestamp"].dt.date
+            df["partition_asset_pair"] = asset
+            self.manager.create_or_update_table(
+                df, "bars", ["partition_date", "partition_asset_pair"]
+            )
+
+    def teardown_method(self):
+        import shutil
+
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_filters_prune_partitions_and_project_columns(self):
+        import pyarrow.dataset as ds
+
+        dataset = self.manager._fallback_dataset("bars", None)
+        pruned = list(
+            dataset.get_fragments(filter=ds.field("partition_asset_pair") == "ETHUSD")
+        )
+        assert len(pruned) == 2  # 2 of 4 (date, asset) directories
+
+        df = self.manager.read_table(
+            "bars",
+            filters=['partition_asset_pair = "ETHUSD"', 'timestamp >= "2024-01-02"'],
+            columns=["timestamp", "close"],
+        )
+
+        assert list(df.columns) == ["timestamp", "close"]
+        assert len(df) == 24
+        assert df["close"].min() == 24.0
+
+    def test_streams_batches_and_time_travel(self):
+        batches = list(self.manager.iter_table_batches("bars", batch_size=10))
+
+        assert all(len(b) <= 10 for b in batches)
+        assert sum(len(b) for b in batches) == 96
+        assert self.manager.read_table("bars", as_of_timestamp="2000-01-01").empty
+        with pytest.raises(ValueError):
+            self.manager.read_table("bars", filters=["close ~ 3"])
+
+
+class TestValidateAndClean:
+    """Single-pass OHLC validation with a rejection bitmask."""
+
+    def test_each_rejected_row_reported_once_with_reasons(self):
+        from finance_feedback_engine.pipelines.batch.batch_ingestion import (
+            RejectionReason,
+        )
+
+        ingester = BatchDataIngester(None, {})
+        good = {
+            "date": "2024-01-01 00:00:00",
+            "open": "100",
+            "high": 101.0,
+            "low": 99.0,
+            "close": 100.5,
+        }
+        candles = [
+            good,
+            {**good, "date": "2024-01-01 01:00:00", "high": 0.0},  # fails 4 rules
+            {**good, "date": "2024-01-01 02:00:00", "close": "n/a"},
+            {**good, "date": "not a date"},
+            {**good, "close": 100.7},  # duplicate timestamp, newer wins
+        ]
+
+        df, failed = ingester.validate_and_clean(candles, "1h", "BTCUSD")
+
+        assert list(df["close"]) == [100.7]
+        assert df["open"].dtype == float
+        assert [r["_rejection_mask"] for r in failed] == [
+            RejectionReason.HIGH_BELOW_LOW
+            | RejectionReason.CLOSE_OUT_OF_RANGE
+            | RejectionReason.OPEN_OUT_OF_RANGE
+            | RejectionReason.NON_POSITIVE_PRICE,
+            RejectionReason.INVALID_VALUE,
+            RejectionReason.INVALID_VALUE,
+        ]
+        assert failed[1]["close"] == "n/a"
+        assert failed[0]["_rejection_reasons"][0] == "HIGH_BELOW_LOW"
+        stats = ingester.last_validation_stats
+        assert (stats["rejected"], stats["duplicates"]) == (3, 1)
+        assert stats["rejected_by_reason"]["INVALID_VALUE"] == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_required_column_rejects_every_row_to_dlq(self):
+        from finance_feedback_engine.pipelines.batch.batch_ingestion import (
+            RejectionReason,
+        )
+
+        ingester = BatchDataIngester(MagicMock(), {})
+        ingester.watermark_store = MagicMock(get=MagicMock(return_value=None))
+        ingester.dlq = MagicMock()
+        ingester.last_validation_stats = {"rejected_by_reason": {"stale": 1}}
+        candles = [
+            {"date": f"2024-01-01 0{h}:00:00", "open": 1.0, "high": 1.0, "low": 1.0}
+            for h in range(3)
+        ]  # no "close"
+
+        df, failed = ingester.validate_and_clean(candles, "1h", "BTCUSD")
+
+        assert df.empty
+        assert len(failed) == 3
+        assert {r["_rejection_mask"] for r in failed} == {
+            RejectionReason.MISSING_COLUMN
+        }
+        stats = ingester.last_validation_stats
+        assert (stats["rows"], stats["valid"], stats["rejected"]) == (3, 0, 3)
+        assert stats["rejected_by_reason"]["MISSING_COLUMN"] == 3
+        assert stats["missing_columns"] == ["close"]
+
+        mock_provider = AsyncMock()
+        mock_provider.get_historical_data.return_value = candles
+        with patch.object(
+            BatchDataIngester, "_get_data_provider", return_value=mock_provider
+        ):
+            result = await ingester.ingest_historical_data(
+                "BTCUSD", "1h", "2024-01-01", "2024-01-02"
+            )
+
+        assert result["status"] == "validation_failed"
+        ingester.dlq.save.assert_called_once()
+        saved = ingester.dlq.save.call_args.kwargs
+        assert len(saved["records"]) == 3
+        assert saved["context"]["rejected_by_reason"]["MISSING_COLUMN"] == 3
@@ -53,7 +53,7 @@ class TestOandaGetCurrentPriceDirect:
             ]
         }
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.request") as mock_get:
             mock_get.return_value = Mock(
                 status_code=200,
                 json=lambda: mock_response,
@@ -83,7 +83,7 @@ class TestOandaGetCurrentPriceDirect:
             ]
         }
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.request") as mock_get:
             mock_get.return_value = Mock(
                 status_code=200,
                 json=lambda: mock_response,
@@ -101,7 +101,7 @@ class TestOandaGetCurrentPriceDirect:
         """Verify None returned when Oanda returns no prices."""
         provider = self._make_provider()
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.request") as mock_get:
             mock_get.return_value = Mock(
                 status_code=200,
                 json=lambda: {"prices": []},
@@ -116,7 +116,7 @@ class TestOandaGetCurrentPriceDirect:
         """Verify None returned (not exception) on API error."""
         provider = self._make_provider()
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.request") as mock_get:
             mock_get.side_effect = Exception("Connection timeout")
 
             result = provider.get_current_price_direct("EUR_USD")
@@ -149,7 +149,7 @@ class TestOandaGetCurrentPriceDirect:
             ]
         }
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.request") as mock_get:
             mock_get.return_value = Mock(
                 status_code=200,
                 json=lambda: mock_response,
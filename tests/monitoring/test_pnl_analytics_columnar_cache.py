@@ -0,0 +1,145 @@
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+
+from finance_feedback_engine.monitoring.pnl_analytics import PnLAnalytics
+
+
+def _outcome(trade_id: str, product: str, pnl: str, exit_time: str, **extra) -> dict:
+    payload = {
+        "trade_id": trade_id,
+        "product": product,
+        "side": "LONG",
+        "entry_time": "2026-02-14T10:00:00+00:00",
+        "entry_price": "100.0",
+        "entry_size": "1.0",
+        "exit_time": exit_time,
+        "exit_price": "101.0",
+        "exit_size": "1.0",
+        "realized_pnl": pnl,
+        "fees": "0",
+        "holding_duration_seconds": 3600,
+        "roi_percent": "1.0",
+    }
+    payload.update(extra)
+    return payload
+
+
+def _append(path: Path, outcomes: list[dict]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a") as f:
+        for outcome in outcomes:
+            f.write(json.dumps(outcome) + "\n")
+
+
+@pytest.fixture
+def outcomes(tmp_path):
+    day_file = tmp_path / "trade_outcomes" / "2026-02-14.jsonl"
+    _append(
+        day_file,
+        [
+            _outcome("t1", "BTC-USD", "50.0", "2026-02-14T12:00:00+00:00"),
+            _outcome("t2", "BTC-USD", "-20.0", "2026-02-14T13:00:00+00:00"),
+            _outcome("t3", "EUR_USD", "10.0", "2026-02-14T14:00:00+00:00"),
+            _outcome("t4", "EUR_USD", "-35.0", "2026-02-14T15:00:00+00:00"),
+            _outcome("t5", "BTC-USD", "0.0", "2026-02-14T16:00:00+00:00"),
+        ],
+    )
+    return tmp_path, day_file
+
+
+def test_frame_metrics_match_dict_metrics(outcomes):
+    data_dir, _ = outcomes
+    analytics = PnLAnalytics(data_dir=str(data_dir))
+
+    expected = analytics.calculate_metrics(analytics.load_trade_outcomes())
+    actual = analytics.calculate_metrics_frame(analytics.load_trade_outcomes_frame())
+
+    assert actual.keys() == expected.keys()
+    for key, value in expected.items():
+        assert actual[key] == pytest.approx(value), key
+
+
+def test_asset_breakdown_matches_per_asset_metrics(outcomes):
+    data_dir, _ = outcomes
+    analytics = PnLAnalytics(data_dir=str(data_dir))
+
+    breakdown = analytics.get_asset_breakdown()
+    trades = analytics.load_trade_outcomes()
+
+    assert set(breakdown) == {"BTC-USD", "EUR_USD"}
+    for asset, metrics in breakdown.items():
+        expected = analytics.calculate_metrics(
+            [t for t in trades if t["product"] == asset]
+        )
+        for key, value in expected.items():
+            assert metrics[key] == pytest.approx(value), (asset, key)
+
+
+def test_appended_outcomes_are_synced_incrementally(outcomes):
+    data_dir, day_file = outcomes
+    analytics = PnLAnalytics(data_dir=str(data_dir))
+    day = datetime(2026, 2, 14, tzinfo=timezone.utc)
+
+    assert analytics.get_daily_summary(day)["total_trades"] == 5
+    assert (data_dir / "pnl_analytics_cache" / "2026-02-14.parquet").exists()
+
+    _append(day_file, [_outcome("t6", "ETH-USD", "25.0", "2026-02-14T17:00:00+00:00")])
+    # Partially written trailing line must wait for the next sync
+    with open(day_file, "a") as f:
+        f.write('{"trade_id": "t7"')
+
+    summary = analytics.get_daily_summary(day)
+    assert summary["total_trades"] == 6
+    assert summary["total_pnl"] == pytest.approx(30.0)
+
+    # A fresh instance reuses the persisted segment and manifest
+    reloaded = PnLAnalytics(data_dir=str(data_dir))
+    frame = reloaded.load_trade_outcomes_frame()
+    assert list(frame["trade_id"]) == ["t1", "t2", "t3", "t4", "t5", "t6"]
+
+
+def test_truncated_day_file_is_rebuilt(outcomes):
+    data_dir, day_file = outcomes
+    analytics = PnLAnalytics(data_dir=str(data_dir))
+    assert len(analytics.load_trade_outcomes_frame()) == 5
+
+    day_file.write_text(
+        json.dumps(_outcome("t9", "BTC-USD", "5.0", "2026-02-14T18:00:00+00:00")) + "\n"
+    )
+
+    frame = analytics.load_trade_outcomes_frame()
+    assert list(frame["trade_id"]) == ["t9"]
+
+
+def test_missing_outcomes_dir_returns_empty_metrics(tmp_path):
+    analytics = PnLAnalytics(data_dir=str(tmp_path))
+
+    summary = analytics.get_monthly_summary(datetime(2026, 2, 1, tzinfo=timezone.utc))
+
+    assert summary["total_trades"] == 0
+    assert summary["month"] == "2026-02"
+    assert analytics.get_asset_breakdown() == {}
+
+
+def test_failed_segment_write_leaves_no_partial_files(outcomes, monkeypatch):
+    data_dir, _ = outcomes
+    cache_dir = data_dir / "pnl_analytics_cache"
+
+    def crash(self, path, **kwargs):
+        Path(path).write_bytes(b"PAR1 truncated")
+        raise OSError("disk full")
+
+    monkeypatch.setattr("pandas.DataFrame.to_parquet", crash)
+    analytics = PnLAnalytics(data_dir=str(data_dir))
+
+    assert len(analytics.load_trade_outcomes_frame()) == 5
+    assert not list(cache_dir.glob("*.parquet"))
+    assert not list(cache_dir.glob("*.tmp"))
+
+    monkeypatch.undo()
+    reloaded = PnLAnalytics(data_dir=str(data_dir))
+    assert len(reloaded.load_trade_outcomes_frame()) == 5
+    assert (cache_dir / "2026-02-14.parquet").exists()
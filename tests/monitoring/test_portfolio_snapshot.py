@@ -0,0 +1,83 @@
+"""Cycle-scoped portfolio snapshots in MonitoringContextProvider."""
+
+import pytest
+
+from finance_feedback_engine.monitoring.context_provider import (
+    MonitoringContextProvider,
+    PortfolioSnapshot,
+)
+
+
+class _CountingPlatform:
+    def __init__(self):
+        self.sync_calls = 0
+        self.async_calls = 0
+        self.portfolio = {
+            "total_value_usd": 1000.0,
+            "futures_positions": [
+                {
+                    "product_id": "BTC-USD",
+                    "side": "LONG",
+                    "contracts": 1,
+                    "current_price": 100.0,
+                    "unrealized_pnl": 5.0,
+                },
+                {
+                    "product_id": "ETH-USD",
+                    "side": "SHORT",
+                    "contracts": 2,
+                    "current_price": 50.0,
+                    "unrealized_pnl": -1.0,
+                },
+            ],
+        }
+
+    def get_portfolio_breakdown(self):
+        self.sync_calls += 1
+        return self.portfolio
+
+    async def aget_portfolio_breakdown(self):
+        self.async_calls += 1
+        return self.portfolio
+
+
+@pytest.mark.asyncio
+async def test_snapshot_serves_per_asset_contexts_without_refetching():
+    platform = _CountingPlatform()
+    provider = MonitoringContextProvider(platform)
+
+    snapshot = await provider.capture_snapshot()
+    provider.use_snapshot(snapshot)
+    btc = provider.get_monitoring_context(asset_pair="BTC-USD")
+    eth = provider.get_monitoring_context(asset_pair="ETH-USD")
+    everything = provider.get_monitoring_context()
+
+    assert isinstance(snapshot, PortfolioSnapshot)
+    assert (platform.async_calls, platform.sync_calls) == (1, 0)
+    assert [p["product_id"] for p in btc["active_positions"]["futures"]] == ["BTC-USD"]
+    assert btc["risk_metrics"]["long_exposure"] == 100.0
+    assert eth["risk_metrics"]["short_exposure"] == 100.0
+    assert everything["risk_metrics"]["total_exposure_usd"] == 200.0
+    assert btc["position_concentration"] == eth["position_concentration"]
+
+    # Views are copies: callers cannot corrupt the shared snapshot
+    btc["active_positions"]["futures"].clear()
+    btc["portfolio_breakdown"]["total_value_usd"] = 0
+    again = provider.get_monitoring_context(asset_pair="BTC-USD")
+    assert len(again["active_positions"]["futures"]) == 1
+    assert snapshot.portfolio["total_value_usd"] == 1000.0
+
+
+def test_invalidate_returns_to_live_fetches():
+    platform = _CountingPlatform()
+    provider = MonitoringContextProvider(platform)
+    provider.use_snapshot(provider._build_snapshot(platform.get_portfolio_breakdown()))
+
+    provider.get_monitoring_context(asset_pair="BTC-USD")
+    assert platform.sync_calls == 1
+
+    provider.invalidate_snapshot()
+    provider.get_monitoring_context(asset_pair="BTC-USD")
+    provider.get_monitoring_context(asset_pair="ETH-USD")
+    assert platform.sync_calls == 3
+    assert provider.snapshot is None
@@ -0,0 +1,140 @@
+"""Tests for provider telemetry and latency-aware routing."""
+
+import random
+
+import pytest
+
+from finance_feedback_engine.decision_engine.ensemble_manager import (
+    EnsembleDecisionManager,
+)
+from finance_feedback_engine.decision_engine.provider_routing import ProviderRouter
+from finance_feedback_engine.monitoring.provider_telemetry import (
+    LatencyHistogram,
+    ProviderTelemetry,
+)
+
+
+class _Clock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_histogram_percentiles_within_bucket_error():
+    histogram = LatencyHistogram()
+    for ms in range(1, 1001):
+        histogram.record(ms / 100.0)  # 0.01s .. 10s
+
+    assert histogram.percentile(0.5) == pytest.approx(5.0, rel=0.05)
+    assert histogram.percentile(0.95) == pytest.approx(9.5, rel=0.05)
+    assert histogram.percentile(1.0) == 10.0
+    assert LatencyHistogram.from_dict(histogram.to_dict()).percentile(
+        0.95
+    ) == histogram.percentile(0.95)
+
+
+def test_rolling_windows_persist_and_expire(tmp_path):
+    clock = _Clock()
+    path = tmp_path / "telemetry.json"
+    telemetry = ProviderTelemetry(
+        path=str(path), window_seconds=60, retention_windows=2, clock=clock
+    )
+
+    telemetry.record_request("gemma2:9b", 2.0, "success", role="judge", tokens=400)
+    telemetry.record_request("gemma2:9b", 4.0, "success", role="judge", tokens=400)
+    telemetry.record_request("gemma2:9b", 30.0, "timeout", role="judge")
+    telemetry.record_outcome("gemma2:9b", True, role="judge")
+
+    stats = telemetry.summary("gemma2:9b", role="judge")
+    assert stats.requests == 3
+    assert stats.timeout_rate == pytest.approx(1 / 3)
+    assert stats.tokens_per_second == pytest.approx(800 / 6.0)
+    assert stats.accuracy == pytest.approx(2 / 3)
+    assert telemetry.summary("gemma2:9b", role="bull").requests == 0
+
+    # Replayed from the snapshot + delta log by a fresh instance
+    restored = ProviderTelemetry(
+        path=str(path), window_seconds=60, retention_windows=2, clock=clock
+    )
+    assert restored.summary("gemma2:9b").requests == 3
+
+    clock.now += 120
+    assert restored.summary("gemma2:9b").requests == 0
+
+
+def test_router_prefers_quality_per_second_within_budget(tmp_path):
+    telemetry = ProviderTelemetry(path=str(tmp_path / "t.json"), clock=_Clock())
+    for _ in range(5):
+        telemetry.record_request("fast", 5.0, "success")
+        telemetry.record_request("slow", 80.0, "success")
+        telemetry.record_request("fast", 5.0, "success", role="judge")
+        telemetry.record_request("deep", 40.0, "success", role="judge")
+        telemetry.record_request("bullish", 10.0, "success", role="bull")
+        telemetry.record_request("bullish", 10.0, "success", role="bear")
+    router = ProviderRouter(
+        telemetry, latency_budget_seconds=60, min_members=1, exploration_rate=0.0
+    )
+
+    # "slow" is over budget; "new" has no samples yet and is kept to gather them
+    assert router.select_ensemble_members(["slow", "fast", "new"]) == ["fast", "new"]
+
+    seats = router.select_debate_seats(
+        {"bull": "bullish", "bear": "bullish", "judge": "deep"},
+        ["fast", "deep", "bullish"],
+    )
+    assert seats == {"bull": "bullish", "bear": "bullish", "judge": "fast"}
+
+    tight = ProviderRouter(telemetry, latency_budget_seconds=10, exploration_rate=0.0)
+    configured = {"bull": "bullish", "bear": "bullish", "judge": "deep"}
+    assert tight.select_debate_seats(configured, ["deep"]) == configured
+
+
+def test_router_explores_unmeasured_debate_candidates(tmp_path):
+    telemetry = ProviderTelemetry(path=str(tmp_path / "t.json"), clock=_Clock())
+    configured = {"bull": "base", "bear": "base", "judge": "base"}
+    for role in ("bull", "bear", "judge"):
+        for _ in range(5):
+            telemetry.record_request("base", 5.0, "success", role=role)
+
+    never = ProviderRouter(telemetry, exploration_rate=0.0)
+    assert never.select_debate_seats(configured, ["base", "new"]) == configured
+
+    # Candidates never seated would never earn role telemetry without exploration
+    always = ProviderRouter(telemetry, exploration_rate=1.0, rng=random.Random(7))
+    seats = always.select_debate_seats(configured, ["base", "new"])
+    assert sorted(seats.values()) == ["base", "base", "new"]
+
+    for role in ("bull", "bear", "judge"):
+        for _ in range(5):
+            telemetry.record_request("new", 1.0, "success", role=role)
+    # Once measured everywhere, nothing is left to explore and "new" wins on speed
+    assert always.select_debate_seats(configured, ["base", "new"]) == {
+        "bull": "new",
+        "bear": "new",
+        "judge": "new",
+    }
+
+
+@pytest.mark.asyncio
+async def test_routed_out_providers_are_not_counted_as_failures():
+    config = {
+        "ensemble": {
+            "enabled_providers": ["llama3.1:8b", "gemma2:9b", "slow"],
+            "provider_weights": {"llama3.1:8b": 0.4, "gemma2:9b": 0.4, "slow": 0.2},
+        }
+    }
+    manager = EnsembleDecisionManager(config)
+    vote = {"action": "BUY", "confidence": 80, "reasoning": "r", "amount": 0}
+
+    result = await manager.aggregate_decisions(
+        {"llama3.1:8b": dict(vote), "gemma2:9b": dict(vote)},
+        failed_providers=[],
+        routed_out_providers=["slow"],
+    )
+
+    meta = result["ensemble_metadata"]
+    assert meta["providers_routed_out"] == ["slow"]
+    assert meta["num_total"] == 2
+    assert meta["confidence_adjustment_factor"] == 1.0
@@ -0,0 +1,194 @@
+"""Tests for process-parallel Optuna optimization over shared storage."""
+
+from decimal import Decimal
+
+import numpy as np
+import optuna
+import pandas as pd
+import pytest
+
+from finance_feedback_engine.backtest.optimizer import ParameterOptimizer
+from finance_feedback_engine.backtest.strategy_adapter import simple_momentum_strategy
+from finance_feedback_engine.optimization.optuna_optimizer import OptunaOptimizer
+from finance_feedback_engine.optimization.parallel import (
+    load_shared_ohlcv,
+    share_ohlcv,
+)
+
+
+@pytest.fixture
+def ohlcv():
+    rng = np.random.default_rng(3)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 400)))
+    return pd.DataFrame(
+        {
+            "time": pd.date_range("2024-01-01", periods=400, freq="h", tz="UTC"),
+            "open": close,
+            "high": close * 1.01,
+            "low": close * 0.99,
+            "close": close,
+            "volume": 1.0,
+        }
+    )
+
+
+class _FixedDataOptimizer(OptunaOptimizer):
+    """Backtest stub that scores trials from the shared OHLCV frame."""
+
+    def _load_ohlcv_once(self):
+        return self._ohlcv
+
+    def _run_backtest(self, config):
+        data = self._trial_data(engine=None, timeframe="1h")
+        risk = config["decision_engine"]["risk_per_trade"]
+        return {
+            "metrics": {
+                "sharpe_ratio": float(len(data)) * risk,
+                "max_drawdown_pct": -5.0,
+            },
+            "trades": [],
+        }
+
+
+class _StubFetchOptimizer(_FixedDataOptimizer):
+    """Loads data through the real engine path with only the fetch stubbed."""
+
+    _load_ohlcv_once = OptunaOptimizer._load_ohlcv_once
+
+    def __init__(self, *args, data, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.fetches = []
+        self._stub_data = data
+
+    def _fetch_ohlcv(self, engine, timeframe):
+        self.fetches.append((engine.config.get("is_backtest"), timeframe))
+        return self._stub_data
+
+
+def test_shared_ohlcv_is_loaded_once_per_process(ohlcv, tmp_path):
+    path = share_ohlcv(ohlcv, tmp_path / "ohlcv.arrow")
+
+    first = load_shared_ohlcv(path)
+
+    assert first is load_shared_ohlcv(path)
+    pd.testing.assert_frame_equal(first, ohlcv, check_index_type=False)
+    # Columns are views of the mapped file, not per-process decoded copies
+    assert not first["close"].to_numpy().flags.writeable
+
+
+def test_parameter_optimizer_runs_trials_across_processes(ohlcv, tmp_path):
+    optimizer = ParameterOptimizer(initial_balance=Decimal("10000"))
+    storage = str(tmp_path / "study.journal")
+
+    results = optimizer.optimize(
+        data=ohlcv,
+        strategy=simple_momentum_strategy,
+        n_trials=6,
+        min_trades=1,
+        n_workers=2,
+        storage=storage,
+    )
+
+    assert len(optimizer.study.trials) == 6
+    assert results
+    assert results == sorted(results, key=lambda r: r.score, reverse=True)
+    # Trials persisted to the shared journal can be reloaded (resumable)
+    reloaded = optuna.load_study(
+        study_name="ffe_parameter_optimization",
+        storage=optuna.storages.JournalStorage(
+            optuna.storages.journal.JournalFileBackend(storage)
+        ),
+    )
+    assert len(reloaded.trials) == 6
+
+
+def test_unpicklable_strategy_falls_back_to_in_process(ohlcv):
+    optimizer = ParameterOptimizer()
+
+    results = optimizer.optimize(
+        data=ohlcv,
+        strategy=lambda data, index: simple_momentum_strategy(data, index),
+        n_trials=3,
+        min_trades=1,
+        n_workers=4,
+    )
+
+    assert len(optimizer.study.trials) == 3
+    assert results
+
+
+def test_hopeless_trials_are_pruned_part_way(ohlcv, monkeypatch):
+    optimizer = ParameterOptimizer()
+    checkpoints = []
+    original_report = optuna.Trial.report
+
+    def report(self, value, step):
+        checkpoints.append(step)
+        return original_report(self, value, step)
+
+    monkeypatch.setattr(optuna.Trial, "report", report)
+    monkeypatch.setattr(optuna.Trial, "should_prune", lambda self: self.number >= 2)
+
+    optimizer.optimize(
+        data=ohlcv,
+        strategy=simple_momentum_strategy,
+        n_trials=4,
+        min_trades=1,
+        prune_interval=100,
+    )
+
+    states = [t.state for t in optimizer.study.trials]
+    assert states[2:] == [optuna.trial.TrialState.PRUNED] * 2
+    pruned = optimizer.study.trials[2]
+    assert list(pruned.intermediate_values) == [100]
+    assert set(checkpoints) == {100, 200, 300}
+
+
+def test_optuna_optimizer_parallel_mode_shares_data(ohlcv, tmp_path):
+    optimizer = _FixedDataOptimizer(
+        config={"decision_engine": {}},
+        asset_pair="BTCUSD",
+        start_date="2024-01-01",
+        end_date="2024-01-17",
+    )
+    optimizer._ohlcv = ohlcv
+
+    study = optimizer.optimize(
+        n_trials=4,
+        show_progress=False,
+        seed=7,
+        n_jobs=2,
+        storage=f"sqlite:///{tmp_path / 'study.db'}",
+    )
+
+    assert len(study.trials) == 4
+    assert len({t.params["risk_per_trade"] for t in study.trials}) == 4
+    # Every worker saw the full shared dataset
+    assert all(
+        t.value == pytest.approx(400 * t.params["risk_per_trade"]) for t in study.trials
+    )
+    assert optimizer._data_path is None
+
+
+def test_optuna_optimizer_parallel_mode_loads_data_through_engine(ohlcv, tmp_path):
+    optimizer = _StubFetchOptimizer(
+        config={"decision_engine": {}, "alpha_vantage_api_key": "demo"},
+        asset_pair="BTCUSD",
+        start_date="2024-01-01",
+        end_date="2024-01-17",
+        data=ohlcv,
+    )
+
+    study = optimizer.optimize(
+        n_trials=2,
+        show_progress=False,
+        seed=7,
+        n_jobs=2,
+        storage=f"sqlite:///{tmp_path / 'study.db'}",
+    )
+
+    assert len(study.trials) == 2
+    assert optimizer.fetches == [(True, "1h")]
+    assert all(
+        t.value == pytest.approx(400 * t.params["risk_per_trade"]) for t in study.trials
+    )
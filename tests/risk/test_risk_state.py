@@ -0,0 +1,201 @@
+"""Tests for the incrementally maintained RiskState and batch validation."""
+
+from unittest.mock import patch
+
+import pytest
+
+from finance_feedback_engine.risk.exposure_reservation import get_exposure_manager
+from finance_feedback_engine.risk.gatekeeper import RiskGatekeeper
+from finance_feedback_engine.risk.risk_state import RiskState, TradeBatch
+
+
+@pytest.fixture(autouse=True)
+def clear_reservations():
+    manager = get_exposure_manager()
+    manager.clear_all_reservations()
+    yield
+    manager.clear_all_reservations()
+
+
+@pytest.fixture
+def positions():
+    return [
+        {
+            "product_id": "BTC-USD",
+            "side": "LONG",
+            "contracts": 0.5,
+            "current_price": 40000.0,
+            "platform": "coinbase",
+        },
+        {
+            "product_id": "ETH-USD",
+            "side": "SHORT",
+            "contracts": 2,
+            "current_price": 2500.0,
+            "platform": "coinbase",
+        },
+        {
+            "instrument": "EUR_USD",
+            "side": "LONG",
+            "units": 10000,
+            "current_price": 1.1,
+            "platform": "oanda",
+        },
+    ]
+
+
+def test_aggregates_follow_fills_and_marks(positions):
+    state = RiskState()
+    state.sync_positions(positions, account_value=100000.0)
+
+    assert state.category_counts() == {"crypto": 2, "forex": 1}
+    assert state.exposure_by_category("crypto") == pytest.approx(25000.0)
+    assert state.exposure_by_platform("oanda") == pytest.approx(11000.0)
+    assert state.net_exposure == pytest.approx(20000.0 + 11000.0 - 5000.0)
+
+    state.mark_to_market({"BTC-USD": 50000.0, "DOGEUSD": 1.0})
+    state.apply_fill("ETH-USD", 2, 2400.0)  # Buys back the short
+    state.apply_fill("SOLUSD", 10, 100.0, platform="coinbase")
+
+    assert state.position("ETHUSD") is None
+    assert state.category_count("crypto") == 2
+    assert state.exposure_by_category("crypto") == pytest.approx(26000.0)
+    assert state.gross_exposure == pytest.approx(37000.0)
+    assert state.concentration_pct("BTC-USD") == pytest.approx(25.0)
+
+    # Incremental state matches a rebuild from scratch
+    rebuilt = RiskState()
+    rebuilt.sync_positions(
+        [
+            {
+                "asset_pair": "BTCUSD",
+                "contracts": 0.5,
+                "current_price": 50000.0,
+                "platform": "coinbase",
+            },
+            {
+                "asset_pair": "EURUSD",
+                "units": 10000,
+                "current_price": 1.1,
+                "platform": "oanda",
+            },
+            {
+                "asset_pair": "SOLUSD",
+                "contracts": 10,
+                "current_price": 100.0,
+                "platform": "coinbase",
+            },
+        ],
+        account_value=100000.0,
+    )
+    assert rebuilt.category_counts() == state.category_counts()
+    assert rebuilt.gross_exposure == pytest.approx(state.gross_exposure)
+
+
+def test_snapshot_includes_spot_holdings_and_size_fallback(positions):
+    from finance_feedback_engine.monitoring.context_provider import PortfolioSnapshot
+
+    snapshot = PortfolioSnapshot(
+        portfolio={"total_value_usd": 100000.0},
+        futures_positions=(
+            {"product_id": "SOL-USD", "size": 10, "current_price": 100.0},
+            {"asset_pair": "ADAUSD", "quantity": 1000, "current_price": 0.5},
+        ),
+        holdings=(
+            {"asset": "BTC", "balance": 0.1, "value_usd": 5000.0},
+            {"asset": "USDC", "balance": 2000.0, "value_usd": 2000.0},
+            {"asset": "USD", "balance": 1000.0, "value_usd": 1000.0},
+        ),
+        position_concentration={},
+    )
+    state = RiskState()
+    state.sync_snapshot(snapshot)
+
+    assert state.position("SOLUSD").quantity == pytest.approx(10.0)
+    assert state.position("ADAUSD").notional == pytest.approx(500.0)
+    assert state.position("BTCUSD").notional == pytest.approx(5000.0)
+    assert state.position("USDC") is None and state.position("USDUSD") is None
+    assert state.category_count("crypto") == 3
+    assert state.gross_exposure == pytest.approx(6500.0)
+
+    # A spot BTC balance and a BTC fill key the same position
+    state.apply_fill("BTC-USD", 0.1, 50000.0)
+    assert state.position("BTCUSD").quantity == pytest.approx(0.2)
+
+
+def test_reserved_concentration(positions):
+    state = RiskState()
+    state.sync_positions(positions, account_value=100000.0)
+
+    manager = get_exposure_manager()
+    manager.reserve_exposure("d1", "BTCUSD", "BUY", 0.1, 5000.0)
+    manager.reserve_exposure("d2", "BTCUSD", "BUY", 0.1, 3000.0)
+
+    assert manager.get_reserved_notional("BTCUSD") == pytest.approx(8000.0)
+    assert manager.get_reserved_notional("BTCUSD", exclude={"d1"}) == pytest.approx(
+        3000.0
+    )
+    assert state.concentration_pct("BTC-USD") == pytest.approx(28.0)
+    assert state.concentration_pct("BTCUSD", include_reserved=False) == pytest.approx(
+        20.0
+    )
+
+    manager.rollback_reservation("d1")
+    assert manager.get_reserved_exposure() == (
+        pytest.approx(3000.0),
+        {"BTCUSD": pytest.approx(3000.0)},
+    )
+
+
+@patch("finance_feedback_engine.risk.gatekeeper.MarketSchedule")
+def test_validate_trades_counts_combined_exposure(mock_schedule):
+    mock_schedule.get_market_status.return_value = {"is_open": True, "warning": None}
+    state = RiskState()
+    state.sync_positions(
+        [{"asset_pair": "ETHUSD", "contracts": 1, "current_price": 2000.0}],
+        account_value=100000.0,
+    )
+    gatekeeper = RiskGatekeeper(max_correlated_assets=2, risk_state=state)
+    context = {
+        "asset_type": "crypto",
+        "total_value_usd": 100000.0,
+        "max_concentration": 25.0,
+        "holdings": {"ETHUSD": "crypto"},
+        "position_concentration": {"asset_position_pct": {"ETHUSD": 2.0}},
+    }
+
+    def decision(decision_id, asset_pair, amount):
+        return {
+            "id": decision_id,
+            "action": "BUY",
+            "asset_pair": asset_pair,
+            "asset_category": "crypto",
+            "suggested_amount": amount,
+            "confidence": 80,
+        }
+
+    # Each passes on its own; together the category and concentration limits bind
+    results = gatekeeper.validate_trades(
+        [
+            decision("a", "BTCUSD", 30000.0),
+            decision("b", "SOLUSD", 1000.0),
+            decision("c", "BTCUSD", 1000.0),
+        ],
+        [dict(context) for _ in range(3)],
+    )
+
+    assert results[0][0] is True
+    assert results[1] == (False, "Correlation limit exceeded")
+    assert results[2][0] is False and "concentration" in results[2][1]
+
+    # Reserved decisions already in the batch are not counted twice
+    batch = TradeBatch()
+    first = decision("a", "BTCUSD", 15000.0)
+    batch.add(first)
+    get_exposure_manager().reserve_exposure("a", "BTCUSD", "BUY", 0.3, 15000.0)
+    allowed, _ = gatekeeper.validate_trade(
+        {**decision("d", "BTCUSD", 5000.0), "asset_category": None},
+        context,
+        batch=batch,
+    )
+    assert allowed is True
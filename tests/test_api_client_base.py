@@ -73,7 +73,7 @@ class TestAPIClientBaseImport:
         import finance_feedback_engine.utils.api_client_base as api_module
 
         assert hasattr(api_module, "ABC")
-        assert hasattr(api_module, "requests")
+        assert hasattr(api_module, "get_http_transport")
         assert hasattr(api_module, "logging")
 
     def test_retry_decorator_available(self):
@@ -0,0 +1,57 @@
+"""Tests for the offline benchmark suite and baseline comparison."""
+
+from finance_feedback_engine.benchmarks import (
+    compare_results,
+    load_results,
+    run_benchmarks,
+    save_results,
+)
+from finance_feedback_engine.benchmarks.__main__ import main
+
+
+def _results(**medians):
+    return {"results": {name: {"median_ms": ms} for name, ms in medians.items()}}
+
+
+def test_compare_flags_only_slowdowns_beyond_tolerance():
+    baseline = _results(fast=10.0, steady=10.0, slow=10.0, dropped=1.0)
+    current = _results(fast=5.0, steady=11.0, slow=14.0, added=2.0)
+
+    status = {
+        c.name: c.status for c in compare_results(baseline, current, tolerance=0.25)
+    }
+
+    assert status == {
+        "added": "new",
+        "dropped": "missing",
+        "fast": "improved",
+        "slow": "regression",
+        "steady": "ok",
+    }
+
+
+def test_sub_noise_changes_are_not_regressions():
+    comparisons = compare_results(
+        _results(tiny=0.01), _results(tiny=0.03), tolerance=0.25
+    )
+
+    assert comparisons[0].status == "ok"
+    assert comparisons[0].change is not None and comparisons[0].change > 1
+
+
+def test_run_and_round_trip_baseline(tmp_path):
+    results = run_benchmarks(["risk_var", "ensemble_aggregate"], repeat=2, warmup=0)
+
+    assert set(results["results"]) == {"risk_var", "ensemble_aggregate"}
+    assert all(r["median_ms"] > 0 for r in results["results"].values())
+    path = save_results(results, tmp_path / "baseline.json")
+    assert load_results(path)["results"] == results["results"]
+
+
+def test_compare_command_exits_nonzero_on_regression(tmp_path, capsys):
+    baseline = save_results(_results(risk_var=1.0), tmp_path / "baseline.json")
+    current = save_results(_results(risk_var=2.0), tmp_path / "current.json")
+
+    assert main(["compare", str(baseline), str(current), "--tolerance", "0.5"]) == 1
+    assert "regression" in capsys.readouterr().out
+    assert main(["compare", str(baseline), str(baseline)]) == 0
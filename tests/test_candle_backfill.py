@@ -0,0 +1,175 @@
+"""Tests for paginated candle backfill against a local HTTP stub."""
+
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from finance_feedback_engine.data_providers.candle_backfill import CandleBackfiller
+from finance_feedback_engine.data_providers.coinbase_data import CoinbaseDataProvider
+from finance_feedback_engine.data_providers.oanda_data import OandaDataProvider
+from finance_feedback_engine.persistence.ohlcv_lake import OHLCVLake
+from finance_feedback_engine.utils.rate_limiter import RateLimiter
+
+
+def _utc(*args) -> datetime:
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+class _CandleStub(BaseHTTPRequestHandler):
+    """Serves hourly candles for the Coinbase and Oanda candle endpoints."""
+
+    requests_seen: list = []
+    fail_starts: set = set()
+
+    def log_message(self, *args):
+        pass
+
+    def _reply(self, status, body):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        self.requests_seen.append((url.path, query))
+
+        if url.path.startswith("/api/v3/brokerage/products/"):
+            start, end = int(query["start"]), int(query["end"])
+            if start in self.fail_starts:
+                return self._reply(500, {"error": "boom"})
+            candles = [
+                {
+                    "start": str(ts),
+                    "open": "1",
+                    "high": "2",
+                    "low": "0.5",
+                    "close": str(ts % 97),
+                    "volume": "3",
+                }
+                for ts in range(start - start % 3600, end + 1, 3600)
+                if ts >= start
+            ]
+            # Coinbase returns newest first
+            return self._reply(200, {"candles": candles[::-1]})
+
+        if url.path.startswith("/v3/instruments/"):
+            start = datetime.fromisoformat(query["from"].replace("Z", "+00:00"))
+            end = datetime.fromisoformat(query["to"].replace("Z", "+00:00"))
+            candles = []
+            cursor = start
+            while cursor <= end:
+                candles.append(
+                    {
+                        "complete": True,
+                        "time": cursor.strftime("%Y-%m-%dT%H:%M:%S.000000000Z"),
+                        "volume": 5,
+                        "mid": {"o": "1.1", "h": "1.2", "l": "1.0", "c": "1.15"},
+                    }
+                )
+                cursor += timedelta(hours=1)
+            return self._reply(200, {"candles": candles})
+
+        self._reply(404, {})
+
+
+@pytest.fixture
+def stub_server():
+    _CandleStub.requests_seen = []
+    _CandleStub.fail_starts = set()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _CandleStub)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def _fast_limiter() -> RateLimiter:
+    return RateLimiter(tokens_per_second=1000.0, max_tokens=1000)
+
+
+def _coinbase(base_url: str) -> CoinbaseDataProvider:
+    provider = CoinbaseDataProvider(rate_limiter=_fast_limiter())
+    provider.BASE_URL = base_url
+    provider.MAX_CANDLES_PER_REQUEST = 24
+    return provider
+
+
+def test_range_is_split_into_pages_and_written_to_lake(stub_server, tmp_path):
+    lake = OHLCVLake(tmp_path)
+    backfiller = CandleBackfiller(_coinbase(stub_server), lake=lake, max_workers=3)
+
+    result = backfiller.run("BTC-USD", _utc(2024, 1, 1), _utc(2024, 1, 5), "1h")
+    backfiller.close()
+
+    assert result.complete
+    assert result.pages_planned == result.pages_fetched == 4
+    assert len(_CandleStub.requests_seen) == 4
+    stored = lake.read("BTCUSD", "1h", _utc(2024, 1, 1), _utc(2024, 1, 4, 23))
+    assert len(stored) == 96
+    assert stored.index.is_monotonic_increasing
+    assert lake.covers("BTCUSD", "1h", _utc(2024, 1, 1), _utc(2024, 1, 5))
+
+
+def test_rerun_resumes_from_lake_coverage(stub_server, tmp_path):
+    lake = OHLCVLake(tmp_path)
+    backfiller = CandleBackfiller(_coinbase(stub_server), lake=lake, max_workers=2)
+
+    backfiller.run("BTC-USD", _utc(2024, 1, 1), _utc(2024, 1, 3), "1h")
+    _CandleStub.requests_seen.clear()
+    result = backfiller.run("BTC-USD", _utc(2024, 1, 1), _utc(2024, 1, 4), "1h")
+
+    # Only the new day is requested
+    assert result.pages_planned == 1
+    assert len(_CandleStub.requests_seen) == 1
+    assert int(_CandleStub.requests_seen[0][1]["start"]) == int(
+        _utc(2024, 1, 3).timestamp()
+    )
+
+
+def test_failed_page_stays_uncovered_and_is_retried(stub_server, tmp_path):
+    lake = OHLCVLake(tmp_path)
+    _CandleStub.fail_starts = {int(_utc(2024, 1, 2).timestamp())}
+    provider = _coinbase(stub_server)
+    provider.circuit_breaker.failure_threshold = 100
+    backfiller = CandleBackfiller(provider, lake=lake, max_workers=2)
+
+    first = backfiller.run("BTC-USD", _utc(2024, 1, 1), _utc(2024, 1, 4), "1h")
+
+    assert not first.complete
+    assert first.failed_pages == [(_utc(2024, 1, 2), _utc(2024, 1, 3))]
+    assert lake.missing_ranges("BTCUSD", "1h", _utc(2024, 1, 1), _utc(2024, 1, 4)) == [
+        (_utc(2024, 1, 2), _utc(2024, 1, 3))
+    ]
+
+    _CandleStub.fail_starts = set()
+    second = backfiller.run("BTC-USD", _utc(2024, 1, 1), _utc(2024, 1, 4), "1h")
+
+    assert second.complete and second.pages_planned == 1
+    assert len(lake.read("BTCUSD", "1h", _utc(2024, 1, 1), _utc(2024, 1, 3, 23))) == 72
+
+
+def test_oanda_pages_exclude_the_next_page_boundary(stub_server, tmp_path):
+    provider = OandaDataProvider(
+        {"access_token": "t", "account_id": "a", "base_url": stub_server},
+        rate_limiter=_fast_limiter(),
+    )
+    provider.MAX_CANDLES_PER_REQUEST = 12
+    lake = OHLCVLake(tmp_path)
+    backfiller = CandleBackfiller(provider, lake=lake, max_workers=2, flush_rows=10)
+
+    result = backfiller.run("EUR_USD", _utc(2024, 3, 4), _utc(2024, 3, 5), "H1")
+
+    assert result.pages_planned == 2
+    assert result.candles_written == 24
+    params = _CandleStub.requests_seen[0][1]
+    assert params["granularity"] == "H1" and params["price"] == "M"
+    assert len(lake.read("EURUSD", "1h", _utc(2024, 3, 4), _utc(2024, 3, 4, 23))) == 24
@@ -159,7 +159,7 @@ class TestCoinbaseDataProvider:
         """Test provider initializes with config."""
         assert provider.credentials["api_key"] == "test_key"
 
-    @patch("requests.get")
+    @patch("requests.Session.request")
     def test_get_candles(self, mock_get, provider):
         """Test getting candle data."""
         mock_response = Mock()
@@ -186,7 +186,7 @@ class TestCoinbaseDataProvider:
         assert len(candles) == 1
         assert candles[0]["close"] == 50500.0
 
-    @patch("requests.get")
+    @patch("requests.Session.request")
     def test_error_handling(self, mock_get, provider):
         """Test error handling for API failures."""
         mock_get.side_effect = Exception("Connection error")
@@ -216,7 +216,7 @@ class TestOandaDataProvider:
         assert provider.api_key == "test_token"
         assert provider.account_id == "test_account"
 
-    @patch("requests.get")
+    @patch("requests.Session.request")
     def test_get_candles(self, mock_get, provider):
         """Test getting forex candle data."""
         mock_response = Mock()
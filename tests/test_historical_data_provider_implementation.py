@@ -1,8 +1,9 @@
 """Tests for HistoricalDataProvider implementation."""
 
-from datetime import datetime, timezone
+import asyncio
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import numpy as np
 import pandas as pd
@@ -66,10 +67,7 @@ class TestHistoricalDataProvider:
         assert provider.validator is not None
         assert provider.data_store is not None
 
-    @patch("asyncio.run")
-    def test_fetch_raw_data(
-        self, mock_asyncio_run, mock_alpha_vantage, tmp_path, sample_ohlcv_data
-    ):
+    def test_fetch_raw_data(self, mock_alpha_vantage, tmp_path, sample_ohlcv_data):
         """Test fetching raw data from Alpha Vantage."""
         from finance_feedback_engine.data_providers.historical_data_provider import (
             HistoricalDataProvider,
@@ -94,7 +92,9 @@ class TestHistoricalDataProvider:
                 "volume": 1500,
             },
         ]
-        mock_asyncio_run.return_value = candles
+        mock_alpha_vantage.return_value.get_historical_data = AsyncMock(
+            return_value=candles
+        )
 
         provider = HistoricalDataProvider(
             api_key="test_api_key", cache_dir=str(tmp_path / "cache")
@@ -103,7 +103,9 @@ class TestHistoricalDataProvider:
         start = datetime(2024, 1, 1, tzinfo=timezone.utc)
         end = datetime(2024, 1, 2, tzinfo=timezone.utc)
 
-        df = provider._fetch_raw_data("BTCUSD", start, end, timeframe="1h")
+        with patch.object(provider, "_fetch_exchange_candles", return_value=[]):
+            df = provider._fetch_raw_data("BTCUSD", start, end, timeframe="1h")
+        provider.close()
 
         assert not df.empty
         assert len(df) == 2
@@ -112,11 +114,8 @@ class TestHistoricalDataProvider:
         )
         assert isinstance(df.index, pd.DatetimeIndex)
 
-    @patch("asyncio.run")
-    def test_fetch_raw_data_caching(
-        self, mock_asyncio_run, mock_alpha_vantage, tmp_path
-    ):
-        """Test that fetched data is cached to parquet."""
+    def test_fetch_raw_data_caching(self, mock_alpha_vantage, tmp_path):
+        """Fetched data is cached in the OHLCV lake, not in per-range files."""
         from finance_feedback_engine.data_providers.historical_data_provider import (
             HistoricalDataProvider,
         )
@@ -130,36 +129,64 @@ class TestHistoricalDataProvider:
                 "close": 105.0,
             }
         ]
-        mock_asyncio_run.return_value = candles
+        fetch = AsyncMock(return_value=candles)
+        mock_alpha_vantage.return_value.get_historical_data = fetch
 
         cache_dir = tmp_path / "cache"
         provider = HistoricalDataProvider(
             api_key="test_api_key", cache_dir=str(cache_dir)
         )
 
-        start = datetime(2024, 1, 1, tzinfo=timezone.utc)
-        end = datetime(2024, 1, 2, tzinfo=timezone.utc)
-
         # First call should fetch from API
-        df1 = provider._fetch_raw_data("BTCUSD", start, end, timeframe="1h")
+        with patch.object(provider, "_fetch_exchange_candles", return_value=[]):
+            df1 = provider.get_historical_data(
+                "BTCUSD", "2024-01-01", "2024-01-02", timeframe="1h"
+            )
         assert not df1.empty
+        assert not list(cache_dir.glob("BTCUSD_*.parquet"))
 
-        # Cache file should exist
-
-        cache_files = list(cache_dir.glob("BTCUSD_*.parquet"))
-
-        if not cache_files:
-
-            # Fallback for case sensitivity
+        # Second call is served from the lake (Alpha Vantage not called again)
+        fetch.reset_mock()
+        df2 = provider.get_historical_data(
+            "BTCUSD", "2024-01-01", "2024-01-02", timeframe="1h"
+        )
+        assert not df2.empty
+        fetch.assert_not_called()
+        provider.close()
 
-            cache_files = list(cache_dir.glob("btcusd_*.parquet"))
+    def test_exchange_fetch_pages_the_requested_range(self, tmp_path):
+        """Exchange candles are paged by explicit start/end, not "N bars ending now"."""
+        from finance_feedback_engine.data_providers.historical_data_provider import (
+            HistoricalDataProvider,
+        )
 
-        assert len(cache_files) > 0
-        # Second call should load from cache (asyncio.run not called again)
-        mock_asyncio_run.reset_mock()
-        df2 = provider._fetch_raw_data("BTCUSD", start, end, timeframe="1h")
-        assert not df2.empty
-        mock_asyncio_run.assert_not_called()
+        provider = HistoricalDataProvider(
+            api_key="test_api_key", cache_dir=str(tmp_path / "cache")
+        )
+        exchange = MagicMock(MAX_CANDLES_PER_REQUEST=10)
+        exchange.fetch_candle_page.side_effect = lambda session, pair, tf, start, end: [
+            {
+                "date": start.isoformat(),
+                "open": 1.0,
+                "high": 1.0,
+                "low": 1.0,
+                "close": 1.0,
+                "volume": 1.0,
+            }
+        ]
+        start = datetime(2023, 3, 1, tzinfo=timezone.utc)
+        end = datetime(2023, 3, 2, tzinfo=timezone.utc)
+        with patch.object(provider, "_get_coinbase_provider", return_value=exchange):
+            candles = provider._fetch_exchange_candles("BTCUSD", start, end, "1h")
+        provider.close()
+
+        pages = [c.args[3:] for c in exchange.fetch_candle_page.call_args_list]
+        assert pages == [
+            (start, start + timedelta(hours=10)),
+            (start + timedelta(hours=10), start + timedelta(hours=20)),
+            (start + timedelta(hours=20), end),
+        ]
+        assert len(candles) == 3
 
     def test_get_historical_data_with_string_dates(self, tmp_path):
         """Test get_historical_data with string date inputs."""
@@ -230,6 +257,37 @@ class TestHistoricalDataProvider:
             assert call_args[1].tzinfo == timezone.utc
             assert call_args[2].tzinfo == timezone.utc
 
+    def test_get_historical_data_keeps_midnight_end_bound(self, tmp_path):
+        """A date-only end is midnight, not the end of that day."""
+        from finance_feedback_engine.data_providers.historical_data_provider import (
+            HistoricalDataProvider,
+        )
+
+        provider = HistoricalDataProvider(
+            api_key="test_api_key", cache_dir=str(tmp_path / "cache")
+        )
+
+        with patch.object(provider, "_fetch_raw_data") as mock_fetch:
+            dates = pd.date_range("2024-01-01", periods=5, freq="1h", tz="UTC")
+            mock_fetch.return_value = pd.DataFrame(
+                {
+                    "open": [100.0] * 5,
+                    "high": [110.0] * 5,
+                    "low": [95.0] * 5,
+                    "close": [105.0] * 5,
+                    "volume": [1000] * 5,
+                },
+                index=dates,
+            )
+
+            provider.get_historical_data(
+                "BTCUSD", start_date="2024-01-01", end_date="2024-01-02", timeframe="1h"
+            )
+
+            assert mock_fetch.call_args[0][2] == datetime(
+                2024, 1, 2, tzinfo=timezone.utc
+            )
+
     def test_get_historical_data_uses_cache_first(self, tmp_path):
         """Test that get_historical_data checks cache before fetching."""
         from finance_feedback_engine.data_providers.historical_data_provider import (
@@ -495,7 +553,12 @@ class TestHistoricalDataProviderIntegration:
             api_key="test_api_key", cache_dir=str(cache_dir)
         )
 
-        with patch("asyncio.run") as mock_run:
+        with (
+            patch.object(provider, "_fetch_exchange_candles", return_value=[]),
+            patch.object(
+                provider, "_fetch_alpha_vantage", new=AsyncMock()
+            ) as mock_fetch,
+        ):
             # Mock API response
             candles = [
                 {
@@ -508,7 +571,7 @@ class TestHistoricalDataProviderIntegration:
                 }
                 for i in range(5)
             ]
-            mock_run.return_value = candles
+            mock_fetch.return_value = candles
 
             df = provider.get_historical_data(
                 "BTCUSD", start_date="2024-01-01", end_date="2024-01-02", timeframe="1h"
@@ -518,8 +581,8 @@ class TestHistoricalDataProviderIntegration:
             assert not df.empty
             assert len(df) == 5
 
-            # Verify persistence
-            cache_files = list(cache_dir.glob("*.parquet"))
+            # Verify persistence (lake partitions)
+            cache_files = list(cache_dir.rglob("*.parquet"))
             assert len(cache_files) > 0
 
     def test_full_workflow_with_cache(self, tmp_path):
@@ -533,7 +596,12 @@ class TestHistoricalDataProviderIntegration:
             api_key="test_api_key", cache_dir=str(cache_dir)
         )
 
-        with patch("asyncio.run") as mock_run:
+        with (
+            patch.object(provider, "_fetch_exchange_candles", return_value=[]),
+            patch.object(
+                provider, "_fetch_alpha_vantage", new=AsyncMock()
+            ) as mock_fetch,
+        ):
             candles = [
                 {
                     "date": "2024-01-01T00:00:00Z",
@@ -544,14 +612,14 @@ class TestHistoricalDataProviderIntegration:
                     "volume": 1000,
                 }
             ]
-            mock_run.return_value = candles
+            mock_fetch.return_value = candles
 
             # First call - should fetch
             df1 = provider.get_historical_data(
                 "BTCUSD", start_date="2024-01-01", end_date="2024-01-02", timeframe="1h"
             )
             assert not df1.empty
-            assert mock_run.call_count == 1
+            assert mock_fetch.call_count == 1
 
             # Second call - should use cache
             df2 = provider.get_historical_data(
@@ -559,7 +627,125 @@ class TestHistoricalDataProviderIntegration:
             )
             assert not df2.empty
             # Should not fetch again
-            assert mock_run.call_count == 1
+            assert mock_fetch.call_count == 1
 
             # DataFrames should be identical
             pd.testing.assert_frame_equal(df1, df2)
+
+
+class TestHistoricalDataProviderAsync:
+    """Async API and background-loop reuse."""
+
+    def test_alpha_vantage_provider_and_loop_reused_across_fetches(
+        self, mock_alpha_vantage, tmp_path
+    ):
+        from finance_feedback_engine.data_providers.historical_data_provider import (
+            HistoricalDataProvider,
+        )
+
+        threads = []
+
+        async def fetch(asset_pair, start, end, timeframe):
+            import threading
+
+            threads.append(threading.current_thread())
+            return [
+                {
+                    "date": f"{start}T00:00:00Z",
+                    "open": 1.0,
+                    "high": 1.0,
+                    "low": 1.0,
+                    "close": 1.0,
+                }
+            ]
+
+        mock_alpha_vantage.return_value.get_historical_data = fetch
+        provider = HistoricalDataProvider(
+            api_key="k", cache_dir=str(tmp_path / "cache")
+        )
+        try:
+            with patch.object(provider, "_fetch_exchange_candles", return_value=[]):
+                for day in (1, 3, 5):
+                    start = datetime(2024, 1, day, tzinfo=timezone.utc)
+                    provider._fetch_raw_data("EURUSD", start, start, timeframe="1d")
+        finally:
+            provider.close()
+
+        assert mock_alpha_vantage.call_count == 1
+        assert len(threads) == 3 and len(set(threads)) == 1
+
+    def test_engine_close_stops_loop_and_alpha_vantage_session(
+        self, mock_alpha_vantage, tmp_path
+    ):
+        from finance_feedback_engine.core import FinanceFeedbackEngine
+        from finance_feedback_engine.data_providers.historical_data_provider import (
+            HistoricalDataProvider,
+        )
+
+        async def fetch(asset_pair, start, end, timeframe):
+            return []
+
+        av_close = AsyncMock()
+        mock_alpha_vantage.return_value.get_historical_data = fetch
+        mock_alpha_vantage.return_value.close = av_close
+        provider = HistoricalDataProvider(
+            api_key="k", cache_dir=str(tmp_path / "cache")
+        )
+        assert provider._loop._thread is None
+
+        with patch.object(provider, "_fetch_exchange_candles", return_value=[]):
+            start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+            provider._fetch_raw_data("EURUSD", start, start, timeframe="1d")
+        thread = provider._loop._thread
+        assert thread is not None and thread.is_alive()
+
+        engine = FinanceFeedbackEngine.__new__(FinanceFeedbackEngine)
+        engine.data_provider = MagicMock(close=AsyncMock())
+        engine.historical_data_provider = provider
+        asyncio.run(engine.close())
+
+        engine.data_provider.close.assert_awaited_once()
+        av_close.assert_awaited_once()
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+
+    async def test_get_historical_data_async_fetches_gaps(self, tmp_path):
+        from finance_feedback_engine.data_providers.historical_data_provider import (
+            HistoricalDataProvider,
+        )
+
+        provider = HistoricalDataProvider(
+            api_key="k", cache_dir=str(tmp_path / "cache")
+        )
+        candles = [
+            {
+                "date": f"2024-01-01T{i:02d}:00:00Z",
+                "open": 100.0,
+                "high": 101.0,
+                "low": 99.0,
+                "close": 100.5,
+                "volume": 10,
+            }
+            for i in range(5)
+        ]
+        try:
+            with (
+                patch.object(provider, "_fetch_exchange_candles", return_value=[]),
+                patch.object(
+                    provider,
+                    "_fetch_alpha_vantage",
+                    new=AsyncMock(return_value=candles),
+                ) as fetch,
+            ):
+                df = await provider.get_historical_data_async(
+                    "BTCUSD", "2024-01-01", "2024-01-02", timeframe="1h"
+                )
+                again = await provider.get_historical_data_async(
+                    "BTCUSD", "2024-01-01", "2024-01-02", timeframe="1h"
+                )
+        finally:
+            provider.close()
+
+        assert len(df) == 5
+        assert fetch.await_count == 1
+        pd.testing.assert_frame_equal(df, again, check_freq=False)
@@ -0,0 +1,71 @@
+"""Tests for coalesced, delta-logged learning state persistence."""
+
+import json
+
+from finance_feedback_engine.decision_engine.thompson_sampling import (
+    ThompsonSamplingWeightOptimizer,
+)
+from finance_feedback_engine.utils.learning_state_store import (
+    LearningStateStore,
+    flush_all_learning_state,
+)
+
+
+def test_updates_are_coalesced_and_replayed_after_crash(tmp_path):
+    path = tmp_path / "stats.json"
+    optimizer = ThompsonSamplingWeightOptimizer(
+        ["local", "qwen"],
+        persistence_path=str(path),
+        flush_interval_seconds=3600,
+        flush_every=100,
+    )
+
+    for _ in range(10):
+        optimizer.update_weights_from_outcome("local", won=True, regime="trending")
+    optimizer.update_weights_from_outcome("qwen", won=False)
+
+    # First update snapshots; the rest only reach the delta log
+    assert json.loads(path.read_text())["provider_stats"]["local"]["alpha"] == 2
+    assert len(optimizer._store.delta_path.read_text().splitlines()) == 10
+
+    # A torn trailing append is ignored; a fresh instance sees every update
+    with open(optimizer._store.delta_path, "a") as f:
+        f.write('{"ts": 1, "set": [[["provider_stats", "qw')
+    restored = ThompsonSamplingWeightOptimizer(
+        ["local", "qwen"], persistence_path=str(path)
+    )
+    assert restored.provider_stats["local"] == {"alpha": 11, "beta": 1}
+    assert restored.provider_stats["qwen"] == {"alpha": 1, "beta": 2}
+    assert (
+        restored.regime_multipliers["trending"]
+        == optimizer.regime_multipliers["trending"]
+    )
+
+    optimizer.flush()
+    assert not optimizer._store.delta_path.exists()
+    assert json.loads(path.read_text())["provider_stats"]["local"]["alpha"] == 11
+
+
+def test_count_based_flush_and_shutdown_flush(tmp_path):
+    state = {}
+    store = LearningStateStore(
+        tmp_path / "history.json",
+        snapshot=lambda: state,
+        flush_interval_seconds=3600,
+        flush_every=3,
+    )
+    writes = []
+    real_write = store.file_io.write_json
+    store.file_io.write_json = lambda *a, **k: (writes.append(1), real_write(*a, **k))
+
+    for i in range(8):
+        state[f"p{i}"] = {"total": i}
+        store.record(((f"p{i}",), state[f"p{i}"]))
+
+    # Leading snapshot, then one every third pending update
+    assert len(writes) == 3
+    assert store.dirty
+
+    flush_all_learning_state()
+    assert not store.dirty
+    assert json.loads((tmp_path / "history.json").read_text()) == state
@@ -0,0 +1,173 @@
+"""Tests for the partitioned OHLCV lake and its use by historical data loaders."""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pandas as pd
+
+from finance_feedback_engine.persistence.ohlcv_lake import (
+    OHLCVLake,
+    normalize_timeframe,
+)
+
+
+def _candles(start: str, periods: int, freq: str = "1h") -> pd.DataFrame:
+    index = pd.date_range(start, periods=periods, freq=freq, tz="UTC")
+    close = pd.Series(range(periods), index=index, dtype="float64") + 100
+    return pd.DataFrame(
+        {
+            "open": close,
+            "high": close + 1,
+            "low": close - 1,
+            "close": close,
+            "volume": 10.0,
+        },
+        index=index,
+    )
+
+
+def _utc(*args) -> datetime:
+    return datetime(*args, tzinfo=timezone.utc)
+
+
+class TestOHLCVLake:
+    def test_write_partitions_by_month_and_reads_range(self, tmp_path):
+        lake = OHLCVLake(tmp_path)
+        lake.write("BTC-USD", "1h", _candles("2024-01-31 20:00", 10))
+
+        months = sorted(p.parent.name for p in tmp_path.rglob("data.parquet"))
+        assert months == ["month=2024-01", "month=2024-02"]
+
+        df = lake.read("BTCUSD", "H1", _utc(2024, 2, 1, 0), _utc(2024, 2, 1, 3))
+        assert list(df.index.hour) == [0, 1, 2, 3]
+        assert list(df.columns) == ["open", "high", "low", "close", "volume"]
+
+    def test_read_only_opens_touched_partitions(self, tmp_path):
+        lake = OHLCVLake(tmp_path)
+        lake.write("ETHUSD", "1d", _candles("2024-01-01", 90, freq="1D"))
+
+        with patch(
+            "finance_feedback_engine.persistence.ohlcv_lake.pq.read_table",
+            wraps=__import__("pyarrow.parquet").parquet.read_table,
+        ) as read_table:
+            df = lake.read("ETHUSD", "1d", _utc(2024, 2, 10), _utc(2024, 2, 12))
+
+        assert len(df) == 3
+        assert read_table.call_count == 1
+        assert "month=2024-02" in str(read_table.call_args[0][0])
+
+    def test_rewritten_bars_replace_existing(self, tmp_path):
+        lake = OHLCVLake(tmp_path)
+        lake.write("BTCUSD", "1h", _candles("2024-01-01", 3))
+        update = _candles("2024-01-01 02:00", 2)
+        update["close"] = 999.0
+        lake.write("BTCUSD", "1h", update)
+
+        df = lake.read("BTCUSD", "1h", _utc(2024, 1, 1), _utc(2024, 1, 2))
+        assert len(df) == 4
+        assert df["close"].iloc[-2:].tolist() == [999.0, 999.0]
+
+    def test_missing_ranges_subtract_coverage(self, tmp_path):
+        lake = OHLCVLake(tmp_path)
+        lake.mark_covered("EURUSD", "1h", _utc(2024, 1, 5), _utc(2024, 1, 10))
+        lake.mark_covered("EURUSD", "1h", _utc(2024, 1, 9), _utc(2024, 1, 12))
+
+        gaps = lake.missing_ranges("EUR_USD", "1h", _utc(2024, 1, 1), _utc(2024, 1, 20))
+
+        assert gaps == [
+            (_utc(2024, 1, 1), _utc(2024, 1, 5)),
+            (_utc(2024, 1, 12), _utc(2024, 1, 20)),
+        ]
+        assert lake.covers("EURUSD", "1h", _utc(2024, 1, 6), _utc(2024, 1, 11))
+
+    def test_concurrent_writers_on_one_root_keep_every_bar(self, tmp_path):
+        lakes = [OHLCVLake(tmp_path), OHLCVLake(tmp_path)]
+
+        def write(i):
+            lake = lakes[i % 2]
+            lake.write(
+                "BTCUSD",
+                "1h",
+                _candles(f"2024-01-01 {i:02d}:00", 1),
+                covered=(_utc(2024, 1, 1, i), _utc(2024, 1, 1, i, 59)),
+            )
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(write, range(24)))
+
+        frame = OHLCVLake(tmp_path).read(
+            "BTCUSD", "1h", _utc(2024, 1, 1), _utc(2024, 1, 2)
+        )
+        assert len(frame) == 24
+        assert len(OHLCVLake(tmp_path).coverage("BTCUSD", "1h")) == 24
+        assert not list(tmp_path.rglob("*.tmp"))
+
+    def test_timeframe_aliases(self):
+        assert normalize_timeframe("M5") == "5m"
+        assert normalize_timeframe("H1") == "1h"
+        assert normalize_timeframe("D") == "1d"
+        assert normalize_timeframe("1h") == "1h"
+
+
+class TestHistoricalDataProviderGapFetch:
+    def test_overlapping_windows_fetch_only_the_gap(self, tmp_path):
+        from finance_feedback_engine.data_providers.historical_data_provider import (
+            HistoricalDataProvider,
+        )
+
+        provider = HistoricalDataProvider(api_key="test", cache_dir=str(tmp_path))
+        requested = []
+
+        def fetch(asset_pair, start, end, timeframe):
+            requested.append((start, end))
+            first = pd.Timestamp(start).ceil("h")
+            hours = int((end - first).total_seconds() // 3600) + 1
+            return _candles(first.isoformat(), hours)
+
+        with patch.object(provider, "_fetch_raw_data", side_effect=fetch):
+            first = provider.get_historical_data("BTCUSD", "2024-01-01", "2024-01-03")
+            second = provider.get_historical_data("BTCUSD", "2024-01-02", "2024-01-05")
+            third = provider.get_historical_data("BTCUSD", "2024-01-01", "2024-01-05")
+
+        assert len(requested) == 2
+        # Only the days after the first window are fetched again
+        assert requested[1][0] == _utc(2024, 1, 3)
+        assert len(first) == 49
+        assert second.index[0] == pd.Timestamp("2024-01-02", tz="UTC")
+        assert len(third) == 97
+        assert third.index.is_monotonic_increasing
+
+
+class TestHistoricalDataManagerLake:
+    def test_fetched_candles_are_written_to_lake(self, tmp_path, monkeypatch):
+        from finance_feedback_engine.backtest.data_loader import HistoricalDataManager
+
+        monkeypatch.setattr(HistoricalDataManager, "CACHE_DIR", tmp_path / "cache")
+        lake = OHLCVLake(tmp_path / "lake")
+        manager = HistoricalDataManager(lake=lake)
+
+        end = pd.Timestamp.now(tz="UTC").floor("h") - pd.Timedelta(hours=1)
+        candles = _candles((end - pd.Timedelta(hours=9)).isoformat(), 10)
+        fetched = candles.reset_index().rename(columns={"timestamp": "time"})
+        fetched = fetched.rename(columns={"index": "time"})
+        platform = MagicMock()
+        platform.__class__.__name__ = "OandaPlatform"
+
+        with patch.object(manager, "_fetch_from_oanda", return_value=fetched):
+            manager.fetch_history("EUR_USD", "H1", 10, platform=platform)
+
+        stored = lake.read("EURUSD", "1h", end - pd.Timedelta(hours=9), end)
+        assert len(stored) == 10
+        pd.testing.assert_series_equal(
+            stored["close"], candles["close"], check_names=False, check_freq=False
+        )
+
+        # A second call with the cache file gone is served from the lake
+        for f in (tmp_path / "cache").glob("*"):
+            f.unlink()
+        with patch.object(manager, "_fetch_from_oanda") as refetch:
+            again = manager.fetch_history("EUR_USD", "H1", 9, platform=platform)
+        refetch.assert_not_called()
+        assert len(again) == 9
+        assert list(again.columns) == ["time", "open", "high", "low", "close", "volume"]
@@ -0,0 +1,176 @@
+"""Tests for the ring-buffer PerformanceMetricsCollector."""
+
+from datetime import UTC, datetime, timedelta
+
+import numpy as np
+import pytest
+
+from finance_feedback_engine.metrics.performance_metrics import (
+    PerformanceMetricsCollector,
+    RollingMetricsCalculator,
+)
+
+
+def _trades(count: int, start: datetime, seed: int = 7) -> list[dict]:
+    rng = np.random.default_rng(seed)
+    trades = []
+    for i in range(count):
+        pnl = float(rng.normal(5, 40))
+        trades.append(
+            {
+                "exit_timestamp": start + timedelta(days=i),
+                "realized_pnl": pnl,
+                "pnl_percentage": pnl / 100,
+                "was_profitable": pnl > 0,
+                "holding_period_hours": float(rng.uniform(1, 48)),
+                "asset_pair": "BTCUSD",
+            }
+        )
+    return trades
+
+
+def _reference(trades: list[dict], initial_balance: float = 10000.0) -> dict:
+    """Straightforward loop implementation used as a parity oracle."""
+    returns = np.array([t["pnl_percentage"] for t in trades])
+    pnl = np.array([t["realized_pnl"] for t in trades])
+    wins = [t for t in trades if t["was_profitable"]]
+    losses = [t for t in trades if not t["was_profitable"]]
+    downside = returns[returns < 0]
+
+    equity = np.concatenate(([initial_balance], initial_balance + np.cumsum(pnl)))
+    running_max = np.maximum.accumulate(equity)
+    drawdown = (equity - running_max) / running_max
+
+    streaks = {True: 0, False: 0}
+    current = {True: 0, False: 0}
+    for t in trades:
+        flag = t["was_profitable"]
+        current[flag] += 1
+        current[not flag] = 0
+        streaks[flag] = max(streaks[flag], current[flag])
+
+    return {
+        "sharpe_ratio": returns.mean() / returns.std() * np.sqrt(250),
+        "sortino_ratio": returns.mean() / downside.std() * np.sqrt(250),
+        "volatility": returns.std() * np.sqrt(250),
+        "downside_deviation": downside.std() * np.sqrt(250),
+        "value_at_risk_95": abs(np.percentile(pnl, 5)),
+        "win_rate": len(wins) / len(trades),
+        "avg_win": np.mean([t["realized_pnl"] for t in wins]),
+        "avg_loss": np.mean([abs(t["realized_pnl"]) for t in losses]),
+        "profit_factor": sum(t["realized_pnl"] for t in wins)
+        / sum(abs(t["realized_pnl"]) for t in losses),
+        "max_drawdown": abs(drawdown.min()) * 100,
+        "largest_win": pnl.max(),
+        "largest_loss": pnl.min(),
+        "longest_winning_streak": streaks[True],
+        "longest_losing_streak": streaks[False],
+        "avg_trade_duration_hours": np.mean(
+            [t["holding_period_hours"] for t in trades]
+        ),
+    }
+
+
+def test_metrics_match_reference_implementation():
+    trades = _trades(300, datetime(2025, 1, 1, tzinfo=UTC))
+    collector = PerformanceMetricsCollector()
+    for trade in trades:
+        collector.record_trade(trade)
+
+    metrics = collector.calculate_metrics()
+    expected = _reference(trades)
+
+    assert metrics.total_trades == 300
+    for name, value in expected.items():
+        assert getattr(metrics, name) == pytest.approx(value, rel=1e-9), name
+    assert len(metrics.monthly_returns) == 10
+
+
+def test_ring_buffer_evicts_oldest_trades():
+    trades = _trades(50, datetime(2025, 1, 1, tzinfo=UTC))
+    collector = PerformanceMetricsCollector(window_size=20)
+    for trade in trades:
+        collector.record_trade(trade)
+
+    metrics = collector.calculate_metrics()
+    expected = _reference(trades[-20:])
+
+    assert len(collector) == 20
+    assert len(collector.trade_history) == 20
+    assert collector.trade_history[0]["pnl"] == trades[30]["realized_pnl"]
+    assert metrics.total_trades == 20
+    for name in ("sharpe_ratio", "win_rate", "avg_win", "value_at_risk_95"):
+        assert getattr(metrics, name) == pytest.approx(expected[name]), name
+
+
+def test_window_days_uses_recent_trades_only():
+    now = datetime.now(UTC)
+    trades = _trades(60, now - timedelta(days=59, hours=1))
+    collector = PerformanceMetricsCollector()
+    for trade in trades:
+        collector.record_trade(trade)
+
+    metrics = collector.calculate_metrics(window_days=10)
+    recent = trades[-10:]
+
+    assert metrics.total_trades == 10
+    assert metrics.sharpe_ratio == pytest.approx(_reference(recent)["sharpe_ratio"])
+
+
+def test_volatility_is_stable_for_price_scale_returns():
+    now = datetime.now(UTC)
+    trades = _trades(300, now - timedelta(days=299, hours=1))
+    rng = np.random.default_rng(3)
+    for trade in trades:
+        # Large mean, tiny spread: E[x^2] - E[x]^2 cancels catastrophically here
+        trade["pnl_percentage"] = 1e7 + float(rng.normal(0, 1e-3))
+    collector = PerformanceMetricsCollector(window_size=200)
+    for trade in trades:
+        collector.record_trade(trade)
+
+    returns = np.array([t["pnl_percentage"] for t in trades])
+    for window_days, expected in ((None, returns[-200:]), (30, returns[-30:])):
+        metrics = collector.calculate_metrics(window_days=window_days)
+        assert metrics.volatility == pytest.approx(
+            np.std(expected) * np.sqrt(250), rel=1e-3
+        )
+
+
+def test_out_of_order_timestamps_fall_back_to_mask():
+    now = datetime.now(UTC)
+    trades = _trades(5, now - timedelta(days=4))
+    trades[0]["exit_timestamp"] = now  # recorded first but newest
+    collector = PerformanceMetricsCollector()
+    for trade in trades:
+        collector.record_trade(trade)
+
+    metrics = collector.calculate_metrics(window_days=2)
+
+    assert metrics.total_trades == 3
+
+
+def test_rolling_calculator_uses_prefix_sums():
+    collector = PerformanceMetricsCollector(window_size=8)
+    start = datetime(2025, 1, 1, tzinfo=UTC)
+    pattern = [True, True, False, True, False, False, True, True, True, False]
+    for i, profitable in enumerate(pattern):
+        collector.record_trade(
+            {
+                "exit_timestamp": start + timedelta(hours=i),
+                "realized_pnl": 10.0 if profitable else -10.0,
+                "was_profitable": profitable,
+            }
+        )
+
+    rolling = RollingMetricsCalculator(collector)
+
+    assert rolling.calculate_rolling_win_rate(window_trades=4) == pytest.approx(0.75)
+    assert rolling.calculate_rolling_win_rate(window_trades=50) == pytest.approx(4 / 8)
+    assert rolling.calculate_current_drawdown() == pytest.approx(10 / 10030 * 100)
+
+
+def test_empty_collector_returns_default_metrics():
+    collector = PerformanceMetricsCollector()
+
+    assert collector.calculate_metrics().total_trades == 0
+    assert RollingMetricsCalculator(collector).calculate_rolling_win_rate() == 0.0
@@ -211,5 +211,69 @@ class TestUnifiedDataProviderAggregation:
             assert result["timeframes"]["5m"]["candles_count"] == 0
 
 
+class TestUnifiedDataProviderCandleForms:
+    """get_candles keeps its list contract; get_candle_series is columnar."""
+
+    def test_get_candles_returns_list_and_series_shares_cache(
+        self, mock_config, mock_candles
+    ):
+        from unittest.mock import MagicMock
+
+        from finance_feedback_engine.data_providers.candle_series import (
+            CandleSeries,
+        )
+
+        provider = UnifiedDataProvider(mock_config)
+        provider.coinbase = MagicMock()
+        provider.coinbase.get_candles.return_value = mock_candles
+
+        candles, source = provider.get_candles("BTCUSD", "1m")
+        series, cached_source = provider.get_candle_series("BTCUSD", "1m")
+
+        assert type(candles) is list
+        assert candles == mock_candles
+        assert isinstance(series, CandleSeries)
+        assert series.close.tolist() == [42050, 42150, 42250]
+        assert source == cached_source == "coinbase"
+        provider.coinbase.get_candles.assert_called_once()
+
+        multi = provider.get_multi_timeframe_data("BTCUSD", ["1m"], columnar=True)
+        assert multi["1m"][0] is series
+        assert (
+            type(provider.get_multi_timeframe_data("BTCUSD", ["1m"])["1m"][0]) is list
+        )
+
+    def test_get_candles_builds_records_once_per_cached_series(
+        self, mock_config, mock_candles
+    ):
+        from unittest.mock import MagicMock, patch
+
+        from finance_feedback_engine.data_providers.candle_series import (
+            CandleSeries,
+        )
+
+        provider = UnifiedDataProvider(mock_config)
+        provider.coinbase = MagicMock()
+        provider.coinbase.get_candles.return_value = mock_candles
+
+        with patch.object(
+            CandleSeries,
+            "to_records",
+            autospec=True,
+            side_effect=CandleSeries.to_records,
+        ) as to_records:
+            first, _ = provider.get_candles("BTCUSD", "1m")
+            second, _ = provider.get_candles("BTCUSD", "1m")
+
+        assert second is first
+        assert to_records.call_count == 1
+
+        # A refreshed series gets fresh records
+        provider._cache.clear()
+        refreshed, _ = provider.get_candles("BTCUSD", "1m")
+        assert refreshed is not first
+        assert refreshed == mock_candles
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
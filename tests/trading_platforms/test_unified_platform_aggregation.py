@@ -0,0 +1,116 @@
+"""Concurrent, cached portfolio reads in UnifiedTradingPlatform."""
+
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from finance_feedback_engine.trading_platforms.unified_platform import (
+    UnifiedTradingPlatform,
+)
+
+
+def _platform(name, total_value, delay=0.0):
+    platform = Mock()
+    platform.__class__.__name__ = name
+
+    def breakdown():
+        time.sleep(delay)
+        return {
+            "total_value_usd": total_value,
+            "holdings": [{"asset": name, "value_usd": total_value}],
+        }
+
+    def balance():
+        time.sleep(delay)
+        return {"USD": total_value}
+
+    platform.get_portfolio_breakdown.side_effect = breakdown
+    platform.get_balance.side_effect = balance
+    platform.get_active_positions.return_value = {"positions": []}
+    platform.execute_trade.return_value = {"success": True}
+    platform.get_execute_breaker.return_value = None
+    return platform
+
+
+@pytest.fixture
+def make_unified(monkeypatch):
+    def make(coinbase, oanda, **aggregation):
+        monkeypatch.setattr(
+            "finance_feedback_engine.trading_platforms.unified_platform.CoinbaseAdvancedPlatform",
+            lambda creds: coinbase,
+        )
+        monkeypatch.setattr(
+            "finance_feedback_engine.trading_platforms.unified_platform.OandaPlatform",
+            lambda creds: oanda,
+        )
+        return UnifiedTradingPlatform(
+            {
+                "coinbase": {"api_key": "test", "api_secret": "test"},
+                "oanda": {"api_key": "test", "account_id": "test"},
+            },
+            config={"portfolio_aggregation": aggregation},
+        )
+
+    return make
+
+
+def test_platforms_are_queried_concurrently(make_unified):
+    unified = make_unified(
+        _platform("Coinbase", 100.0, 0.3), _platform("Oanda", 50.0, 0.3)
+    )
+
+    started = time.perf_counter()
+    portfolio = unified.get_portfolio_breakdown()
+    balance = unified.get_balance()
+    elapsed = time.perf_counter() - started
+
+    assert portfolio["total_value_usd"] == 150.0
+    assert balance == {"coinbase_USD": 100.0, "oanda_USD": 50.0}
+    assert elapsed < 1.0  # Sequential would take 1.2s
+
+
+def test_slow_platform_times_out_with_partial_result(make_unified):
+    slow = _platform("Oanda", 50.0, 0.5)
+    unified = make_unified(
+        _platform("Coinbase", 100.0), slow, platform_timeout_seconds=0.1
+    )
+
+    portfolio = unified.get_portfolio_breakdown()
+
+    assert set(portfolio["platform_breakdowns"]) == {"coinbase"}
+    assert portfolio["total_value_usd"] == 100.0
+    # Partial results are not cached
+    unified.get_portfolio_breakdown()
+    assert slow.get_portfolio_breakdown.call_count == 2
+
+
+def test_concurrent_callers_share_one_fetch(make_unified):
+    coinbase = _platform("Coinbase", 100.0, 0.2)
+    unified = make_unified(
+        coinbase, _platform("Oanda", 50.0, 0.2), cache_ttl_seconds=30
+    )
+    results = []
+
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(unified.get_portfolio_breakdown())
+        )
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert coinbase.get_portfolio_breakdown.call_count == 1
+    assert all(r["total_value_usd"] == 150.0 for r in results)
+    # Callers get independent copies
+    results[0]["holdings"].clear()
+    assert unified.get_portfolio_breakdown()["holdings"]
+    assert coinbase.get_portfolio_breakdown.call_count == 1
+
+    unified.execute_trade({"id": "t1", "asset_pair": "BTCUSD", "action": "BUY"})
+    unified.get_portfolio_breakdown()
+    assert coinbase.get_portfolio_breakdown.call_count == 2
@@ -0,0 +1,41 @@
+"""Tests for the reusable background event loop."""
+
+import asyncio
+import threading
+
+import pytest
+
+from finance_feedback_engine.utils.background_loop import BackgroundEventLoop
+
+
+async def _whoami():
+    return threading.current_thread(), asyncio.get_running_loop()
+
+
+def test_runs_every_call_on_one_loop_thread():
+    runner = BackgroundEventLoop()
+    try:
+        first = runner.run(_whoami())
+        second = runner.run(_whoami())
+    finally:
+        runner.close()
+
+    assert first == second
+    assert first[0] is not threading.current_thread()
+    assert first[1].is_closed()
+
+
+async def test_run_async_from_another_loop_and_reentry_guard():
+    runner = BackgroundEventLoop()
+    try:
+        thread, loop = await runner.run_async(_whoami())
+        assert loop is not asyncio.get_running_loop()
+
+        async def nested():
+            with pytest.raises(RuntimeError):
+                runner.run(_whoami())
+            return await runner.run_async(_whoami())
+
+        assert await runner.run_async(nested()) == (thread, loop)
+    finally:
+        runner.close()
@@ -0,0 +1,102 @@
+"""Tests for the shared pooled HTTP transport."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from finance_feedback_engine.utils.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerOpenError,
+)
+from finance_feedback_engine.utils.http_transport import HTTPTransport
+from finance_feedback_engine.utils.rate_limiter import RateLimiter
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        status = 503 if self.path.startswith("/down") else 200
+        body = b'{"ok": true}'
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_connections_are_reused_and_metered_per_host(server_url):
+    transport = HTTPTransport(pool_maxsize=2)
+
+    for _ in range(5):
+        assert transport.get(f"{server_url}/candles").json() == {"ok": True}
+
+    host = server_url.split("://", 1)[1]
+    stats = transport.get_metrics()[host]
+    assert stats["requests"] == 5
+    assert stats["errors"] == 0
+    assert stats["connections_opened"] == 1
+    assert stats["connections_reused"] == 4
+    assert 0 < stats["avg_latency_ms"] <= stats["max_latency_ms"]
+    transport.close()
+
+
+def test_rate_limiter_and_circuit_breaker_are_applied(server_url):
+    transport = HTTPTransport()
+    limiter = RateLimiter(tokens_per_second=1000.0, max_tokens=10)
+    breaker = CircuitBreaker(failure_threshold=1, name="test")
+
+    def failing_get():
+        response = transport.get(f"{server_url}/down", rate_limiter=limiter)
+        response.raise_for_status()
+
+    with pytest.raises(requests.HTTPError):
+        breaker.call_sync(failing_get)
+    with pytest.raises(CircuitBreakerOpenError):
+        transport.get(f"{server_url}/ok", circuit_breaker=breaker)
+
+    host = server_url.split("://", 1)[1]
+    assert transport.get_metrics()[host]["errors"] == 1
+    transport.close()
+
+
+def test_mount_routes_foreign_session_through_shared_pools(server_url):
+    transport = HTTPTransport()
+    sdk_session = transport.mount(requests.Session())
+
+    sdk_session.get(f"{server_url}/a")
+    transport.get(f"{server_url}/b")
+
+    host = server_url.split("://", 1)[1]
+    assert transport.get_metrics()[host]["requests"] == 2
+    assert transport.get_metrics()[host]["connections_opened"] == 1
+    transport.close()
+
+
+def test_configure_keeps_transport_when_settings_are_unchanged(monkeypatch):
+    from finance_feedback_engine.utils import http_transport
+
+    monkeypatch.setattr(http_transport, "_transport", None)
+    first = http_transport.configure_http_transport(pool_maxsize=7)
+    assert http_transport.configure_http_transport(pool_maxsize=7) is first
+    assert first.session.adapters["https://"] is first.adapter
+
+    resized = http_transport.configure_http_transport(pool_maxsize=9)
+    assert resized is not first
+    assert http_transport.get_http_transport() is resized
+    resized.close()